@@ -178,3 +178,84 @@ EOF
 check_file() { [[ -f "$1" ]] && echo "  ✓ $2" || echo "  ✗ $2"; }
 check_dir() { [[ -d "$1" && -n $(ls -A "$1" 2>/dev/null) ]] && echo "  ✓ $2" || echo "  ✗ $2"; }
 
+
+# Advisory per-file locks, shared with the nuaa CLI (nuaa_cli/locks.py).
+# Hold the lock of a file for the whole read-modify-write, one lock at a time:
+#   acquire_file_lock "$plan_file" || exit 1
+#   ...rewrite "$plan_file" via a temp file in the same directory and mv...
+#   release_file_lock "$plan_file"
+# With flock(1) the lock is .<name>.lock plus the .<name>.lck marker; without it,
+# only .<name>.lck is created exclusively (abandoned after 300 seconds). Every
+# writer takes the marker, so flock and fallback writers exclude each other.
+# Under the flock, a marker whose pid no longer runs is removed at once, and the
+# .lock file is deleted on release. NUAA_LOCK_TIMEOUT sets the wait.
+_lock_owner_gone() {
+    local owner
+    owner=$(head -n 1 "$1" 2>/dev/null)
+    [[ "$owner" =~ ^[0-9]+$ ]] && kill -0 "$owner" 2>&1 | grep -q "No such process"
+}
+
+acquire_file_lock() {
+    local target="$1"
+    local timeout="${NUAA_LOCK_TIMEOUT:-30}"
+    local dir=$(dirname "$target")
+    local name=$(basename "$target")
+    local marker="$dir/.$name.lck"
+    local waited=0
+
+    if command -v flock >/dev/null 2>&1; then
+        while :; do
+            exec 9>>"$dir/.$name.lock"
+            if ! flock -w "$timeout" 9; then
+                echo "Error: Timed out after ${timeout}s waiting for the lock on $target" >&2
+                exec 9>&-
+                return 1
+            fi
+            # The previous holder deletes the file on release: lock the current one
+            [[ /dev/fd/9 -ef "$dir/.$name.lock" ]] && break
+            exec 9>&-
+        done
+        # Also take the .lck marker that writers without flock(1) compete for
+        until ( set -C; echo "$$" > "$marker" ) 2>/dev/null; do
+            if [[ -n $(find "$marker" -mmin +5 2>/dev/null) ]] || _lock_owner_gone "$marker"; then
+                rm -f "$marker"
+                continue
+            fi
+            if (( waited >= timeout * 10 )); then
+                echo "Error: Timed out after ${timeout}s waiting for the lock on $target" >&2
+                exec 9>&-
+                return 1
+            fi
+            sleep 0.1
+            waited=$((waited + 1))
+        done
+        NUAA_LOCK_MODE="flock"
+        return 0
+    fi
+
+    until ( set -C; echo "$$" > "$marker" ) 2>/dev/null; do
+        if [[ -n $(find "$marker" -mmin +5 2>/dev/null) ]]; then
+            rm -f "$marker"
+            continue
+        fi
+        if (( waited >= timeout * 10 )); then
+            echo "Error: Timed out after ${timeout}s waiting for the lock on $target" >&2
+            return 1
+        fi
+        sleep 0.1
+        waited=$((waited + 1))
+    done
+    NUAA_LOCK_MODE="file"
+}
+
+release_file_lock() {
+    local target="$1"
+    if [[ -n "${NUAA_LOCK_MODE:-}" ]]; then
+        rm -f "$(dirname "$target")/.$(basename "$target").lck"
+    fi
+    if [[ "${NUAA_LOCK_MODE:-}" == "flock" ]]; then
+        rm -f "$(dirname "$target")/.$(basename "$target").lock"
+        exec 9>&-
+    fi
+    NUAA_LOCK_MODE=""
+}
@@ -10,6 +10,7 @@ source "$SCRIPT_DIR/common.sh"
 INITIATIVE=""
 SECTION=""
 JSON_MODE=false
+UPDATE_PLAN=true
 
 parse_args() {
     while [[ $# -gt 0 ]]; do
@@ -17,6 +18,7 @@ parse_args() {
             --json) JSON_MODE=true; shift ;;
             --initiative) INITIATIVE="$2"; shift 2 ;;
             --section) SECTION="$2"; shift 2 ;;
+            --no-plan-update) UPDATE_PLAN=false; shift ;;
             *) echo "Unknown option: $1" >&2; exit 1 ;;
         esac
     done
@@ -108,9 +110,10 @@ update_plan_status() {
     local section="$2"
     local new_status="$3"
 
-    # Find the section in the plan and update its status
-    # This uses a temporary file for safe in-place editing
-    local temp_file=$(mktemp)
+    # Find the section in the plan and update its status. The plan is locked for
+    # the whole rewrite, and the temporary file lives next to it so mv is atomic.
+    acquire_file_lock "$plan_file" || return 1
+    local temp_file=$(mktemp "$(dirname "$plan_file")/.plan.md.XXXXXX")
     local in_section=false
 
     while IFS= read -r line; do
@@ -130,6 +133,7 @@ update_plan_status() {
     done < "$plan_file" > "$temp_file"
 
     mv "$temp_file" "$plan_file"
+    release_file_lock "$plan_file"
 }
 
 main() {
@@ -143,20 +147,24 @@ main() {
     local initiative=$(find_initiative "$INITIATIVE")
     local section_file=$(create_section_file "$initiative" "$SECTION")
 
-    # Update plan status
+    # Update plan status (the nuaa CLI passes --no-plan-update and edits plan.md itself)
     local plan_file="initiatives/$initiative/plan.md"
-    update_plan_status "$plan_file" "$SECTION" "In Progress"
+    if [[ $UPDATE_PLAN == true ]]; then
+        update_plan_status "$plan_file" "$SECTION" "In Progress"
+    fi
 
     if [[ $JSON_MODE == true ]]; then
         echo "{"
         echo "  \"initiative\": \"$initiative\","
         echo "  \"section\": \"$SECTION\","
         echo "  \"section_file\": \"$section_file\","
-        echo "  \"plan_updated\": true"
+        echo "  \"plan_updated\": $UPDATE_PLAN"
         echo "}"
     else
         echo "✓ Created section: $section_file"
-        echo "✓ Updated plan status: In Progress"
+        if [[ $UPDATE_PLAN == true ]]; then
+            echo "✓ Updated plan status: In Progress"
+        fi
         echo ""
         echo "Next steps:"
         echo "  1. Have AI draft content using /nuaa.draft \"$SECTION\""
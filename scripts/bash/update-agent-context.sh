@@ -558,7 +558,20 @@ inject_constitution() {
 # Main Agent File Update Function
 #==============================================================================
 
+# Agents and the CLI may update the same context file concurrently, so the whole
+# create/update/inject sequence runs under the file's lock
 update_agent_file() {
+    local target_file="$1"
+    local rc=0
+
+    mkdir -p "$(dirname "$target_file")"
+    acquire_file_lock "$target_file" || return 1
+    _update_agent_file "$@" || rc=$?
+    release_file_lock "$target_file"
+    return $rc
+}
+
+_update_agent_file() {
     local target_file="$1"
     local agent_name="$2"
     
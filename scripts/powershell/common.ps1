@@ -177,3 +177,42 @@ function Test-DirHasFiles {
     }
 }
 
+
+# Advisory per-file locks, shared with the nuaa CLI (nuaa_cli/locks.py).
+# Creates .<name>.lck exclusively; the CLI and bash writers take the same marker
+# even when they also hold flock. A marker older than 300 seconds is abandoned.
+# NUAA_LOCK_TIMEOUT sets how long to wait (default 30 seconds).
+function Lock-NuaaFile {
+    param([Parameter(Mandatory = $true)][string]$Path)
+    $timeout = if ($env:NUAA_LOCK_TIMEOUT) { [double]$env:NUAA_LOCK_TIMEOUT } else { 30 }
+    $dir = Split-Path -Parent $Path
+    if (-not $dir) { $dir = '.' }
+    $marker = Join-Path $dir (".{0}.lck" -f (Split-Path -Leaf $Path))
+    $deadline = (Get-Date).AddSeconds($timeout)
+
+    while ($true) {
+        try {
+            $stream = [System.IO.File]::Open($marker, [System.IO.FileMode]::CreateNew, [System.IO.FileAccess]::Write)
+            $writer = New-Object System.IO.StreamWriter($stream)
+            $writer.WriteLine($PID)
+            $writer.Close()
+            return $marker
+        }
+        catch [System.IO.IOException] {
+            $item = Get-Item -LiteralPath $marker -ErrorAction SilentlyContinue
+            if ($item -and $item.LastWriteTime -lt (Get-Date).AddSeconds(-300)) {
+                Remove-Item -LiteralPath $marker -Force -ErrorAction SilentlyContinue
+                continue
+            }
+            if ((Get-Date) -ge $deadline) {
+                throw "Timed out after ${timeout}s waiting for the lock on $Path"
+            }
+            Start-Sleep -Milliseconds 100
+        }
+    }
+}
+
+function Unlock-NuaaFile {
+    param([Parameter(Mandatory = $true)][string]$Marker)
+    Remove-Item -LiteralPath $Marker -Force -ErrorAction SilentlyContinue
+}
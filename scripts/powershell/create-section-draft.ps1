@@ -4,7 +4,8 @@
 param(
     [string]$Initiative = "",
     [string]$Section = "",
-    [switch]$Json
+    [switch]$Json,
+    [switch]$NoPlanUpdate
 )
 
 $scriptDir = Split-Path -Parent $MyInvocation.MyCommand.Path
@@ -102,30 +103,39 @@ function Update-PlanStatus {
         [string]$newStatus
     )
 
-    $lines = Get-Content $planFile
-    $output = @()
-    $inSection = $false
-
-    foreach ($line in $lines) {
-        if ($line -match "^###\s+.*:\s+$sectionName\s*$") {
-            $inSection = $true
-            $output += $line
-        }
-        elseif ($inSection -and $line -match '^\*\*Status\*\*:\s*') {
-            $output += "**Status**: $newStatus"
-            $inSection = $false
-        }
-        elseif ($inSection -and $line -match '^###\s+') {
-            # Hit next section without finding status
-            $inSection = $false
-            $output += $line
+    # Lock the plan for the whole rewrite and replace it in one step
+    $lock = Lock-NuaaFile -Path $planFile
+    try {
+        $lines = Get-Content $planFile
+        $output = @()
+        $inSection = $false
+
+        foreach ($line in $lines) {
+            if ($line -match "^###\s+.*:\s+$sectionName\s*$") {
+                $inSection = $true
+                $output += $line
+            }
+            elseif ($inSection -and $line -match '^\*\*Status\*\*:\s*') {
+                $output += "**Status**: $newStatus"
+                $inSection = $false
+            }
+            elseif ($inSection -and $line -match '^###\s+') {
+                # Hit next section without finding status
+                $inSection = $false
+                $output += $line
+            }
+            else {
+                $output += $line
+            }
         }
-        else {
-            $output += $line
-        }
-    }
 
-    Set-Content -Path $planFile -Value ($output -join "`n") -NoNewline
+        $tempFile = Join-Path (Split-Path -Parent $planFile) (".plan.md.{0}.tmp" -f $PID)
+        Set-Content -Path $tempFile -Value ($output -join "`n") -NoNewline
+        Move-Item -LiteralPath $tempFile -Destination $planFile -Force
+    }
+    finally {
+        Unlock-NuaaFile -Marker $lock
+    }
 }
 
 # Main execution
@@ -137,22 +147,26 @@ try {
     $initiativeName = Find-Initiative -name $Initiative
     $sectionFile = New-SectionFile -initiative $initiativeName -sectionName $Section
 
-    # Update plan status
+    # Update plan status (the nuaa CLI passes -NoPlanUpdate and edits plan.md itself)
     $planFile = "initiatives\$initiativeName\plan.md"
-    Update-PlanStatus -planFile $planFile -sectionName $Section -newStatus "In Progress"
+    if (-not $NoPlanUpdate) {
+        Update-PlanStatus -planFile $planFile -sectionName $Section -newStatus "In Progress"
+    }
 
     if ($Json) {
         $output = @{
             initiative = $initiativeName
             section = $Section
             section_file = $sectionFile
-            plan_updated = $true
+            plan_updated = -not $NoPlanUpdate
         }
         $output | ConvertTo-Json -Compress
     }
     else {
         Write-Host "✓ Created section: $sectionFile" -ForegroundColor Green
-        Write-Host "✓ Updated plan status: In Progress" -ForegroundColor Green
+        if (-not $NoPlanUpdate) {
+            Write-Host "✓ Updated plan status: In Progress" -ForegroundColor Green
+        }
         Write-Host ""
         Write-Host "Next steps:"
         Write-Host "  1. Have AI draft content using /nuaa.draft `"$Section`"" -ForegroundColor Cyan
@@ -398,7 +398,7 @@ function Inject-Constitution {
     }
 }
 
-function Update-AgentFile {
+function Update-AgentFileUnlocked {
     param(
         [Parameter(Mandatory = $true)]
         [string]$TargetFile,
@@ -438,6 +438,27 @@ function Update-AgentFile {
     return $true
 }
 
+function Update-AgentFile {
+    param(
+        [Parameter(Mandatory = $true)]
+        [string]$TargetFile,
+        [Parameter(Mandatory = $true)]
+        [string]$AgentName
+    )
+    # Agents and the CLI may update the same context file concurrently, so the
+    # whole create/update/inject sequence runs under the file's lock
+    $dir = Split-Path -Parent $TargetFile
+    if (-not (Test-Path $dir)) { New-Item -ItemType Directory -Path $dir | Out-Null }
+    try { $lock = Lock-NuaaFile -Path $TargetFile }
+    catch { Write-Err "$_"; return $false }
+    try {
+        return (Update-AgentFileUnlocked -TargetFile $TargetFile -AgentName $AgentName)
+    }
+    finally {
+        Unlock-NuaaFile -Marker $lock
+    }
+}
+
 function Update-SpecificAgent {
     param(
         [Parameter(Mandatory = $true)]
@@ -0,0 +1,5 @@
+"""Allow ``python -m nuaa_cli``."""
+
+from . import app
+
+app(prog_name="nuaa")
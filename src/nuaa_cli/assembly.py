@@ -0,0 +1,348 @@
+"""Native assembly of an initiative's section drafts into one final document.
+
+Sections are taken in ``plan.md`` order and every one must have the status
+Passed. Each draft is rendered into a *chunk*: its title and metadata block are
+dropped, and so are the reviewer-only parts of the section template (Section
+Purpose, Notes for Reviewers, Revision History). The ``Content`` wrapper heading
+is unwrapped, and the remaining headings are nested under a ``##`` heading
+named after the plan section.
+
+Chunks are kept in ``.nuaa/cache/assembly/<initiative>/``, next to a
+``cache.json`` with the headings, word count and SHA-256 of each draft, so
+re-assembly only re-renders the drafts that changed. Each initiative has its
+own cache file under its own lock, so assembling different initiatives at once
+loses no records. The table of contents is rebuilt from the cached headings.
+The final document is then streamed chunk by chunk into ``final/<initiative>.md``
+with an atomic replace; it is never held in memory as a whole. When neither a
+draft nor the title changed and the output was not edited since, it is not
+rewritten at all.
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+from pathlib import Path
+from typing import Iterable, NamedTuple, TextIO
+
+from .locks import atomic_writer, file_lock
+from .markers import CLARIFICATION, PLACEHOLDER, scan_markdown
+from .planfile import Section, load_plan, section_filename
+from .workspace import INITIATIVES, PROJECT_CACHE, project_cache
+
+CHUNKS_DIR = PROJECT_CACHE / "assembly"
+ASSEMBLY_CACHE = "cache.json"  # in each initiative's chunk directory
+CACHE_VERSION = 1
+
+# Headings of the section template that are for reviewers, not readers
+INTERNAL_HEADINGS = {"section purpose", "notes for reviewers", "revision history"}
+# Headings whose body is kept but whose heading line is dropped
+UNWRAPPED_HEADINGS = {"content"}
+# Deepest heading level listed in the table of contents
+TOC_DEPTH = 3
+
+_HEADING = re.compile(r"^(#{1,6})[ \t]+(.+?)[ \t#]*$")
+_FIELD_LINE = re.compile(r"^\*\*[^*\n]+\*\*:")
+_FENCE = re.compile(r"^[ \t]*(```|~~~)")
+_RULE = re.compile(r"^[ \t]*(-{3,}|\*{3,}|_{3,})[ \t]*$")
+_ANCHOR_DROP = re.compile(r"[^\w\- ]")
+
+
+class AssembledSection(NamedTuple):
+    number: int
+    name: str
+    draft: Path
+    words: int
+    rendered: bool  # False when the cached chunk was reused
+
+
+class Assembly(NamedTuple):
+    output: Path
+    sections: list[AssembledSection]
+    written: bool  # False when the existing output was already up to date
+    unresolved: dict[str, int]  # section name -> placeholder/clarification markers left
+
+
+def render_section(lines: Iterable[str], out: TextIO, name: str) -> tuple[list[list], int]:
+    """Write one section draft to ``out`` as a chunk of the final document.
+
+    Returns the chunk's headings as ``[level, text]`` pairs and its word count.
+    Blank lines and horizontal rules directly before a heading or at the end of
+    the draft are dropped, so removed parts leave no stray separators.
+    """
+    headings: list[list] = [[2, name]]
+    out.write(f"## {name}\n")
+    words = 0
+    pending: list[str] = []
+    preamble = True
+    fence = None
+    skip = None  # level of the internal heading being skipped
+    unwrapped = None  # level of the wrapper heading whose children move up one level
+    fresh = True  # nothing written since the last heading
+    for raw in lines:
+        line = raw.rstrip("\r\n")
+        heading = _HEADING.match(line) if fence is None else None
+        in_code = fence is not None
+        opener = _FENCE.match(line)
+        if opener:
+            in_code = True
+            if fence is None:
+                fence = opener.group(1)
+            elif opener.group(1) == fence:
+                fence = None
+
+        if preamble:
+            if not in_code and (
+                not line.strip()
+                or _RULE.match(line)
+                or _FIELD_LINE.match(line)
+                or (heading and len(heading.group(1)) == 1)
+            ):
+                continue
+            preamble = False
+
+        if heading:
+            level, text = len(heading.group(1)), heading.group(2)
+            if skip is not None and level > skip:
+                continue
+            skip = None
+            pending = []
+            if text.lower() in INTERNAL_HEADINGS:
+                skip = level
+                continue
+            if unwrapped is not None and level <= unwrapped:
+                unwrapped = None
+            if text.lower() in UNWRAPPED_HEADINGS:
+                unwrapped = level
+                continue
+            level = min(level + (0 if unwrapped is not None else 1), 6)
+            out.write(f"\n{'#' * level} {text}\n")
+            headings.append([level, text])
+            fresh = True
+            continue
+        if skip is not None:
+            continue
+        if not in_code and (not line.strip() or _RULE.match(line)):
+            pending.append(line)
+            continue
+
+        if fresh:
+            out.write("\n")
+            pending = []
+            fresh = False
+        for held in pending:
+            out.write(held + "\n")
+        pending = []
+        out.write(line + "\n")
+        words += len(line.split())
+    return headings, words
+
+
+def _anchor(text: str, seen: dict[str, int]) -> str:
+    """GitHub/pandoc-style heading id, with ``-1``, ``-2``... for repeats."""
+    slug = _ANCHOR_DROP.sub("", text.strip().lower()).replace(" ", "-")
+    count = seen.get(slug, 0)
+    seen[slug] = count + 1
+    return slug if count == 0 else f"{slug}-{count}"
+
+
+def table_of_contents(title: str, sections: list[tuple[int, list[list]]]) -> str:
+    """Build the table of contents from ``(section number, headings)`` pairs."""
+    seen: dict[str, int] = {}
+    _anchor(title, seen)
+    _anchor("Table of Contents", seen)
+    lines = ["## Table of Contents", ""]
+    for number, headings in sections:
+        for level, text in headings:
+            anchor = _anchor(text, seen)
+            if level == 2:
+                lines.append(f"{number}. [{text}](#{anchor})")
+            elif level <= TOC_DEPTH:
+                lines.append(f"{'   ' * (level - 2)}- [{text}](#{anchor})")
+    return "\n".join(lines) + "\n"
+
+
+def plan_title(plan_file: Path, default: str) -> str:
+    """Return the document name from the plan's ``# Document Plan: <name>`` heading."""
+    with open(plan_file, "r", encoding="utf-8", errors="replace") as f:
+        for line in f:
+            if line.startswith("# "):
+                title = line[2:].strip()
+                return title.split(":", 1)[1].strip() if ":" in title else title
+    return default
+
+
+def check_sections(sections: list[Section], sections_dir: Path) -> list[str]:
+    """Return one problem per section that has not passed or has no draft."""
+    problems = []
+    for section in sections:
+        if not section.passed:
+            problems.append(f"{section.title}: status is {section.status or 'unknown'}, not Passed")
+        elif not (sections_dir / section_filename(section.name)).is_file():
+            problems.append(
+                f"{section.title}: draft not found (sections/{section_filename(section.name)})"
+            )
+    return problems
+
+
+class AssemblyCache:
+    """Per-section digests, headings and word counts of one initiative's rendered chunks."""
+
+    def __init__(self, root: Path, initiative: str):
+        self.root = root
+        self.chunks = root / CHUNKS_DIR / initiative
+        self.path = self.chunks / ASSEMBLY_CACHE
+        self.sections_dir = root / INITIATIVES / initiative / "sections"
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                raise ValueError("assembly cache version mismatch")
+        except (OSError, ValueError):
+            data = {"version": CACHE_VERSION, "sections": {}, "output": None}
+        self.entry = data
+
+    def save(self) -> None:
+        """Write the cache atomically (a lost race only costs a re-render)."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self.entry, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # read-only workspace: every section is re-rendered next time
+
+    def chunk(self, section: Section) -> tuple[Path, dict, bool]:
+        """Return the chunk file and cache record of ``section``, rendering it if its draft changed."""
+        filename = section_filename(section.name)
+        draft = self.sections_dir / filename
+        chunk = self.chunks / filename
+        record = self.entry["sections"].get(filename)
+        stat = draft.stat()
+        if record and record["name"] == section.name and chunk.is_file():
+            if (record["mtime_ns"], record["size"]) == (stat.st_mtime_ns, stat.st_size):
+                return chunk, record, False
+            with open(draft, "rb") as f:
+                digest = hashlib.file_digest(f, "sha256").hexdigest()
+            if digest == record["sha256"]:
+                record.update(mtime_ns=stat.st_mtime_ns)
+                return chunk, record, False
+
+        project_cache(self.root)
+        self.chunks.mkdir(parents=True, exist_ok=True)
+        tmp = chunk.with_name(f".{chunk.name}.{os.getpid()}.tmp")
+        sha = hashlib.sha256()
+        with open(draft, "rb") as source, open(tmp, "w", encoding="utf-8") as out:
+            stat = os.fstat(source.fileno())
+
+            def lines():
+                for raw in source:
+                    sha.update(raw)
+                    yield raw.decode("utf-8", "replace")
+
+            headings, words = render_section(lines(), out, section.name)
+        os.replace(tmp, chunk)
+        record = self.entry["sections"][filename] = {
+            "name": section.name,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha.hexdigest(),
+            "headings": headings,
+            "words": words,
+        }
+        return chunk, record, True
+
+    def prune(self, keep: set[str]) -> None:
+        """Forget sections that are no longer in the plan and delete their chunks."""
+        for filename in set(self.entry["sections"]) - keep:
+            del self.entry["sections"][filename]
+            try:
+                (self.chunks / filename).unlink()
+            except FileNotFoundError:
+                pass
+
+
+def _output_digest(title: str, initiative: str, records: list[dict]) -> str:
+    key = json.dumps(
+        [CACHE_VERSION, title, initiative, [(r["name"], r["sha256"]) for r in records]]
+    )
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def assemble_initiative(initiative: str, root: Path | None = None) -> Assembly:
+    """Assemble ``initiatives/<initiative>/sections`` into ``final/<initiative>.md``.
+
+    Raises ``ValueError`` listing every section that blocks assembly and
+    ``FileNotFoundError`` if the initiative has no plan.
+    """
+    root = Path(root) if root is not None else Path.cwd()
+    folder = root / INITIATIVES / initiative
+    plan_file = folder / "plan.md"
+    plan = load_plan(plan_file)
+    if not plan.sections:
+        raise ValueError("plan.md lists no sections")
+    problems = check_sections(plan.sections, folder / "sections")
+    if problems:
+        raise ValueError("\n".join(problems))
+
+    title = plan_title(plan_file, initiative)
+    output = folder / "final" / f"{initiative}.md"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(output):
+        cache = AssemblyCache(root, initiative)
+        chunks, records, assembled = [], [], []
+        for section in plan.sections:
+            chunk, record, rendered = cache.chunk(section)
+            chunks.append(chunk)
+            records.append(record)
+            draft = folder / "sections" / section_filename(section.name)
+            assembled.append(
+                AssembledSection(section.number, section.name, draft, record["words"], rendered)
+            )
+        cache.prune({section_filename(s.name) for s in plan.sections})
+
+        digest = _output_digest(title, initiative, records)
+        previous = cache.entry["output"]
+        try:
+            stat = output.stat()
+            current = previous and previous["digest"] == digest
+            current = current and (previous["mtime_ns"], previous["size"]) == (
+                stat.st_mtime_ns,
+                stat.st_size,
+            )
+        except FileNotFoundError:
+            current = False
+
+        if not current:
+            toc = table_of_contents(
+                title, [(s.number, r["headings"]) for s, r in zip(plan.sections, records)]
+            )
+            header = (
+                f"---\ntitle: {json.dumps(title, ensure_ascii=False)}\n"
+                f"initiative: {json.dumps(initiative)}\nstatus: draft\n---\n\n"
+                f"# {title}\n\n{toc}"
+            )
+            with atomic_writer(output) as f:
+                f.write(header.encode("utf-8"))
+                for chunk in chunks:
+                    f.write(b"\n---\n\n")
+                    with open(chunk, "rb") as part:
+                        shutil.copyfileobj(part, f)
+            stat = output.stat()
+            cache.entry["output"] = {
+                "digest": digest,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+            }
+        cache.save()
+
+    scans, _ = scan_markdown(chunks, root=root)
+    names = {str(chunk): section.name for chunk, section in zip(chunks, plan.sections)}
+    unresolved = {}
+    for scan in scans:
+        count = sum(1 for m in scan.markers if m.kind in (PLACEHOLDER, CLARIFICATION))
+        if count:
+            unresolved[names[scan.path]] = count
+    return Assembly(output, assembled, not current, unresolved)
@@ -0,0 +1,211 @@
+"""Provision many NUAA project workspaces at once (``nuaa init --batch``).
+
+Each distinct (agent, script) template is prepared once, whether rendered from
+the bundled kit, read from ``--template-source`` or downloaded from the release,
+and the per-project work (write files with their modes, ``git init``) fans out
+over a thread pool that reports into a single StepTracker.
+"""
+
+import csv
+import json
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, NamedTuple
+
+import httpx
+
+from .bundle import resolve_template_source
+from .cache import TemplateCache
+from .config import AGENT_CONFIG, SCRIPT_TYPE_CHOICES
+from .download import (
+    download_asset,
+    extract_template_archive,
+    fetch_asset_into_cache,
+    fetch_release,
+    find_template_asset,
+    verify_asset_digest,
+)
+from .render import kit_version, package_files, write_package
+from .system import init_git_repo, is_git_repo
+from .ui import StepTracker
+from .upgrade import archive_package, package_bytes, record_install
+
+
+class BatchProject(NamedTuple):
+    path: Path
+    ai: str
+    script: str
+
+
+def load_manifest(
+    manifest: Path, default_ai: str | None = None, default_script: str | None = None
+) -> list[BatchProject]:
+    """Read ``path``, ``ai`` and ``script`` entries from a CSV or JSON manifest.
+
+    CSV files need a header row; JSON is a list of objects (or ``{"projects": [...]}``).
+    ``ai`` and ``script`` fall back to the defaults given on the command line, and
+    relative paths are resolved against the manifest's directory. Raises ValueError
+    listing every invalid row.
+    """
+    text = manifest.read_text(encoding="utf-8")
+    if manifest.suffix.lower() == ".json":
+        data = json.loads(text)
+        rows = data.get("projects", []) if isinstance(data, dict) else data
+    else:
+        rows = list(csv.DictReader(line for line in text.splitlines() if line.strip()))
+
+    base = manifest.resolve().parent
+    projects: list[BatchProject] = []
+    errors: list[str] = []
+    seen: set[Path] = set()
+    for number, row in enumerate(rows, start=1):
+        row = {str(k).strip().lower(): str(v or "").strip() for k, v in row.items() if k}
+        path_value = row.get("path", "")
+        ai = row.get("ai") or default_ai or ""
+        script = row.get("script") or default_script or ""
+        if not path_value:
+            errors.append(f"entry {number}: missing path")
+            continue
+        path = (base / path_value).resolve()
+        if ai not in AGENT_CONFIG:
+            errors.append(f"entry {number} ({path_value}): unknown AI assistant '{ai}'")
+        if script not in SCRIPT_TYPE_CHOICES:
+            errors.append(f"entry {number} ({path_value}): unknown script type '{script}'")
+        if path in seen:
+            errors.append(f"entry {number} ({path_value}): duplicate path")
+        elif path.exists():
+            errors.append(f"entry {number} ({path_value}): directory already exists")
+        seen.add(path)
+        projects.append(BatchProject(path, ai, script))
+
+    if errors:
+        raise ValueError("\n".join(errors))
+    if not projects:
+        raise ValueError(f"{manifest} lists no projects")
+    return projects
+
+
+def prepare_templates(
+    pairs: list[tuple[str, str]],
+    work_dir: Path,
+    *,
+    template_source: str | None = None,
+    client: httpx.Client | None = None,
+    cache: TemplateCache | None = None,
+    github_token: str | None = None,
+    debug: bool = False,
+) -> tuple[dict[tuple[str, str], Callable[[Path], None]], str]:
+    """Prepare each (agent, script) template once; returns (installer per pair, summary).
+
+    Without ``template_source`` or ``client`` the templates are rendered from the
+    bundled kit. With ``client`` the release is looked up once and each distinct
+    asset is downloaded (or taken from ``cache``) once, into ``work_dir`` when uncached.
+    """
+    installers: dict[tuple[str, str], Callable[[Path], None]] = {}
+
+    def from_archive(zip_path: Path, release: str, ai: str, script: str) -> Callable[[Path], None]:
+        template = archive_package(zip_path)
+
+        def install(dest: Path) -> None:
+            extract_template_archive(zip_path, dest, verbose=False)
+            record_install(dest, template, release=release, ai=ai, script=script)
+
+        return install
+
+    if template_source:
+        for ai, script in pairs:
+            zip_path, meta = resolve_template_source(template_source, ai, script, work_dir)
+            installers[(ai, script)] = from_archive(zip_path, meta["release"], ai, script)
+        return installers, f"{len(pairs)} from {template_source}"
+
+    if client is None:
+        version = kit_version()
+        for ai, script in pairs:
+            files = package_files(ai, script, version=version)
+            template = package_bytes(files)
+
+            def install(dest: Path, files=files, template=template, ai=ai, script=script) -> None:
+                dest.mkdir(parents=True)
+                write_package(files, dest)
+                record_install(dest, template, release=version, ai=ai, script=script)
+
+            installers[(ai, script)] = install
+        return installers, f"{len(pairs)} rendered locally"
+
+    release = fetch_release(client, github_token=github_token, cache=cache, debug=debug)
+    tag = release["tag_name"]
+    downloaded = cached = 0
+    for ai, script in pairs:
+        asset = find_template_asset(release.get("assets", []), ai, script)
+        if asset is None:
+            raise RuntimeError(f"Release {tag} has no asset for {ai}/{script}")
+        if cache:
+            zip_path, was_cached = fetch_asset_into_cache(
+                client,
+                cache,
+                tag,
+                asset,
+                show_progress=False,
+                github_token=github_token,
+                debug=debug,
+            )
+        else:
+            zip_path, was_cached = work_dir / asset["name"], False
+            sha256 = download_asset(
+                client,
+                asset["browser_download_url"],
+                zip_path,
+                show_progress=False,
+                github_token=github_token,
+                debug=debug,
+            )
+            verify_asset_digest(asset, sha256)
+        cached += was_cached
+        downloaded += not was_cached
+        installers[(ai, script)] = from_archive(zip_path, tag, ai, script)
+    return installers, f"release {tag}: {downloaded} downloaded, {cached} cached"
+
+
+def provision_projects(
+    projects: list[BatchProject],
+    installers: dict[tuple[str, str], Callable[[Path], None]],
+    tracker: StepTracker,
+    *,
+    git: bool = True,
+    jobs: int | None = None,
+) -> list[tuple[BatchProject, str]]:
+    """Install every project in parallel; returns the (project, error) pairs that failed.
+
+    Each project is a tracker step keyed ``project:<n>``. A failed install removes the
+    half-written directory; a failed ``git init`` is reported but keeps the project.
+    """
+    failures: list[tuple[BatchProject, str]] = []
+
+    def provision(index: int, project: BatchProject) -> None:
+        key = f"project:{index}"
+        tracker.start(key, f"{project.ai}/{project.script}")
+        existed = project.path.exists()
+        try:
+            installers[(project.ai, project.script)](project.path)
+        except Exception as e:
+            if not existed and project.path.exists():
+                shutil.rmtree(project.path, ignore_errors=True)
+            tracker.error(key, str(e))
+            failures.append((project, str(e)))
+            return
+
+        detail = f"{project.ai}/{project.script}"
+        if git and not is_git_repo(project.path):
+            ok, error = init_git_repo(project.path, quiet=True)
+            if not ok:
+                tracker.error(key, f"{detail}, git init failed")
+                failures.append((project, error or "git init failed"))
+                return
+            detail += ", git initialized"
+        tracker.complete(key, detail)
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        for future in [pool.submit(provision, i, p) for i, p in enumerate(projects)]:
+            future.result()
+    return failures
@@ -0,0 +1,121 @@
+"""Offline template bundles and local template sources.
+
+A bundle is a zip holding every ``nuaa-template-<agent>-<script>-<version>.zip``
+asset of one release, stored uncompressed (the assets are already zips), plus a
+``nuaa-bundle.json`` manifest::
+
+    {"release": "v1.2.0", "assets": [{"name": ..., "size": ..., "sha256": ...}]}
+"""
+
+import json
+import os
+import re
+import shutil
+import zipfile
+from pathlib import Path
+from urllib.parse import urlparse
+from urllib.request import url2pathname
+
+BUNDLE_MANIFEST = "nuaa-bundle.json"
+BUNDLE_PREFIX = "nuaa-templates-"
+
+
+def bundle_filename(tag: str) -> str:
+    return f"{BUNDLE_PREFIX}{tag}.zip"
+
+
+def write_bundle(dest: Path, tag: str, archives: list[tuple[str, Path, str]]) -> Path:
+    """Write a bundle of (asset_name, path, sha256) archives atomically to ``dest``."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f"{dest.name}.{os.getpid()}.part")
+    manifest = {"release": tag, "assets": []}
+    try:
+        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_STORED) as zf:
+            for name, path, sha256 in archives:
+                zf.write(path, arcname=name)
+                manifest["assets"].append(
+                    {"name": name, "size": path.stat().st_size, "sha256": sha256}
+                )
+            zf.writestr(BUNDLE_MANIFEST, json.dumps(manifest, indent=2))
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return dest
+
+
+def _version_key(name: str) -> tuple[int, ...]:
+    return tuple(int(n) for n in re.findall(r"\d+", name))
+
+
+def _release_from_name(name: str, pattern: str) -> str:
+    """Derive the release tag from an asset name such as nuaa-template-claude-sh-v1.2.0.zip."""
+    suffix = name[len(pattern) :].removesuffix(".zip").lstrip("-")
+    return suffix or "local"
+
+
+def source_path(source: str) -> Path:
+    """Convert a --template-source value (path or file:// URL) to a local path."""
+    if source.startswith("file:"):
+        parsed = urlparse(source)
+        return Path(url2pathname(parsed.path))
+    return Path(source).expanduser()
+
+
+def resolve_template_source(
+    source: str, ai_assistant: str, script_type: str, work_dir: Path
+) -> tuple[Path, dict]:
+    """Locate the template archive for an agent/script pair without touching the network.
+
+    ``source`` may be a template zip, an offline bundle, a directory (or file:// mirror)
+    of release assets, or a directory containing a bundle. Returns (zip_path, metadata)
+    in the same shape as ``download_template_from_github``. ``metadata["local"]`` is
+    True when ``zip_path`` is the user's own file and must not be deleted.
+    """
+    pattern = f"nuaa-template-{ai_assistant}-{script_type}"
+    path = source_path(source)
+
+    if path.is_dir():
+        candidates = sorted(path.glob(f"{pattern}*.zip"), key=lambda p: _version_key(p.name))
+        if candidates:
+            path = candidates[-1]
+        else:
+            bundles = sorted(path.glob(f"{BUNDLE_PREFIX}*.zip"), key=lambda p: _version_key(p.name))
+            if not bundles:
+                raise FileNotFoundError(f"No asset matching '{pattern}*.zip' or bundle in {path}")
+            path = bundles[-1]
+
+    if not path.is_file():
+        raise FileNotFoundError(f"Template source not found: {source}")
+
+    with zipfile.ZipFile(path) as zf:
+        if BUNDLE_MANIFEST in zf.namelist():
+            manifest = json.loads(zf.read(BUNDLE_MANIFEST))
+            member = next(
+                (a for a in manifest.get("assets", []) if a["name"].startswith(pattern)), None
+            )
+            if member is None:
+                available = ", ".join(a["name"] for a in manifest.get("assets", []))
+                raise FileNotFoundError(
+                    f"Bundle {path.name} has no asset matching '{pattern}' (available: {available or 'none'})"
+                )
+            work_dir.mkdir(parents=True, exist_ok=True)
+            extracted = work_dir / member["name"]
+            with zf.open(member["name"]) as src, open(extracted, "wb") as out:
+                shutil.copyfileobj(src, out)
+            return extracted, {
+                "filename": member["name"],
+                "size": member.get("size", extracted.stat().st_size),
+                "release": manifest.get("release", "local"),
+                "asset_url": path.resolve().as_uri(),
+                "cached": False,
+                "local": False,
+            }
+
+    return path, {
+        "filename": path.name,
+        "size": path.stat().st_size,
+        "release": _release_from_name(path.name, pattern),
+        "asset_url": path.resolve().as_uri(),
+        "cached": False,
+        "local": True,
+    }
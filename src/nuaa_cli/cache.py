@@ -0,0 +1,294 @@
+"""Persistent, content-addressed cache for NUAA release template archives.
+
+Layout under the user cache directory (``NUAA_CACHE_DIR`` overrides it)::
+
+    templates/
+        index.json          release metadata (ETag, fetch time) and (tag, asset) -> blob entries
+        blobs/<sha256>      archive bytes, stored once per unique content
+        tmp/                in-flight (resumable) downloads, moved into blobs/ when done
+    compiled-templates/
+        <key>.json          compiled scaffold templates per templates directory (templating.py)
+
+Blobs are immutable and named by their SHA-256, so concurrent writers can only
+ever race to store identical bytes. Every read-modify-write of the index holds
+the index's file lock and replaces the file atomically, so concurrent processes
+and threads (``init --batch``) never drop each other's entries.
+
+Release metadata (tag, publish date, asset list) is served without contacting
+GitHub for ``NUAA_RELEASE_TTL`` seconds after it was fetched or revalidated.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+from .locks import file_lock
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+DEFAULT_RELEASE_TTL = 3600
+INDEX_VERSION = 1
+
+# Release JSON fields the CLI reads; everything else is dropped before caching
+RELEASE_FIELDS = ("tag_name", "name", "published_at", "html_url")
+ASSET_FIELDS = ("name", "size", "browser_download_url", "digest")
+
+
+def cache_root() -> Path:
+    """Return the NUAA CLI cache directory (``NUAA_CACHE_DIR`` takes precedence)."""
+    override = os.getenv("NUAA_CACHE_DIR")
+    if override:
+        return Path(override)
+    from platformdirs import user_cache_dir
+
+    return Path(user_cache_dir("nuaa-cli", appauthor=False))
+
+
+def release_ttl() -> float:
+    """Return how long cached release metadata stays fresh (``NUAA_RELEASE_TTL`` seconds)."""
+    try:
+        return max(0.0, float(os.getenv("NUAA_RELEASE_TTL", DEFAULT_RELEASE_TTL)))
+    except ValueError:
+        return float(DEFAULT_RELEASE_TTL)
+
+
+def slim_release(data: dict) -> dict:
+    """Reduce a releases API response to the fields the CLI uses."""
+    release = {k: data[k] for k in RELEASE_FIELDS if k in data}
+    release["assets"] = [
+        {k: asset[k] for k in ASSET_FIELDS if k in asset} for asset in data.get("assets", [])
+    ]
+    return release
+
+
+def sha256_file(path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """Return the hex SHA-256 digest of a file, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class TemplateCache:
+    """Template archives keyed by (release tag, asset name), stored by SHA-256 and evicted LRU."""
+
+    def __init__(self, root: Path | None = None, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.root = Path(root) if root is not None else cache_root() / "templates"
+        self.blobs_dir = self.root / "blobs"
+        self.tmp_dir = self.root / "tmp"
+        self.index_path = self.root / "index.json"
+        self.max_bytes = max_bytes
+
+    # ------------------------------
+    # Index persistence
+    # ------------------------------
+
+    def _load(self) -> dict:
+        try:
+            with open(self.index_path, "r", encoding="utf-8") as f:
+                index = json.load(f)
+            if index.get("version") == INDEX_VERSION:
+                return index
+        except (FileNotFoundError, json.JSONDecodeError, OSError):
+            pass
+        return {"version": INDEX_VERSION, "releases": {}, "entries": {}}
+
+    def _save(self, index: dict) -> None:
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_name(
+            f"{self.index_path.name}.{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp, self.index_path)
+
+    @staticmethod
+    def _key(tag: str, asset_name: str) -> str:
+        return f"{tag}/{asset_name}"
+
+    # ------------------------------
+    # Release metadata (conditional requests)
+    # ------------------------------
+
+    def release(self, url: str) -> tuple[str | None, dict | None]:
+        """Return the cached (etag, release JSON) for a releases API URL."""
+        entry = self.release_entry(url)
+        if not entry:
+            return None, None
+        return entry.get("etag"), entry.get("data")
+
+    def release_entry(self, url: str) -> dict | None:
+        """Return the cached ``{"etag", "data", "fetched_at"}`` entry for a releases API URL."""
+        entry = self._load()["releases"].get(url)
+        return entry if entry and entry.get("data") is not None else None
+
+    def release_age(self, url: str) -> float | None:
+        """Seconds since the release metadata was fetched or revalidated, or None if uncached."""
+        entry = self.release_entry(url)
+        if entry is None:
+            return None
+        return max(0.0, time.time() - entry.get("fetched_at", 0))
+
+    def store_release(self, url: str, etag: str | None, data: dict) -> None:
+        """Remember the release metadata (and its ETag, for conditional requests)."""
+        with file_lock(self.index_path):
+            index = self._load()
+            index["releases"][url] = {
+                "etag": etag,
+                "data": slim_release(data),
+                "fetched_at": time.time(),
+            }
+            self._save(index)
+
+    def touch_release(self, url: str) -> None:
+        """Mark cached release metadata as revalidated now (after a 304)."""
+        with file_lock(self.index_path):
+            index = self._load()
+            entry = index["releases"].get(url)
+            if entry:
+                entry["fetched_at"] = time.time()
+                self._save(index)
+
+    # ------------------------------
+    # Archive blobs
+    # ------------------------------
+
+    def lookup(self, tag: str, asset_name: str) -> Path | None:
+        """Return the cached archive for (tag, asset) and mark it recently used, or None."""
+        if not self._load()["entries"].get(self._key(tag, asset_name)):
+            return None
+        with file_lock(self.index_path):
+            index = self._load()
+            entry = index["entries"].get(self._key(tag, asset_name))
+            if not entry:
+                return None
+            blob = self.blobs_dir / entry["sha256"]
+            if not blob.is_file() or blob.stat().st_size != entry.get("size"):
+                del index["entries"][self._key(tag, asset_name)]
+                self._save(index)
+                return None
+            entry["last_used"] = time.time()
+            self._save(index)
+        return blob
+
+    def staging_path(self, asset_name: str, tag: str = "") -> Path:
+        """Return the temp path inside the cache for an in-flight download.
+
+        The name is stable per (tag, asset) so an interrupted download can be resumed
+        by a later run.
+        """
+        self.tmp_dir.mkdir(parents=True, exist_ok=True)
+        prefix = f"{tag}--" if tag else ""
+        return self.tmp_dir / f"{prefix}{asset_name}.part"
+
+    def add(self, tag: str, asset_name: str, path: Path, sha256: str | None = None) -> Path:
+        """Move a downloaded archive into the cache and index it; returns the blob path.
+
+        A given ``sha256`` must come from the bytes of ``path`` (callers hold the
+        staging file's lock). ``path`` may already be gone if the blob was stored
+        by another run.
+        """
+        digest = sha256 or sha256_file(path)
+        self.blobs_dir.mkdir(parents=True, exist_ok=True)
+        blob = self.blobs_dir / digest
+        if blob.exists():
+            path.unlink(missing_ok=True)
+        else:
+            try:
+                os.replace(path, blob)
+            except FileNotFoundError:
+                if not blob.is_file():
+                    raise
+
+        with file_lock(self.index_path):
+            index = self._load()
+            index["entries"][self._key(tag, asset_name)] = {
+                "sha256": digest,
+                "size": blob.stat().st_size,
+                "last_used": time.time(),
+            }
+            self._evict(index, keep=self._key(tag, asset_name))
+            self._save(index)
+        return blob
+
+    def evict(self) -> list[str]:
+        """Evict least-recently-used entries until the cache fits in max_bytes."""
+        with file_lock(self.index_path):
+            index = self._load()
+            removed = self._evict(index)
+            if removed:
+                self._save(index)
+        return removed
+
+    def _evict(self, index: dict, keep: str | None = None) -> list[str]:
+        entries = index["entries"]
+        blob_sizes = {e["sha256"]: e.get("size", 0) for e in entries.values()}
+        total = sum(blob_sizes.values())
+        removed: list[str] = []
+        for key, entry in sorted(entries.items(), key=lambda kv: kv[1].get("last_used", 0)):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            del entries[key]
+            removed.append(key)
+            digest = entry["sha256"]
+            if any(e["sha256"] == digest for e in entries.values()):
+                continue
+            total -= blob_sizes.get(digest, 0)
+            (self.blobs_dir / digest).unlink(missing_ok=True)
+        return removed
+
+
+class FileStore:
+    """Content-addressed copies of installed template files (the merge base for ``nuaa upgrade``).
+
+    Each project keeps its own store under ``.nuaa/cache/merge-bases/``, holding
+    one file per SHA-256 listed in its install manifest; ``prune`` drops the rest
+    after every install, so the store never outgrows the installed template.
+    """
+
+    def __init__(self, root: Path):
+        self.root = Path(root)
+
+    def get(self, sha256: str) -> bytes | None:
+        """Return the stored bytes for a digest, or None if they were never stored."""
+        try:
+            return (self.root / sha256).read_bytes()
+        except OSError:
+            return None
+
+    def put(self, data: bytes) -> str:
+        """Store ``data`` (if not already present) and return its SHA-256."""
+        digest = hashlib.sha256(data).hexdigest()
+        blob = self.root / digest
+        if blob.exists():
+            return digest
+        try:
+            self.root.mkdir(parents=True, exist_ok=True)
+            tmp = blob.with_name(f"{digest}.{os.getpid()}.tmp")
+            tmp.write_bytes(data)
+            os.replace(tmp, blob)
+        except OSError:
+            pass  # a missing merge base only means upgrade reports a conflict
+        return digest
+
+    def prune(self, keep: set[str]) -> int:
+        """Delete stored files whose digest is not in ``keep``; returns how many were removed."""
+        removed = 0
+        try:
+            blobs = list(self.root.iterdir())
+        except OSError:
+            return 0
+        for blob in blobs:
+            if blob.name in keep:
+                continue
+            try:
+                blob.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
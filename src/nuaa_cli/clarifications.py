@@ -0,0 +1,157 @@
+"""Find and resolve ``[NEEDS CLARIFICATION: ...]`` markers in specifications.
+
+Answers are applied in a single pass: the document is rebuilt from the text
+between the marker spans and the answers, whatever the number of markers.
+
+``nuaa clarify --answers`` reads answers from a file so specifications can be
+resolved without prompts. JSON Lines files hold one object per line::
+
+    {"initiative": "001-naloxone", "question": "What age range?", "answer": "18+"}
+    {"index": 2, "answer": "Ongoing service"}
+
+A marker is identified by its ``question`` text or by its 1-based ``index`` in
+the spec; ``initiative`` is optional and defaults to the initiative given on the
+command line. YAML files (which need PyYAML) hold the same records as a list, or
+a mapping of question or index to answer, optionally nested under initiative
+names::
+
+    001-naloxone:
+      What age range?: All adults (18+)
+      2: Ongoing service
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+_MARKER = re.compile(r"\[NEEDS CLARIFICATION: ([^\]]+)\]")
+
+
+class Clarification(NamedTuple):
+    index: int  # 1-based position in the document
+    question: str
+    start: int
+    end: int
+
+
+class AnswerMatch(NamedTuple):
+    answers: dict[int, str]  # clarification index -> answer
+    unused: list[str | int]  # keys that matched no marker
+
+
+def find_clarifications(text: str) -> list[Clarification]:
+    """Return the clarification markers of ``text`` in document order."""
+    return [
+        Clarification(i, match.group(1).strip(), match.start(), match.end())
+        for i, match in enumerate(_MARKER.finditer(text), start=1)
+    ]
+
+
+def apply_answers(text: str, clarifications: list[Clarification], answers: dict[int, str]) -> str:
+    """Replace the answered markers of ``text`` in one pass over their spans."""
+    parts = []
+    position = 0
+    for item in clarifications:
+        if item.index in answers:
+            parts.append(text[position : item.start])
+            parts.append(answers[item.index])
+            position = item.end
+    parts.append(text[position:])
+    return "".join(parts)
+
+
+def match_answers(clarifications: list[Clarification], answers: dict) -> AnswerMatch:
+    """Map answers keyed by marker index (int) or question text (str) to marker indexes.
+
+    An answer keyed by question text resolves every marker asking that question.
+    """
+    by_question: dict[str, list[int]] = {}
+    for item in clarifications:
+        by_question.setdefault(item.question, []).append(item.index)
+    resolved: dict[int, str] = {}
+    unused: list[str | int] = []
+    for key, answer in answers.items():
+        if isinstance(key, int):
+            indexes = [key] if 1 <= key <= len(clarifications) else []
+        else:
+            indexes = by_question.get(key.strip(), [])
+        if not indexes:
+            unused.append(key)
+        for index in indexes:
+            resolved.setdefault(index, answer)
+    return AnswerMatch(resolved, unused)
+
+
+def _records_from_mapping(mapping: dict, initiative: str | None = None) -> list[dict]:
+    records = []
+    for key, value in mapping.items():
+        if isinstance(value, dict) and initiative is None:
+            records.extend(_records_from_mapping(value, str(key)))
+        else:
+            field = "index" if isinstance(key, int) else "question"
+            records.append({"initiative": initiative, field: key, "answer": value})
+    return records
+
+
+def _read_records(path: Path) -> list:
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        records = []
+        for number, line in enumerate(text.splitlines(), start=1):
+            if line.strip():
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"line {number}: invalid JSON ({e.msg})") from None
+        return records
+    if path.suffix.lower() in (".yaml", ".yml"):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError(
+                "reading YAML answer files requires PyYAML (pip install pyyaml); "
+                "use a .jsonl file instead"
+            ) from None
+        try:
+            data = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"invalid YAML ({e})") from None
+        if isinstance(data, dict):
+            return _records_from_mapping(data)
+        if isinstance(data, list):
+            return data
+        raise ValueError("expected a list of answers or a mapping of questions to answers")
+    raise ValueError(f"unsupported answer file type '{path.suffix}' (use .yaml, .yml or .jsonl)")
+
+
+def load_answers(path: Path) -> dict[str | None, dict[str | int, str]]:
+    """Read an answer file into ``{initiative or None: {index or question: answer}}``.
+
+    Raises ValueError listing every invalid entry.
+    """
+    answers: dict[str | None, dict[str | int, str]] = {}
+    errors: list[str] = []
+    for number, record in enumerate(_read_records(path), start=1):
+        if not isinstance(record, dict):
+            errors.append(f"entry {number}: expected an object")
+            continue
+        index, question = record.get("index"), record.get("question")
+        if isinstance(index, bool) or (index is not None and not isinstance(index, int)):
+            errors.append(f"entry {number}: index must be a number")
+            continue
+        if (index is None) == (question is None or not str(question).strip()):
+            errors.append(f"entry {number}: give exactly one of question or index")
+            continue
+        if record.get("answer") is None or not str(record["answer"]).strip():
+            errors.append(f"entry {number}: missing answer")
+            continue
+        initiative = record.get("initiative") or None
+        key = index if index is not None else str(question).strip()
+        answers.setdefault(initiative, {})[key] = str(record["answer"]).strip()
+
+    if errors:
+        raise ValueError("\n".join(errors))
+    if not answers:
+        raise ValueError(f"{path} contains no answers")
+    return answers
@@ -0,0 +1,62 @@
+"""Registry of NUAA CLI subcommands.
+
+Each command lives in its own module and is imported only when it is invoked
+(or when help needs its docstring), so running one command never pays for the
+imports of another. Register new commands in ``COMMANDS`` in the order they
+should appear in ``nuaa --help``.
+"""
+
+import importlib
+
+import click
+
+# CLI name -> (module under nuaa_cli.commands, attribute name)
+COMMANDS: dict[str, tuple[str, str]] = {
+    "init": ("init", "init"),
+    "check": ("check", "check"),
+    "templates": ("templates", "templates_app"),
+    "upgrade": ("upgrade", "upgrade"),
+    "design": ("design", "design"),
+    "propose": ("propose", "propose"),
+    "measure": ("measure", "measure"),
+    "document": ("document", "document"),
+    "report": ("report", "report"),
+    "refine": ("refine", "refine"),
+    "mission": ("mission", "mission"),
+    "specify": ("specify", "specify"),
+    "clarify": ("clarify", "clarify"),
+    "plan": ("plan", "plan"),
+    "gate-check": ("gate_check", "gate_check"),
+    "status": ("status", "status"),
+    "inventory": ("inventory", "inventory"),
+    "schedule": ("schedule", "schedule"),
+    "draft": ("draft", "draft"),
+    "revise": ("revise", "revise"),
+    "assemble": ("assemble", "assemble"),
+    "review": ("review", "review"),
+    "lint": ("lint", "lint_app"),
+    "export": ("export", "export"),
+    "version": ("version", "version"),
+}
+
+
+def load_command(name: str) -> click.Command:
+    """Import the module backing ``name`` and build its click command.
+
+    A module attribute may be a plain function (registered as a single
+    command) or a ``typer.Typer`` instance (registered as a command group).
+    """
+    import typer
+
+    module_name, attr = COMMANDS[name]
+    module = importlib.import_module(f"{__name__}.{module_name}")
+    target = getattr(module, attr)
+
+    if isinstance(target, typer.Typer):
+        command = typer.main.get_command(target)
+    else:
+        single = typer.Typer(add_completion=False)
+        single.command(name=name)(target)
+        command = typer.main.get_command(single)
+    command.name = name
+    return command
@@ -0,0 +1,141 @@
+"""Assemble validated sections into a final document."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.markup import escape
+from rich.panel import Panel
+from rich.table import Table
+
+from ..assembly import Assembly, assemble_initiative
+from ..ui import console, show_banner
+from ..workspace import latest_initiative, record_initiative
+
+
+def assemble(
+    initiative: Optional[str] = typer.Argument(
+        None, help="Initiative to assemble (uses most recent if not specified)"
+    ),
+    output_format: str = typer.Option(
+        "markdown", "--format", help="Output format: markdown, docx, pdf, html"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the assembly result as JSON"),
+):
+    """
+    Assemble validated sections into final document.
+
+    Sections are streamed from sections/ into final/<initiative>.md in plan.md
+    order, under a generated table of contents. Every section must have the
+    status Passed. Drafts that did not change since the last assembly are not
+    re-rendered.
+
+    Examples:
+        nuaa assemble
+        nuaa assemble 001-naloxone-distribution --format docx
+    """
+    if not as_json:
+        show_banner()
+
+    # Determine initiative
+    if initiative is None:
+        initiatives_dir = Path("initiatives")
+        if not initiatives_dir.exists():
+            console.print("[red]Error: No initiatives directory found[/red]")
+            raise typer.Exit(1)
+
+        initiative = latest_initiative()
+        if initiative is None:
+            console.print("[red]Error: No initiatives found[/red]")
+            raise typer.Exit(1)
+
+    # Check plan exists
+    plan_file = Path(f"initiatives/{initiative}/plan.md")
+    if not plan_file.exists():
+        console.print(f"[red]Error: Plan not found: {plan_file}[/red]")
+        raise typer.Exit(1)
+
+    try:
+        result = assemble_initiative(initiative, root=Path("."))
+    except ValueError as e:
+        console.print(f"[red]Error: Cannot assemble {initiative}:[/red]")
+        for line in str(e).splitlines():
+            console.print(f"  [red]•[/red] {escape(line)}")
+        console.print("[yellow]Check progress with 'nuaa status'[/yellow]")
+        raise typer.Exit(1)
+    except OSError as e:
+        console.print(f"[red]Error assembling {initiative}: {escape(str(e))}[/red]")
+        raise typer.Exit(1)
+    record_initiative(initiative)
+
+    if as_json:
+        typer.echo(json.dumps(_assembly_json(initiative, result), indent=2, ensure_ascii=False))
+        return
+    _print_assembly(initiative, result, output_format)
+
+
+def _assembly_json(initiative: str, result: Assembly) -> dict:
+    return {
+        "initiative": initiative,
+        "output_file": str(result.output),
+        "written": result.written,
+        "words": sum(s.words for s in result.sections),
+        "sections": [
+            {
+                "number": s.number,
+                "name": s.name,
+                "draft": str(s.draft),
+                "words": s.words,
+                "rendered": s.rendered,
+            }
+            for s in result.sections
+        ],
+        "unresolved": result.unresolved,
+    }
+
+
+def _print_assembly(initiative: str, result: Assembly, output_format: str) -> None:
+    table = Table(title="Sections Assembled", show_header=True, header_style="bold")
+    table.add_column("#", justify="right")
+    table.add_column("Section", style="cyan")
+    table.add_column("Words", justify="right")
+    table.add_column("Chunk")
+    for s in result.sections:
+        table.add_row(
+            str(s.number),
+            escape(s.name),
+            f"{s.words:,}",
+            "[green]re-rendered[/green]" if s.rendered else "[dim]unchanged[/dim]",
+        )
+    console.print(table)
+
+    rendered = sum(s.rendered for s in result.sections)
+    words = sum(s.words for s in result.sections)
+    written = (
+        f"[green]✓[/green] Final document: [cyan]{result.output}[/cyan]"
+        if result.written
+        else f"[green]✓[/green] Final document up to date: [cyan]{result.output}[/cyan]"
+    )
+    next_steps = "  Run [cyan]nuaa review --action start[/cyan] to begin review"
+    if output_format.lower() not in ("markdown", "md"):
+        next_steps += (
+            f"\n  Run [cyan]nuaa export --format {escape(output_format)}[/cyan] to convert it"
+        )
+    console.print(
+        Panel(
+            f"[green]✓[/green] Initiative: [cyan]{initiative}[/cyan]\n"
+            f"{written}\n"
+            f"[green]✓[/green] {len(result.sections)} sections, {words:,} words "
+            f"({rendered} re-rendered)\n\n"
+            f"[bold]Next steps:[/bold]\n{next_steps}\n"
+            f"  Optionally have AI run [cyan]/nuaa.assemble[/cyan] to add transitions",
+            title="Assembly Complete",
+            border_style="green",
+        )
+    )
+    for name, count in result.unresolved.items():
+        console.print(
+            f"[yellow]⚠ {escape(name)} still has {count} placeholder or clarification "
+            "marker(s)[/yellow]"
+        )
@@ -0,0 +1,63 @@
+"""Check that required tools are installed."""
+
+from ..config import AGENT_CONFIG
+from ..releases import cached_latest_release, refresh_in_background
+from ..system import check_tool
+from ..ui import StepTracker, console, show_banner
+
+
+def check():
+    """Check that all required tools are installed."""
+    show_banner()
+    console.print("[bold]Checking for installed tools...[/bold]\n")
+
+    tracker = StepTracker("Check Available Tools")
+
+    tracker.add("git", "Git version control")
+    git_ok = check_tool("git", tracker=tracker)
+
+    cli_agent_results: dict[str, bool] = {}
+    has_ide_agent = False
+    for agent_key, agent_config in AGENT_CONFIG.items():
+        agent_name = agent_config["name"]
+        requires_cli = agent_config["requires_cli"]
+
+        tracker.add(agent_key, agent_name)
+
+        if requires_cli:
+            cli_agent_results[agent_key] = check_tool(agent_key, tracker=tracker)
+        else:
+            # IDE-based agent - skip CLI check and mark as optional
+            tracker.skip(agent_key, "IDE-based, no CLI check")
+            has_ide_agent = True
+
+    # Check VS Code variants (not in agent config)
+    tracker.add("code", "Visual Studio Code")
+    check_tool("code", tracker=tracker)
+
+    tracker.add("code-insiders", "Visual Studio Code Insiders")
+    check_tool("code-insiders", tracker=tracker)
+
+    console.print(tracker.render())
+
+    console.print("\n[bold green]NUAA CLI is ready to use![/bold green]")
+
+    # Never wait on GitHub here: report the cached release and refresh it in the background
+    release = cached_latest_release()
+    if release is None:
+        refresh_in_background()
+    elif release.get("tag_name"):
+        published = (release.get("published_at") or "")[:10]
+        suffix = f" (released {published})" if published else ""
+        console.print(f"[dim]Latest templates: {release['tag_name']}{suffix}[/dim]")
+
+    if not git_ok:
+        console.print("[dim]Tip: Install git for repository management[/dim]")
+
+    if not any(cli_agent_results.values()):
+        if has_ide_agent:
+            console.print(
+                "[dim]Tip: Install a CLI-based AI assistant if you need standalone workflows; IDE assistants are already supported.[/dim]"
+            )
+        else:
+            console.print("[dim]Tip: Install an AI assistant for the best experience[/dim]")
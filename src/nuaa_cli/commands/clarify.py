@@ -0,0 +1,217 @@
+"""Resolve clarification markers in a specification."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.markup import escape
+from rich.panel import Panel
+from rich.table import Table
+
+from ..clarifications import apply_answers, find_clarifications, load_answers, match_answers
+from ..locks import file_lock, write_atomic
+from ..ui import console, show_banner
+from ..workspace import latest_initiative
+
+
+def _clarify_spec(spec_path: Path, answers: dict) -> tuple[int, int, list]:
+    """Apply file answers to one spec under its lock; returns (resolved, remaining, unused)."""
+    with file_lock(spec_path):
+        content = spec_path.read_text(encoding="utf-8")
+        clarifications = find_clarifications(content)
+        matched = match_answers(clarifications, answers)
+        if matched.answers:
+            write_atomic(spec_path, apply_answers(content, clarifications, matched.answers))
+    return len(matched.answers), len(clarifications) - len(matched.answers), matched.unused
+
+
+def _clarify_from_file(initiative: Optional[str], answers_file: Path) -> None:
+    try:
+        answers = load_answers(answers_file)
+    except OSError as e:
+        console.print(f"[red]Error reading answer file: {e}[/red]")
+        raise typer.Exit(1)
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] Invalid answer file {answers_file}:")
+        for line in str(e).splitlines():
+            console.print(f"  [red]•[/red] {escape(line)}")
+        raise typer.Exit(1)
+
+    # Answers without an initiative go to the one named on the command line (or the
+    # most recent); naming an initiative there also limits the run to it.
+    unscoped = answers.pop(None, {})
+    if initiative is not None:
+        answers = {initiative: {**unscoped, **answers.get(initiative, {})}}
+    elif unscoped:
+        initiative = latest_initiative()
+        if initiative is None:
+            console.print("[red]Error: No initiatives found[/red]")
+            raise typer.Exit(1)
+        answers[initiative] = {**unscoped, **answers.get(initiative, {})}
+
+    table = Table(title="Clarifications", show_header=True, header_style="bold")
+    table.add_column("Initiative", style="cyan")
+    table.add_column("Resolved", justify="right")
+    table.add_column("Remaining", justify="right")
+    table.add_column("Unmatched answers")
+    resolved_total = updated = failed = 0
+    for name in sorted(answers):
+        spec_path = Path(f"initiatives/{name}/spec.md")
+        if not spec_path.exists():
+            table.add_row(escape(name), "-", "-", "[red]Specification not found[/red]")
+            failed += 1
+            continue
+        try:
+            resolved, remaining, unused = _clarify_spec(spec_path, answers[name])
+        except OSError as e:
+            table.add_row(escape(name), "-", "-", f"[red]{escape(str(e))}[/red]")
+            failed += 1
+            continue
+        resolved_total += resolved
+        updated += bool(resolved)
+        table.add_row(
+            escape(name),
+            f"[green]{resolved}[/green]",
+            f"[yellow]{remaining}[/yellow]" if remaining else "0",
+            escape(", ".join(str(key) for key in unused)) or "-",
+        )
+    console.print(table)
+    console.print(
+        f"Resolved [bold]{resolved_total}[/bold] clarification(s) in {updated} specification(s)"
+    )
+    if failed:
+        raise typer.Exit(1)
+
+
+def clarify(
+    initiative: Optional[str] = typer.Argument(
+        None,
+        help="Initiative to clarify (e.g., '001-naloxone-distribution'). If not provided, uses most recent.",
+    ),
+    answers_file: Optional[Path] = typer.Option(
+        None,
+        "--answers",
+        help="Apply answers from a .yaml or .jsonl file instead of asking",
+    ),
+):
+    """
+    Resolve ambiguities in a program specification through interactive questions.
+
+    With --answers, markers are resolved from a file without prompting. Each
+    entry names a marker by its question text or its number and may name an
+    initiative, so one file can resolve specs across many initiatives.
+
+    Examples:
+        nuaa clarify
+        nuaa clarify 001-naloxone-distribution --answers answers.yaml
+        nuaa clarify --answers answers.jsonl
+    """
+    show_banner()
+
+    if answers_file is not None:
+        _clarify_from_file(initiative, answers_file)
+        return
+
+    # Determine which initiative to clarify
+    if initiative is None:
+        # Find most recent initiative
+        initiatives_dir = Path("initiatives")
+        if not initiatives_dir.exists():
+            console.print("[red]Error: No initiatives directory found[/red]")
+            console.print(
+                '[yellow]Create an initiative first: nuaa specify "Program description"[/yellow]'
+            )
+            raise typer.Exit(1)
+
+        # Get all initiative directories
+        initiative_dirs = sorted([d for d in initiatives_dir.iterdir() if d.is_dir()], reverse=True)
+        if not initiative_dirs:
+            console.print("[red]Error: No initiatives found[/red]")
+            console.print(
+                '[yellow]Create an initiative first: nuaa specify "Program description"[/yellow]'
+            )
+            raise typer.Exit(1)
+
+        initiative = initiative_dirs[0].name
+        console.print(f"[blue]Using most recent initiative: {initiative}[/blue]\n")
+
+    # Check if spec file exists
+    spec_path = Path(f"initiatives/{initiative}/spec.md")
+    if not spec_path.exists():
+        console.print(f"[red]Error: Specification not found: {spec_path}[/red]")
+        raise typer.Exit(1)
+
+    # Read spec file
+    try:
+        content = spec_path.read_text(encoding="utf-8")
+    except Exception as e:
+        console.print(f"[red]Error reading specification: {e}[/red]")
+        raise typer.Exit(1)
+
+    # Find all [NEEDS CLARIFICATION: ...] markers
+    matches = find_clarifications(content)
+
+    if not matches:
+        console.print(
+            Panel(
+                "[green]✓[/green] No ambiguities to clarify\n\n"
+                "The specification is ready for planning.\n\n"
+                "[bold]Next step:[/bold]\n"
+                "  Run [cyan]nuaa plan[/cyan] to create implementation plan",
+                title="Specification Clear",
+                border_style="green",
+            )
+        )
+        return
+
+    console.print(
+        Panel(
+            f"Found [yellow]{len(matches)}[/yellow] ambiguities to resolve\n\n"
+            "You'll be asked questions to clarify each ambiguity.\n"
+            "Your answers will be directly inserted into the specification.",
+            title="Clarification Process",
+            border_style="yellow",
+        )
+    )
+    console.print()
+
+    # For each marker, ask user
+    answers: dict[str, list[str]] = {}
+    for i, match in enumerate(matches, 1):
+        question = match.question
+
+        console.print(f"[bold cyan]Question {i} of {len(matches)}:[/bold cyan]")
+        console.print(f"[yellow]{question}[/yellow]\n")
+
+        answer = typer.prompt("Your answer")
+
+        answers.setdefault(question, []).append(answer)
+
+        console.print(f"[green]✓[/green] Recorded: {answer}\n")
+
+    # Write updated spec. The answers are applied to the spec as it is now, under
+    # its lock, so edits made while the questions were open are not lost: each
+    # marker takes the next answer given for its question.
+    try:
+        with file_lock(spec_path):
+            content = spec_path.read_text(encoding="utf-8")
+            current = find_clarifications(content)
+            resolved = {
+                item.index: answers[item.question].pop(0)
+                for item in current
+                if answers.get(item.question)
+            }
+            write_atomic(spec_path, apply_answers(content, current, resolved))
+        console.print(
+            Panel(
+                f"[green]✓[/green] Updated specification: [cyan]{spec_path}[/cyan]\n"
+                f"[green]✓[/green] All ambiguities resolved\n\n"
+                "[bold]Next step:[/bold]\n"
+                "  Run [cyan]nuaa plan[/cyan] to create implementation plan",
+                title="Clarification Complete",
+                border_style="green",
+            )
+        )
+    except Exception as e:
+        console.print(f"[red]Error writing specification: {e}[/red]")
+        raise typer.Exit(1)
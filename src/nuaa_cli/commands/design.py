@@ -0,0 +1,157 @@
+"""Scaffold a new program design."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.markup import escape
+from rich.panel import Panel
+from rich.table import Table
+
+from ..designs import (
+    DESIGN_FILES,
+    DesignProgram,
+    changelog_text,
+    design_feature_dir,
+    design_mapping,
+    load_design_templates,
+    load_programs,
+    render_design_file,
+    write_designs,
+)
+from ..scaffold import _load_compiled_template, _write_markdown
+from ..ui import console, show_banner
+
+
+def _design_batch(source: Path, force: bool, jobs: int | None) -> None:
+    """Scaffold every program listed in ``source`` and print one summary table."""
+    if not source.is_file():
+        console.print(f"[red]Error:[/red] Program list not found: {source}")
+        raise typer.Exit(1)
+    try:
+        programs = load_programs(source)
+    except (ValueError, OSError) as e:
+        console.print(
+            Panel(escape(str(e)), title="[red]Invalid Program List[/red]", border_style="red")
+        )
+        raise typer.Exit(1)
+    try:
+        templates = load_design_templates()
+    except FileNotFoundError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+
+    results = write_designs(programs, templates, force=force, jobs=jobs)
+
+    table = Table(
+        title=f"Program designs from {source.name}", show_header=True, header_style="bold"
+    )
+    table.add_column("Feature", style="cyan")
+    table.add_column("Program")
+    table.add_column("Written", justify="right")
+    table.add_column("Skipped", justify="right")
+    table.add_column("Result")
+    for result in results:
+        if result.error:
+            outcome = f"[red]{escape(result.error)}[/red]"
+        elif result.skipped:
+            outcome = f"[yellow]kept {escape(', '.join(result.skipped))}[/yellow]"
+        else:
+            outcome = "[green]ok[/green]"
+        table.add_row(
+            result.feature or "-",
+            escape(result.program.program),
+            str(len(result.written)),
+            str(len(result.skipped)),
+            outcome,
+        )
+    console.print(table)
+
+    failed = sum(1 for result in results if result.error)
+    written = sum(len(result.written) for result in results)
+    console.print(
+        f"{len(results) - failed} of {len(results)} program designs ready, "
+        f"{written} files written"
+    )
+    if failed:
+        raise typer.Exit(1)
+
+
+def design(
+    program_name: Optional[str] = typer.Argument(
+        None, help="Program name (used to derive feature folder)"
+    ),
+    target_population: Optional[str] = typer.Argument(None, help="Target population description"),
+    duration: Optional[str] = typer.Argument(None, help="Program duration (e.g., '6 months')"),
+    here: bool = typer.Option(True, help="Create under ./nuaa (current project)"),
+    feature: Optional[str] = typer.Option(
+        None, help="Override feature slug (e.g., '001-custom-slug')"
+    ),
+    force: bool = typer.Option(False, help="Overwrite existing files if present"),
+    from_file: Optional[Path] = typer.Option(
+        None,
+        "--from",
+        help="Scaffold every program in a CSV or JSONL file (program, population, duration, funder)",
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", min=1, help="Number of parallel writers with --from"
+    ),
+):
+    """Create a new NUAA program design with logic model and impact framework scaffolds.
+
+    With --from, every program listed in a CSV file (header row) or JSON Lines file
+    is scaffolded in one run, each into its own numbered feature folder.
+    """
+    show_banner()
+    if from_file is not None:
+        if program_name or target_population or duration or feature:
+            console.print(
+                "[red]Error:[/red] --from cannot be combined with a program, population, "
+                "duration or --feature"
+            )
+            raise typer.Exit(1)
+        _design_batch(from_file, force, jobs)
+        return
+    if not (program_name and target_population and duration):
+        console.print(
+            "[red]Error:[/red] PROGRAM_NAME, TARGET_POPULATION and DURATION are required "
+            "(or use --from programs.csv)"
+        )
+        raise typer.Exit(1)
+
+    # Determine feature directory
+    feature_dir, num_str, slug = design_feature_dir(program_name, feature)
+    created = datetime.now().strftime("%Y-%m-%d")
+    mapping = design_mapping(
+        DesignProgram(program_name, target_population, duration), num_str, slug, created
+    )
+
+    for name in DESIGN_FILES:
+        try:
+            text = render_design_file(name, _load_compiled_template(name), mapping)
+            dest = feature_dir / name
+            if not dest.exists() or force:
+                _write_markdown(dest, text)
+                console.print(f"[green]Created:[/green] {dest}")
+            else:
+                console.print(f"[yellow]File exists, skipping:[/yellow] {dest}")
+        except Exception as e:
+            console.print(f"[red]Failed to create {name}:[/red] {e}")
+            # The program design is required; the other scaffolds are best effort
+            if name == "program-design.md":
+                raise typer.Exit(1)
+
+    # Changelog bootstrap
+    changelog = feature_dir / "CHANGELOG.md"
+    if not changelog.exists():
+        _write_markdown(changelog, changelog_text(f"{num_str}-{slug}"))
+        console.print(f"[green]Created:[/green] {changelog}")
+
+    console.print(
+        Panel(
+            f"Feature ready: [cyan]{feature_dir}[/cyan]",
+            title="Design Created",
+            border_style="green",
+        )
+    )
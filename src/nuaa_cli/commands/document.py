@@ -0,0 +1,40 @@
+"""Scaffold an existing program analysis."""
+
+from datetime import datetime
+
+import typer
+
+from ..scaffold import (
+    _feature_dir_for_program,
+    _prepend_metadata,
+    _render_template,
+    _write_markdown,
+)
+from ..ui import console, show_banner
+
+
+def document(
+    program_name: str = typer.Argument(..., help="Existing program identifier/name"),
+    force: bool = typer.Option(False, help="Overwrite if exists"),
+):
+    """Create an existing program analysis document (brownfield documentation)."""
+    show_banner()
+    feature_dir = _feature_dir_for_program(program_name)
+    mapping = {
+        "PROGRAM_NAME": program_name,
+        "DATE": datetime.now().strftime("%Y-%m-%d"),
+    }
+    try:
+        text = _prepend_metadata(
+            _render_template("existing-program-analysis.md", mapping),
+            {"title": f"{program_name} - Existing Program Analysis"},
+        )
+        dest = feature_dir / "existing-program-analysis.md"
+        if dest.exists() and not force:
+            console.print(f"[yellow]File exists, skipping:[/yellow] {dest}")
+        else:
+            _write_markdown(dest, text)
+            console.print(f"[green]Created:[/green] {dest}")
+    except Exception as e:
+        console.print(f"[red]Failed to create existing-program-analysis.md:[/red] {e}")
+        raise typer.Exit(1)
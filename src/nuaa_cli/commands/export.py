@@ -0,0 +1,159 @@
+"""Export assembled documents."""
+
+import json
+import shutil
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.markup import escape
+from rich.table import Table
+
+from ..exports import (
+    CURRENT,
+    DEFAULT_TIMEOUT,
+    EXPORTED,
+    FAILED,
+    ExportCache,
+    ExportResult,
+    parse_formats,
+    pdf_engine,
+    plan_exports,
+    run_exports,
+)
+from ..scaffold import _find_templates_root
+from ..ui import console, show_banner
+from ..workspace import INITIATIVES, WorkspaceIndex, latest_initiative
+
+RESULT_LABELS = {
+    EXPORTED: "[green]✓ exported[/green]",
+    CURRENT: "[dim]up to date[/dim]",
+}
+
+
+def _print_results(results: list[ExportResult], missing: list[str]) -> None:
+    table = Table(title="Export", show_header=True, header_style="bold")
+    table.add_column("Initiative", style="cyan")
+    table.add_column("Format")
+    table.add_column("Output")
+    table.add_column("Result")
+    for r in results:
+        label = RESULT_LABELS.get(r.status) or f"[red]✗ {escape(r.error or 'failed')}[/red]"
+        table.add_row(escape(r.initiative), r.format.upper(), escape(str(r.output)), label)
+    for initiative in missing:
+        table.add_row(escape(initiative), "-", "-", "[yellow]not assembled[/yellow]")
+    console.print(table)
+
+
+def export(
+    initiative: Optional[str] = typer.Argument(
+        None, help="Initiative to export (uses most recent if not specified)"
+    ),
+    output_format: str = typer.Option(
+        "docx", "--format", help="Export formats, comma-separated: docx, pdf, html"
+    ),
+    output: Optional[str] = typer.Option(
+        None, "--output", help="Output filename (one initiative and format only)"
+    ),
+    all_initiatives: bool = typer.Option(
+        False, "--all", help="Export every initiative that has an assembled document"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", min=1, help="Conversions to run at once (default: CPU count)"
+    ),
+    force: bool = typer.Option(False, "--force", help="Export even if the output is up to date"),
+    timeout: float = typer.Option(
+        DEFAULT_TIMEOUT, "--timeout", min=1, help="Seconds allowed per conversion"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the results as JSON"),
+):
+    """
+    Export assembled document to Word, PDF, or HTML.
+
+    Conversions run in parallel, one pandoc process per initiative and format.
+    An output is skipped when the assembled document, its reference document or
+    template, and the pandoc options are unchanged since it was written.
+
+    Examples:
+        nuaa export
+        nuaa export 001-naloxone-distribution --format docx,html,pdf
+        nuaa export --all --format docx,pdf --jobs 8
+    """
+    if not as_json:
+        show_banner()
+
+    try:
+        formats = parse_formats(output_format)
+    except ValueError as e:
+        console.print(f"[red]Error: {e}[/red]")
+        raise typer.Exit(1)
+
+    if not Path(INITIATIVES).is_dir():
+        console.print("[red]Error: No initiatives directory found[/red]")
+        raise typer.Exit(1)
+    if all_initiatives:
+        initiatives = sorted(WorkspaceIndex().collection(INITIATIVES))
+    else:
+        initiative = initiative or latest_initiative()
+        if initiative is None:
+            console.print("[red]Error: No initiatives found[/red]")
+            raise typer.Exit(1)
+        if not Path(INITIATIVES, initiative).is_dir():
+            console.print(f"[red]Error: Initiative not found: {initiative}[/red]")
+            raise typer.Exit(1)
+        initiatives = [initiative]
+    if output and (len(initiatives) > 1 or len(formats) > 1):
+        console.print("[red]Error: --output needs a single initiative and format[/red]")
+        raise typer.Exit(1)
+
+    try:
+        templates_dir = _find_templates_root()
+    except FileNotFoundError:
+        templates_dir = None
+
+    cache = ExportCache(Path("."))
+    export_jobs, missing = plan_exports(
+        initiatives,
+        formats,
+        cache,
+        templates_dir,
+        root=Path("."),
+        output=Path(output) if output else None,
+    )
+    if missing and not all_initiatives:
+        console.print(
+            f"[red]Error: No assembled document found in {INITIATIVES}/{missing[0]}/final[/red]"
+        )
+        console.print("[yellow]Run 'nuaa assemble' first[/yellow]")
+        raise typer.Exit(1)
+
+    pending = [job for job in export_jobs if force or not cache.is_current(job)]
+    if pending and shutil.which("pandoc") is None:
+        console.print("[red]Error: pandoc is required for document export[/red]")
+        console.print("Install: https://pandoc.org/installing.html")
+        raise typer.Exit(1)
+    if any(job.format == "pdf" for job in pending) and pdf_engine() is None:
+        console.print("[red]Error: LaTeX (xelatex or pdflatex) is required for PDF export[/red]")
+        console.print("Install: https://www.latex-project.org/get/")
+        raise typer.Exit(1)
+
+    results = run_exports(export_jobs, cache, workers=jobs, timeout=timeout, force=force)
+    counts = {
+        status: sum(r.status == status for r in results) for status in (EXPORTED, CURRENT, FAILED)
+    }
+
+    if as_json:
+        report = {
+            "results": [{**r._asdict(), "output": str(r.output)} for r in results],
+            "not_assembled": missing,
+            **counts,
+        }
+        typer.echo(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        _print_results(results, missing)
+        console.print(
+            f"{counts[EXPORTED]} exported, {counts[CURRENT]} up to date, "
+            f"{counts[FAILED]} failed"
+        )
+    if counts[FAILED]:
+        raise typer.Exit(1)
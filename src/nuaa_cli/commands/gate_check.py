@@ -0,0 +1,229 @@
+"""Validate a section against its quality gate."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.markup import escape
+from rich.panel import Panel
+
+from ..locks import LockTimeout
+from ..planfile import STATUSES, GateResult, Plan, Section, load_plan, set_status
+from ..ui import console, show_banner
+from ..workspace import latest_initiative
+
+
+def _result_json(result: GateResult) -> dict:
+    section = result.section
+    return {
+        "section": section.name,
+        "number": section.number,
+        "gate": section.gate,
+        "status": section.status,
+        "dependencies": list(section.dependencies),
+        "dependencies_satisfied": result.satisfied,
+        "blockers": result.blockers,
+    }
+
+
+def _load_plan(initiative: str | None) -> tuple[str, Path, Plan]:
+    """Resolve the initiative (most recent by default) and return its parsed plan."""
+    if initiative is None:
+        if not Path("initiatives").exists():
+            console.print("[red]Error: No initiatives directory found[/red]")
+            raise typer.Exit(1)
+
+        initiative = latest_initiative()
+        if initiative is None:
+            console.print("[red]Error: No initiatives found[/red]")
+            raise typer.Exit(1)
+
+    plan_file = Path(f"initiatives/{initiative}/plan.md")
+    if not plan_file.exists():
+        console.print(f"[red]Error: Plan not found: {plan_file}[/red]")
+        console.print("[yellow]Run 'nuaa plan' first to create a document plan[/yellow]")
+        raise typer.Exit(1)
+
+    try:
+        return initiative, plan_file, load_plan(plan_file)
+    except OSError as e:
+        console.print(f"[red]Error reading {plan_file}: {e}[/red]")
+        raise typer.Exit(1)
+
+
+def _record_result(
+    plan_file: Path, target: Section, record: str | None, satisfied: bool, as_json: bool
+) -> None:
+    """Write ``record`` as the section's status; only Failed is recorded while blocked."""
+    if record is None:
+        return
+    if not satisfied and record != "Failed":
+        console.print(
+            f"[red]Error: Cannot record {record} while dependencies are not satisfied "
+            "(only Failed can be recorded)[/red]"
+        )
+        raise typer.Exit(1)
+    try:
+        set_status(plan_file, target.title, record)
+    except (LockTimeout, OSError, ValueError) as e:
+        console.print(f"[red]Error recording result in {plan_file}: {escape(str(e))}[/red]")
+        raise typer.Exit(1)
+    if not as_json:
+        console.print(f"[green]✓[/green] Recorded in {plan_file}: [cyan]{record}[/cyan]")
+
+
+def _check_all(initiative: str, plan_file: Path, plan: Plan, as_json: bool) -> None:
+    """Report every section's gate and dependencies; exit 1 if the plan has errors."""
+    check = plan.check()
+    results = check.results
+    passed = sum(r.section.passed for r in results)
+    ready = sum(r.satisfied and not r.section.passed for r in results)
+
+    if as_json:
+        document = {
+            "initiative": initiative,
+            "plan": plan_file.as_posix(),
+            "sections": [_result_json(r) for r in results],
+            "summary": {
+                "total": len(results),
+                "passed": passed,
+                "ready": ready,
+                "blocked": len(results) - passed - ready,
+            },
+            "errors": check.errors,
+        }
+        typer.echo(json.dumps(document, indent=2, ensure_ascii=False))
+        if check.errors:
+            raise typer.Exit(1)
+        return
+
+    from rich.table import Table
+
+    table = Table(title=f"Gate check: {initiative}", show_header=True, header_style="bold")
+    table.add_column("#", justify="right")
+    table.add_column("Section", style="cyan")
+    table.add_column("Gate", justify="center")
+    table.add_column("Status")
+    table.add_column("Dependencies")
+    for result in results:
+        section = result.section
+        if section.passed:
+            state = "[green]✓ passed[/green]"
+        elif result.satisfied:
+            state = "[green]✓ ready[/green]"
+        else:
+            state = "[red]✗ waiting on[/red] " + escape(", ".join(result.blockers))
+        gate = str(section.gate) if section.gate is not None else "?"
+        table.add_row(
+            str(section.number), escape(section.name), gate, escape(section.status or "-"), state
+        )
+    console.print(table)
+    console.print(
+        f"{len(results)} section(s): [green]{passed} passed[/green], "
+        f"[cyan]{ready} ready[/cyan], [yellow]{len(results) - passed - ready} blocked[/yellow]"
+    )
+
+    if check.errors:
+        for error in check.errors:
+            console.print(f"[red]Error:[/red] {escape(error)}")
+        raise typer.Exit(1)
+
+
+def gate_check(
+    section: Optional[str] = typer.Argument(
+        None, help="Section name to validate (e.g., 'Program Description' or 'Section 3')"
+    ),
+    initiative: Optional[str] = typer.Option(
+        None, "--initiative", help="Initiative to check (uses most recent if not specified)"
+    ),
+    all_sections: bool = typer.Option(
+        False, "--all", help="Check every section of the plan in one pass"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print a JSON document instead of a report"),
+    record: Optional[str] = typer.Option(
+        None, "--record", help="Record the validation result in plan.md (Passed or Failed)"
+    ),
+):
+    """
+    Validate a section against its quality gate criteria.
+
+    With --all, every section's dependencies are resolved in one pass over the
+    plan. Dependency cycles and references to unknown sections are errors (exit 1).
+
+    Examples:
+        nuaa gate-check "Program Description"
+        nuaa gate-check --all
+        nuaa gate-check --all --json    # For scripts and pre-merge hooks
+        nuaa gate-check "Program Description" --record Passed
+    """
+    if not all_sections and section is None:
+        console.print("[red]Error: Provide a SECTION or use --all[/red]")
+        raise typer.Exit(1)
+    if record is not None:
+        status = {s.lower(): s for s in STATUSES}.get(record.strip().lower())
+        if status is None or all_sections:
+            console.print(
+                "[red]Error: --record takes one SECTION and a status: "
+                f"{', '.join(STATUSES)}[/red]"
+            )
+            raise typer.Exit(1)
+        record = status
+    if not as_json:
+        show_banner()
+
+    initiative, plan_file, plan = _load_plan(initiative)
+    if all_sections:
+        _check_all(initiative, plan_file, plan, as_json)
+        return
+
+    target = plan.find(section)
+    if target is None:
+        console.print(f"[red]Error: Section '{section}' not found in {plan_file}[/red]")
+        if len(plan):
+            names = ", ".join(s.name for s in plan)
+            console.print(f"[yellow]Sections in plan: {names}[/yellow]")
+        raise typer.Exit(1)
+
+    if as_json:
+        result = GateResult(target, plan.resolve(target)[0], plan.blockers(target))
+        typer.echo(json.dumps({"initiative": initiative, **_result_json(result)}, indent=2))
+        _record_result(plan_file, target, record, result.satisfied, as_json)
+        if not result.satisfied:
+            raise typer.Exit(1)
+        return
+
+    gate = f"Gate {target.gate}" if target.gate is not None else "unknown"
+    blockers = plan.blockers(target)
+    if blockers:
+        waiting = "\n".join(f"  • {blocker}" for blocker in blockers)
+        console.print(
+            Panel(
+                f"[yellow]⚠[/yellow] Section: [cyan]{target.name}[/cyan]\n"
+                f"[yellow]⚠[/yellow] Gate: [cyan]{gate}[/cyan]\n"
+                f"[yellow]⚠[/yellow] Status: [cyan]{target.status}[/cyan]\n\n"
+                f"[red]✗ Dependencies not satisfied[/red]\n{waiting}\n\n"
+                f"[bold]This section cannot proceed until dependencies are complete.[/bold]",
+                title="Gate Check Failed",
+                border_style="red",
+            )
+        )
+        _record_result(plan_file, target, record, False, as_json)
+        raise typer.Exit(1)
+
+    dependencies = ", ".join(target.dependencies) or "None"
+    console.print(
+        Panel(
+            f"[green]✓[/green] Section: [cyan]{target.name}[/cyan]\n"
+            f"[green]✓[/green] Gate: [cyan]{gate}[/cyan]\n"
+            f"[green]✓[/green] Status: [cyan]{target.status}[/cyan]\n"
+            f"[green]✓[/green] Dependencies: [cyan]{dependencies}[/cyan]\n\n"
+            f"[bold]Next steps:[/bold]\n"
+            f"  1. Have AI validate content with [cyan]/nuaa.gate-check {target.name}[/cyan]\n"
+            f"  2. Address any feedback from validation\n"
+            f"  3. Update plan.md with validation result",
+            title="Gate Check Passed",
+            border_style="green",
+        )
+    )
+    _record_result(plan_file, target, record, True, as_json)
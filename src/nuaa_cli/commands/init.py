@@ -0,0 +1,561 @@
+"""Initialize a new NUAA project workspace from the release templates."""
+
+import os
+import shlex
+import shutil
+import sys
+from pathlib import Path
+
+import httpx
+import typer
+from rich.live import Live
+from rich.panel import Panel
+
+from ..cache import TemplateCache
+from ..config import AGENT_CONFIG, SCRIPT_TYPE_CHOICES
+from ..download import download_and_extract_template
+from ..github import get_ssl_context
+from ..render import install_package, kit_root
+from ..system import check_tool, init_git_repo, is_git_repo
+from ..ui import StepTracker, console, select_with_arrows, show_banner
+
+
+def init(
+    project_name: str | None = typer.Argument(
+        None,
+        help="Name for your new project directory (optional if using --here, or use '.' for current directory)",
+    ),
+    ai_assistant: str | None = typer.Option(
+        None,
+        "--ai",
+        help="AI assistant to use: claude, gemini, copilot, cursor-agent, qwen, opencode, codex, windsurf, kilocode, auggie, codebuddy, amp, or q",
+    ),
+    script_type: str | None = typer.Option(None, "--script", help="Script type to use: sh or ps"),
+    ignore_agent_tools: bool = typer.Option(
+        False,
+        "--ignore-agent-tools",
+        help="Skip checks for AI agent tools like Claude Code",
+    ),
+    no_git: bool = typer.Option(False, "--no-git", help="Skip git repository initialization"),
+    here: bool = typer.Option(
+        False,
+        "--here",
+        help="Initialize project in the current directory instead of creating a new one",
+    ),
+    force: bool = typer.Option(
+        False,
+        "--force",
+        help="Force merge/overwrite when using --here (skip confirmation)",
+    ),
+    skip_tls: bool = typer.Option(
+        False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"
+    ),
+    debug: bool = typer.Option(
+        False,
+        "--debug",
+        help="Show verbose diagnostic output for network and extraction failures",
+    ),
+    github_token: str | None = typer.Option(
+        None,
+        "--github-token",
+        help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)",
+    ),
+    no_cache: bool = typer.Option(
+        False,
+        "--no-cache",
+        help="Bypass the local template cache and always download the release archive",
+    ),
+    template_source: str | None = typer.Option(
+        None,
+        "--template-source",
+        help="Use a local template zip, offline bundle, asset directory or file:// mirror instead of GitHub",
+    ),
+    from_release: bool = typer.Option(
+        False,
+        "--from-release",
+        help="Download the pre-built release archive from GitHub instead of rendering the bundled templates",
+    ),
+    batch: Path | None = typer.Option(
+        None,
+        "--batch",
+        help="Provision every project listed in a CSV or JSON manifest (fields: path, ai, script)",
+    ),
+    jobs: int | None = typer.Option(
+        None, "--jobs", "-j", help="Number of projects to provision in parallel with --batch"
+    ),
+):
+    """
+    Initialize a new NUAA Project Kit workspace from the latest template.
+
+    This command will:
+    1. Check that required tools are installed (git is optional)
+    2. Let you choose your AI assistant
+    3. Render the agent templates bundled with the CLI (or download a release with --from-release)
+    4. Extract the template to a new project directory or current directory
+    5. Initialize a fresh git repository (if not --no-git and no existing repo)
+    6. Optionally set up AI assistant commands
+
+    Examples:
+        specify init my-project
+        specify init my-project --ai claude
+        specify init my-project --ai copilot --no-git
+        specify init --ignore-agent-tools my-project
+        specify init . --ai claude         # Initialize in current directory
+        specify init .                     # Initialize in current directory (interactive AI selection)
+        specify init --here --ai claude    # Alternative syntax for current directory
+        specify init --here --ai codex
+        specify init --here --ai codebuddy
+        specify init --here
+        specify init --here --force  # Skip confirmation when current directory not empty
+        specify init my-project --from-release  # Use the latest GitHub release archive
+        specify init my-project --from-release --no-cache  # Always download a fresh archive
+        specify init my-project --ai claude --template-source ./nuaa-templates-v1.2.0.zip
+        specify init --batch cohort.csv --ai claude --script sh
+    """
+
+    show_banner()
+
+    if batch:
+        if project_name or here:
+            console.print(
+                "[red]Error:[/red] --batch cannot be combined with a project name or --here"
+            )
+            raise typer.Exit(1)
+        _init_batch(
+            batch,
+            ai_assistant=ai_assistant,
+            script_type=script_type,
+            ignore_agent_tools=ignore_agent_tools,
+            no_git=no_git,
+            skip_tls=skip_tls,
+            debug=debug,
+            github_token=github_token,
+            no_cache=no_cache,
+            template_source=template_source,
+            from_release=from_release,
+            jobs=jobs,
+        )
+        return
+
+    if project_name == ".":
+        here = True
+        project_name = None  # Clear project_name to use existing validation logic
+
+    if here and project_name:
+        console.print("[red]Error:[/red] Cannot specify both project name and --here flag")
+        raise typer.Exit(1)
+
+    if not here and not project_name:
+        console.print(
+            "[red]Error:[/red] Must specify either a project name, use '.' for current directory, or use --here flag"
+        )
+        raise typer.Exit(1)
+
+    if here:
+        project_name = Path.cwd().name
+        project_path = Path.cwd()
+
+        existing_items = list(project_path.iterdir())
+        if existing_items:
+            console.print(
+                f"[yellow]Warning:[/yellow] Current directory is not empty ({len(existing_items)} items)"
+            )
+            console.print(
+                "[yellow]Template files will be merged with existing content and may overwrite existing files[/yellow]"
+            )
+            if force:
+                console.print(
+                    "[cyan]--force supplied: skipping confirmation and proceeding with merge[/cyan]"
+                )
+            else:
+                response = typer.confirm("Do you want to continue?")
+                if not response:
+                    console.print("[yellow]Operation cancelled[/yellow]")
+                    raise typer.Exit(0)
+    else:
+        assert project_name is not None  # for type checkers
+        project_path = Path(project_name).resolve()
+        if project_path.exists():
+            error_panel = Panel(
+                f"Directory '[cyan]{project_name}[/cyan]' already exists\n"
+                "Please choose a different project name or remove the existing directory.",
+                title="[red]Directory Conflict[/red]",
+                border_style="red",
+                padding=(1, 2),
+            )
+            console.print()
+            console.print(error_panel)
+            raise typer.Exit(1)
+
+    current_dir = Path.cwd()
+
+    setup_lines = [
+        "[cyan]Specify Project Setup[/cyan]",
+        "",
+        f"{'Project':<15} [green]{project_path.name}[/green]",
+        f"{'Working Path':<15} [dim]{current_dir}[/dim]",
+    ]
+
+    if not here:
+        setup_lines.append(f"{'Target Path':<15} [dim]{project_path}[/dim]")
+
+    console.print(Panel("\n".join(setup_lines), border_style="cyan", padding=(1, 2)))
+
+    should_init_git = False
+    if not no_git:
+        should_init_git = check_tool("git")
+        if not should_init_git:
+            console.print("[yellow]Git not found - will skip repository initialization[/yellow]")
+
+    if ai_assistant:
+        if ai_assistant not in AGENT_CONFIG:
+            console.print(
+                f"[red]Error:[/red] Invalid AI assistant '{ai_assistant}'. Choose from: {', '.join(AGENT_CONFIG.keys())}"
+            )
+            raise typer.Exit(1)
+        selected_ai = ai_assistant
+    else:
+        # Create options dict for selection (agent_key: display_name)
+        ai_choices = {key: config["name"] for key, config in AGENT_CONFIG.items()}
+        selected_ai = select_with_arrows(ai_choices, "Choose your AI assistant:", "copilot")
+
+    if not ignore_agent_tools:
+        agent_config = AGENT_CONFIG.get(selected_ai)
+        if agent_config and agent_config["requires_cli"]:
+            install_url = agent_config["install_url"]
+            if not check_tool(selected_ai):
+                error_panel = Panel(
+                    f"[cyan]{selected_ai}[/cyan] not found\n"
+                    f"Install from: [cyan]{install_url}[/cyan]\n"
+                    f"{agent_config['name']} is required to continue with this project type.\n\n"
+                    "Tip: Use [cyan]--ignore-agent-tools[/cyan] to skip this check",
+                    title="[red]Agent Detection Error[/red]",
+                    border_style="red",
+                    padding=(1, 2),
+                )
+                console.print()
+                console.print(error_panel)
+                raise typer.Exit(1)
+
+    if script_type:
+        if script_type not in SCRIPT_TYPE_CHOICES:
+            console.print(
+                f"[red]Error:[/red] Invalid script type '{script_type}'. Choose from: {', '.join(SCRIPT_TYPE_CHOICES.keys())}"
+            )
+            raise typer.Exit(1)
+        selected_script = script_type
+    else:
+        default_script = "ps" if os.name == "nt" else "sh"
+
+        if sys.stdin.isatty():
+            selected_script = select_with_arrows(
+                SCRIPT_TYPE_CHOICES,
+                "Choose script type (or press Enter)",
+                default_script,
+            )
+        else:
+            selected_script = default_script
+
+    console.print(f"[cyan]Selected AI assistant:[/cyan] {selected_ai}")
+    console.print(f"[cyan]Selected script type:[/cyan] {selected_script}")
+
+    tracker = StepTracker("Initialize NUAA Project")
+
+    sys._specify_tracker_active = True  # type: ignore[attr-defined]
+
+    tracker.add("precheck", "Check required tools")
+    tracker.complete("precheck", "ok")
+    tracker.add("ai-select", "Select AI assistant")
+    tracker.complete("ai-select", f"{selected_ai}")
+    tracker.add("script-select", "Select script type")
+    tracker.complete("script-select", selected_script)
+    for key, label in [
+        ("fetch", "Fetch templates"),
+        ("download", "Download template"),
+        ("extract", "Extract template"),
+        ("zip-list", "Archive contents"),
+        ("extracted-summary", "Extraction summary"),
+        ("chmod", "Ensure scripts executable"),
+        ("cleanup", "Cleanup"),
+        ("git", "Initialize git repository"),
+        ("final", "Finalize"),
+    ]:
+        tracker.add(key, label)
+
+    # Track git error message outside Live context so it persists
+    git_error_message = None
+
+    with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
+        tracker.attach_refresh(lambda: live.update(tracker.render()))
+        try:
+            if not template_source and not from_release and kit_root() is not None:
+                install_package(
+                    project_path,
+                    selected_ai,
+                    selected_script,
+                    here,
+                    verbose=False,
+                    tracker=tracker,
+                )
+            elif template_source:
+                download_and_extract_template(
+                    project_path,
+                    selected_ai,
+                    selected_script,
+                    here,
+                    verbose=False,
+                    tracker=tracker,
+                    debug=debug,
+                    template_source=template_source,
+                )
+            else:
+                verify = not skip_tls
+                local_ssl_context = get_ssl_context() if verify else False
+
+                with httpx.Client(verify=local_ssl_context) as local_client:
+                    download_and_extract_template(
+                        project_path,
+                        selected_ai,
+                        selected_script,
+                        here,
+                        verbose=False,
+                        tracker=tracker,
+                        client=local_client,
+                        debug=debug,
+                        github_token=github_token,
+                        cache=None if no_cache else TemplateCache(),
+                    )
+
+            if not no_git:
+                tracker.start("git")
+                if is_git_repo(project_path):
+                    tracker.complete("git", "existing repo detected")
+                elif should_init_git:
+                    success, error_msg = init_git_repo(project_path, quiet=True)
+                    if success:
+                        tracker.complete("git", "initialized")
+                    else:
+                        tracker.error("git", "init failed")
+                        git_error_message = error_msg
+                else:
+                    tracker.skip("git", "git not available")
+            else:
+                tracker.skip("git", "--no-git flag")
+
+            tracker.complete("final", "project ready")
+        except Exception as e:
+            tracker.error("final", str(e))
+            console.print(Panel(f"Initialization failed: {e}", title="Failure", border_style="red"))
+            if debug:
+                _env_pairs = [
+                    ("Python", sys.version.split()[0]),
+                    ("Platform", sys.platform),
+                    ("CWD", str(Path.cwd())),
+                ]
+                _label_width = max(len(k) for k, _ in _env_pairs)
+                env_lines = [
+                    f"{k.ljust(_label_width)} → [bright_black]{v}[/bright_black]"
+                    for k, v in _env_pairs
+                ]
+                console.print(
+                    Panel(
+                        "\n".join(env_lines),
+                        title="Debug Environment",
+                        border_style="magenta",
+                    )
+                )
+            if not here and project_path.exists():
+                shutil.rmtree(project_path)
+            raise typer.Exit(1)
+        finally:
+            pass
+
+    console.print(tracker.render())
+    console.print("\n[bold green]NUAA project workspace ready.[/bold green]")
+
+    # Show git error details if initialization failed
+    if git_error_message:
+        console.print()
+        git_error_panel = Panel(
+            f"[yellow]Warning:[/yellow] Git repository initialization failed\n\n"
+            f"{git_error_message}\n\n"
+            f"[dim]You can initialize git manually later with:[/dim]\n"
+            f"[cyan]cd {project_path if not here else '.'}[/cyan]\n"
+            f"[cyan]git init[/cyan]\n"
+            f"[cyan]git add .[/cyan]\n"
+            f'[cyan]git commit -m "Initial commit"[/cyan]',
+            title="[red]Git Initialization Failed[/red]",
+            border_style="red",
+            padding=(1, 2),
+        )
+        console.print(git_error_panel)
+
+    # Agent folder security notice
+    agent_config = AGENT_CONFIG.get(selected_ai)
+    if agent_config:
+        agent_folder = agent_config["folder"]
+        security_notice = Panel(
+            f"Some agents may store credentials, auth tokens, or other identifying and private artifacts in the agent folder within your project.\n"
+            f"Consider adding [cyan]{agent_folder}[/cyan] (or parts of it) to [cyan].gitignore[/cyan] to prevent accidental credential leakage.",
+            title="[yellow]Agent Folder Security[/yellow]",
+            border_style="yellow",
+            padding=(1, 2),
+        )
+        console.print()
+        console.print(security_notice)
+
+    steps_lines = []
+    if not here:
+        steps_lines.append(f"1. Go to the project folder: [cyan]cd {project_name}[/cyan]")
+        step_num = 2
+    else:
+        steps_lines.append("1. You're already in the project directory!")
+        step_num = 2
+
+    # Add Codex-specific setup step if needed
+    if selected_ai == "codex":
+        codex_path = project_path / ".codex"
+        quoted_path = shlex.quote(str(codex_path))
+        if os.name == "nt":  # Windows
+            cmd = f"setx CODEX_HOME {quoted_path}"
+        else:  # Unix-like systems
+            cmd = f"export CODEX_HOME={quoted_path}"
+
+        steps_lines.append(
+            f"{step_num}. Set [cyan]CODEX_HOME[/cyan] environment variable before running Codex: [cyan]{cmd}[/cyan]"
+        )
+        step_num += 1
+
+    steps_lines.append(f"{step_num}. Start using slash commands with your AI agent:")
+
+    steps_lines.append("   2.1 [cyan]/nuaa.design[/] - Create program designs with logic models")
+    steps_lines.append("   2.2 [cyan]/nuaa.propose[/] - Generate funding proposals")
+    steps_lines.append("   2.3 [cyan]/nuaa.measure[/] - Define impact measurement frameworks")
+    steps_lines.append("   2.4 [cyan]/nuaa.document[/] - Document existing programs")
+    steps_lines.append("   2.5 [cyan]/nuaa.refine[/] - Refine and improve outputs")
+
+    steps_panel = Panel(
+        "\n".join(steps_lines), title="Next Steps", border_style="cyan", padding=(1, 2)
+    )
+    console.print()
+    console.print(steps_panel)
+
+    enhancement_lines = [
+        "Additional NUAA commands available [bright_black](comprehensive program management)[/bright_black]",
+        "",
+        "○ [cyan]/nuaa.report[/] [bright_black](optional)[/bright_black] - Generate reports and presentations from program data",
+        "○ [cyan]/nuaa.refine[/] [bright_black](optional)[/bright_black] - Improve and iterate on existing documents",
+        "",
+    ]
+    enhancements_panel = Panel(
+        "\n".join(enhancement_lines),
+        title="Enhancement Commands",
+        border_style="cyan",
+        padding=(1, 2),
+    )
+    console.print()
+    console.print(enhancements_panel)
+
+
+def _init_batch(
+    manifest: Path,
+    *,
+    ai_assistant: str | None,
+    script_type: str | None,
+    ignore_agent_tools: bool,
+    no_git: bool,
+    skip_tls: bool,
+    debug: bool,
+    github_token: str | None,
+    no_cache: bool,
+    template_source: str | None,
+    from_release: bool,
+    jobs: int | None,
+) -> None:
+    """Provision every project in ``manifest``, preparing each distinct template once."""
+    import tempfile
+
+    from ..batch import load_manifest, prepare_templates, provision_projects
+
+    if not manifest.is_file():
+        console.print(f"[red]Error:[/red] Manifest not found: {manifest}")
+        raise typer.Exit(1)
+    default_script = script_type or ("ps" if os.name == "nt" else "sh")
+    try:
+        projects = load_manifest(manifest, ai_assistant, default_script)
+    except (ValueError, OSError) as e:
+        console.print(Panel(str(e), title="[red]Invalid Manifest[/red]", border_style="red"))
+        raise typer.Exit(1)
+
+    pairs = list(dict.fromkeys((p.ai, p.script) for p in projects))
+    if not ignore_agent_tools:
+        missing = [
+            ai
+            for ai in dict.fromkeys(ai for ai, _ in pairs)
+            if AGENT_CONFIG[ai]["requires_cli"] and not check_tool(ai)
+        ]
+        if missing:
+            console.print(
+                f"[red]Error:[/red] Agent tools not found: {', '.join(missing)}\n"
+                "Tip: Use [cyan]--ignore-agent-tools[/cyan] to skip this check"
+            )
+            raise typer.Exit(1)
+    git = not no_git and check_tool("git")
+
+    tracker = StepTracker(f"Initialize {len(projects)} NUAA Projects")
+    tracker.add("manifest", "Read manifest")
+    tracker.complete("manifest", f"{len(projects)} projects, {len(pairs)} templates")
+    tracker.add("templates", "Prepare templates")
+    cwd = Path.cwd()
+    for index, project in enumerate(projects):
+        label = project.path.relative_to(cwd) if project.path.is_relative_to(cwd) else project.path
+        tracker.add(f"project:{index}", str(label))
+    tracker.add("final", "Finalize")
+
+    with tempfile.TemporaryDirectory(prefix="nuaa-batch-") as work_dir:
+        with Live(tracker.render(), console=console, refresh_per_second=8, transient=True) as live:
+            tracker.attach_refresh(lambda: live.update(tracker.render()))
+            tracker.start("templates")
+            try:
+                if from_release and not template_source:
+                    local_ssl_context = get_ssl_context() if not skip_tls else False
+                    with httpx.Client(verify=local_ssl_context) as client:
+                        installers, summary = prepare_templates(
+                            pairs,
+                            Path(work_dir),
+                            client=client,
+                            cache=None if no_cache else TemplateCache(),
+                            github_token=github_token,
+                            debug=debug,
+                        )
+                else:
+                    installers, summary = prepare_templates(
+                        pairs, Path(work_dir), template_source=template_source
+                    )
+            except Exception as e:
+                tracker.error("templates", str(e))
+                tracker.skip("final", "no projects created")
+                live.stop()
+                console.print(tracker.render())
+                console.print(Panel(str(e), title="Template Error", border_style="red"))
+                raise typer.Exit(1)
+            tracker.complete("templates", summary)
+
+            failures = provision_projects(projects, installers, tracker, git=git, jobs=jobs)
+            created = len(projects) - len(failures)
+            if failures:
+                tracker.error("final", f"{created} ready, {len(failures)} failed")
+            else:
+                tracker.complete("final", f"{created} projects ready")
+
+    console.print(tracker.render())
+    if failures:
+        console.print(
+            Panel(
+                "\n\n".join(f"[bold]{p.path}[/bold]\n{error}" for p, error in failures),
+                title="[red]Failed Projects[/red]",
+                border_style="red",
+            )
+        )
+        raise typer.Exit(1)
+    console.print(f"\n[bold green]{created} NUAA project workspaces ready.[/bold green]")
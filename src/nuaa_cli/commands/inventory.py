@@ -0,0 +1,118 @@
+"""Inventory unresolved markers across the workspace."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.markup import escape
+from rich.table import Table
+
+from ..inventory import workspace_inventory
+from ..markers import BRACKET, CLARIFICATION, PLACEHOLDER
+from ..ui import console, show_banner
+from ..workspace import FEATURES, INITIATIVES
+
+
+def _count_cells(counts: dict) -> list[str]:
+    cells = [str(counts[kind]) if counts[kind] else "-" for kind in (PLACEHOLDER, CLARIFICATION)]
+    cells.append(str(counts[BRACKET]) if counts[BRACKET] else "-")
+    cells.append(f"[bold]{counts['total']}[/bold]")
+    return cells
+
+
+def _print_inventory(report: dict, details: bool) -> None:
+    folders = report["initiatives"] + report["features"]
+    summary = Table(title="Unresolved markers", show_header=True, header_style="bold")
+    summary.add_column("Folder", style="cyan")
+    summary.add_column("Docs", justify="right")
+    for column in ("Placeholders", "Clarifications", "Tokens", "Total"):
+        summary.add_column(column, justify="right")
+    for folder in folders:
+        summary.add_row(
+            escape(folder["path"]),
+            f"{len(folder['documents'])}/{folder['documents_scanned']}",
+            *_count_cells(folder["counts"]),
+        )
+    console.print(summary)
+
+    documents = [doc for folder in folders for doc in folder["documents"]]
+    if documents:
+        table = Table(title="Documents with markers", show_header=True, header_style="bold")
+        table.add_column("Document", style="cyan")
+        table.add_column("Section")
+        for column in ("Placeholders", "Clarifications", "Tokens", "Total"):
+            table.add_column(column, justify="right")
+        for doc in documents:
+            table.add_row(
+                escape(doc["path"]), escape(doc["section"] or "-"), *_count_cells(doc["counts"])
+            )
+        console.print(table)
+
+    if details and documents:
+        locations = Table(title="Marker locations", show_header=True, header_style="bold")
+        locations.add_column("Document", style="cyan")
+        locations.add_column("Line:Col", justify="right")
+        locations.add_column("Heading")
+        locations.add_column("Marker")
+        for doc in documents:
+            for marker in doc["markers"]:
+                style = "yellow" if marker["kind"] == BRACKET else "red"
+                locations.add_row(
+                    escape(doc["path"]),
+                    f"{marker['line']}:{marker['column']}",
+                    escape(marker["section"] or "-"),
+                    f"[{style}]{escape(marker['text'])}[/{style}]",
+                )
+        console.print(locations)
+
+    totals = report["totals"]
+    console.print(
+        f"[bold]{totals['total']}[/bold] unresolved marker(s) in {totals['documents']} "
+        f"document(s) across {len(report['initiatives'])} initiative(s) and "
+        f"{len(report['features'])} feature(s)"
+    )
+    console.print(
+        f"[dim]Scanned {report['scanned']} markdown files ({report['cached']} unchanged)[/dim]"
+    )
+
+
+def inventory(
+    details: bool = typer.Option(
+        False, "--details", "-d", help="Also list every marker with its line, column and heading"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", min=1, help="Worker processes for large trees (default: CPU count)"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Rescan every file instead of reusing .nuaa/cache/markers.json"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the inventory as JSON"),
+):
+    """
+    Count unresolved markers in every initiative and feature document.
+
+    Reports `[PLACEHOLDER: ...]`, `[NEEDS CLARIFICATION: ...]` and other
+    template tokens per initiative, section draft and feature document, with
+    the line, column and heading of each. All folders are scanned in one pass;
+    unchanged files are answered from a cache shared with `nuaa lint`.
+
+    Examples:
+        nuaa inventory
+        nuaa inventory --details
+        nuaa inventory --json > inventory.json
+    """
+    if not as_json:
+        show_banner()
+
+    if not Path(INITIATIVES).is_dir() and not Path(FEATURES).is_dir():
+        console.print("[red]Error: No initiatives/ or nuaa/ directory found[/red]")
+        console.print("[yellow]Run this command from the root of a NUAA project[/yellow]")
+        raise typer.Exit(1)
+
+    report = workspace_inventory(jobs=jobs, cache=not no_cache)
+
+    if as_json:
+        typer.echo(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        _print_inventory(report, details)
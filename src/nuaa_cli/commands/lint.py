@@ -0,0 +1,118 @@
+"""Lint NUAA markdown documents."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.markup import escape
+from rich.table import Table
+
+from ..markers import FileScan, scan_markdown
+from ..scaffold import _find_templates_root
+from ..ui import console, show_banner
+
+lint_app = typer.Typer(help="Check NUAA documents for unfinished content", add_completion=False)
+
+
+@lint_app.callback()
+def lint():
+    """Check NUAA documents for unfinished content."""
+
+
+def _scan_json(scans: list[FileScan], cached: int, failing: list[FileScan]) -> dict:
+    return {
+        "scanned": len(scans),
+        "cached": cached,
+        "failing": [scan.path for scan in failing],
+        "files": [
+            {
+                "path": scan.path,
+                "final": scan.final,
+                "markers": [marker._asdict() for marker in scan.markers],
+            }
+            for scan in scans
+            if scan.markers
+        ],
+    }
+
+
+@lint_app.command()
+def placeholders(
+    paths: Optional[list[Path]] = typer.Argument(
+        None, help="Files or directories to scan (defaults to the NUAA templates directory)"
+    ),
+    all_documents: bool = typer.Option(
+        False, "--all", help="List markers in every document, not only final ones"
+    ),
+    jobs: Optional[int] = typer.Option(
+        None, "--jobs", "-j", min=1, help="Worker processes for large trees (default: CPU count)"
+    ),
+    no_cache: bool = typer.Option(
+        False, "--no-cache", help="Rescan every file instead of reusing .nuaa/cache/markers.json"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the results as JSON"),
+):
+    """
+    Find unresolved placeholder tokens in final markdown documents.
+
+    A document is final when its front matter has `status: final`. Outside
+    fenced code, any `[...]` that is not a markdown link, `[PLACEHOLDER: ...]`
+    and `[NEEDS CLARIFICATION: ...]` count as unresolved. Exits 1 if a final
+    document has one. Unchanged files are answered from a cache.
+
+    Examples:
+        nuaa lint placeholders
+        nuaa lint placeholders initiatives/ nuaa/ --all
+        nuaa lint placeholders docs --json
+    """
+    if not as_json:
+        show_banner()
+
+    if not paths:
+        try:
+            paths = [_find_templates_root()]
+        except FileNotFoundError:
+            console.print(
+                "[red]Error:[/red] Could not locate NUAA templates under .nuaa/templates "
+                "or nuaa-kit/templates."
+            )
+            raise typer.Exit(1)
+    missing = [path for path in paths if not path.exists()]
+    if missing:
+        console.print(f"[red]Error:[/red] Path not found: {missing[0]}")
+        raise typer.Exit(1)
+
+    scans, cached = scan_markdown(paths, jobs=jobs, cache=not no_cache)
+    failing = [scan for scan in scans if scan.final and scan.markers]
+
+    if as_json:
+        typer.echo(json.dumps(_scan_json(scans, cached, failing), indent=2))
+        if failing:
+            raise typer.Exit(1)
+        return
+
+    shown = [scan for scan in scans if scan.markers and (scan.final or all_documents)]
+    if shown:
+        table = Table(title="Unresolved markers", show_header=True, header_style="bold")
+        table.add_column("File", style="cyan")
+        table.add_column("Line:Col", justify="right")
+        table.add_column("Marker")
+        for scan in shown:
+            style = "red" if scan.final else "yellow"
+            for marker in scan.markers:
+                table.add_row(
+                    escape(scan.path),
+                    f"{marker.line}:{marker.column}",
+                    f"[{style}]{escape(marker.text)}[/{style}]",
+                )
+        console.print(table)
+
+    console.print(f"[dim]Scanned {len(scans)} markdown files ({cached} unchanged)[/dim]")
+    if failing:
+        for scan in failing:
+            console.print(
+                f"[red]Placeholder tokens found in FINAL document:[/red] {escape(scan.path)}"
+            )
+        raise typer.Exit(1)
+    console.print("[green]No placeholder tokens found in final documents.[/green]")
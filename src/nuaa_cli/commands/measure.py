@@ -0,0 +1,44 @@
+"""Scaffold an impact measurement framework."""
+
+from datetime import datetime
+
+import typer
+
+from ..scaffold import (
+    _feature_dir_for_program,
+    _prepend_metadata,
+    _render_template,
+    _write_markdown,
+)
+from ..ui import console, show_banner
+
+
+def measure(
+    program_name: str = typer.Argument(..., help="Program name (existing)"),
+    evaluation_period: str = typer.Argument(..., help="Evaluation period"),
+    budget: str = typer.Argument(..., help="Evaluation budget (e.g., $7000)"),
+    force: bool = typer.Option(False, help="Overwrite if exists"),
+):
+    """Create or update the impact framework document from the template."""
+    show_banner()
+    feature_dir = _feature_dir_for_program(program_name)
+    mapping = {
+        "PROGRAM_NAME": program_name,
+        "EVALUATION_PERIOD": evaluation_period,
+        "BUDGET": budget,
+        "DATE": datetime.now().strftime("%Y-%m-%d"),
+    }
+    try:
+        text = _prepend_metadata(
+            _render_template("impact-framework.md", mapping),
+            {"title": f"{program_name} - Impact Framework"},
+        )
+        dest = feature_dir / "impact-framework.md"
+        if dest.exists() and not force:
+            console.print(f"[yellow]File exists, skipping:[/yellow] {dest}")
+        else:
+            _write_markdown(dest, text)
+            console.print(f"[green]Created:[/green] {dest}")
+    except Exception as e:
+        console.print(f"[red]Failed to create impact-framework.md:[/red] {e}")
+        raise typer.Exit(1)
@@ -0,0 +1,153 @@
+"""Create or manage the NUAA mission constitution."""
+
+import subprocess
+import sys
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.panel import Panel
+
+from ..locks import LockTimeout, file_lock, write_atomic
+from ..scaffold import _load_compiled_template
+from ..ui import console, show_banner
+
+# Default wording for the constitution's commitment and requirement placeholders
+_CONSTITUTION_DEFAULTS = {
+    # Lived Experience commitments
+    "[LIVED_EXPERIENCE_COMMITMENT_1]": "People with lived experience lead program design, delivery, and evaluation",
+    "[LIVED_EXPERIENCE_COMMITMENT_2]": "Peer workers are valued, supported, and fairly compensated for their expertise",
+    "[LIVED_EXPERIENCE_COMMITMENT_3]": "Lived experience is recognized as equal to academic or professional expertise",
+    # Harm Reduction commitments
+    "[HARM_REDUCTION_COMMITMENT_1]": "Programs are grounded in evidence-based harm reduction principles",
+    "[HARM_REDUCTION_COMMITMENT_2]": "People's choices about drug use are respected without judgment",
+    "[HARM_REDUCTION_COMMITMENT_3]": "Support is offered without requiring abstinence or behavior change",
+    # Cultural Safety commitments
+    "[CULTURAL_SAFETY_COMMITMENT_1]": "Aboriginal and Torres Strait Islander peoples' cultural protocols are respected",
+    "[CULTURAL_SAFETY_COMMITMENT_2]": "LGBTIQ+ inclusion is embedded in all programs",
+    "[CULTURAL_SAFETY_COMMITMENT_3]": "Programs are accessible to culturally and linguistically diverse communities",
+    # Data Ethics commitments
+    "[DATA_ETHICS_COMMITMENT_1]": "Participants provide free and informed consent for data collection and use",
+    "[DATA_ETHICS_COMMITMENT_2]": "Data security and privacy are prioritized in all systems",
+    "[DATA_ETHICS_COMMITMENT_3]": "Community benefits from data use - never harmed by it",
+    # Evidence requirements
+    "[EVIDENCE_REQUIREMENT_1]": "All programs cite relevant harm reduction research and community evidence",
+    "[EVIDENCE_REQUIREMENT_2]": "Community knowledge and lived experience are valued as evidence",
+    "[EVIDENCE_REQUIREMENT_3]": "Programs adapt based on evaluation findings and community feedback",
+    # Evaluation requirements
+    "[EVALUATION_REQUIREMENT_1]": "Evaluation questions and methods are defined before program starts",
+    "[EVALUATION_REQUIREMENT_2]": "People with lived experience participate in evaluation design and analysis",
+    "[EVALUATION_REQUIREMENT_3]": "Evaluation findings are shared with community and contribute to harm reduction knowledge",
+    # Budget requirements
+    "[BUDGET_REQUIREMENT_1]": "Budgets reflect true costs including adequate peer worker compensation",
+    "[BUDGET_REQUIREMENT_2]": "Financial sustainability is planned from program design phase",
+    "[BUDGET_REQUIREMENT_3]": "Budget priorities align with organizational values (fair pay, cultural safety, community benefit)",
+    # Accountability mechanisms
+    "[ACCOUNTABILITY_MECHANISM_1]": "Programs are reviewed regularly by staff, management, and consumer advisory",
+    "[ACCOUNTABILITY_MECHANISM_2]": "Community feedback is actively sought and incorporated",
+    "[ACCOUNTABILITY_MECHANISM_3]": "Deviations from constitutional principles require explicit justification and approval",
+}
+
+
+def mission(
+    set: Optional[str] = typer.Option(
+        None, "--set", help="Set mission statement and create constitution"
+    ),
+    edit: bool = typer.Option(False, "--edit", help="Edit constitution in default editor"),
+    show: bool = typer.Option(False, "--show", help="Display current constitution"),
+):
+    """Create or manage the NUAA mission constitution."""
+    show_banner()
+    constitution_path = Path("memory/constitution.md")
+
+    if show:
+        # Display existing constitution
+        if not constitution_path.exists():
+            console.print("[yellow]No constitution found. Create one with --set[/yellow]")
+            raise typer.Exit(1)
+        content = constitution_path.read_text(encoding="utf-8")
+        console.print(Panel(content, title="Mission Constitution", border_style="blue"))
+
+    elif edit:
+        # Open in default editor
+        if not constitution_path.exists():
+            console.print("[yellow]No constitution found. Create one first with --set[/yellow]")
+            raise typer.Exit(1)
+        typer.launch(str(constitution_path), locate=False)
+        console.print("✓ Constitution updated. Run agent context update if needed.")
+
+    elif set:
+        # Create new constitution from template
+        try:
+            template = _load_compiled_template("mission-constitution-template.md")
+        except FileNotFoundError:
+            console.print("[red]Template not found. Check installation.[/red]")
+            raise typer.Exit(1)
+
+        today = datetime.now().strftime("%Y-%m-%d")
+        next_year = datetime.now().replace(year=datetime.now().year + 1).strftime("%Y-%m-%d")
+        content = template.render(
+            {
+                **_CONSTITUTION_DEFAULTS,
+                "[CORE_MISSION]": set,
+                "[RATIFICATION_DATE]": today,
+                "[NEXT_REVIEW_DATE]": next_year,
+            }
+        )
+        constitution_path.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            with file_lock(constitution_path):
+                write_atomic(constitution_path, content)
+        except LockTimeout as e:
+            console.print(f"[red]Error:[/red] {e}")
+            raise typer.Exit(1)
+
+        console.print(f"✓ Mission constitution created at {constitution_path}")
+
+        # Update agent context files
+        update_script_bash = Path("scripts/bash/update-agent-context.sh")
+        update_script_ps = Path("scripts/powershell/update-agent-context.ps1")
+
+        script_run = False
+        if sys.platform == "win32" and update_script_ps.exists():
+            try:
+                result = subprocess.run(
+                    ["pwsh", "-File", str(update_script_ps)],
+                    capture_output=True,
+                    text=True,
+                    timeout=30,
+                )
+                if result.returncode == 0:
+                    console.print("✓ Updated agent context files")
+                    script_run = True
+                else:
+                    console.print(
+                        f"[yellow]⚠ Agent context update returned error: {result.stderr}[/yellow]"
+                    )
+            except Exception as e:
+                console.print(f"[yellow]⚠ Could not run agent context update: {e}[/yellow]")
+        elif update_script_bash.exists():
+            try:
+                result = subprocess.run(
+                    ["bash", str(update_script_bash)], capture_output=True, text=True, timeout=30
+                )
+                if result.returncode == 0:
+                    console.print("✓ Updated agent context files")
+                    script_run = True
+                else:
+                    console.print(
+                        f"[yellow]⚠ Agent context update returned error: {result.stderr}[/yellow]"
+                    )
+            except Exception as e:
+                console.print(f"[yellow]⚠ Could not run agent context update: {e}[/yellow]")
+
+        if not script_run:
+            console.print(
+                "[yellow]⚠ Could not find update script. Manually run agent context update if needed.[/yellow]"
+            )
+
+    else:
+        console.print("Use --set, --edit, or --show")
+        raise typer.Exit(1)
@@ -0,0 +1,72 @@
+"""Prepare a document plan for an initiative."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.panel import Panel
+
+from ..ui import console, show_banner
+from ..workspace import latest_initiative
+
+
+def plan(
+    initiative: Optional[str] = typer.Argument(
+        None,
+        help="Initiative to plan (e.g., '001-naloxone-distribution'). If not provided, uses most recent.",
+    ),
+    doc_type: Optional[str] = typer.Option(
+        None, "--type", help="Document type: proposal, design, evaluation, impact"
+    ),
+):
+    """Create a document plan from a program specification."""
+    show_banner()
+
+    # Determine initiative
+    if initiative is None:
+        initiatives_dir = Path("initiatives")
+        if not initiatives_dir.exists():
+            console.print("[red]Error: No initiatives directory found[/red]")
+            raise typer.Exit(1)
+
+        initiative = latest_initiative()
+        if initiative is None:
+            console.print("[red]Error: No initiatives found[/red]")
+            raise typer.Exit(1)
+
+    # Check spec exists and is complete
+    spec_file = Path(f"initiatives/{initiative}/spec.md")
+    if not spec_file.exists():
+        console.print(f"[red]Error: Specification not found: {spec_file}[/red]")
+        console.print("[yellow]Run 'nuaa specify' first to create a specification[/yellow]")
+        raise typer.Exit(1)
+
+    # Check for clarification markers
+    spec_content = spec_file.read_text()
+    if "[NEEDS CLARIFICATION:" in spec_content:
+        console.print("[yellow]Warning: Specification has unresolved clarifications[/yellow]")
+        console.print("[yellow]Consider running 'nuaa clarify' first[/yellow]")
+
+        if not typer.confirm("Continue anyway?"):
+            raise typer.Exit(0)
+
+    # Success message
+    plan_file = Path(f"initiatives/{initiative}/plan.md")
+    console.print(
+        Panel(
+            f"[green]✓[/green] Initiative: [cyan]{initiative}[/cyan]\n"
+            f"[green]✓[/green] Specification: [cyan]{spec_file}[/cyan]\n"
+            f"[green]✓[/green] Document type: [cyan]{doc_type or 'auto-detect'}[/cyan]\n\n"
+            f"[bold]AI will create:[/bold]\n"
+            f"  • Document plan with section breakdown\n"
+            f"  • Gate assignments for each section\n"
+            f"  • Dependency mapping between sections\n"
+            f"  • Quality criteria for validation\n\n"
+            f"[bold]Next steps:[/bold]\n"
+            f"  1. Have AI create the plan using [cyan]/nuaa.plan[/cyan]\n"
+            f"  2. Review the plan in [cyan]{plan_file}[/cyan]\n"
+            f"  3. Start drafting with [cyan]nuaa draft [SECTION][/cyan]",
+            title="Ready to Plan",
+            border_style="green",
+        )
+    )
@@ -0,0 +1,51 @@
+"""Scaffold a funding proposal."""
+
+from datetime import datetime
+
+import typer
+
+from ..scaffold import (
+    _feature_dir_for_program,
+    _prepend_metadata,
+    _render_template,
+    _write_markdown,
+)
+from ..ui import console, show_banner
+
+
+def propose(
+    program_name: str = typer.Argument(..., help="Program name (existing or new)"),
+    funder: str = typer.Argument(..., help="Funder name"),
+    amount: str = typer.Argument(..., help="Amount requested, e.g., $50000"),
+    duration: str = typer.Argument(..., help="Duration e.g., '12 months'"),
+    force: bool = typer.Option(False, help="Overwrite if proposal.md exists"),
+):
+    """Create a funding proposal from the template, linked to the program design."""
+    show_banner()
+    feature_dir = _feature_dir_for_program(program_name)
+    created = datetime.now().strftime("%Y-%m-%d")
+    mapping = {
+        "PROGRAM_NAME": program_name,
+        "FUNDER": funder,
+        "AMOUNT": amount,
+        "DURATION": duration,
+        "DATE": created,
+    }
+    try:
+        filled = _render_template("proposal.md", mapping)
+        meta = {
+            "title": f"{program_name} - Proposal",
+            "funder": funder,
+            "amount": amount,
+            "created": created,
+        }
+        text = _prepend_metadata(filled, meta)
+        dest = feature_dir / "proposal.md"
+        if dest.exists() and not force:
+            console.print(f"[yellow]File exists, skipping:[/yellow] {dest}")
+        else:
+            _write_markdown(dest, text)
+            console.print(f"[green]Created:[/green] {dest}")
+    except Exception as e:
+        console.print(f"[red]Failed to create proposal.md:[/red] {e}")
+        raise typer.Exit(1)
@@ -0,0 +1,32 @@
+"""Record refinement entries in a feature changelog."""
+
+import typer
+
+from ..locks import LockTimeout, file_lock, write_atomic
+from ..scaffold import _find_feature_dir_by_program, _stamp
+from ..ui import console, show_banner
+
+
+def refine(
+    program_name: str = typer.Argument(..., help="Program name (existing)"),
+    note: str = typer.Option("Refinement applied", "--note", help="Changelog note to record"),
+):
+    """Record a refinement entry in the feature CHANGELOG.md."""
+    show_banner()
+    feature_dir = _find_feature_dir_by_program(program_name)
+    if not feature_dir:
+        console.print("[red]Could not find feature directory for program[/red]")
+        raise typer.Exit(1)
+    changelog = feature_dir / "CHANGELOG.md"
+    entry = f"- {_stamp()} - {note}\n"
+    try:
+        with file_lock(changelog):
+            if changelog.exists():
+                with open(changelog, "a", encoding="utf-8") as f:
+                    f.write(entry)
+            else:
+                write_atomic(changelog, f"# Changelog for {feature_dir.name}\n\n" + entry)
+    except LockTimeout as e:
+        console.print(f"[red]Error:[/red] {e}")
+        raise typer.Exit(1)
+    console.print(f"[green]Updated:[/green] {changelog}")
@@ -0,0 +1,51 @@
+"""Scaffold a program report."""
+
+from datetime import datetime
+
+import typer
+
+from ..scaffold import (
+    _feature_dir_for_program,
+    _write_markdown,
+)
+from ..ui import console, show_banner
+
+
+def report(
+    program_name: str = typer.Argument(..., help="Program name (existing)"),
+    report_type: str = typer.Option(
+        "final",
+        "--type",
+        help="Report type: progress|mid-program|final|quarterly|annual",
+    ),
+    force: bool = typer.Option(False, help="Overwrite if exists"),
+):
+    """Generate a simple report scaffold referencing program artifacts."""
+    show_banner()
+    feature_dir = _feature_dir_for_program(program_name)
+    created = datetime.now().strftime("%Y-%m-%d")
+    content = f"""# {program_name} - {report_type.title()} Report
+
+Generated: {created}
+
+This is a scaffold report. Populate the sections based on your impact framework and collected data.
+
+## Overview
+
+## Key Findings
+
+## Progress Against Logic Model
+
+## Equity Analysis
+
+## Budget vs Actuals
+
+## Lessons Learned and Recommendations
+
+"""
+    dest = feature_dir / "report.md"
+    if dest.exists() and not force:
+        console.print(f"[yellow]File exists, skipping:[/yellow] {dest}")
+    else:
+        _write_markdown(dest, content)
+        console.print(f"[green]Created:[/green] {dest}")
@@ -0,0 +1,131 @@
+"""Manage the document review process."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.panel import Panel
+
+from ..ui import console, show_banner
+from ..workspace import latest_initiative, record_initiative
+
+
+def review(
+    initiative: Optional[str] = typer.Argument(
+        None, help="Initiative to review (uses most recent if not specified)"
+    ),
+    action: str = typer.Option(
+        "start", "--action", help="Action: start, add-feedback, summarize, plan-revisions, complete"
+    ),
+):
+    """Manage document review process."""
+    show_banner()
+
+    # Determine initiative
+    if initiative is None:
+        initiatives_dir = Path("initiatives")
+        if not initiatives_dir.exists():
+            console.print("[red]Error: No initiatives directory found[/red]")
+            raise typer.Exit(1)
+
+        initiative = latest_initiative()
+        if initiative is None:
+            console.print("[red]Error: No initiatives found[/red]")
+            raise typer.Exit(1)
+
+    # Check final document exists (for most actions)
+    if action != "start":
+        final_dir = Path(f"initiatives/{initiative}/final")
+        if not final_dir.exists() or not list(final_dir.glob("*.md")):
+            console.print("[red]Error: No assembled document found[/red]")
+            console.print("[yellow]Run 'nuaa assemble' first[/yellow]")
+            raise typer.Exit(1)
+
+    # Create reviews directory if needed
+    reviews_dir = Path(f"initiatives/{initiative}/reviews")
+    reviews_dir.mkdir(exist_ok=True)
+    record_initiative(initiative)
+
+    # Action-specific messages
+    if action == "start":
+        console.print(
+            Panel(
+                f"[green]✓[/green] Initiative: [cyan]{initiative}[/cyan]\n"
+                f"[green]✓[/green] Reviews directory: [cyan]{reviews_dir}[/cyan]\n\n"
+                f"[bold]AI will:[/bold]\n"
+                f"  • Create new review round directory\n"
+                f"  • Generate review tracking file\n"
+                f"  • Create feedback templates for reviewers\n"
+                f"  • Set initiative status to 'Under Review'\n\n"
+                f"[bold]Have AI run:[/bold] [cyan]/nuaa.review --action start[/cyan]",
+                title="Start Review",
+                border_style="blue",
+            )
+        )
+
+    elif action == "add-feedback":
+        console.print(
+            Panel(
+                f"[green]✓[/green] Initiative: [cyan]{initiative}[/cyan]\n\n"
+                f"[bold]AI will:[/bold]\n"
+                f"  • Collect feedback items interactively\n"
+                f"  • Organize by section and severity\n"
+                f"  • Update review tracking file\n"
+                f"  • Save feedback to reviewer file\n\n"
+                f"[bold]Have AI run:[/bold] [cyan]/nuaa.review --action add-feedback[/cyan]",
+                title="Add Feedback",
+                border_style="blue",
+            )
+        )
+
+    elif action == "summarize":
+        console.print(
+            Panel(
+                f"[green]✓[/green] Initiative: [cyan]{initiative}[/cyan]\n\n"
+                f"[bold]AI will:[/bold]\n"
+                f"  • Read all feedback files\n"
+                f"  • Group by section and severity\n"
+                f"  • Identify patterns across reviewers\n"
+                f"  • Generate comprehensive summary\n\n"
+                f"[bold]Have AI run:[/bold] [cyan]/nuaa.review --action summarize[/cyan]",
+                title="Summarize Feedback",
+                border_style="blue",
+            )
+        )
+
+    elif action == "plan-revisions":
+        console.print(
+            Panel(
+                f"[green]✓[/green] Initiative: [cyan]{initiative}[/cyan]\n\n"
+                f"[bold]AI will:[/bold]\n"
+                f"  • Analyze all feedback\n"
+                f"  • Create prioritized revision plan\n"
+                f"  • Estimate revision effort\n"
+                f"  • Provide step-by-step commands\n\n"
+                f"[bold]Have AI run:[/bold] [cyan]/nuaa.review --action plan-revisions[/cyan]",
+                title="Plan Revisions",
+                border_style="blue",
+            )
+        )
+
+    elif action == "complete":
+        console.print(
+            Panel(
+                f"[green]✓[/green] Initiative: [cyan]{initiative}[/cyan]\n\n"
+                f"[bold]AI will:[/bold]\n"
+                f"  • Verify critical issues addressed\n"
+                f"  • Archive review files\n"
+                f"  • Update document status\n"
+                f"  • Suggest next steps\n\n"
+                f"[bold]Have AI run:[/bold] [cyan]/nuaa.review --action complete[/cyan]",
+                title="Complete Review",
+                border_style="blue",
+            )
+        )
+
+    else:
+        console.print(f"[red]Error: Unknown action: {action}[/red]")
+        console.print(
+            "[yellow]Valid actions: start, add-feedback, summarize, plan-revisions, complete[/yellow]"
+        )
+        raise typer.Exit(1)
@@ -0,0 +1,82 @@
+"""Revise drafted sections."""
+
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.panel import Panel
+
+from ..planfile import section_filename
+from ..ui import console, show_banner
+from ..workspace import latest_initiative
+
+
+def revise(
+    section: str = typer.Argument(..., help="Section name to revise"),
+    initiative: Optional[str] = typer.Option(
+        None, "--initiative", help="Initiative (uses most recent if not specified)"
+    ),
+    revision_type: str = typer.Option(
+        "feedback", "--type", help="Revision type: placeholder, feedback, consistency, enhancement"
+    ),
+    feedback: Optional[str] = typer.Option(None, "--feedback", help="Specific feedback to address"),
+):
+    """Revise a drafted section based on feedback or new information."""
+    show_banner()
+
+    # Determine initiative
+    if initiative is None:
+        initiatives_dir = Path("initiatives")
+        if not initiatives_dir.exists():
+            console.print("[red]Error: No initiatives directory found[/red]")
+            raise typer.Exit(1)
+
+        initiative = latest_initiative()
+        if initiative is None:
+            console.print("[red]Error: No initiatives found[/red]")
+            raise typer.Exit(1)
+
+    # Check section exists
+    section_file = Path(f"initiatives/{initiative}/sections") / section_filename(section)
+
+    if not section_file.exists():
+        console.print(f"[red]Error: Section not found: {section_file}[/red]")
+        console.print("[yellow]Use 'nuaa draft' to create initial draft first[/yellow]")
+        raise typer.Exit(1)
+
+    # Validate revision type
+    valid_types = ["placeholder", "feedback", "consistency", "enhancement"]
+    if revision_type not in valid_types:
+        console.print(f"[red]Error: Invalid revision type: {revision_type}[/red]")
+        console.print(f"[yellow]Valid types: {', '.join(valid_types)}[/yellow]")
+        raise typer.Exit(1)
+
+    # Check for feedback if type is feedback
+    if revision_type == "feedback" and not feedback:
+        console.print("[yellow]Warning: No feedback provided for feedback revision[/yellow]")
+        console.print('[yellow]Consider using --feedback "your specific feedback"[/yellow]')
+
+    console.print(
+        Panel(
+            f"[green]✓[/green] Section: [cyan]{section}[/cyan]\n"
+            f"[green]✓[/green] File: [cyan]{section_file}[/cyan]\n"
+            f"[green]✓[/green] Revision type: [cyan]{revision_type}[/cyan]\n"
+            + (f"[green]✓[/green] Feedback: [cyan]{feedback}[/cyan]\n" if feedback else "")
+            + "\n[bold]AI will:[/bold]\n"
+            + ("  • Resolve placeholder markers\n" if revision_type == "placeholder" else "")
+            + ("  • Address specific feedback points\n" if revision_type == "feedback" else "")
+            + (
+                "  • Re-read dependencies and align content\n"
+                if revision_type == "consistency"
+                else ""
+            )
+            + ("  • Strengthen evidence and clarity\n" if revision_type == "enhancement" else "")
+            + f"  • Update revision history\n"
+            f"  • Maintain existing content structure\n\n"
+            f'[bold]Have AI run:[/bold] [cyan]/nuaa.revise "{section}" --type {revision_type}'
+            + (f' --feedback "{feedback}"' if feedback else "")
+            + "[/cyan]",
+            title="Ready to Revise",
+            border_style="blue",
+        )
+    )
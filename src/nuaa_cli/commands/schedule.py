@@ -0,0 +1,140 @@
+"""Plan parallel drafting of an initiative's sections across several agents."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.markup import escape
+from rich.table import Table
+
+from ..planfile import load_plan
+from ..schedule import Schedule, build_schedule
+from ..ui import console, show_banner
+from ..workspace import latest_initiative
+
+
+def _schedule_json(initiative: str, schedule: Schedule, errors: list[str]) -> dict:
+    return {
+        "initiative": initiative,
+        "agents": schedule.agents,
+        "waves": [[s.name for s in wave] for wave in schedule.waves],
+        "critical_path": {
+            "words": schedule.critical_length,
+            "sections": [s.name for s in schedule.critical_path],
+        },
+        "assignments": [
+            {
+                "agent": slot.agent,
+                "section": slot.section.name,
+                "number": slot.section.number,
+                "start": slot.start,
+                "end": slot.end,
+            }
+            for slot in schedule.slots
+        ],
+        "makespan": schedule.makespan,
+        "lower_bound": schedule.lower_bound,
+        "total_words": schedule.total,
+        "errors": errors,
+    }
+
+
+def _print_schedule(initiative: str, schedule: Schedule) -> None:
+    waves = Table(title=f"Drafting waves: {initiative}", show_header=True, header_style="bold")
+    waves.add_column("Wave", justify="right")
+    waves.add_column("Sections (can be drafted in parallel)", style="cyan")
+    for number, wave in enumerate(schedule.waves, start=1):
+        waves.add_row(str(number), escape(", ".join(s.name for s in wave)))
+    console.print(waves)
+
+    chain = " → ".join(s.name for s in schedule.critical_path)
+    console.print(
+        f"[bold]Critical path:[/bold] {escape(chain)} "
+        f"([cyan]{schedule.critical_length}[/cyan] words)"
+    )
+
+    agents = Table(
+        title=f"Assignment for {schedule.agents} agent(s)", show_header=True, header_style="bold"
+    )
+    agents.add_column("Agent", justify="right")
+    agents.add_column("Sections, in order", style="cyan")
+    agents.add_column("Words", justify="right")
+    agents.add_column("Done at", justify="right")
+    for agent in range(1, schedule.agents + 1):
+        slots = [slot for slot in schedule.slots if slot.agent == agent]
+        order = ", ".join(f"{slot.section.name} ({slot.start}–{slot.end})" for slot in slots)
+        agents.add_row(
+            str(agent),
+            escape(order) or "[dim]idle[/dim]",
+            str(sum(slot.end - slot.start for slot in slots)),
+            str(max((slot.end for slot in slots), default=0)),
+        )
+    console.print(agents)
+    console.print(
+        f"Makespan: [bold]{schedule.makespan}[/bold] words of drafting "
+        f"(lower bound {schedule.lower_bound}, {schedule.total} words in total)"
+    )
+
+
+def schedule(
+    agents: int = typer.Option(
+        2, "--agents", "-n", min=1, help="Number of agents drafting in parallel"
+    ),
+    initiative: Optional[str] = typer.Option(
+        None, "--initiative", help="Initiative to schedule (uses most recent if not specified)"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the schedule as JSON"),
+):
+    """
+    Split the unfinished sections of a plan into parallel drafting waves.
+
+    Sections are weighted by their **Estimated Length** in plan.md. The schedule
+    shows which sections can be drafted at the same time, the critical path, and
+    an assignment to N agents that keeps the overall drafting time short.
+    Times are measured in words drafted.
+
+    Examples:
+        nuaa schedule
+        nuaa schedule --agents 4
+        nuaa schedule --agents 3 --json
+    """
+    if not as_json:
+        show_banner()
+
+    # Determine initiative
+    if initiative is None:
+        if not Path("initiatives").exists():
+            console.print("[red]Error: No initiatives directory found[/red]")
+            raise typer.Exit(1)
+
+        initiative = latest_initiative()
+        if initiative is None:
+            console.print("[red]Error: No initiatives found[/red]")
+            raise typer.Exit(1)
+
+    plan_file = Path(f"initiatives/{initiative}/plan.md")
+    if not plan_file.exists():
+        console.print(f"[red]Error: Plan not found: {plan_file}[/red]")
+        console.print("[yellow]Run 'nuaa plan' first to create a document plan[/yellow]")
+        raise typer.Exit(1)
+
+    plan = load_plan(plan_file)
+    errors = plan.check().errors
+    if errors and not as_json:
+        for error in errors:
+            console.print(f"[red]Error:[/red] {escape(error)}")
+        console.print("[yellow]Fix the dependencies in plan.md before scheduling[/yellow]")
+        raise typer.Exit(1)
+
+    result = build_schedule(plan, agents)
+    if as_json:
+        typer.echo(json.dumps(_schedule_json(initiative, result, errors), indent=2))
+        if errors:
+            raise typer.Exit(1)
+        return
+
+    if not result.slots:
+        console.print("[green]All sections have passed their gates; nothing to schedule[/green]")
+        return
+    _print_schedule(initiative, result)
@@ -0,0 +1,59 @@
+"""Create a new program specification."""
+
+from typing import Optional
+
+import typer
+from rich.markup import escape
+from rich.panel import Panel
+
+from ..initiatives import create_initiative
+from ..locks import LockTimeout
+from ..ui import console, show_banner
+
+
+def specify(
+    description: str = typer.Argument(
+        ..., help="Program description (e.g., 'Peer-led naloxone distribution program')"
+    ),
+    short_name: Optional[str] = typer.Option(
+        None, "--short-name", help="Custom short name (2-4 words) for the initiative folder"
+    ),
+    number: Optional[int] = typer.Option(
+        None, "--number", min=1, help="Initiative number to use instead of the next free one"
+    ),
+):
+    """Create a new program specification with auto-numbered initiative."""
+    show_banner()
+
+    try:
+        created = create_initiative(description, short_name=short_name, number=number)
+    except FileNotFoundError as e:
+        console.print(f"[red]Error: {escape(str(e))}[/red]")
+        console.print(
+            "[yellow]Please ensure you're running from a NUAA project directory.[/yellow]"
+        )
+        raise typer.Exit(1)
+    except FileExistsError:
+        console.print(f"[red]Error: Initiative number {number:03d} is already in use[/red]")
+        raise typer.Exit(1)
+    except (LockTimeout, OSError) as e:
+        console.print(f"[red]Error creating initiative: {escape(str(e))}[/red]")
+        raise typer.Exit(1)
+
+    spec_file = created.spec_file.relative_to(created.directory.parents[1])
+
+    # Success message
+    console.print(
+        Panel(
+            f"[green]✓[/green] Created initiative: [cyan]{created.name}[/cyan]\n"
+            f"[green]✓[/green] Specification: [cyan]{spec_file}[/cyan]\n\n"
+            f"[yellow]⚠[/yellow] Specification has [yellow][PLACEHOLDER][/yellow] markers - AI will fill these\n"
+            f"[yellow]⚠[/yellow] AI may add [yellow][NEEDS CLARIFICATION][/yellow] markers for ambiguities\n\n"
+            f"[bold]Next steps:[/bold]\n"
+            f"  1. Have AI fill in the specification using [cyan]/nuaa.specify[/cyan]\n"
+            f"  2. Run [cyan]nuaa clarify[/cyan] to resolve any ambiguities\n"
+            f"  3. Run [cyan]nuaa plan[/cyan] to create implementation plan",
+            title="Initiative Created",
+            border_style="green",
+        )
+    )
@@ -0,0 +1,132 @@
+"""Report initiative progress."""
+
+import json
+from pathlib import Path
+from typing import Optional
+
+import typer
+from rich.markup import escape
+from rich.panel import Panel
+from rich.table import Table
+
+from ..progress import BLOCKED, FAILED, IN_PROGRESS, PASSED, READY, initiative_status
+from ..ui import console, show_banner
+from ..workspace import latest_initiative
+
+STATE_LABELS = {
+    PASSED: "[green]✓ Passed[/green]",
+    IN_PROGRESS: "[cyan]🔄 In Progress[/cyan]",
+    BLOCKED: "[yellow]⏸ Blocked[/yellow]",
+    READY: "⭕ Not Started",
+    FAILED: "[red]❌ Failed[/red]",
+}
+
+
+def _print_report(report: dict) -> None:
+    console.print(
+        Panel(
+            f"Initiative: [cyan]{report['initiative']}[/cyan]\n"
+            f"Overall progress: [bold]{report['completion']}%[/bold] "
+            f"({report['passed']} of {report['total']} sections passed, "
+            f"{report['drafted']} drafted)\n"
+            f"Critical path: [bold]{report['critical_path']['length']}[/bold] section(s) remaining",
+            title="Initiative Status",
+            border_style="blue",
+        )
+    )
+    if not report["sections"]:
+        console.print("[yellow]No sections found in plan.md[/yellow]")
+        console.print("[dim]To break the document into sections, have AI run /nuaa.plan[/dim]")
+        return
+
+    sections = Table(title="Section Progress", show_header=True, header_style="bold")
+    sections.add_column("#", justify="right")
+    sections.add_column("Section", style="cyan")
+    sections.add_column("Gate", justify="center")
+    sections.add_column("Status")
+    sections.add_column("Words", justify="right")
+    sections.add_column("Blocker")
+    for s in report["sections"]:
+        label = STATE_LABELS.get(s["state"], escape(s["status"]))
+        sections.add_row(
+            str(s["number"]),
+            escape(s["name"]),
+            str(s["gate"]) if s["gate"] is not None else "?",
+            label,
+            str(s["words"]) if s["draft"] else "-",
+            escape(", ".join(s["blockers"])) if s["state"] != PASSED and s["blockers"] else "-",
+        )
+    console.print(sections)
+
+    gates = Table(title="Gate Summary", show_header=True, header_style="bold")
+    for column in ("Gate", "Passed", "In Progress", "Failed", "Remaining", "Pass Rate"):
+        gates.add_column(column, justify="right")
+    for gate, counts in report["gates"].items():
+        gates.add_row(
+            gate,
+            str(counts[PASSED]),
+            str(counts[IN_PROGRESS]),
+            str(counts[FAILED]),
+            str(counts["remaining"]),
+            f"{counts['pass_rate']}%",
+        )
+    console.print(gates)
+
+    if report["next"]:
+        console.print("[bold]Ready to draft:[/bold] " + escape(", ".join(report["next"])))
+    if report["critical_path"]["sections"]:
+        chain = " → ".join(report["critical_path"]["sections"])
+        console.print(f"[bold]Critical path:[/bold] {escape(chain)}")
+    for error in report["errors"]:
+        console.print(f"[red]Error:[/red] {escape(error)}")
+    console.print("[dim]For recommendations, have AI run /nuaa.status[/dim]")
+
+
+def status(
+    initiative: Optional[str] = typer.Argument(
+        None, help="Initiative to check (uses most recent if not specified)"
+    ),
+    as_json: bool = typer.Option(False, "--json", help="Print the report as JSON"),
+):
+    """
+    Show initiative progress and section gate status.
+
+    Progress is computed from plan.md and the drafts in sections/, and cached
+    until one of those files changes.
+
+    Examples:
+        nuaa status
+        nuaa status 001-naloxone-distribution --json
+    """
+    if not as_json:
+        show_banner()
+
+    # Determine initiative
+    if initiative is None:
+        initiatives_dir = Path("initiatives")
+        if not initiatives_dir.exists():
+            console.print("[red]Error: No initiatives directory found[/red]")
+            raise typer.Exit(1)
+
+        initiative = latest_initiative()
+        if initiative is None:
+            console.print("[red]Error: No initiatives found[/red]")
+            raise typer.Exit(1)
+
+    # Check plan exists
+    plan_file = Path(f"initiatives/{initiative}/plan.md")
+    if not plan_file.exists():
+        console.print(f"[red]Error: Plan not found: {plan_file}[/red]")
+        console.print("[yellow]Run 'nuaa plan' first to create a document plan[/yellow]")
+        raise typer.Exit(1)
+
+    try:
+        report = initiative_status(initiative)
+    except OSError as e:
+        console.print(f"[red]Error reading {plan_file}: {e}[/red]")
+        raise typer.Exit(1)
+
+    if as_json:
+        typer.echo(json.dumps(report, indent=2, ensure_ascii=False))
+    else:
+        _print_report(report)
@@ -0,0 +1,188 @@
+"""Manage release template archives (offline bundles for air-gapped installs)."""
+
+from pathlib import Path
+
+import httpx
+import typer
+from rich.table import Table
+
+from ..bundle import bundle_filename, write_bundle
+from ..cache import TemplateCache
+from ..config import AGENT_CONFIG, SCRIPT_TYPE_CHOICES
+from ..download import fetch_asset_into_cache, fetch_release, find_template_asset
+from ..github import get_ssl_context
+from ..render import build_release_packages, kit_root, kit_version
+from ..ui import console, show_banner
+
+templates_app = typer.Typer(help="Manage release template archives", add_completion=False)
+
+
+@templates_app.callback()
+def templates():
+    """Manage release template archives."""
+
+
+@templates_app.command()
+def bundle(
+    release: str | None = typer.Option(
+        None, "--release", help="Release tag to bundle (defaults to the latest release)"
+    ),
+    output: Path | None = typer.Option(
+        None,
+        "--output",
+        "-o",
+        help="Bundle file or directory to write (defaults to nuaa-templates-<tag>.zip in the current directory)",
+    ),
+    skip_tls: bool = typer.Option(
+        False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"
+    ),
+    debug: bool = typer.Option(
+        False, "--debug", help="Show verbose diagnostic output for network failures"
+    ),
+    github_token: str | None = typer.Option(
+        None,
+        "--github-token",
+        help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)",
+    ),
+):
+    """
+    Pack every agent/script template of one release into an offline bundle.
+
+    Assets already in the local template cache are not downloaded again. Use the
+    bundle on a machine without network access:
+
+    Examples:
+        nuaa templates bundle
+        nuaa templates bundle --release v1.2.0 -o /media/usb/
+        nuaa init my-project --ai claude --template-source /media/usb/nuaa-templates-v1.2.0.zip
+    """
+    show_banner()
+
+    cache = TemplateCache()
+    archives: list[tuple[str, Path, str]] = []
+    missing: list[str] = []
+
+    table = Table(title="Template Bundle", show_lines=False)
+    table.add_column("Asset", style="cyan")
+    table.add_column("Size", justify="right")
+    table.add_column("Source", style="dim")
+
+    with httpx.Client(verify=get_ssl_context() if not skip_tls else False) as client:
+        try:
+            release_data = fetch_release(
+                client, tag=release, github_token=github_token, cache=cache, debug=debug
+            )
+        except Exception as e:
+            console.print(f"[red]Error fetching release information:[/red] {e}")
+            raise typer.Exit(1)
+
+        tag = release_data.get("tag_name", release or "unknown")
+        assets = release_data.get("assets", [])
+        console.print(f"[cyan]Bundling release:[/cyan] {tag}")
+
+        for agent in AGENT_CONFIG:
+            for script in SCRIPT_TYPE_CHOICES:
+                asset = find_template_asset(assets, agent, script)
+                if asset is None:
+                    missing.append(f"{agent}-{script}")
+                    continue
+                try:
+                    blob, was_cached = fetch_asset_into_cache(
+                        client,
+                        cache,
+                        tag,
+                        asset,
+                        show_progress=False,
+                        github_token=github_token,
+                        debug=debug,
+                    )
+                except Exception as e:
+                    console.print(f"[red]Error downloading {asset['name']}:[/red] {e}")
+                    raise typer.Exit(1)
+                # Cache blobs are named by their SHA-256
+                archives.append((asset["name"], blob, blob.name))
+                table.add_row(
+                    asset["name"],
+                    f"{blob.stat().st_size:,}",
+                    "cache" if was_cached else "downloaded",
+                )
+
+    if not archives:
+        console.print(f"[red]Error:[/red] Release {tag} has no template assets")
+        raise typer.Exit(1)
+
+    dest = output or Path.cwd()
+    if dest.is_dir() or output is None:
+        dest = dest / bundle_filename(tag)
+    write_bundle(dest, tag, archives)
+
+    console.print(table)
+    if missing:
+        console.print(f"[yellow]Warning:[/yellow] No asset published for: {', '.join(missing)}")
+    console.print(
+        f"\n[bold green]Wrote {len(archives)} templates to[/bold green] {dest} "
+        f"({dest.stat().st_size:,} bytes)"
+    )
+
+
+def _split_list(value: str | None, allowed: dict, kind: str) -> list[str]:
+    if not value:
+        return list(allowed)
+    items = list(dict.fromkeys(v for v in value.replace(",", " ").split() if v))
+    unknown = [v for v in items if v not in allowed]
+    if unknown:
+        console.print(
+            f"[red]Error:[/red] Unknown {kind} {', '.join(unknown)} (allowed: {', '.join(allowed)})"
+        )
+        raise typer.Exit(1)
+    return items
+
+
+@templates_app.command()
+def build(
+    version: str | None = typer.Option(
+        None, "--version", help="Version for the archive names (defaults to the CLI version)"
+    ),
+    agents: str | None = typer.Option(
+        None, "--agents", help="Comma or space separated agents to build (default: all)"
+    ),
+    scripts: str | None = typer.Option(
+        None, "--scripts", help="Comma or space separated script types to build (default: sh ps)"
+    ),
+    output: Path = typer.Option(
+        Path(".genreleases"), "--output", "-o", help="Directory to write the archives to"
+    ),
+    jobs: int | None = typer.Option(
+        None, "--jobs", "-j", help="Number of packages to render in parallel"
+    ),
+):
+    """
+    Render release template archives locally from the bundled NUAA kit.
+
+    Produces the same nuaa-template-<agent>-<script>-<version>.zip archives as the
+    release workflow, rendering all agents in parallel. No network access is needed.
+
+    Examples:
+        nuaa templates build
+        nuaa templates build --agents claude,gemini --scripts sh -o dist/
+    """
+    root = kit_root()
+    if root is None:
+        console.print("[red]Error:[/red] NUAA kit sources (nuaa-kit/commands) are not available")
+        raise typer.Exit(1)
+
+    agent_list = _split_list(agents, AGENT_CONFIG, "agent")
+    script_list = _split_list(scripts, SCRIPT_TYPE_CHOICES, "script type")
+    version = version or kit_version()
+
+    archives = build_release_packages(
+        output, agent_list, script_list, version=version, root=root, max_workers=jobs
+    )
+
+    table = Table(title=f"Template Archives ({version})")
+    table.add_column("Archive", style="cyan")
+    table.add_column("Size", justify="right")
+    for archive in archives:
+        table.add_row(archive.name, f"{archive.stat().st_size:,}")
+    console.print(table)
+    console.print(f"\n[bold green]Wrote {len(archives)} archives to[/bold green] {output}")
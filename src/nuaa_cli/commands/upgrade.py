@@ -0,0 +1,178 @@
+"""Upgrade a workspace to a newer template release, touching only changed files."""
+
+from pathlib import Path
+
+import typer
+from rich.table import Table
+
+from ..config import AGENT_CONFIG, SCRIPT_TYPE_CHOICES
+from ..ui import console, show_banner
+from ..upgrade import (
+    INSTALL_MANIFEST,
+    NEW_SUFFIX,
+    apply_upgrade,
+    archive_package,
+    load_install,
+    package_bytes,
+    plan_upgrade,
+    record_install,
+)
+
+ACTION_STYLES = {
+    "add": "green",
+    "update": "cyan",
+    "merge": "blue",
+    "conflict": "red",
+    "sidecar": "yellow",
+    "remove": "magenta",
+    "keep": "dim",
+}
+
+
+def _release_target(
+    ai: str, script: str, release: str | None, skip_tls: bool, debug: bool, github_token: str | None
+) -> tuple[str, dict[str, bytes]]:
+    import httpx
+
+    from ..cache import TemplateCache
+    from ..download import fetch_asset_into_cache, fetch_release, find_template_asset
+    from ..github import get_ssl_context
+
+    cache = TemplateCache()
+    with httpx.Client(verify=get_ssl_context() if not skip_tls else False) as client:
+        release_data = fetch_release(
+            client, tag=release, github_token=github_token, cache=cache, debug=debug
+        )
+        tag = release_data["tag_name"]
+        asset = find_template_asset(release_data.get("assets", []), ai, script)
+        if asset is None:
+            raise RuntimeError(f"Release {tag} has no template for {ai}/{script}")
+        blob, _ = fetch_asset_into_cache(
+            client, cache, tag, asset, github_token=github_token, debug=debug
+        )
+    return tag, archive_package(blob)
+
+
+def upgrade(
+    ai: str | None = typer.Option(
+        None,
+        "--ai",
+        help="AI assistant of the workspace (read from the template manifest by default)",
+    ),
+    script: str | None = typer.Option(
+        None,
+        "--script",
+        help="Script type of the workspace: sh or ps (read from the manifest by default)",
+    ),
+    from_release: bool = typer.Option(
+        False,
+        "--from-release",
+        help="Upgrade to the GitHub release archive instead of the kit bundled with this CLI",
+    ),
+    release: str | None = typer.Option(
+        None, "--release", help="Release tag to upgrade to (implies --from-release)"
+    ),
+    dry_run: bool = typer.Option(
+        False, "--dry-run", help="Show what would change without writing anything"
+    ),
+    skip_tls: bool = typer.Option(
+        False, "--skip-tls", help="Skip SSL/TLS verification (not recommended)"
+    ),
+    debug: bool = typer.Option(
+        False, "--debug", help="Show verbose diagnostic output for network failures"
+    ),
+    github_token: str | None = typer.Option(
+        None,
+        "--github-token",
+        help="GitHub token to use for API requests (or set GH_TOKEN or GITHUB_TOKEN environment variable)",
+    ),
+):
+    """
+    Upgrade the workspace in the current directory to a newer template release.
+
+    Only files whose template content changed between the installed and the target
+    release are written. Files you edited are three-way merged with the new
+    template; overlapping edits are left with conflict markers to resolve by hand.
+
+    Examples:
+        nuaa upgrade --dry-run
+        nuaa upgrade
+        nuaa upgrade --release v1.3.0
+        nuaa upgrade --ai claude --script sh   # Workspace created before upgrade tracking
+    """
+    show_banner()
+    project_path = Path.cwd()
+
+    installed = load_install(project_path)
+    ai = ai or (installed or {}).get("ai")
+    script = script or (installed or {}).get("script")
+    if not ai or not script:
+        console.print(f"[red]Error:[/red] No template manifest found ({INSTALL_MANIFEST}).")
+        console.print(
+            "[yellow]Pass --ai and --script to adopt a workspace created by an older CLI[/yellow]"
+        )
+        raise typer.Exit(1)
+    if ai not in AGENT_CONFIG:
+        console.print(f"[red]Error:[/red] Unknown AI assistant '{ai}'")
+        raise typer.Exit(1)
+    if script not in SCRIPT_TYPE_CHOICES:
+        console.print(f"[red]Error:[/red] Unknown script type '{script}'")
+        raise typer.Exit(1)
+
+    try:
+        if from_release or release:
+            target_release, target = _release_target(
+                ai, script, release, skip_tls, debug, github_token
+            )
+        else:
+            from ..render import kit_version, package_files
+
+            target_release = kit_version()
+            target = package_bytes(package_files(ai, script, version=target_release))
+    except Exception as e:
+        console.print(f"[red]Error loading target templates:[/red] {e}")
+        raise typer.Exit(1)
+
+    installed_release = (installed or {}).get("release", "untracked")
+    console.print(
+        f"[cyan]Upgrading[/cyan] {ai}/{script} templates: "
+        f"[bold]{installed_release}[/bold] → [bold]{target_release}[/bold]"
+    )
+    changes, unchanged = plan_upgrade(project_path, installed, target, target_release)
+
+    if changes:
+        table = Table(show_header=True, header_style="bold")
+        table.add_column("Action")
+        table.add_column("File", style="cyan")
+        table.add_column("Details", style="dim")
+        for change in changes:
+            style = ACTION_STYLES.get(change.action, "white")
+            table.add_row(f"[{style}]{change.action}[/{style}]", change.path, change.detail)
+        console.print(table)
+
+    written = sum(change.action != "keep" for change in changes)
+    console.print(f"{written} file(s) to change, {unchanged} unchanged")
+
+    if dry_run:
+        console.print("[dim]Dry run: no files were written[/dim]")
+        return
+    if not changes and installed and installed.get("release") == target_release:
+        console.print("[green]Already up to date[/green]")
+        return
+
+    apply_upgrade(project_path, changes)
+    record_install(project_path, target, release=target_release, ai=ai, script=script)
+
+    conflicts = [c.path for c in changes if c.action == "conflict"]
+    sidecars = [c.path for c in changes if c.action == "sidecar"]
+    if conflicts:
+        console.print(
+            f"[yellow]Resolve the conflict markers in {len(conflicts)} file(s):[/yellow] "
+            + ", ".join(conflicts)
+        )
+    if sidecars:
+        console.print(
+            f"[yellow]Review the new template versions saved as *{NEW_SUFFIX}:[/yellow] "
+            + ", ".join(sidecars)
+        )
+    console.print(f"[green]Workspace upgraded to {target_release}[/green]")
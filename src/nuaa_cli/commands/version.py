@@ -0,0 +1,84 @@
+"""Display version and system information."""
+
+from datetime import datetime
+from pathlib import Path
+
+from rich.panel import Panel
+from rich.table import Table
+
+from ..releases import cached_latest_release, refresh_latest_release
+from ..ui import console, show_banner
+
+
+def version():
+    """Display version and system information."""
+    import platform
+    import importlib.metadata
+
+    show_banner()
+
+    # Get CLI version from package metadata
+    cli_version = "unknown"
+    try:
+        cli_version = importlib.metadata.version("nuaa-cli")
+    except Exception:
+        # Fallback: try reading from pyproject.toml if running from source
+        try:
+            import tomllib
+
+            pyproject_path = Path(__file__).resolve().parents[3] / "pyproject.toml"
+            if pyproject_path.exists():
+                with open(pyproject_path, "rb") as f:
+                    data = tomllib.load(f)
+                    cli_version = data.get("project", {}).get("version", "unknown")
+        except Exception:
+            pass
+
+    # Latest NUAA release (reporting only): served from the release metadata cache,
+    # which is refreshed in the background once stale. Only a cold cache waits on GitHub.
+    template_version = "unknown"
+    release_date = "unknown"
+
+    release_data = cached_latest_release()
+    if release_data is None:
+        try:
+            release_data = refresh_latest_release(timeout=10, max_attempts=1)
+        except Exception:
+            release_data = None
+
+    if release_data:
+        template_version = release_data.get("tag_name") or "unknown"
+        # Remove 'v' prefix if present
+        if template_version.startswith("v"):
+            template_version = template_version[1:]
+        release_date = release_data.get("published_at") or "unknown"
+        if release_date != "unknown":
+            # Format the date nicely
+            try:
+                dt = datetime.fromisoformat(release_date.replace("Z", "+00:00"))
+                release_date = dt.strftime("%Y-%m-%d")
+            except Exception:
+                pass
+
+    info_table = Table(show_header=False, box=None, padding=(0, 2))
+    info_table.add_column("Key", style="cyan", justify="right")
+    info_table.add_column("Value", style="white")
+
+    info_table.add_row("CLI Version", cli_version)
+    info_table.add_row("Template Version", template_version)
+    info_table.add_row("Released", release_date)
+    info_table.add_row("", "")
+    info_table.add_row("Python", platform.python_version())
+    info_table.add_row("Platform", platform.system())
+    info_table.add_row("Architecture", platform.machine())
+    info_table.add_row("OS Version", platform.version())
+
+    panel = Panel(
+        info_table,
+        title="[bold cyan]NUAA CLI Information[/bold cyan]",
+        border_style="cyan",
+        padding=(1, 2),
+    )
+
+    console.print(panel)
+    console.print()
@@ -0,0 +1,137 @@
+"""Static configuration shared by NUAA CLI commands."""
+
+from pathlib import Path
+
+# NUAA templates are published as release assets in this repository
+REPO_OWNER = "zophiezlan"
+REPO_NAME = "spec-driven-projects"
+RELEASES_LATEST_URL = f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/releases/latest"
+
+
+def release_api_url(tag: str | None = None) -> str:
+    """Return the releases API URL for a tag, or for the latest release."""
+    if tag:
+        return f"https://api.github.com/repos/{REPO_OWNER}/{REPO_NAME}/releases/tags/{tag}"
+    return RELEASES_LATEST_URL
+
+
+# Agent configuration with name, folder, install URL, CLI tool requirement, and where
+# (and in which format) the rendered slash-command files are written
+AGENT_CONFIG = {
+    "copilot": {
+        "name": "GitHub Copilot",
+        "folder": ".github/agents/",
+        "install_url": None,  # IDE-based, no CLI check needed
+        "requires_cli": False,
+        "commands_dir": ".github/agents",
+        "command_format": "agent.md",
+    },
+    "claude": {
+        "name": "Claude Code",
+        "folder": ".claude/",
+        "install_url": "https://docs.anthropic.com/en/docs/claude-code/setup",
+        "requires_cli": True,
+        "commands_dir": ".claude/commands",
+        "command_format": "md",
+    },
+    "gemini": {
+        "name": "Gemini CLI",
+        "folder": ".gemini/",
+        "install_url": "https://github.com/google-gemini/gemini-cli",
+        "requires_cli": True,
+        "commands_dir": ".gemini/commands",
+        "command_format": "toml",
+    },
+    "cursor-agent": {
+        "name": "Cursor",
+        "folder": ".cursor/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+        "commands_dir": ".cursor/commands",
+        "command_format": "md",
+    },
+    "qwen": {
+        "name": "Qwen Code",
+        "folder": ".qwen/",
+        "install_url": "https://github.com/QwenLM/qwen-code",
+        "requires_cli": True,
+        "commands_dir": ".qwen/commands",
+        "command_format": "toml",
+    },
+    "opencode": {
+        "name": "opencode",
+        "folder": ".opencode/",
+        "install_url": "https://opencode.ai",
+        "requires_cli": True,
+        "commands_dir": ".opencode/command",
+        "command_format": "md",
+    },
+    "codex": {
+        "name": "Codex CLI",
+        "folder": ".codex/",
+        "install_url": "https://github.com/openai/codex",
+        "requires_cli": True,
+        "commands_dir": ".codex/prompts",
+        "command_format": "md",
+    },
+    "windsurf": {
+        "name": "Windsurf",
+        "folder": ".windsurf/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+        "commands_dir": ".windsurf/workflows",
+        "command_format": "md",
+    },
+    "kilocode": {
+        "name": "Kilo Code",
+        "folder": ".kilocode/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+        "commands_dir": ".kilocode/workflows",
+        "command_format": "md",
+    },
+    "auggie": {
+        "name": "Auggie CLI",
+        "folder": ".augment/",
+        "install_url": "https://docs.augmentcode.com/cli/setup-auggie/install-auggie-cli",
+        "requires_cli": True,
+        "commands_dir": ".augment/commands",
+        "command_format": "md",
+    },
+    "codebuddy": {
+        "name": "CodeBuddy",
+        "folder": ".codebuddy/",
+        "install_url": "https://www.codebuddy.ai/cli",
+        "requires_cli": True,
+        "commands_dir": ".codebuddy/commands",
+        "command_format": "md",
+    },
+    "roo": {
+        "name": "Roo Code",
+        "folder": ".roo/",
+        "install_url": None,  # IDE-based
+        "requires_cli": False,
+        "commands_dir": ".roo/commands",
+        "command_format": "md",
+    },
+    "q": {
+        "name": "Amazon Q Developer CLI",
+        "folder": ".amazonq/",
+        "install_url": "https://aws.amazon.com/developer/learning/q-developer-cli/",
+        "requires_cli": True,
+        "commands_dir": ".amazonq/prompts",
+        "command_format": "md",
+    },
+    "amp": {
+        "name": "Amp",
+        "folder": ".agents/",
+        "install_url": "https://ampcode.com/manual#install",
+        "requires_cli": True,
+        "commands_dir": ".agents/commands",
+        "command_format": "md",
+    },
+}
+
+SCRIPT_TYPE_CHOICES = {"sh": "POSIX Shell (bash/zsh)", "ps": "PowerShell"}
+
+CLAUDE_LOCAL_PATH = Path.home() / ".claude" / "local" / "claude"
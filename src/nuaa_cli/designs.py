@@ -0,0 +1,207 @@
+"""Program design scaffolds for ``nuaa design``, one program or a whole batch.
+
+A design is ``program-design.md``, ``logic-model.md`` and ``impact-framework.md``
+rendered from the kit templates, plus a ``CHANGELOG.md``. For ``--from`` the
+templates are compiled once, every program's folder is reserved in file order, all
+documents are rendered in memory, and the writes fan out over a thread pool.
+"""
+
+import csv
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import NamedTuple
+
+from .scaffold import (
+    _ensure_nuaa_root,
+    _find_templates_root,
+    _load_compiled_template,
+    _next_feature_dir,
+    _placeholder_values,
+    _prepend_metadata,
+    _stamp,
+    _write_markdown,
+)
+from .templating import Template
+
+# Template (and output) file name -> title suffix, in the order they are written
+DESIGN_FILES = {
+    "program-design.md": "Program Design",
+    "logic-model.md": "Logic Model",
+    "impact-framework.md": "Impact Framework",
+}
+
+_FIELDS = {
+    "program": "program",
+    "program_name": "program",
+    "population": "population",
+    "target_population": "population",
+    "duration": "duration",
+    "funder": "funder",
+    "feature": "feature",
+}
+
+
+class DesignProgram(NamedTuple):
+    program: str
+    population: str
+    duration: str
+    funder: str = ""
+    feature: str = ""
+
+
+class DesignResult(NamedTuple):
+    program: DesignProgram
+    feature: str
+    written: list[str]
+    skipped: list[str]
+    error: str | None = None
+
+
+def load_programs(path: Path) -> list[DesignProgram]:
+    """Read programs from a CSV file with a header row or from JSON Lines.
+
+    Columns are ``program``, ``population``, ``duration`` and optionally ``funder``
+    and ``feature`` (``program_name`` and ``target_population`` are accepted too).
+    Raises ValueError listing every invalid row.
+    """
+    text = path.read_text(encoding="utf-8")
+    if path.suffix.lower() in (".jsonl", ".ndjson"):
+        rows = []
+        for number, line in enumerate(text.splitlines(), start=1):
+            if line.strip():
+                try:
+                    rows.append(json.loads(line))
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"line {number}: invalid JSON ({e.msg})") from None
+    else:
+        rows = list(csv.DictReader(line for line in text.splitlines() if line.strip()))
+
+    programs: list[DesignProgram] = []
+    errors: list[str] = []
+    for number, row in enumerate(rows, start=1):
+        if not isinstance(row, dict):
+            errors.append(f"entry {number}: expected an object")
+            continue
+        values = {
+            _FIELDS[key]: str(value or "").strip()
+            for key, value in ((str(k).strip().lower(), v) for k, v in row.items() if k)
+            if key in _FIELDS
+        }
+        missing = [f for f in ("program", "population", "duration") if not values.get(f)]
+        if missing:
+            errors.append(f"entry {number}: missing {', '.join(missing)}")
+            continue
+        programs.append(DesignProgram(**values))
+
+    if errors:
+        raise ValueError("\n".join(errors))
+    if not programs:
+        raise ValueError(f"{path} lists no programs")
+    return programs
+
+
+def load_design_templates(start: Path | None = None) -> dict[str, Template]:
+    """Load the three compiled design templates from one templates directory lookup."""
+    root = _find_templates_root(start)
+    return {name: _load_compiled_template(name, root) for name in DESIGN_FILES}
+
+
+def design_feature_dir(
+    program_name: str, feature: str | None = None, root: Path | None = None
+) -> tuple[Path, str, str]:
+    """Return (feature dir, number, slug) for a design, reserving a new folder if needed.
+
+    ``feature`` may be a full ``NNN-slug`` (used as-is) or a slug for the next number.
+    """
+    if feature and re.match(r"^\d{3}-", feature):
+        feature_dir = _ensure_nuaa_root(root) / feature
+        feature_dir.mkdir(parents=True, exist_ok=True)
+        return feature_dir, feature[:3], feature.split("-", 1)[1]
+    return _next_feature_dir(feature or program_name, root)
+
+
+def design_mapping(program: DesignProgram, num_str: str, slug: str, created: str) -> dict:
+    return {
+        "PROGRAM_NAME": program.program,
+        "TARGET_POPULATION": program.population,
+        "DURATION": program.duration,
+        "FUNDER": program.funder,
+        "DATE": created,
+        "FEATURE_ID": num_str,
+        "SLUG": slug,
+    }
+
+
+def render_design_file(name: str, template: Template, mapping: dict[str, str]) -> str:
+    """Fill one design template and prepend its metadata block."""
+    feature = f"{mapping['FEATURE_ID']}-{mapping['SLUG']}"
+    meta = {"title": f"{mapping['PROGRAM_NAME']} - {DESIGN_FILES[name]}"}
+    if name == "program-design.md":
+        meta.update(created=mapping["DATE"], feature=feature, status="draft")
+    else:
+        meta["feature"] = feature
+    return _prepend_metadata(template.render(_placeholder_values(mapping)), meta)
+
+
+def changelog_text(feature: str) -> str:
+    return f"# Changelog for {feature}\n\n- {_stamp()} - Initialized program design\n"
+
+
+def write_designs(
+    programs: list[DesignProgram],
+    templates: dict[str, Template],
+    *,
+    force: bool = False,
+    jobs: int | None = None,
+    root: Path | None = None,
+) -> list[DesignResult]:
+    """Scaffold every program and return one result per program, in input order.
+
+    Existing documents are kept unless ``force``; an existing CHANGELOG.md is
+    always kept. A program whose folder cannot be reserved or whose writes fail
+    gets an ``error`` and does not stop the others.
+    """
+    created = datetime.now().strftime("%Y-%m-%d")
+    plans: list[tuple[int, DesignProgram, str, list[tuple[Path, str, bool]]]] = []
+    results: dict[int, DesignResult] = {}
+    for index, program in enumerate(programs):
+        try:
+            feature_dir, num_str, slug = design_feature_dir(
+                program.program, program.feature or None, root
+            )
+        except OSError as e:
+            results[index] = DesignResult(program, "", [], [], str(e))
+            continue
+        mapping = design_mapping(program, num_str, slug, created)
+        documents = [
+            (feature_dir / name, render_design_file(name, template, mapping), force)
+            for name, template in templates.items()
+        ]
+        documents.append((feature_dir / "CHANGELOG.md", changelog_text(feature_dir.name), False))
+        plans.append((index, program, feature_dir.name, documents))
+
+    def write(path: Path, text: str, overwrite: bool) -> bool:
+        if path.exists() and not overwrite:
+            return False
+        _write_markdown(path, text)
+        return True
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        futures = [
+            [(path, pool.submit(write, path, text, overwrite)) for path, text, overwrite in docs]
+            for _, _, _, docs in plans
+        ]
+        for (index, program, feature, _), writes in zip(plans, futures):
+            written, skipped, errors = [], [], []
+            for path, future in writes:
+                try:
+                    (written if future.result() else skipped).append(path.name)
+                except OSError as e:
+                    errors.append(f"{path.name}: {e}")
+            results[index] = DesignResult(
+                program, feature, written, skipped, "; ".join(errors) or None
+            )
+    return [results[index] for index in range(len(programs))]
@@ -0,0 +1,695 @@
+"""Download, extract, and post-process NUAA release templates."""
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import zipfile
+from pathlib import Path, PurePosixPath
+
+import httpx
+import typer
+from rich.panel import Panel
+from rich.progress import Progress, SpinnerColumn, TextColumn
+
+from .bundle import resolve_template_source
+from .cache import TemplateCache, release_ttl
+from .github import (
+    RetryScheduler,
+    _format_rate_limit_error,
+    _github_auth_headers,
+    get_ssl_context,
+    release_api_url,
+)
+from .locks import file_lock
+from .render import script_mode
+from .ui import StepTracker, console
+from .upgrade import archive_package, record_install
+
+
+def handle_vscode_settings(sub_item, dest_file, rel_path, verbose=False, tracker=None) -> None:
+    """Handle merging or copying of .vscode/settings.json files."""
+
+    def log(message, color="green"):
+        if verbose and not tracker:
+            console.print(f"[{color}]{message}[/] {rel_path}")
+
+    try:
+        with open(sub_item, "r", encoding="utf-8") as f:
+            new_settings = json.load(f)
+
+        if dest_file.exists():
+            merged = merge_json_files(dest_file, new_settings, verbose=verbose and not tracker)
+            with open(dest_file, "w", encoding="utf-8") as f:
+                json.dump(merged, f, indent=4)
+                f.write("\n")
+            log("Merged:", "green")
+        else:
+            shutil.copy2(sub_item, dest_file)
+            log("Copied (no existing settings.json):", "blue")
+
+    except Exception as e:
+        log(f"Warning: Could not merge, copying instead: {e}", "yellow")
+        shutil.copy2(sub_item, dest_file)
+
+
+def merge_json_files(existing_path: Path, new_content: dict, verbose: bool = False) -> dict:
+    """Merge new JSON content into existing JSON file.
+
+    Performs a deep merge where:
+    - New keys are added
+    - Existing keys are preserved unless overwritten by new content
+    - Nested dictionaries are merged recursively
+    - Lists and other values are replaced (not merged)
+
+    Args:
+        existing_path: Path to existing JSON file
+        new_content: New JSON content to merge in
+        verbose: Whether to print merge details
+
+    Returns:
+        Merged JSON content as dict
+    """
+    try:
+        with open(existing_path, "r", encoding="utf-8") as f:
+            existing_content = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        # If file doesn't exist or is invalid, just use new content
+        return new_content
+
+    def deep_merge(base: dict, update: dict) -> dict:
+        """Recursively merge update dict into base dict."""
+        result = base.copy()
+        for key, value in update.items():
+            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
+                # Recursively merge nested dictionaries
+                result[key] = deep_merge(result[key], value)
+            else:
+                # Add new key or replace existing value
+                result[key] = value
+        return result
+
+    merged = deep_merge(existing_content, new_content)
+
+    if verbose:
+        console.print(f"[cyan]Merged JSON file:[/cyan] {existing_path.name}")
+
+    return merged
+
+
+def _report_retry(delay: float, reason: str, attempt: int) -> None:
+    console.print(f"[yellow]{reason}; retrying in {delay:.0f}s (attempt {attempt + 2})[/yellow]")
+
+
+def default_scheduler() -> RetryScheduler:
+    """Return the retry scheduler used when callers do not supply one."""
+    return RetryScheduler(on_wait=_report_retry)
+
+
+def fetch_release(
+    http_client: httpx.Client,
+    *,
+    tag: str | None = None,
+    github_token: str | None = None,
+    cache: TemplateCache | None = None,
+    debug: bool = False,
+    scheduler: RetryScheduler | None = None,
+    max_age: float | None = None,
+    timeout: float = 30,
+) -> dict:
+    """Fetch release JSON (latest, or by tag) from the GitHub API.
+
+    With a ``cache``, metadata fetched less than ``max_age`` seconds ago (default
+    ``NUAA_RELEASE_TTL``) is returned without any request; older entries are
+    revalidated conditionally (If-None-Match) and a 304 reuses the cached JSON.
+    Rate-limited and transient failures are retried per ``scheduler``.
+    Raises RuntimeError with a rate-limit aware message on failure.
+    """
+    api_url = release_api_url(tag)
+
+    if cache:
+        age = cache.release_age(api_url)
+        if age is not None and age < (release_ttl() if max_age is None else max_age):
+            return cache.release(api_url)[1]
+    scheduler = scheduler or default_scheduler()
+
+    cached_etag, cached_release = cache.release(api_url) if cache else (None, None)
+    request_headers = _github_auth_headers(github_token)
+    if cached_etag and cached_release is not None:
+        request_headers["If-None-Match"] = cached_etag
+
+    attempt = 0
+    while True:
+        try:
+            response = http_client.get(
+                api_url,
+                timeout=timeout,
+                follow_redirects=True,
+                headers=request_headers,
+            )
+        except httpx.TransportError as e:
+            delay = scheduler.delay_for_error(e, attempt)
+            if delay is None:
+                raise RuntimeError(f"Request to {api_url} failed: {e}") from e
+            scheduler.wait(delay, f"Network error ({type(e).__name__})", attempt)
+            attempt += 1
+            continue
+        status = response.status_code
+        if status in (200, 304):
+            break
+        delay = scheduler.delay_for_response(status, response.headers, attempt)
+        if delay is None:
+            break
+        scheduler.wait(delay, f"GitHub API returned {status}", attempt)
+        attempt += 1
+
+    if status == 304 and cached_release is not None:
+        cache.touch_release(api_url)
+        return cached_release
+    if status != 200:
+        # Format detailed error message with rate-limit info
+        error_msg = _format_rate_limit_error(status, response.headers, api_url)
+        if debug:
+            error_msg += f"\n\n[dim]Response body (truncated 500):[/dim]\n{response.text[:500]}"
+        raise RuntimeError(error_msg)
+    try:
+        release_data = response.json()
+    except ValueError as je:
+        raise RuntimeError(
+            f"Failed to parse release JSON: {je}\nRaw (truncated 400): {response.text[:400]}"
+        )
+    if cache:
+        cache.store_release(api_url, response.headers.get("ETag"), release_data)
+    return release_data
+
+
+def find_template_asset(assets: list[dict], ai_assistant: str, script_type: str) -> dict | None:
+    """Return the release asset for an agent/script pair, or None."""
+    # Expected asset name pattern: nuaa-template-<agent>-<script>-<version>.zip
+    pattern = f"nuaa-template-{ai_assistant}-{script_type}"
+    matching_assets = [
+        asset for asset in assets if pattern in asset["name"] and asset["name"].endswith(".zip")
+    ]
+    return matching_assets[0] if matching_assets else None
+
+
+class IncompleteDownload(httpx.TransportError):
+    """The connection closed before the advertised number of bytes arrived."""
+
+
+def _hash_prefix(path: Path, size: int):
+    """Return a SHA-256 object primed with the first ``size`` bytes of ``path``."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        remaining = size
+        while remaining:
+            chunk = f.read(min(1024 * 1024, remaining))
+            if not chunk:
+                break
+            digest.update(chunk)
+            remaining -= len(chunk)
+    return digest
+
+
+def download_asset(
+    http_client: httpx.Client,
+    url: str,
+    dest: Path,
+    *,
+    show_progress: bool = True,
+    github_token: str | None = None,
+    debug: bool = False,
+    scheduler: RetryScheduler | None = None,
+) -> str:
+    """Stream a release asset to ``dest`` and return its hex SHA-256 digest.
+
+    Bytes already present in ``dest`` (from an interrupted attempt or an earlier run)
+    are kept and the rest is requested with ``Range``. Dropped connections, timeouts,
+    5xx responses and rate limits are retried per ``scheduler``; a server that
+    ignores the range simply sends the whole file again.
+    """
+    scheduler = scheduler or default_scheduler()
+    attempt = 0
+    while True:
+        offset = dest.stat().st_size if dest.exists() else 0
+        headers = _github_auth_headers(github_token)
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        try:
+            with http_client.stream(
+                "GET",
+                url,
+                timeout=httpx.Timeout(60, connect=15),
+                follow_redirects=True,
+                headers=headers,
+            ) as response:
+                status = response.status_code
+                if status == 416 and offset:
+                    # Nothing left to send: the partial file is already complete (or stale)
+                    complete = response.headers.get("content-range", "") == f"bytes */{offset}"
+                    if complete:
+                        return _hash_prefix(dest, offset).hexdigest()
+                    dest.unlink()
+                    continue
+                if status not in (200, 206):
+                    delay = scheduler.delay_for_response(status, response.headers, attempt)
+                    if delay is None:
+                        # Handle rate-limiting on download as well
+                        error_msg = _format_rate_limit_error(status, response.headers, url)
+                        if debug:
+                            response.read()
+                            error_msg += f"\n\n[dim]Response body (truncated 400):[/dim]\n{response.text[:400]}"
+                        raise RuntimeError(error_msg)
+                    response.close()
+                    scheduler.wait(delay, f"Download returned {status}", attempt)
+                    attempt += 1
+                    continue
+
+                if status == 206 and response.headers.get("content-range", "").startswith(
+                    f"bytes {offset}-"
+                ):
+                    digest = _hash_prefix(dest, offset)
+                    mode = "ab"
+                else:
+                    digest = hashlib.sha256()
+                    offset = 0
+                    mode = "wb"
+                total_size = int(response.headers.get("content-length", 0))
+                expected = offset + total_size if total_size else None
+
+                with open(dest, mode) as f:
+                    chunks = response.iter_bytes()
+                    if show_progress and expected:
+                        with Progress(
+                            SpinnerColumn(),
+                            TextColumn("[progress.description]{task.description}"),
+                            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+                            console=console,
+                        ) as progress:
+                            label = "Resuming..." if offset else "Downloading..."
+                            task = progress.add_task(label, total=expected, completed=offset)
+                            downloaded = offset
+                            for chunk in chunks:
+                                digest.update(chunk)
+                                f.write(chunk)
+                                downloaded += len(chunk)
+                                progress.update(task, completed=downloaded)
+                    else:
+                        for chunk in chunks:
+                            digest.update(chunk)
+                            f.write(chunk)
+                if expected is not None and dest.stat().st_size < expected:
+                    raise IncompleteDownload(
+                        f"received {dest.stat().st_size:,} of {expected:,} bytes"
+                    )
+                return digest.hexdigest()
+        except httpx.TransportError as e:
+            delay = scheduler.delay_for_error(e, attempt)
+            if delay is None:
+                raise RuntimeError(f"Download of {url} failed: {e}") from e
+            scheduler.wait(delay, f"Download interrupted ({e or type(e).__name__})", attempt)
+            attempt += 1
+
+
+def verify_asset_digest(asset: dict, sha256: str) -> None:
+    """Raise RuntimeError if GitHub published a SHA-256 for the asset and it differs."""
+    expected = asset.get("digest") or ""
+    if expected.startswith("sha256:") and expected[len("sha256:") :] != sha256:
+        raise RuntimeError(
+            f"Checksum mismatch for {asset['name']}: expected {expected[len('sha256:'):]}, got {sha256}"
+        )
+
+
+def fetch_asset_into_cache(
+    http_client: httpx.Client,
+    cache: TemplateCache,
+    tag: str,
+    asset: dict,
+    *,
+    show_progress: bool = True,
+    github_token: str | None = None,
+    debug: bool = False,
+    scheduler: RetryScheduler | None = None,
+) -> tuple[Path, bool]:
+    """Return (blob_path, was_cached) for a release asset, downloading it on a cache miss.
+
+    A partial download is left in the cache's staging area so the next run resumes it.
+    The staging file is locked from the download until it is stored, so concurrent
+    runs never append to the same file; a run that waited finds the stored blob.
+    """
+    cached_zip = cache.lookup(tag, asset["name"])
+    if cached_zip is not None:
+        return cached_zip, True
+    staging = cache.staging_path(asset["name"], tag)
+    with file_lock(staging):
+        cached_zip = cache.lookup(tag, asset["name"])
+        if cached_zip is not None:
+            return cached_zip, True
+        sha256 = download_asset(
+            http_client,
+            asset["browser_download_url"],
+            staging,
+            show_progress=show_progress,
+            github_token=github_token,
+            debug=debug,
+            scheduler=scheduler,
+        )
+        try:
+            verify_asset_digest(asset, sha256)
+        except Exception:
+            staging.unlink(missing_ok=True)
+            raise
+        return cache.add(tag, asset["name"], staging, sha256), False
+
+
+def download_template_from_github(
+    ai_assistant: str,
+    download_dir: Path,
+    *,
+    script_type: str = "sh",
+    verbose: bool = True,
+    show_progress: bool = True,
+    client: httpx.Client | None = None,
+    debug: bool = False,
+    github_token: str | None = None,
+    cache: TemplateCache | None = None,
+    scheduler: RetryScheduler | None = None,
+) -> tuple[Path, dict]:
+    """Resolve the latest release asset for the agent/script pair and return (zip_path, metadata).
+
+    With a ``cache``, the releases API is queried conditionally (If-None-Match) and
+    archives already stored for the release tag are reused instead of downloaded.
+    In that case ``zip_path`` points into the cache and ``metadata["cached"]`` is True;
+    callers must not delete it.
+    """
+    close_client = False
+    http_client = client
+    if http_client is None:
+        http_client = httpx.Client(verify=get_ssl_context())
+        close_client = True
+
+    if verbose:
+        console.print("[cyan]Fetching latest release information...[/cyan]")
+
+    try:
+        release_data = fetch_release(
+            http_client,
+            github_token=github_token,
+            cache=cache,
+            debug=debug,
+            scheduler=scheduler,
+        )
+    except Exception as e:
+        console.print("[red]Error fetching release information[/red]")
+        console.print(Panel(str(e), title="Fetch Error", border_style="red"))
+        if close_client:
+            http_client.close()
+        raise typer.Exit(1)
+
+    assets = release_data.get("assets", [])
+    asset = find_template_asset(assets, ai_assistant, script_type)
+
+    if asset is None:
+        pattern = f"nuaa-template-{ai_assistant}-{script_type}"
+        console.print(
+            f"[red]No matching release asset found[/red] for [bold]{ai_assistant}[/bold] (expected pattern: [bold]{pattern}[/bold])"
+        )
+        asset_names = [a.get("name", "?") for a in assets]
+        console.print(
+            Panel(
+                "\n".join(asset_names) or "(no assets)",
+                title="Available Assets",
+                border_style="yellow",
+            )
+        )
+        if close_client:
+            http_client.close()
+        raise typer.Exit(1)
+
+    download_url = asset["browser_download_url"]
+    filename = asset["name"]
+    file_size = asset["size"]
+
+    if verbose:
+        console.print(f"[cyan]Found template:[/cyan] {filename}")
+        console.print(f"[cyan]Size:[/cyan] {file_size:,} bytes")
+        console.print(f"[cyan]Release:[/cyan] {release_data['tag_name']}")
+
+    metadata = {
+        "filename": filename,
+        "size": file_size,
+        "release": release_data["tag_name"],
+        "asset_url": download_url,
+        "cached": False,
+    }
+
+    zip_path = download_dir / filename
+    try:
+        if cache:
+            zip_path, was_cached = fetch_asset_into_cache(
+                http_client,
+                cache,
+                release_data["tag_name"],
+                asset,
+                show_progress=show_progress,
+                github_token=github_token,
+                debug=debug,
+                scheduler=scheduler,
+            )
+            metadata["cached"] = True
+            if verbose:
+                if was_cached:
+                    console.print(f"[cyan]Using cached template:[/cyan] {zip_path}")
+                else:
+                    console.print(f"Downloaded: {filename}")
+            return zip_path, metadata
+
+        if verbose:
+            console.print("[cyan]Downloading template...[/cyan]")
+        sha256 = download_asset(
+            http_client,
+            download_url,
+            zip_path,
+            show_progress=show_progress,
+            github_token=github_token,
+            debug=debug,
+            scheduler=scheduler,
+        )
+        verify_asset_digest(asset, sha256)
+        if verbose:
+            console.print(f"Downloaded: {filename}")
+        return zip_path, metadata
+    except Exception as e:
+        console.print("[red]Error downloading template[/red]")
+        detail = str(e)
+        if not metadata["cached"] and zip_path.exists():
+            zip_path.unlink()
+        console.print(Panel(detail, title="Download Error", border_style="red"))
+        raise typer.Exit(1)
+    finally:
+        if close_client:
+            http_client.close()
+
+
+def _archive_prefix(names: list[str]) -> str:
+    """Return the single wrapper directory (``"name/"``) shared by every entry, or ``""``."""
+    tops = {name.split("/", 1)[0] for name in names}
+    if len(tops) != 1:
+        return ""
+    prefix = tops.pop() + "/"
+    return prefix if all(name.startswith(prefix) for name in names) else ""
+
+
+def _safe_relative(name: str) -> PurePosixPath:
+    rel = PurePosixPath(name.replace("\\", "/"))
+    if rel.is_absolute() or ".." in rel.parts or (rel.parts and ":" in rel.parts[0]):
+        raise ValueError(f"Unsafe path in template archive: {name}")
+    return rel
+
+
+def extract_template_archive(
+    zip_path: Path,
+    project_path: Path,
+    is_current_dir: bool = False,
+    *,
+    verbose: bool = True,
+    tracker: StepTracker | None = None,
+) -> Path:
+    """Extract a template archive into ``project_path`` in a single streaming pass.
+
+    A single top-level wrapper directory is stripped from entry paths, entries are
+    written straight to their final location (merging into an existing directory
+    with ``is_current_dir``; a new ``project_path`` must not exist), and execute
+    bits come from each entry's Unix mode or a ``#!`` at the start of a ``*.sh``
+    file. An existing ``.vscode/settings.json`` is merged rather than replaced.
+    Raises on failure without cleaning up.
+    """
+    if not is_current_dir:
+        project_path.mkdir(parents=True)
+
+    with zipfile.ZipFile(zip_path, "r") as zip_ref:
+        infos = zip_ref.infolist()
+        if tracker:
+            tracker.start("zip-list")
+            tracker.complete("zip-list", f"{len(infos)} entries")
+        elif verbose:
+            console.print(f"[cyan]ZIP contains {len(infos)} items[/cyan]")
+
+        prefix = _archive_prefix([info.filename for info in infos])
+        top_level: set[str] = set()
+        executable = 0
+        for info in infos:
+            name = info.filename[len(prefix) :]
+            if not name or name == "/":
+                continue
+            rel = _safe_relative(name)
+            top_level.add(rel.parts[0])
+            dest = project_path.joinpath(*rel.parts)
+            if info.is_dir():
+                dest.mkdir(parents=True, exist_ok=True)
+                continue
+            dest.parent.mkdir(parents=True, exist_ok=True)
+
+            if is_current_dir and rel.as_posix() == ".vscode/settings.json" and dest.exists():
+                with tempfile.TemporaryDirectory() as temp_dir:
+                    incoming = Path(temp_dir) / "settings.json"
+                    incoming.write_bytes(zip_ref.read(info))
+                    handle_vscode_settings(incoming, dest, rel, verbose, tracker)
+                continue
+            if is_current_dir and dest.exists() and verbose and not tracker:
+                console.print(f"[yellow]Overwriting file:[/yellow] {rel}")
+
+            with zip_ref.open(info) as src, open(dest, "wb") as out:
+                head = src.read(2)
+                out.write(head)
+                shutil.copyfileobj(src, out, 1024 * 1024)
+
+            if os.name != "nt":
+                entry_mode = (info.external_attr >> 16) & 0o777 if info.create_system == 3 else 0
+                mode = dest.stat().st_mode
+                new_mode = script_mode(rel.name, head, mode | (entry_mode & 0o111))
+                if new_mode != mode:
+                    os.chmod(dest, new_mode)
+                if new_mode & 0o100:
+                    executable += 1
+
+    if tracker:
+        tracker.start("extracted-summary")
+        tracker.complete("extracted-summary", f"{len(top_level)} top-level items")
+        if prefix:
+            tracker.add("flatten", "Flatten nested directory")
+            tracker.complete("flatten", prefix.rstrip("/"))
+        tracker.complete("chmod", f"{executable} executable files")
+    elif verbose:
+        console.print(f"[cyan]Extracted {len(top_level)} items to {project_path}[/cyan]")
+        if prefix:
+            console.print("[cyan]Flattened nested directory structure[/cyan]")
+
+    return project_path
+
+
+def download_and_extract_template(
+    project_path: Path,
+    ai_assistant: str,
+    script_type: str,
+    is_current_dir: bool = False,
+    *,
+    verbose: bool = True,
+    tracker: StepTracker | None = None,
+    client: httpx.Client | None = None,
+    debug: bool = False,
+    github_token: str | None = None,
+    cache: TemplateCache | None = None,
+    template_source: str | None = None,
+) -> Path:
+    """Download the latest release and extract it to create a new project.
+    Returns project_path. Uses tracker if provided (with keys: fetch, download, extract, cleanup)
+    Archives served from or stored in ``cache`` are left in place after extraction.
+    With ``template_source`` (zip, bundle, asset directory or file:// mirror) no network
+    request is made and the user's own archive is never deleted.
+    """
+    current_dir = Path.cwd()
+
+    if tracker:
+        tracker.start(
+            "fetch", "reading local template source" if template_source else "contacting GitHub API"
+        )
+    try:
+        if template_source:
+            zip_path, meta = resolve_template_source(
+                template_source, ai_assistant, script_type, current_dir
+            )
+        else:
+            zip_path, meta = download_template_from_github(
+                ai_assistant,
+                current_dir,
+                script_type=script_type,
+                verbose=verbose and tracker is None,
+                show_progress=(tracker is None),
+                client=client,
+                debug=debug,
+                github_token=github_token,
+                cache=cache,
+            )
+        if tracker:
+            tracker.complete("fetch", f"release {meta['release']} ({meta['size']:,} bytes)")
+            tracker.add("download", "Download template")
+            tracker.complete("download", meta["filename"] + (" (cached)" if meta["cached"] else ""))
+    except Exception as e:
+        if tracker:
+            tracker.error("fetch", str(e))
+        else:
+            if verbose:
+                console.print(f"[red]Error downloading template:[/red] {e}")
+        raise
+
+    if tracker:
+        tracker.add("extract", "Extract template")
+        tracker.start("extract")
+    elif verbose:
+        console.print("Extracting template...")
+
+    try:
+        extract_template_archive(
+            zip_path, project_path, is_current_dir, verbose=verbose, tracker=tracker
+        )
+        record_install(
+            project_path,
+            archive_package(zip_path),
+            release=meta["release"],
+            ai=ai_assistant,
+            script=script_type,
+        )
+    except Exception as e:
+        if tracker:
+            tracker.error("extract", str(e))
+        else:
+            if verbose:
+                console.print(f"[red]Error extracting template:[/red] {e}")
+                if debug:
+                    console.print(Panel(str(e), title="Extraction Error", border_style="red"))
+
+        if not is_current_dir and project_path.exists():
+            shutil.rmtree(project_path)
+        raise typer.Exit(1)
+    else:
+        if tracker:
+            tracker.complete("extract")
+    finally:
+        if tracker:
+            tracker.add("cleanup", "Remove temporary archive")
+
+        if meta["cached"] or meta.get("local"):
+            if tracker:
+                tracker.skip(
+                    "cleanup", "archive kept in cache" if meta["cached"] else "local archive kept"
+                )
+        elif zip_path.exists():
+            zip_path.unlink()
+            if tracker:
+                tracker.complete("cleanup")
+            elif verbose:
+                console.print(f"Cleaned up: {zip_path.name}")
+
+    return project_path
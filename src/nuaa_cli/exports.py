@@ -0,0 +1,289 @@
+"""Convert assembled documents to Word, PDF and HTML with pandoc, make-style.
+
+Every (initiative, format) pair is one job. A job's *digest* covers everything
+its output depends on: the SHA-256 of the assembled document, of the reference
+document or template for that format, and the pandoc arguments. The digest is
+recorded in ``.nuaa/cache/exports.json`` next to the output's mtime and size.
+An output whose recorded digest still matches, and which was not touched since,
+is up to date and skipped without starting pandoc. Input hashes are themselves
+cached by mtime and size, so an unchanged workspace costs one ``stat`` per file.
+
+Stale jobs run concurrently on a thread pool, one pandoc process each. Pandoc
+writes to a temporary file beside the output, which is then moved into place,
+so an interrupted or failed export never leaves a truncated file.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+from .workspace import INITIATIVES, PROJECT_CACHE, project_cache
+
+EXPORT_CACHE = PROJECT_CACHE / "exports.json"
+CACHE_VERSION = 1
+
+EXPORT_FORMATS = ("docx", "pdf", "html")
+DEFAULT_TIMEOUT = 300
+
+# format -> template file name in the templates directory (used when it exists)
+FORMAT_TEMPLATES = {
+    "docx": "nuaa-word-template.docx",
+    "pdf": "nuaa-pdf-template.tex",
+    "html": "nuaa-style.css",
+}
+
+EXPORTED = "exported"
+CURRENT = "current"
+FAILED = "failed"
+
+
+class ExportJob(NamedTuple):
+    initiative: str
+    format: str
+    source: Path
+    output: Path
+    args: tuple[str, ...]  # pandoc arguments after the input file
+    digest: str
+
+
+class ExportResult(NamedTuple):
+    initiative: str
+    format: str
+    output: Path
+    status: str  # EXPORTED, CURRENT or FAILED
+    error: str | None = None
+
+
+def parse_formats(value: str) -> list[str]:
+    """Split ``docx,html,pdf`` into formats in the given order; raises ValueError on unknown ones."""
+    formats = []
+    for name in value.split(","):
+        name = name.strip().lower()
+        if not name:
+            continue
+        if name not in EXPORT_FORMATS:
+            raise ValueError(
+                f"Unsupported format: {name} (choose from {', '.join(EXPORT_FORMATS)})"
+            )
+        if name not in formats:
+            formats.append(name)
+    if not formats:
+        raise ValueError("No export format given")
+    return formats
+
+
+def find_assembled_document(folder: Path) -> Path | None:
+    """Return the assembled markdown of an initiative folder, or None if there is none.
+
+    ``final/<initiative>.md`` as written by ``nuaa assemble`` wins; otherwise the most
+    recently modified markdown file in ``final/`` other than the assembly report.
+    """
+    final = folder / "final"
+    native = final / f"{folder.name}.md"
+    if native.is_file():
+        return native
+    try:
+        with os.scandir(final) as it:
+            candidates = [
+                (entry.stat().st_mtime, entry.name)
+                for entry in it
+                if entry.is_file()
+                and entry.name.endswith(".md")
+                and entry.name != "assembly-report.md"
+            ]
+    except (FileNotFoundError, NotADirectoryError):
+        return None
+    return final / max(candidates)[1] if candidates else None
+
+
+def pdf_engine() -> str | None:
+    """Return the first available LaTeX engine for PDF output, or None."""
+    for engine in ("xelatex", "pdflatex"):
+        if shutil.which(engine):
+            return engine
+    return None
+
+
+def pandoc_args(fmt: str, template: Path | None, engine: str | None = None) -> tuple[str, ...]:
+    """Return the pandoc options for one format (the same ones ``export-document.sh`` used)."""
+    args = ["--standalone"]
+    if fmt == "docx" and template is not None:
+        args.append(f"--reference-doc={template}")
+    elif fmt == "pdf":
+        args.append(f"--pdf-engine={engine or 'xelatex'}")
+        if template is not None:
+            args.append(f"--template={template}")
+    elif fmt == "html":
+        args.append("--toc")
+        if template is not None:
+            args.append(f"--css={template}")
+    return tuple(args)
+
+
+class ExportCache:
+    """Input hashes and recorded output digests under a project root."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.path = root / EXPORT_CACHE
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") != CACHE_VERSION:
+                raise ValueError("export cache version mismatch")
+        except (OSError, ValueError):
+            data = {"version": CACHE_VERSION, "inputs": {}, "outputs": {}}
+        self._data = data
+
+    def save(self) -> None:
+        """Write the cache atomically (a lost race only costs a re-export)."""
+        try:
+            project_cache(self.root)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # read-only workspace: everything is exported again next time
+
+    def file_hash(self, path: Path) -> str:
+        """SHA-256 of ``path``, re-hashed only when its mtime or size changed."""
+        stat = path.stat()
+        key = str(path)
+        entry = self._data["inputs"].get(key)
+        if entry and (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size):
+            return entry["sha256"]
+        with open(path, "rb") as f:
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        self._data["inputs"][key] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+        }
+        return digest
+
+    def is_current(self, job: ExportJob) -> bool:
+        """True if ``job.output`` was produced from the same inputs and not touched since."""
+        entry = self._data["outputs"].get(str(job.output))
+        if not entry or entry["digest"] != job.digest:
+            return False
+        try:
+            stat = job.output.stat()
+        except FileNotFoundError:
+            return False
+        return (entry["mtime_ns"], entry["size"]) == (stat.st_mtime_ns, stat.st_size)
+
+    def record(self, job: ExportJob) -> None:
+        """Remember the digest ``job.output`` was just produced from."""
+        stat = job.output.stat()
+        self._data["outputs"][str(job.output)] = {
+            "digest": job.digest,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+        }
+
+
+def plan_exports(
+    initiatives: list[str],
+    formats: list[str],
+    cache: ExportCache,
+    templates_dir: Path | None = None,
+    root: Path | None = None,
+    output: Path | None = None,
+) -> tuple[list[ExportJob], list[str]]:
+    """Build one job per initiative and format.
+
+    Returns the jobs and the initiatives that have no assembled document.
+    ``output`` overrides the output path (one initiative and format only).
+    """
+    root = Path(root) if root is not None else Path.cwd()
+    templates = {}
+    for fmt in formats:
+        path = templates_dir / FORMAT_TEMPLATES[fmt] if templates_dir is not None else None
+        templates[fmt] = path if path is not None and path.is_file() else None
+    template_hashes = {fmt: cache.file_hash(t) if t else "" for fmt, t in templates.items()}
+    engine = pdf_engine() if "pdf" in formats else None
+
+    jobs, missing = [], []
+    for initiative in initiatives:
+        source = find_assembled_document(root / INITIATIVES / initiative)
+        if source is None:
+            missing.append(initiative)
+            continue
+        source_hash = cache.file_hash(source)
+        for fmt in formats:
+            args = pandoc_args(fmt, templates[fmt], engine)
+            key = json.dumps([fmt, str(source), args, source_hash, template_hashes[fmt]])
+            jobs.append(
+                ExportJob(
+                    initiative,
+                    fmt,
+                    source,
+                    output or source.with_suffix(f".{fmt}"),
+                    args,
+                    hashlib.sha256(key.encode("utf-8")).hexdigest(),
+                )
+            )
+    return jobs, missing
+
+
+def _convert(job: ExportJob, timeout: float) -> ExportResult:
+    """Run pandoc for one job, writing through a temporary file beside the output."""
+    tmp = job.output.with_name(f".{job.output.stem}.{os.getpid()}.tmp{job.output.suffix}")
+    try:
+        job.output.parent.mkdir(parents=True, exist_ok=True)
+        completed = subprocess.run(
+            ["pandoc", str(job.source), "-o", str(tmp), *job.args],
+            capture_output=True,
+            text=True,
+            timeout=timeout,
+        )
+        if completed.returncode != 0:
+            message = completed.stderr.strip() or f"pandoc exited with {completed.returncode}"
+            return ExportResult(job.initiative, job.format, job.output, FAILED, message)
+        os.replace(tmp, job.output)
+    except subprocess.TimeoutExpired:
+        return ExportResult(
+            job.initiative, job.format, job.output, FAILED, f"timed out after {timeout:g}s"
+        )
+    except OSError as e:
+        return ExportResult(job.initiative, job.format, job.output, FAILED, str(e))
+    finally:
+        try:
+            tmp.unlink()
+        except FileNotFoundError:
+            pass
+    return ExportResult(job.initiative, job.format, job.output, EXPORTED)
+
+
+def run_exports(
+    jobs: list[ExportJob],
+    cache: ExportCache,
+    workers: int | None = None,
+    timeout: float = DEFAULT_TIMEOUT,
+    force: bool = False,
+) -> list[ExportResult]:
+    """Export every stale job concurrently and return one result per job, in job order."""
+    results: dict[int, ExportResult] = {}
+    stale = []
+    for i, job in enumerate(jobs):
+        if not force and cache.is_current(job):
+            results[i] = ExportResult(job.initiative, job.format, job.output, CURRENT)
+        else:
+            stale.append(i)
+
+    if stale:
+        workers = max(1, min(workers or os.cpu_count() or 1, len(stale)))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            done = pool.map(lambda i: _convert(jobs[i], timeout), stale)
+            for i, result in zip(stale, done):
+                results[i] = result
+                if result.status == EXPORTED:
+                    cache.record(jobs[i])
+    cache.save()
+    return [results[i] for i in range(len(jobs))]
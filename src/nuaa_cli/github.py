@@ -0,0 +1,176 @@
+"""GitHub API helpers: authentication, TLS context, and rate-limit reporting.
+
+Importing this module pulls in the HTTP stack, so only network commands do it.
+"""
+
+import os
+import random
+import ssl
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import Callable
+
+import httpx
+import truststore
+
+from .config import RELEASES_LATEST_URL, release_api_url  # noqa: F401 (re-exported)
+
+
+@lru_cache(maxsize=1)
+def get_ssl_context() -> ssl.SSLContext:
+    """Return the process-wide truststore SSL context, created on first use."""
+    return truststore.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+
+
+def _github_token(cli_token: str | None = None) -> str | None:
+    """Return sanitized GitHub token (cli arg takes precedence) or None."""
+    return ((cli_token or os.getenv("GH_TOKEN") or os.getenv("GITHUB_TOKEN") or "").strip()) or None
+
+
+def _github_auth_headers(cli_token: str | None = None) -> dict:
+    """Return Authorization header dict only when a non-empty token exists."""
+    token = _github_token(cli_token)
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+def _parse_rate_limit_headers(headers: httpx.Headers) -> dict:
+    """Extract and parse GitHub rate-limit headers."""
+    info = {}
+
+    # Standard GitHub rate-limit headers
+    if "X-RateLimit-Limit" in headers:
+        info["limit"] = headers.get("X-RateLimit-Limit")
+    if "X-RateLimit-Remaining" in headers:
+        info["remaining"] = headers.get("X-RateLimit-Remaining")
+    if "X-RateLimit-Reset" in headers:
+        reset_epoch = int(headers.get("X-RateLimit-Reset", "0"))
+        if reset_epoch:
+            reset_time = datetime.fromtimestamp(reset_epoch, tz=timezone.utc)
+            info["reset_epoch"] = reset_epoch
+            info["reset_time"] = reset_time
+            info["reset_local"] = reset_time.astimezone()
+
+    # Retry-After header (seconds or HTTP-date)
+    if "Retry-After" in headers:
+        retry_after = headers.get("Retry-After")
+        try:
+            info["retry_after_seconds"] = int(retry_after)
+        except ValueError:
+            info["retry_after"] = retry_after
+            try:
+                retry_at = parsedate_to_datetime(retry_after)
+                delta = retry_at - datetime.now(timezone.utc)
+                info["retry_after_seconds"] = max(0, int(delta.total_seconds()))
+            except (TypeError, ValueError):
+                pass
+
+    return info
+
+
+# Statuses worth retrying regardless of headers (403/429 are retried only when rate limited)
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class RetryScheduler:
+    """Decide whether, and for how long, to back off before retrying a GitHub request.
+
+    Server hints win: ``Retry-After`` is honoured exactly, and an exhausted rate limit
+    (``X-RateLimit-Remaining: 0``) waits until ``X-RateLimit-Reset``. Other transient
+    failures (5xx, connection resets, timeouts) use capped exponential backoff with
+    jitter. A wait longer than ``max_wait`` is not attempted; the caller reports the
+    error instead. ``NUAA_RETRY_ATTEMPTS`` and ``NUAA_MAX_RETRY_WAIT`` override the defaults.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int | None = None,
+        max_wait: float | None = None,
+        *,
+        base_delay: float = 1.0,
+        max_backoff: float = 30.0,
+        sleep: Callable[[float], None] = time.sleep,
+        clock: Callable[[], float] = time.time,
+        on_wait: Callable[[float, str, int], None] | None = None,
+    ):
+        self.max_attempts = max_attempts or int(os.getenv("NUAA_RETRY_ATTEMPTS", "5"))
+        self.max_wait = (
+            max_wait if max_wait is not None else float(os.getenv("NUAA_MAX_RETRY_WAIT", "300"))
+        )
+        self.base_delay = base_delay
+        self.max_backoff = max_backoff
+        self.sleep = sleep
+        self.clock = clock
+        self.on_wait = on_wait
+
+    def backoff(self, attempt: int) -> float:
+        """Exponential backoff for ``attempt`` (0-based) with up to 10% jitter."""
+        delay = min(self.max_backoff, self.base_delay * (2**attempt))
+        return delay + random.uniform(0, delay / 10)
+
+    def delay_for_response(
+        self, status_code: int, headers: httpx.Headers, attempt: int
+    ) -> float | None:
+        """Seconds to wait before retrying a failed response, or None if it should not be retried."""
+        if attempt + 1 >= self.max_attempts:
+            return None
+        rate_info = _parse_rate_limit_headers(headers)
+        if status_code in (403, 429) and "retry_after_seconds" in rate_info:
+            delay = float(rate_info["retry_after_seconds"])
+        elif (
+            status_code in (403, 429)
+            and rate_info.get("remaining") == "0"
+            and "reset_epoch" in rate_info
+        ):
+            delay = max(0.0, rate_info["reset_epoch"] - self.clock()) + 1
+        elif status_code in RETRY_STATUSES:
+            delay = float(rate_info.get("retry_after_seconds", self.backoff(attempt)))
+        else:
+            return None
+        return delay if delay <= self.max_wait else None
+
+    def delay_for_error(self, error: Exception, attempt: int) -> float | None:
+        """Seconds to wait after a transport error (timeout, reset, DNS), or None to give up."""
+        if attempt + 1 >= self.max_attempts or not isinstance(error, httpx.TransportError):
+            return None
+        return self.backoff(attempt)
+
+    def wait(self, delay: float, reason: str, attempt: int) -> None:
+        if self.on_wait:
+            self.on_wait(delay, reason, attempt)
+        self.sleep(delay)
+
+
+def _format_rate_limit_error(status_code: int, headers: httpx.Headers, url: str) -> str:
+    """Format a user-friendly error message with rate-limit information."""
+    rate_info = _parse_rate_limit_headers(headers)
+
+    lines = [f"GitHub API returned status {status_code} for {url}"]
+    lines.append("")
+
+    if rate_info:
+        lines.append("[bold]Rate Limit Information:[/bold]")
+        if "limit" in rate_info:
+            lines.append(f"  • Rate Limit: {rate_info['limit']} requests/hour")
+        if "remaining" in rate_info:
+            lines.append(f"  • Remaining: {rate_info['remaining']}")
+        if "reset_local" in rate_info:
+            reset_str = rate_info["reset_local"].strftime("%Y-%m-%d %H:%M:%S %Z")
+            lines.append(f"  • Resets at: {reset_str}")
+        if "retry_after_seconds" in rate_info:
+            lines.append(f"  • Retry after: {rate_info['retry_after_seconds']} seconds")
+        lines.append("")
+
+    # Add troubleshooting guidance
+    lines.append("[bold]Troubleshooting Tips:[/bold]")
+    lines.append("  • If you're on a shared CI or corporate environment, you may be rate-limited.")
+    lines.append(
+        "  • Consider using a GitHub token via --github-token or the GH_TOKEN/GITHUB_TOKEN"
+    )
+    lines.append("    environment variable to increase rate limits.")
+    lines.append(
+        "  • Authenticated requests have a limit of 5,000/hour vs 60/hour for unauthenticated."
+    )
+
+    return "\n".join(lines)
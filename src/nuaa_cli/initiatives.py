@@ -0,0 +1,96 @@
+"""Create numbered initiative folders with a rendered specification.
+
+This is the engine behind ``nuaa specify`` and replaces the process spawned for
+``create-new-initiative.sh`` / ``.ps1``: the slug rules are the same, the number is
+reserved through the workspace index, and the spec template is rendered in memory
+and written once.
+"""
+
+import re
+from datetime import date
+from pathlib import Path
+from typing import NamedTuple
+
+from .locks import write_atomic
+from .scaffold import _find_templates_root
+from .workspace import INITIATIVES, WorkspaceIndex
+
+SPEC_TEMPLATE = "program-specification-template.md"
+MAX_NAME_LENGTH = 100  # conservative limit for directory names
+
+STOP_WORDS = frozenset(
+    "i a an the to for of in on at by with from is are was were be been being have has "
+    "had do does did will would should could can may might must shall this that these "
+    "those my your our their want need add get set".split()
+)
+
+_NON_ALNUM = re.compile(r"[^a-z0-9]+")
+_SPEC_TOKENS = re.compile(r"\[(INITIATIVE_NUMBER|INITIATIVE_SLUG|CREATED_DATE|PROGRAM_NAME)\]")
+
+
+class Initiative(NamedTuple):
+    name: str
+    number: str
+    slug: str
+    directory: Path
+    spec_file: Path
+
+
+def clean_slug(name: str) -> str:
+    """Lowercase ``name`` and collapse every run of other characters to one hyphen."""
+    return _NON_ALNUM.sub("-", name.lower()).strip("-")
+
+
+def generate_slug(description: str) -> str:
+    """Build a short name from the first three meaningful words of a description.
+
+    Stop words and words under three characters are dropped; exactly four
+    meaningful words are all kept. If no word survives, the first three words
+    of the cleaned description are used, as in ``create-new-initiative.sh``.
+    """
+    words = [
+        w for w in _NON_ALNUM.split(description.lower()) if len(w) >= 3 and w not in STOP_WORDS
+    ]
+    if not words:
+        return "-".join([w for w in clean_slug(description).split("-") if w][:3]) or "initiative"
+    return "-".join(words[: 4 if len(words) == 4 else 3])
+
+
+def render_spec(template: str, number: str, slug: str, program_name: str, created: str) -> str:
+    """Fill the specification template's metadata tokens in one pass."""
+    values = {
+        "INITIATIVE_NUMBER": number,
+        "INITIATIVE_SLUG": slug,
+        "CREATED_DATE": created,
+        "PROGRAM_NAME": program_name,
+    }
+    return _SPEC_TOKENS.sub(lambda m: values[m.group(1)], template)
+
+
+def create_initiative(
+    description: str,
+    short_name: str | None = None,
+    number: int | None = None,
+    root: Path | None = None,
+) -> Initiative:
+    """Reserve the next initiative number and write its ``spec.md``.
+
+    Raises ``FileNotFoundError`` if the spec template cannot be found and
+    ``FileExistsError`` if an explicit ``number`` names an existing folder.
+    """
+    root = Path(root) if root is not None else Path.cwd()
+    template = (_find_templates_root(root) / SPEC_TEMPLATE).read_text(encoding="utf-8")
+
+    slug = clean_slug(short_name) if short_name else generate_slug(description)
+    slug = slug[: MAX_NAME_LENGTH - 4].rstrip("-") or "initiative"
+
+    index = WorkspaceIndex(root)
+    entry = index.reserve(INITIATIVES, slug, number)
+    directory = root / INITIATIVES / entry["name"]
+    spec_file = directory / "spec.md"
+    num_str = entry["name"].split("-", 1)[0]
+    write_atomic(
+        spec_file, render_spec(template, num_str, slug, description, date.today().isoformat())
+    )
+    index.record(INITIATIVES, entry["name"])  # status is now "specified"
+    return Initiative(entry["name"], num_str, slug, directory, spec_file)
@@ -0,0 +1,122 @@
+"""Workspace-wide inventory of unresolved markers for ``nuaa inventory``.
+
+Every markdown document of every initiative (spec, plan, section drafts, final
+document) and of every feature folder is scanned in one pass through
+:func:`nuaa_cli.markers.scan_markdown`. The work is therefore shared with
+``nuaa lint placeholders``: unchanged files are answered from
+``.nuaa/cache/markers.json`` and changed ones are scanned on a process pool.
+
+Markers are grouped per folder and per document. Drafts under ``sections/`` are
+named after their plan section, and each document also gets counts per heading.
+Markdown task-list boxes (``[ ]``, ``[x]``) are not template tokens and are not
+counted.
+"""
+
+import os
+from pathlib import Path
+
+from .markers import BRACKET, CLARIFICATION, PLACEHOLDER, FileScan, Marker, scan_markdown
+from .planfile import load_plan, section_filename
+from .workspace import FEATURES, INITIATIVES, WorkspaceIndex
+
+KINDS = (PLACEHOLDER, CLARIFICATION, BRACKET)
+
+_TASK_BOXES = {"[ ]", "[x]", "[X]"}
+
+
+def marker_counts(markers: list[Marker]) -> dict[str, int]:
+    """Count ``markers`` by kind, with a ``total``."""
+    counts = dict.fromkeys(KINDS, 0)
+    for marker in markers:
+        counts[marker.kind] += 1
+    counts["total"] = len(markers)
+    return counts
+
+
+def _add(totals: dict[str, int], counts: dict[str, int]) -> None:
+    for key, value in counts.items():
+        totals[key] = totals.get(key, 0) + value
+
+
+def _section_names(folder: Path) -> dict[str, str]:
+    """Map draft file names under ``sections/`` to their plan section names."""
+    try:
+        plan = load_plan(folder / "plan.md")
+    except OSError:
+        return {}
+    return {section_filename(s.name): s.name for s in plan.sections}
+
+
+def _document(relative: str, scan: FileScan, markers: list[Marker], sections: dict) -> dict:
+    parts = relative.split("/")
+    section = None
+    if len(parts) == 4 and parts[2] == "sections":
+        section = sections.get(parts[3], parts[3].removesuffix(".md"))
+    headings: dict[str, int] = {}
+    for marker in markers:
+        headings[marker.section] = headings.get(marker.section, 0) + 1
+    return {
+        "path": relative,
+        "section": section,
+        "final": scan.final,
+        "counts": marker_counts(markers),
+        "headings": headings,
+        "markers": [marker._asdict() for marker in markers],
+    }
+
+
+def workspace_inventory(
+    root: Path | None = None, jobs: int | None = None, cache: bool = True
+) -> dict:
+    """Inventory the unresolved markers of every initiative and feature under ``root``.
+
+    Returns ``{"initiatives": [...], "features": [...], "totals": {...}, "scanned": n,
+    "cached": n}``. Each folder lists only its documents that still have markers.
+    """
+    root = Path(root) if root is not None else Path.cwd()
+    index = WorkspaceIndex(root)
+    folders = {
+        f"{kind}/{name}": {
+            "name": name,
+            "path": f"{kind}/{name}",
+            "documents_scanned": 0,
+            "counts": marker_counts([]),
+            "documents": [],
+        }
+        for kind in (INITIATIVES, FEATURES)
+        for name in sorted(index.collection(kind))
+    }
+    scans, hits = scan_markdown(
+        [root / folder for folder in folders], root=root, jobs=jobs, cache=cache
+    )
+
+    totals = marker_counts([])
+    sections: dict[str, dict[str, str]] = {}
+    documents = 0
+    for scan in scans:
+        relative = os.path.relpath(scan.path, root).replace(os.sep, "/")
+        folder = folders["/".join(relative.split("/")[:2])]
+        folder["documents_scanned"] += 1
+        markers = [m for m in scan.markers if m.text not in _TASK_BOXES]
+        if not markers:
+            continue
+        if folder["path"] not in sections:
+            sections[folder["path"]] = (
+                _section_names(root / folder["path"])
+                if folder["path"].startswith(INITIATIVES)
+                else {}
+            )
+        document = _document(relative, scan, markers, sections[folder["path"]])
+        folder["documents"].append(document)
+        _add(folder["counts"], document["counts"])
+        _add(totals, document["counts"])
+        documents += 1
+
+    totals["documents"] = documents
+    return {
+        "initiatives": [f for f in folders.values() if f["path"].startswith(f"{INITIATIVES}/")],
+        "features": [f for f in folders.values() if f["path"].startswith(f"{FEATURES}/")],
+        "totals": totals,
+        "scanned": len(scans),
+        "cached": hits,
+    }
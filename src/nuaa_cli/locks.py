@@ -0,0 +1,219 @@
+"""Advisory per-file locks for workspace files that several agents or CLI runs modify.
+
+A writer holds the lock of one file (``plan.md``, a spec, a changelog) for its
+whole read-modify-write cycle and replaces the file atomically with
+``write_atomic``. Readers therefore never need a lock: they see either the old
+or the new content, never a partial write.
+
+On POSIX the lock is ``flock`` on a hidden sibling ``.<name>.lock`` file, the same
+lock ``flock(1)`` takes in the bash scripts; the kernel releases it if the holder
+dies. The holder deletes the file before releasing it, so no lock files are left
+next to the user's documents; a writer that locked a file which was deleted
+meanwhile opens the new one and tries again.
+
+Where ``fcntl`` is unavailable (Windows) or the filesystem rejects ``flock``, the
+lock is the exclusive creation of ``.<name>.lck`` holding the owner's pid, as the
+PowerShell scripts and bash without ``flock(1)`` do. Such a file older than
+``STALE_LOCK_SECONDS`` is treated as abandoned.
+
+Writers using ``flock`` also create ``.<name>.lck`` once they hold the flock, and
+remove it on release. Both kinds of writer therefore compete for the same
+marker file, whichever of them goes first. A flock holder that finds a marker
+whose pid no longer runs on this host removes it at once: its owner was killed
+before it could clean up.
+"""
+
+import errno
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+DEFAULT_LOCK_TIMEOUT = 30.0
+STALE_LOCK_SECONDS = 300
+_POLL_SECONDS = 0.05
+
+
+class LockTimeout(TimeoutError):
+    """Raised when a file lock is not acquired within the timeout."""
+
+    def __init__(self, path: Path, timeout: float):
+        super().__init__(f"Timed out after {timeout:g}s waiting for the lock on {path}")
+        self.path = path
+        self.timeout = timeout
+
+
+def lock_timeout() -> float:
+    """Seconds to wait for a lock (``NUAA_LOCK_TIMEOUT``, default 30)."""
+    try:
+        return float(os.environ.get("NUAA_LOCK_TIMEOUT", DEFAULT_LOCK_TIMEOUT))
+    except ValueError:
+        return DEFAULT_LOCK_TIMEOUT
+
+
+def lock_path(path: Path) -> Path:
+    """Return the ``flock`` file guarding ``path``."""
+    return path.with_name(f".{path.name}.lock")
+
+
+def fallback_lock_path(path: Path) -> Path:
+    """Return the exclusive lock file guarding ``path`` where ``flock`` is unavailable."""
+    return path.with_name(f".{path.name}.lck")
+
+
+def _held_by_fallback(marker: Path) -> bool:
+    """True if a live ``.lck`` file exists; an abandoned one is removed."""
+    try:
+        age = time.time() - marker.stat().st_mtime
+    except FileNotFoundError:
+        return False
+    if age > STALE_LOCK_SECONDS:
+        try:
+            marker.unlink()
+        except FileNotFoundError:
+            pass
+        return False
+    return True
+
+
+def _owner_gone(marker: Path) -> bool:
+    """True if the pid recorded in ``marker`` no longer runs on this host."""
+    try:
+        pid = int(marker.read_text(encoding="utf-8").split()[0])
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    except (OSError, ValueError, IndexError):
+        pass  # gone already, still being written, or alive under another user
+    return False
+
+
+def _try_flock(fd: int) -> bool | None:
+    """Try to take the flock; None means the filesystem does not support it."""
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return True
+    except OSError as e:
+        if e.errno in (errno.EAGAIN, errno.EACCES, errno.EWOULDBLOCK):
+            return False
+        if e.errno in (errno.ENOLCK, errno.EOPNOTSUPP, errno.EINVAL):
+            return None
+        raise
+
+
+def _same_file(fd: int, path: Path) -> bool:
+    """True if ``fd`` is still the file at ``path`` (the previous holder may have deleted it)."""
+    try:
+        current = os.stat(path)
+    except FileNotFoundError:
+        return False
+    opened = os.fstat(fd)
+    return (opened.st_dev, opened.st_ino) == (current.st_dev, current.st_ino)
+
+
+def _try_create(marker: Path, flock_held: bool = False) -> bool:
+    try:
+        fd = os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+    except FileExistsError:
+        if flock_held and _owner_gone(marker):
+            try:
+                marker.unlink()
+            except FileNotFoundError:
+                pass
+            return _try_create(marker)
+        _held_by_fallback(marker)
+        return False
+    with os.fdopen(fd, "w") as f:
+        f.write(f"{os.getpid()}\n")
+    return True
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float | None = None):
+    """Hold the exclusive lock of ``path`` for the duration of the block.
+
+    Raises ``LockTimeout`` if another writer keeps it for more than ``timeout``
+    seconds (``lock_timeout()`` by default).
+    """
+    path = Path(path)
+    timeout = lock_timeout() if timeout is None else timeout
+    deadline = time.monotonic() + timeout
+    path.parent.mkdir(parents=True, exist_ok=True)
+    marker = fallback_lock_path(path)
+
+    lock = lock_path(path)
+    fd = None
+    if fcntl is not None:
+        fd = os.open(lock, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        while True:
+            locked = _try_flock(fd) if fd is not None else None
+            if locked is None:
+                if fd is not None:
+                    os.close(fd)
+                    fd = None
+                if _try_create(marker):
+                    break
+            elif locked and not _same_file(fd, lock):
+                os.close(fd)  # deleted by the previous holder: lock the current file
+                fd = None
+                fd = os.open(lock, os.O_RDWR | os.O_CREAT, 0o644)
+                continue
+            elif locked:
+                # Take the fallback marker too, so writers without flock see the lock
+                if _try_create(marker, flock_held=True):
+                    break
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            if time.monotonic() >= deadline:
+                raise LockTimeout(path, timeout)
+            time.sleep(_POLL_SECONDS)
+
+        try:
+            yield path
+        finally:
+            for done in (marker, lock) if fcntl is not None else (marker,):
+                try:
+                    done.unlink()
+                except FileNotFoundError:
+                    pass
+    finally:
+        if fd is not None:
+            os.close(fd)  # closing the descriptor releases the flock
+
+
+@contextmanager
+def atomic_writer(path: Path):
+    """Yield a binary file that replaces ``path`` atomically when the block exits.
+
+    The data goes to a synced temporary file beside ``path``, so large outputs can
+    be streamed; if the block raises, ``path`` is left untouched.
+    """
+    path = Path(path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        if path.exists():
+            os.chmod(tmp, path.stat().st_mode)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def write_atomic(path: Path, data: bytes | str) -> None:
+    """Replace ``path`` with ``data`` via a synced temporary file and ``os.replace``."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    with atomic_writer(path) as f:
+        f.write(data)
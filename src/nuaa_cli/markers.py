@@ -0,0 +1,279 @@
+"""Find unresolved placeholder and clarification markers in markdown documents.
+
+Three kinds of marker are reported, outside fenced code blocks only:
+
+* ``[PLACEHOLDER: ...]`` left in a template for the AI to fill,
+* ``[NEEDS CLARIFICATION: ...]`` added for ``nuaa clarify``,
+* any other ``[...]`` not followed by ``(``, i.e. not a markdown link, which
+  ``check-placeholders.sh`` treats as a template token.
+
+Each marker carries its line, column and the nearest heading above it. Each
+file is read once; its bytes are hashed and scanned in the same pass.
+Results are kept in ``.nuaa/cache/markers.json`` keyed by path, with the file's
+mtime, size and SHA-256. A file whose mtime and size are unchanged is not read
+again. One whose mtime changed but whose size and hash did not is not rescanned.
+Large batches of changed files are scanned on a process pool, and the cache is
+checkpointed while they run so an interrupted scan does not start over.
+"""
+
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple
+
+from .workspace import PROJECT_CACHE, project_cache
+
+MARKER_CACHE = PROJECT_CACHE / "markers.json"
+CACHE_VERSION = 2
+
+PLACEHOLDER = "placeholder"
+CLARIFICATION = "clarification"
+BRACKET = "bracket"
+
+# Below this many files to (re)scan, starting worker processes costs more than it saves
+PARALLEL_THRESHOLD = 64
+# While scanning, results so far are written to the cache at most this often
+CHECKPOINT_SECONDS = 5.0
+
+_MARKER = re.compile(r"\[(PLACEHOLDER|NEEDS CLARIFICATION):[^\]\n]*\]|\[[^\]\n]+\](?!\()")
+_KINDS = {"PLACEHOLDER": PLACEHOLDER, "NEEDS CLARIFICATION": CLARIFICATION}
+_FENCE = re.compile(r"^[ \t]*(```|~~~).*$", re.MULTILINE)
+_HEADING = re.compile(r"^#{1,6}[ \t]+(.+?)[ \t#]*$", re.MULTILINE)
+_FINAL = re.compile(r"(?im)^status:\s*[\"']?final\b")
+_SKIP_DIRS = {".git", ".nuaa", "node_modules", "__pycache__"}
+
+
+class Marker(NamedTuple):
+    kind: str
+    text: str
+    line: int
+    column: int
+    section: str  # nearest heading above the marker, "" before the first one
+
+
+class FileScan(NamedTuple):
+    path: str
+    final: bool
+    markers: list[Marker]
+
+
+def front_matter(text: str) -> str | None:
+    """Return the YAML front matter block of a document, or None if it has none."""
+    if not text.startswith("---"):
+        return None
+    end = text.find("\n---", 3)
+    return text[3:end] if end != -1 else None
+
+
+def is_final(text: str) -> bool:
+    """True if the document's front matter says ``status: final``."""
+    meta = front_matter(text)
+    return bool(meta and _FINAL.search(meta))
+
+
+def _fenced_spans(text: str) -> list[tuple[int, int]]:
+    """Return the (start, end) offsets of fenced code blocks, fences included."""
+    spans = []
+    opening = None
+    for match in _FENCE.finditer(text):
+        if opening is None:
+            opening = match
+        elif match.group(1) == opening.group(1):
+            spans.append((opening.start(), match.end()))
+            opening = None
+    if opening is not None:
+        spans.append((opening.start(), len(text)))
+    return spans
+
+
+def _outside(matches: Iterable[re.Match], spans: list[tuple[int, int]]) -> Iterator[re.Match]:
+    """Yield the matches (in offset order) that do not start inside a fenced span."""
+    span = 0
+    for match in matches:
+        start = match.start()
+        while span < len(spans) and spans[span][1] <= start:
+            span += 1
+        if span == len(spans) or spans[span][0] > start:
+            yield match
+
+
+def scan_text(text: str) -> list[Marker]:
+    """Return the markers in ``text`` with 1-based line and column, skipping fenced code.
+
+    Each marker also carries the text of the nearest markdown heading above it.
+    """
+    spans = _fenced_spans(text) if "```" in text or "~~~" in text else []
+    headings = list(_outside(_HEADING.finditer(text), spans))
+    markers: list[Marker] = []
+    line, line_start, position = 1, 0, 0
+    heading, section = 0, ""
+    for match in _outside(_MARKER.finditer(text), spans):
+        start = match.start()
+        newlines = text.count("\n", position, start)
+        if newlines:
+            line += newlines
+            line_start = text.rfind("\n", position, start) + 1
+        position = start
+        while heading < len(headings) and headings[heading].start() <= start:
+            section = headings[heading].group(1)
+            heading += 1
+        kind = _KINDS.get(match.group(1), BRACKET)
+        markers.append(Marker(kind, match.group(), line, start - line_start + 1, section))
+    return markers
+
+
+def _scan_file(path: str, known_sha256: str | None = None) -> tuple | None:
+    """Read, hash and scan one file (runs in worker processes).
+
+    Returns ``(path, mtime_ns, size, sha256, final, markers)``; ``final`` and
+    ``markers`` are None when the hash equals ``known_sha256``. Returns None if
+    the file can no longer be read.
+    """
+    try:
+        with open(path, "rb") as f:
+            stat = os.fstat(f.fileno())
+            data = f.read()
+    except OSError:
+        return None
+    digest = hashlib.sha256(data).hexdigest()
+    if digest == known_sha256:
+        return path, stat.st_mtime_ns, stat.st_size, digest, None, None
+    text = data.decode("utf-8", "replace")
+    return path, stat.st_mtime_ns, stat.st_size, digest, is_final(text), scan_text(text)
+
+
+def iter_markdown(paths: Iterable[Path]) -> list[Path]:
+    """Expand files and directories into the markdown files under them, sorted."""
+    files: set[Path] = set()
+    for path in paths:
+        path = Path(path)
+        if path.is_file():
+            files.add(path)
+            continue
+        for directory, dirnames, filenames in os.walk(path):
+            dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+            files.update(Path(directory, name) for name in filenames if name.endswith(".md"))
+    return sorted(files)
+
+
+class MarkerCache:
+    """Per-file scan results under a project root, keyed by mtime, size and hash."""
+
+    def __init__(self, root: Path | None = None, persist: bool = True):
+        self.root = (Path(root) if root is not None else Path.cwd()).resolve()
+        self.path = self.root / MARKER_CACHE
+        self._prefix = os.path.join(str(self.root), "")
+        self.persist = persist
+        self._data: dict | None = None
+        self.hits = 0
+
+    def _load(self) -> dict:
+        if self._data is None:
+            try:
+                if not self.persist:
+                    raise ValueError("marker cache disabled")
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") != CACHE_VERSION:
+                    raise ValueError("marker cache version mismatch")
+            except (OSError, ValueError):
+                data = {"version": CACHE_VERSION, "files": {}}
+            self._data = data
+        return self._data
+
+    def save(self) -> None:
+        """Write the cache atomically (a lost race only costs a rescan)."""
+        if self._data is None or not self.persist:
+            return
+        try:
+            project_cache(self.root)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # read-only workspace: results are simply recomputed next time
+
+    def _key(self, path: Path) -> str:
+        absolute = os.path.abspath(path)
+        if absolute.startswith(self._prefix):
+            return absolute[len(self._prefix) :].replace(os.sep, "/")
+        return absolute
+
+    def scan(self, files: list[Path], jobs: int | None = None) -> list[FileScan]:
+        """Scan ``files``, reusing cached results, and return them in the given order."""
+        entries = self._load()["files"]
+        results: dict[str, FileScan] = {}
+        pending: list[tuple[str, str | None]] = []
+        keys = {}
+        for path in files:
+            key = keys[str(path)] = self._key(path)
+            entry = entries.get(key)
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                results[str(path)] = _from_entry(str(path), entry)
+                self.hits += 1
+            else:
+                same_size = entry and entry["size"] == stat.st_size
+                pending.append((str(path), entry["sha256"] if same_size else None))
+
+        checkpoint = time.monotonic() + CHECKPOINT_SECONDS
+        for scanned in _run(pending, jobs):
+            if time.monotonic() >= checkpoint:
+                self.save()  # an interrupted run keeps the files scanned so far
+                checkpoint = time.monotonic() + CHECKPOINT_SECONDS
+            if scanned is None:
+                continue
+            path, mtime_ns, size, digest, final, markers = scanned
+            entry = entries.get(keys[path])
+            if final is None:
+                entry.update(mtime_ns=mtime_ns)
+                self.hits += 1
+            else:
+                entry = entries[keys[path]] = {
+                    "mtime_ns": mtime_ns,
+                    "size": size,
+                    "sha256": digest,
+                    "final": final,
+                    "markers": [list(m) for m in markers],
+                }
+            results[path] = _from_entry(path, entry)
+        if pending:
+            self.save()
+        return [results[str(path)] for path in files if str(path) in results]
+
+
+def _from_entry(path: str, entry: dict) -> FileScan:
+    return FileScan(path, entry["final"], [Marker(*m) for m in entry["markers"]])
+
+
+def _run(pending: list[tuple[str, str | None]], jobs: int | None) -> Iterator[tuple | None]:
+    """Scan pending files in this process, or on a process pool for large batches.
+
+    Results are yielded in ``pending`` order as they become available.
+    """
+    if len(pending) < PARALLEL_THRESHOLD or jobs == 1:
+        for path, sha in pending:
+            yield _scan_file(path, sha)
+        return
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = jobs or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        paths, hashes = zip(*pending)
+        chunksize = max(1, len(pending) // (workers * 4))
+        yield from pool.map(_scan_file, paths, hashes, chunksize=chunksize)
+
+
+def scan_markdown(
+    paths: Iterable[Path], root: Path | None = None, jobs: int | None = None, cache: bool = True
+) -> tuple[list[FileScan], int]:
+    """Scan every markdown file under ``paths``; returns the scans and the cache hit count."""
+    store = MarkerCache(root, persist=cache)
+    return store.scan(iter_markdown(paths), jobs), store.hits
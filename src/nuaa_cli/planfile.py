@@ -0,0 +1,468 @@
+"""Parsed model of an initiative's ``plan.md``: sections, gates, statuses and dependencies.
+
+A plan lists its sections as::
+
+    ### Section 3: Service Model
+
+    **Gate**: Gate 2 - Core Content
+    **Dependencies**: Program Description, Section 1 (must be drafted first)
+    **Estimated Length**: 4 paragraphs / 600 words
+    **Status**: In Progress
+
+``load_plan`` parses the file in one pass into ``Section`` records and resolves
+each dependency (by section name, ``Section N`` or a bare number) to the section
+it names. Parsed plans are memoized per (path, mtime, size), so repeated lookups
+in one process never re-read an unchanged file.
+
+``set_status``, ``set_gate`` and ``add_dependency`` edit one section in place:
+they splice the new value at the byte offsets kept by the parse and replace the
+file atomically under its lock (see ``nuaa_cli.locks``).
+"""
+
+import re
+from collections import deque
+from pathlib import Path
+from typing import NamedTuple
+
+PASSED = "Passed"
+NOT_STARTED = "Not Started"
+STATUSES = ("Not Started", "In Progress", "Blocked", "Gate Review", "Passed", "Failed")
+
+_SECTION_HEADING = re.compile(r"^###\s+Section\s+(\d+)\s*:\s*(.+?)\s*$")
+_FIELD = re.compile(r"^\*\*([^*]+)\*\*\s*:\s*(.*?)\s*$")
+_GATE_NUMBER = re.compile(r"Gate\s+(\d+)", re.IGNORECASE)
+_SECTION_REF = re.compile(r"^Sections?\s+(?=\d)", re.IGNORECASE)
+_PARENTHETICAL = re.compile(r"\([^)]*\)")
+_TRAILING_NOTE = re.compile(r"\s*\([^)]*\)\s*$")
+_WORDS = re.compile(r"(\d+)(?:\s*[-–]\s*(\d+))?\s*words", re.IGNORECASE)
+_PARAGRAPHS = re.compile(r"(\d+)(?:\s*[-–]\s*(\d+))?\s*paragraphs?", re.IGNORECASE)
+
+# Words per paragraph when an estimate only gives a paragraph count
+WORDS_PER_PARAGRAPH = 150
+
+
+class Section(NamedTuple):
+    number: int
+    name: str
+    gate: int | None
+    status: str
+    dependencies: tuple[str, ...]
+    fields: dict[str, str]
+    line: int
+    # Byte offsets (start, end) of each field's value in the file, keyed by field name
+    spans: dict[str, tuple[int, int]]
+    # Byte offset just past the last field line (or the heading when there are none)
+    fields_end: int
+
+    @property
+    def passed(self) -> bool:
+        return self.status.lower().startswith(PASSED.lower())
+
+    @property
+    def title(self) -> str:
+        return f"Section {self.number}: {self.name}"
+
+    @property
+    def estimated_words(self) -> int | None:
+        """Midpoint of the ``**Estimated Length**`` field in words, or None if it has no number.
+
+        ``4-5 paragraphs (600-800 words)`` gives 700; ``3 paragraphs`` gives 450.
+        """
+        estimate = self.fields.get("Estimated Length", "")
+        match = _WORDS.search(estimate)
+        scale = 1
+        if match is None:
+            match = _PARAGRAPHS.search(estimate)
+            scale = WORDS_PER_PARAGRAPH
+        if match is None:
+            return None
+        low = int(match.group(1))
+        high = int(match.group(2) or low)
+        return (low + high) * scale // 2
+
+
+class GateResult(NamedTuple):
+    section: Section
+    dependencies: list[Section]
+    blockers: list[str]
+
+    @property
+    def satisfied(self) -> bool:
+        return not self.blockers
+
+
+class PlanCheck(NamedTuple):
+    # Sections in dependency order; sections caught in a cycle follow in file order
+    results: list[GateResult]
+    errors: list[str]
+
+
+def parse_dependencies(value: str) -> tuple[str, ...]:
+    """Split a ``**Dependencies**`` value on commas and semicolons; ``None`` yields no references.
+
+    ``Sections 2, 3`` becomes ``("2", "3")``. Other references are kept as written,
+    including ``&``, ``and`` and parentheses, since section names such as
+    ``Next Steps & Sustainability (Final Reports)`` contain them; ``Plan.find``
+    drops a trailing ``(...)`` note only if the full name matches no section.
+    """
+    if _PARENTHETICAL.sub("", value).strip().lower() in ("", "none", "n/a", "-"):
+        return ()
+    refs = []
+    for part in re.split(r"[,;]", value):
+        part = part.strip().strip(" .")
+        number = _SECTION_REF.sub("", _TRAILING_NOTE.sub("", part)).strip(" .")
+        ref = number if number.isdigit() else part
+        if ref:
+            refs.append(ref)
+    return tuple(refs)
+
+
+def section_filename(name: str) -> str:
+    """Return the file name of a section's draft under ``sections/`` (as ``nuaa draft`` writes it)."""
+    return f"{name.lower().replace(' ', '-')}.md"
+
+
+def _blockers(deps: list[Section], unknown: list[str]) -> list[str]:
+    blocked = [f"{dep.name} (status: {dep.status or 'unknown'})" for dep in deps if not dep.passed]
+    return blocked + [f"{ref} (not in plan)" for ref in unknown]
+
+
+class Plan:
+    """The sections of one plan file with name/number lookup and resolved dependencies."""
+
+    def __init__(self, path: Path, sections: list[Section]):
+        self.path = path
+        self.sections = sections
+        self._by_name = {s.name.lower(): s for s in sections}
+        self._by_number = {s.number: s for s in sections}
+        self._check: PlanCheck | None = None
+
+    def __iter__(self):
+        return iter(self.sections)
+
+    def __len__(self) -> int:
+        return len(self.sections)
+
+    def find(self, ref: str) -> Section | None:
+        """Return the section named ``ref`` (any case), or referenced as ``Section N`` / ``N``.
+
+        A trailing ``(...)`` note is ignored when ``ref`` with it names no section.
+        """
+        ref = ref.strip()
+        section = self._by_name.get(ref.lower())
+        if section is not None:
+            return section
+        ref = _TRAILING_NOTE.sub("", ref)
+        section = self._by_name.get(ref.lower())
+        if section is not None:
+            return section
+        heading = _SECTION_HEADING.match(f"### {ref}")
+        if heading:
+            return self._by_number.get(int(heading.group(1)))
+        number = _SECTION_REF.sub("", ref)
+        return self._by_number.get(int(number)) if number.isdigit() else None
+
+    def resolve(self, section: Section) -> tuple[list[Section], list[str]]:
+        """Return (dependency sections, references that name no section in the plan).
+
+        The whole ``**Dependencies**`` value is tried as one name first, for section
+        names that contain a comma.
+        """
+        whole = self.find(section.fields.get("Dependencies", ""))
+        if whole is not None and len(section.dependencies) > 1:
+            return [whole], []
+        found, unknown = [], []
+        for ref in section.dependencies:
+            dep = self.find(ref)
+            if dep is None:
+                unknown.append(_TRAILING_NOTE.sub("", ref))
+            else:
+                found.append(dep)
+        return found, unknown
+
+    def blockers(self, section: Section) -> list[str]:
+        """Describe each dependency of ``section`` that has not passed its gate."""
+        return _blockers(*self.resolve(section))
+
+    def graph(self) -> dict[int, list[int]]:
+        """Return ``section number -> numbers of the sections it depends on`` (known ones only)."""
+        return {s.number: [d.number for d in self.resolve(s)[0]] for s in self.sections}
+
+    def check(self) -> PlanCheck:
+        """Evaluate every section's dependencies in one topological sweep.
+
+        Duplicate section numbers, dependencies that name no section and
+        dependency cycles are returned as errors alongside the per-section results.
+        The result is computed once per parsed plan.
+        """
+        if self._check is None:
+            self._check = self._sweep()
+        return self._check
+
+    def critical_path(self, weight=None) -> tuple[float, list[Section]]:
+        """Return the longest chain of unfinished sections through the dependency graph.
+
+        ``weight(section)`` is the cost of one section (1 by default); passed sections
+        cost nothing. Returns ``(total weight, sections in dependency order)``.
+        """
+        best: dict[int, tuple[float, list[Section]]] = {}
+        for result in self.check().results:
+            section = result.section
+            before = max(
+                (best[d.number] for d in result.dependencies if d.number in best),
+                key=lambda chain: chain[0],
+                default=(0, []),
+            )
+            if section.passed:
+                best[section.number] = before
+            else:
+                cost = weight(section) if weight else 1
+                best[section.number] = (before[0] + cost, before[1] + [section])
+        return max(best.values(), key=lambda chain: chain[0], default=(0, []))
+
+    def _sweep(self) -> PlanCheck:
+        errors: list[str] = []
+        seen: set[int] = set()
+        for section in self.sections:
+            if section.number in seen:
+                errors.append(f"Section {section.number} appears more than once")
+            seen.add(section.number)
+
+        results: dict[int, GateResult] = {}
+        dependents: dict[int, list[int]] = {number: [] for number in self._by_number}
+        pending: dict[int, int] = {}
+        for section in self._by_number.values():
+            deps, unknown = self.resolve(section)
+            for ref in unknown:
+                errors.append(f"{section.title} depends on unknown section '{ref}'")
+            blockers = _blockers(deps, unknown)
+            results[section.number] = GateResult(section, deps, blockers)
+            numbers = {dep.number for dep in deps}
+            pending[section.number] = len(numbers)
+            for number in numbers:
+                dependents[number].append(section.number)
+
+        # Kahn's algorithm, seeded in file order so independent sections keep plan order
+        ready = deque(s.number for s in self._by_number.values() if not pending[s.number])
+        order: list[int] = []
+        while ready:
+            number = ready.popleft()
+            order.append(number)
+            for dependent in dependents[number]:
+                pending[dependent] -= 1
+                if not pending[dependent]:
+                    ready.append(dependent)
+
+        stuck = [number for number in self._by_number if pending[number]]
+        errors.extend(self._cycles(stuck, results))
+        return PlanCheck([results[number] for number in order + stuck], errors)
+
+    @staticmethod
+    def _cycles(stuck: list[int], results: dict[int, GateResult]) -> list[str]:
+        """Describe each cycle among the sections left over by the topological sort.
+
+        Every leftover section depends on another leftover one, so following those
+        edges always ends in a cycle or in a section already walked from.
+        """
+        leftover, visited = set(stuck), set()
+        messages = []
+        for start in stuck:
+            path, number = [], start
+            while number not in path and number not in visited:
+                path.append(number)
+                number = next(
+                    d.number for d in results[number].dependencies if d.number in leftover
+                )
+            if number in path:
+                cycle = path[path.index(number) :] + [number]
+                titles = (results[n].section.title for n in cycle)
+                messages.append("Dependency cycle: " + " → ".join(titles))
+            visited.update(path)
+        return messages
+
+
+def parse_plan(data: bytes, path: Path | None = None) -> Plan:
+    """Parse plan.md bytes into a Plan; fields are read until the next ``###`` heading."""
+    sections: list[Section] = []
+    current: dict | None = None
+
+    def finish() -> None:
+        if current is None:
+            return
+        fields = current["fields"]
+        gate = _GATE_NUMBER.search(fields.get("Gate", ""))
+        sections.append(
+            Section(
+                number=current["number"],
+                name=current["name"],
+                gate=int(gate.group(1)) if gate else None,
+                status=fields.get("Status", ""),
+                dependencies=parse_dependencies(fields.get("Dependencies", "")),
+                fields=fields,
+                line=current["line"],
+                spans=current["spans"],
+                fields_end=current["fields_end"],
+            )
+        )
+
+    offset = 0
+    for number, raw in enumerate(data.splitlines(keepends=True), start=1):
+        line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+        start = offset
+        offset += len(raw)
+        if line.startswith("###"):
+            finish()
+            current = None
+            heading = _SECTION_HEADING.match(line)
+            if heading:
+                current = {
+                    "number": int(heading.group(1)),
+                    "name": heading.group(2),
+                    "line": number,
+                    "fields": {},
+                    "spans": {},
+                    "fields_end": offset,
+                }
+            continue
+        if line.startswith("## "):
+            finish()
+            current = None
+            continue
+        if current is None:
+            continue
+        field = _FIELD.match(line)
+        if field and field.group(1).strip() not in current["fields"]:
+            key, value = field.group(1).strip(), field.group(2)
+            current["fields"][key] = value
+            value_start = start + len(line[: field.start(2)].encode("utf-8"))
+            current["spans"][key] = (value_start, value_start + len(value.encode("utf-8")))
+            current["fields_end"] = offset
+    finish()
+    return Plan(path or Path("plan.md"), sections)
+
+
+# Resolved path -> ((mtime_ns, size), Plan) of the last parse
+_PLANS: dict[str, tuple[tuple[int, int], Plan]] = {}
+
+
+def load_plan(path: Path) -> Plan:
+    """Return the parsed plan at ``path``, re-parsing only when its mtime or size changed."""
+    key = str(path.resolve())
+    stat = path.stat()
+    cached = _PLANS.get(key)
+    if cached is not None and cached[0] == (stat.st_mtime_ns, stat.st_size):
+        return cached[1]
+    plan = parse_plan(path.read_bytes(), Path(key))
+    _PLANS[key] = ((stat.st_mtime_ns, stat.st_size), plan)
+    return plan
+
+
+# ------------------------------
+# Structured edits
+# ------------------------------
+
+
+def update_section(path: Path, ref: str, fields) -> Section:
+    """Set ``**Field**`` values of one section in place and return the updated section.
+
+    ``fields`` is a ``{field: value}`` dict, or a function ``(plan, section) -> dict``
+    evaluated under the lock for edits that depend on the current values.
+    The plan is locked for the edit and re-read under the lock. Existing values
+    are spliced at the byte offsets recorded by the parse; missing fields are
+    inserted after the section's last field. The result is written to a
+    temporary file, synced and moved over the plan, and the new parse replaces
+    the cached one.
+    """
+    from .locks import file_lock, write_atomic
+
+    path = Path(path)
+    with file_lock(path):
+        # Parse the bytes being edited rather than the cached plan: the offsets must
+        # match them even if a writer that ignores the lock changed the file.
+        data = path.read_bytes()
+        plan = parse_plan(data, path.resolve())
+        section = plan.find(ref)
+        if section is None:
+            raise ValueError(f"Section '{ref}' not found in {path}")
+        if callable(fields):
+            fields = fields(plan, section)
+        for key, value in fields.items():
+            if "\n" in value or "\r" in value:
+                raise ValueError(f"Value for {key} must be a single line")
+        if all(section.fields.get(key) == value for key, value in fields.items()):
+            return section
+
+        splices = []
+        insert = []
+        for key, value in fields.items():
+            if key in section.spans:
+                start, end = section.spans[key]
+                splices.append((start, end, value.encode("utf-8")))
+            else:
+                insert.append(f"**{key}**: {value}\n")
+        if insert:
+            at = section.fields_end
+            prefix = "\n" if at and data[at - 1 : at] != b"\n" else ""
+            splices.append((at, at, (prefix + "".join(insert)).encode("utf-8")))
+
+        for start, end, value in sorted(splices, reverse=True):
+            data = data[:start] + value + data[end:]
+        write_atomic(path, data)
+
+        stat = path.stat()
+        updated = parse_plan(data, plan.path)
+        _PLANS[str(plan.path)] = ((stat.st_mtime_ns, stat.st_size), updated)
+    return updated.find(str(section.number))
+
+
+def set_status(path: Path, ref: str, status: str) -> Section:
+    """Set the ``**Status**`` of a section (e.g. ``In Progress``, ``Passed``)."""
+    return update_section(path, ref, {"Status": status})
+
+
+def set_gate(path: Path, ref: str, gate: int) -> Section:
+    """Move a section to gate ``gate``, keeping the gate's label text if it has one."""
+
+    def fields(plan: Plan, section: Section) -> dict[str, str]:
+        current = section.fields.get("Gate", "")
+        if _GATE_NUMBER.search(current):
+            return {"Gate": _GATE_NUMBER.sub(f"Gate {gate}", current, count=1)}
+        return {"Gate": f"Gate {gate}"}
+
+    return update_section(path, ref, fields)
+
+
+def add_dependency(path: Path, ref: str, dependency: str) -> Section:
+    """Make section ``ref`` depend on section ``dependency``; a no-op if it already does.
+
+    Raises ValueError if the dependency is unknown or the edit would create a cycle.
+    """
+
+    def fields(plan: Plan, section: Section) -> dict[str, str]:
+        needed = plan.find(dependency)
+        if needed is None:
+            raise ValueError(f"Section '{dependency}' not found in {plan.path}")
+        if needed.number == section.number or section.number in _upstream(plan, needed):
+            raise ValueError(f"{section.title} -> {needed.title} would create a dependency cycle")
+        current = section.fields.get("Dependencies", "")
+        if needed in plan.resolve(section)[0]:
+            return {"Dependencies": current}
+        # A name with a separator in it would not read back as one reference
+        name = needed.name if not re.search(r"[,;]", needed.name) else f"Section {needed.number}"
+        value = f"{current}, {name}" if section.dependencies else name
+        return {"Dependencies": value}
+
+    return update_section(path, ref, fields)
+
+
+def _upstream(plan: Plan, section: Section) -> set[int]:
+    """Numbers of every section ``section`` depends on, directly or transitively."""
+    graph = plan.graph()
+    seen: set[int] = set()
+    stack = list(graph.get(section.number, []))
+    while stack:
+        number = stack.pop()
+        if number not in seen:
+            seen.add(number)
+            stack.extend(graph.get(number, []))
+    return seen
@@ -0,0 +1,177 @@
+"""Computed initiative progress for ``nuaa status``.
+
+The report is derived from ``plan.md`` (section statuses, gates and dependencies)
+and the drafts in ``initiatives/<id>/sections/``: per-gate progress, completion
+percentage, blocked sections with their blockers, sections ready to start and the
+critical path of unfinished work.
+
+Reports are cached in ``.nuaa/cache/status.json`` under a fingerprint of the plan
+and every draft (mtime and size), so polling an unchanged initiative costs one
+``stat`` per file and no parsing.
+"""
+
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .planfile import GateResult, Plan, load_plan, section_filename
+from .workspace import INITIATIVES, PROJECT_CACHE, project_cache
+
+STATUS_CACHE = PROJECT_CACHE / "status.json"
+CACHE_VERSION = 1
+
+PASSED = "passed"
+FAILED = "failed"
+IN_PROGRESS = "in_progress"
+BLOCKED = "blocked"
+READY = "ready"
+
+_ACTIVE_STATUSES = ("in progress", "gate review")
+
+
+def section_state(result: GateResult) -> str:
+    """Classify a section as passed, failed, in_progress, blocked or ready."""
+    status = result.section.status.lower()
+    if result.section.passed:
+        return PASSED
+    if status.startswith(FAILED):
+        return FAILED
+    if status.startswith(_ACTIVE_STATUSES):
+        return IN_PROGRESS
+    return READY if result.satisfied else BLOCKED
+
+
+def _drafts(sections_dir: Path) -> dict[str, os.stat_result]:
+    try:
+        with os.scandir(sections_dir) as it:
+            return {e.name: e.stat() for e in it if e.is_file() and e.name.endswith(".md")}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _fingerprint(plan_file: Path, drafts: dict[str, os.stat_result]) -> list:
+    stat = plan_file.stat()
+    files = sorted([name, s.st_mtime_ns, s.st_size] for name, s in drafts.items())
+    return [stat.st_mtime_ns, stat.st_size, files]
+
+
+def _word_count(path: Path) -> int:
+    try:
+        return len(path.read_bytes().split())
+    except OSError:
+        return 0
+
+
+def compute_status(
+    initiative: str, plan: Plan, sections_dir: Path, drafts: dict | None = None
+) -> dict:
+    """Build the status report of one initiative from its parsed plan and drafts."""
+    check = plan.check()
+    if drafts is None:
+        drafts = _drafts(sections_dir)
+    sections, gates = [], {}
+    for result in check.results:
+        section = result.section
+        state = section_state(result)
+        filename = section_filename(section.name)
+        drafted = filename in drafts
+        sections.append(
+            {
+                "number": section.number,
+                "name": section.name,
+                "gate": section.gate,
+                "status": section.status,
+                "state": state,
+                "dependencies": [dep.number for dep in result.dependencies],
+                "blockers": result.blockers,
+                "draft": f"sections/{filename}" if drafted else None,
+                "words": _word_count(sections_dir / filename) if drafted else 0,
+            }
+        )
+        gate = gates.setdefault(
+            str(section.gate) if section.gate is not None else "?",
+            {"total": 0, PASSED: 0, IN_PROGRESS: 0, FAILED: 0, "remaining": 0},
+        )
+        gate["total"] += 1
+        gate[state if state in (PASSED, IN_PROGRESS, FAILED) else "remaining"] += 1
+    sections.sort(key=lambda s: s["number"])
+    for gate in gates.values():
+        gate["pass_rate"] = round(100 * gate[PASSED] / gate["total"])
+
+    total = len(sections)
+    passed = sum(s["state"] == PASSED for s in sections)
+    length, path = plan.critical_path()
+    return {
+        "initiative": initiative,
+        "updated": datetime.fromtimestamp(plan.path.stat().st_mtime, timezone.utc).isoformat(),
+        "total": total,
+        "passed": passed,
+        "drafted": sum(s["draft"] is not None for s in sections),
+        "completion": round(100 * passed / total, 1) if total else 0.0,
+        "gates": dict(sorted(gates.items())),
+        "sections": sections,
+        "blocked": [
+            {"section": s["name"], "blockers": s["blockers"]}
+            for s in sections
+            if s["blockers"] and s["state"] != PASSED
+        ],
+        "next": [
+            s["name"]
+            for s in sections
+            if s["state"] == READY or (s["state"] == FAILED and not s["blockers"])
+        ],
+        "critical_path": {"length": length, "sections": [s.name for s in path]},
+        "errors": check.errors,
+    }
+
+
+class StatusCache:
+    """Status reports per initiative, keyed by a fingerprint of the files they came from."""
+
+    def __init__(self, root: Path | None = None):
+        self.root = Path(root) if root is not None else Path.cwd()
+        self.path = self.root / STATUS_CACHE
+
+    def _load(self) -> dict:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == CACHE_VERSION:
+                return data
+        except (OSError, ValueError):
+            pass
+        return {"version": CACHE_VERSION, "initiatives": {}}
+
+    def _save(self, data: dict) -> None:
+        try:
+            project_cache(self.root)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(data, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+        except OSError:
+            pass  # read-only workspace: the report is simply recomputed next time
+
+    def report(self, initiative: str) -> dict:
+        """Return the status report of ``initiative``, recomputing it only if a file changed."""
+        folder = self.root / INITIATIVES / initiative
+        plan_file = folder / "plan.md"
+        sections_dir = folder / "sections"
+        drafts = _drafts(sections_dir)
+        key = _fingerprint(plan_file, drafts)
+
+        data = self._load()
+        cached = data["initiatives"].get(initiative)
+        if cached is not None and cached.get("key") == key:
+            return cached["report"]
+
+        report = compute_status(initiative, load_plan(plan_file), sections_dir, drafts)
+        data["initiatives"][initiative] = {"key": key, "report": report}
+        self._save(data)
+        return report
+
+
+def initiative_status(initiative: str, root: Path | None = None) -> dict:
+    """Return the (cached) status report of an initiative."""
+    return StatusCache(root).report(initiative)
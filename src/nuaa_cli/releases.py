@@ -0,0 +1,109 @@
+"""Latest-release metadata for reporting commands, served from the template cache.
+
+``nuaa version`` and ``nuaa check`` read the cached ``releases/latest`` entry and
+return immediately. When the entry is older than ``NUAA_RELEASE_TTL`` a detached
+``python -m nuaa_cli.releases`` process revalidates it in the background, so the
+next run sees the new release without any command waiting on GitHub. Set
+``NUAA_RELEASE_REFRESH=0`` to disable background refreshes.
+
+This module does not import the HTTP stack; only the refresh itself does.
+"""
+
+import os
+import subprocess
+import sys
+import time
+
+from .cache import TemplateCache, release_ttl
+from .config import RELEASES_LATEST_URL
+
+# A refresh that has not finished within this window is assumed dead and may be retried
+REFRESH_LOCK_SECONDS = 120
+
+
+def cached_latest_release(
+    cache: TemplateCache | None = None, *, refresh: bool = True
+) -> dict | None:
+    """Return the cached latest release metadata, or None if nothing is cached.
+
+    Stale entries are still returned; with ``refresh`` a background revalidation is
+    started for them.
+    """
+    cache = cache or TemplateCache()
+    age = cache.release_age(RELEASES_LATEST_URL)
+    if age is None:
+        return None
+    if refresh and age >= release_ttl():
+        refresh_in_background(cache)
+    return cache.release(RELEASES_LATEST_URL)[1]
+
+
+def refresh_in_background(cache: TemplateCache | None = None) -> bool:
+    """Start a detached process that revalidates the latest release; returns True if started.
+
+    A lock file in the cache keeps concurrent commands from starting duplicate refreshes.
+    """
+    if os.getenv("NUAA_RELEASE_REFRESH", "1") == "0":
+        return False
+    cache = cache or TemplateCache()
+    lock = cache.root / "release-refresh.lock"
+    try:
+        cache.root.mkdir(parents=True, exist_ok=True)
+        if lock.exists() and time.time() - lock.stat().st_mtime < REFRESH_LOCK_SECONDS:
+            return False
+        lock.unlink(missing_ok=True)
+        os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except OSError:
+        return False
+
+    kwargs: dict = {}
+    if os.name == "nt":
+        kwargs["creationflags"] = subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs["start_new_session"] = True
+    try:
+        subprocess.Popen(
+            [sys.executable, "-m", "nuaa_cli.releases", str(cache.root)],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            **kwargs,
+        )
+    except OSError:
+        lock.unlink(missing_ok=True)
+        return False
+    return True
+
+
+def refresh_latest_release(
+    cache: TemplateCache | None = None, *, timeout: float = 30, max_attempts: int | None = None
+) -> dict:
+    """Revalidate the latest release metadata now and return it.
+
+    Raises RuntimeError (see ``fetch_release``) when GitHub cannot be reached.
+    """
+    import httpx
+
+    from .download import fetch_release
+    from .github import RetryScheduler, get_ssl_context
+
+    cache = cache or TemplateCache()
+    scheduler = RetryScheduler(max_attempts=max_attempts, max_wait=60)
+    with httpx.Client(verify=get_ssl_context()) as client:
+        return fetch_release(client, cache=cache, scheduler=scheduler, max_age=0, timeout=timeout)
+
+
+def main(argv: list[str]) -> int:
+    cache = TemplateCache(argv[0]) if argv else TemplateCache()
+    try:
+        refresh_latest_release(cache)
+    except Exception:
+        return 1
+    finally:
+        (cache.root / "release-refresh.lock").unlink(missing_ok=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
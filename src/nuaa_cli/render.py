@@ -0,0 +1,380 @@
+"""Render agent template packages from the NUAA kit sources.
+
+This is the Python port of ``.github/workflows/scripts/create-release-packages.sh``:
+for an (agent, script) pair it produces the same file tree as the published
+``nuaa-template-<agent>-<script>-<version>.zip`` release asset, so ``nuaa init``
+can build a project without downloading anything.
+
+The kit sources are looked up in the installed package (``nuaa_cli/kit``, added
+by the wheel build) and then in the source checkout. Rendered command bodies
+are memoized per (file, mtime, size, agent, script).
+"""
+
+import os
+import re
+import shutil
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+from .config import AGENT_CONFIG, SCRIPT_TYPE_CHOICES
+from .ui import console
+from .upgrade import package_bytes, record_install
+
+# Script variant -> directory under scripts/
+SCRIPT_DIRS = {"sh": "bash", "ps": "powershell"}
+
+# Outward argument tokens differ by format:
+#   * Markdown/prompt agents: $ARGUMENTS
+#   * TOML agents (gemini, qwen): {{args}}
+ARG_FORMATS = {"md": "$ARGUMENTS", "agent.md": "$ARGUMENTS", "toml": "{{args}}"}
+
+_PATH_REWRITES = [
+    (re.compile(r"(/?)memory/"), ".nuaa/memory/"),
+    (re.compile(r"(/?)scripts/"), ".nuaa/scripts/"),
+    (re.compile(r"(/?)templates/"), ".nuaa/templates/"),
+]
+
+
+def kit_root() -> Path | None:
+    """Return the directory holding ``nuaa-kit/commands``, or None if the kit is unavailable."""
+    package_dir = Path(__file__).resolve().parent
+    for candidate in (package_dir / "kit", package_dir.parent.parent):
+        if (candidate / "nuaa-kit" / "commands").is_dir():
+            return candidate
+    return None
+
+
+def kit_version() -> str:
+    """Return the version stamped into rendered packages (``v`` + the CLI version)."""
+    import importlib.metadata
+
+    try:
+        return "v" + importlib.metadata.version("nuaa-cli")
+    except importlib.metadata.PackageNotFoundError:
+        return "vdev"
+
+
+# ------------------------------
+# Command rendering
+# ------------------------------
+
+
+def _frontmatter_value(lines: list[str], key: str, indented: bool = False) -> str:
+    """Return the value of the first ``key:`` line, or an empty string."""
+    indent = r"\s*" if indented else ""
+    pattern = re.compile(rf"^{indent}{re.escape(key)}:\s*")
+    for line in lines:
+        m = pattern.match(line)
+        if m:
+            return line[m.end() :]
+    return ""
+
+
+def _agent_script_value(lines: list[str], script: str) -> str:
+    """Return the ``agent_scripts.<script>`` command, or an empty string."""
+    pattern = re.compile(rf"^\s*{re.escape(script)}:\s*")
+    in_agent_scripts = False
+    for line in lines:
+        if line == "agent_scripts:":
+            in_agent_scripts = True
+            continue
+        if in_agent_scripts:
+            m = pattern.match(line)
+            if m:
+                return line[m.end() :]
+            if re.match(r"^[a-zA-Z]", line):
+                in_agent_scripts = False
+    return ""
+
+
+def _strip_script_sections(lines: list[str]) -> list[str]:
+    """Drop the ``scripts:`` and ``agent_scripts:`` blocks from the frontmatter."""
+    out: list[str] = []
+    dash_count = 0
+    in_frontmatter = skipping = False
+    for line in lines:
+        if line == "---":
+            out.append(line)
+            dash_count += 1
+            in_frontmatter = dash_count == 1
+            continue
+        if in_frontmatter and line in ("scripts:", "agent_scripts:"):
+            skipping = True
+            continue
+        if in_frontmatter and skipping and re.match(r"^[a-zA-Z].*:", line):
+            skipping = False
+        if in_frontmatter and skipping and re.match(r"^\s", line):
+            continue
+        out.append(line)
+    return out
+
+
+@lru_cache(maxsize=512)
+def _render_command_cached(
+    path: str, mtime_ns: int, size: int, agent: str, script: str, command_format: str
+) -> str:
+    text = Path(path).read_text(encoding="utf-8").replace("\r", "").rstrip("\n")
+    lines = text.split("\n")
+
+    description = _frontmatter_value(lines, "description")
+    script_command = _frontmatter_value(lines, script, indented=True) or (
+        f"(Missing script command for {script})"
+    )
+    agent_script_command = _agent_script_value(lines, script)
+
+    text = text.replace("{SCRIPT}", script_command)
+    if agent_script_command:
+        text = text.replace("{AGENT_SCRIPT}", agent_script_command)
+    body = "\n".join(_strip_script_sections(text.split("\n")))
+    body = body.replace("{ARGS}", ARG_FORMATS[command_format]).replace("__AGENT__", agent)
+    for pattern, replacement in _PATH_REWRITES:
+        body = pattern.sub(replacement, body)
+    body = body.rstrip("\n")
+
+    if command_format == "toml":
+        body = body.replace("\\", "\\\\")
+        return f'description = "{description}"\n\nprompt = """\n{body}\n"""\n'
+    return body + "\n"
+
+
+def render_command(path: Path, agent: str, script: str) -> str:
+    """Render one ``nuaa-kit/commands/*.md`` source for an agent and script variant."""
+    st = path.stat()
+    command_format = AGENT_CONFIG[agent]["command_format"]
+    return _render_command_cached(
+        str(path), st.st_mtime_ns, st.st_size, agent, script, command_format
+    )
+
+
+# ------------------------------
+# Package assembly
+# ------------------------------
+
+
+def package_files(
+    agent: str, script: str, *, root: Path | None = None, version: str | None = None
+) -> dict[str, Path | str]:
+    """Return the files of one agent package as ``relative path -> source file or text``.
+
+    Source files are copied as-is (keeping their mode); strings are rendered content.
+    """
+    if agent not in AGENT_CONFIG:
+        raise ValueError(f"Unknown AI assistant '{agent}'")
+    if script not in SCRIPT_TYPE_CHOICES:
+        raise ValueError(f"Unknown script type '{script}'")
+    root = root or kit_root()
+    if root is None:
+        raise FileNotFoundError("NUAA kit sources (nuaa-kit/commands) are not available")
+    version = version or kit_version()
+
+    files: dict[str, Path | str] = {}
+
+    memory_dir = root / "memory"
+    if memory_dir.is_dir():
+        for path in sorted(memory_dir.rglob("*")):
+            if path.is_file():
+                files[f".nuaa/memory/{path.relative_to(memory_dir).as_posix()}"] = path
+
+    scripts_dir = root / "scripts"
+    if scripts_dir.is_dir():
+        variant_dir = scripts_dir / SCRIPT_DIRS[script]
+        for path in sorted(variant_dir.rglob("*")) if variant_dir.is_dir() else []:
+            if path.is_file():
+                rel = path.relative_to(scripts_dir).as_posix()
+                files[f".nuaa/scripts/{rel}"] = path
+        for path in sorted(scripts_dir.iterdir()):
+            if path.is_file():
+                files[f".nuaa/scripts/{path.name}"] = path
+
+    templates_dir = root / "nuaa-kit" / "templates"
+    if templates_dir.is_dir():
+        for path in sorted(templates_dir.rglob("*")):
+            if path.is_file() and path.name != "vscode-settings.json":
+                files[f".nuaa/templates/{path.name}"] = path
+
+    config = AGENT_CONFIG[agent]
+    commands_dir = config["commands_dir"]
+    command_format = config["command_format"]
+    for source in sorted((root / "nuaa-kit" / "commands").glob("*.md")):
+        files[f"{commands_dir}/nuaa.{source.stem}.{command_format}"] = render_command(
+            source, agent, script
+        )
+
+    if agent == "copilot":
+        for rel in [k for k in files if k.startswith(f"{commands_dir}/nuaa.")]:
+            basename = rel.rsplit("/", 1)[1].removesuffix(".agent.md")
+            files[f".github/prompts/{basename}.prompt.md"] = (
+                f"---\nagent: {basename}\nversion: {version}\n"
+                f"generated_from: .github/agents/{basename}.agent.md\n---\n\n" + files[rel]
+            )
+        vscode_settings = root / "templates" / "vscode-settings.json"
+        if vscode_settings.is_file():
+            files[".vscode/settings.json"] = vscode_settings
+    elif agent in ("gemini", "qwen"):
+        context_file = root / "agent_templates" / agent / f"{agent.upper()}.md"
+        if context_file.is_file():
+            files[context_file.name] = context_file
+
+    return files
+
+
+def script_mode(rel_path: str, head: bytes, mode: int) -> int:
+    """Return ``mode`` with execute bits mirrored from read bits for shebang ``*.sh`` files."""
+    if rel_path.endswith(".sh") and head.startswith(b"#!"):
+        mode |= (mode & 0o444) >> 2
+    return mode
+
+
+def write_package(files: dict[str, Path | str], dest: Path) -> list[Path]:
+    """Write package files under ``dest``, overwriting existing files; returns written paths.
+
+    Shell scripts with a shebang are made executable as they are written.
+    """
+    written = []
+    for rel, source in files.items():
+        target = dest / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        if isinstance(source, Path):
+            shutil.copy2(source, target)
+            head = b""
+            if rel.endswith(".sh"):
+                with open(source, "rb") as f:
+                    head = f.read(2)
+        else:
+            with open(target, "w", encoding="utf-8", newline="\n") as f:
+                f.write(source)
+            head = source[:2].encode()
+        if head and os.name != "nt":
+            mode = target.stat().st_mode
+            new_mode = script_mode(rel, head, mode)
+            if new_mode != mode:
+                os.chmod(target, new_mode)
+        written.append(target)
+    return written
+
+
+def install_package(
+    project_path: Path,
+    ai_assistant: str,
+    script_type: str,
+    is_current_dir: bool = False,
+    *,
+    verbose: bool = True,
+    tracker=None,
+    root: Path | None = None,
+) -> Path:
+    """Render the agent package straight into ``project_path`` (the offline ``init`` path).
+
+    Uses the same tracker keys as ``download_and_extract_template``. With
+    ``is_current_dir`` files are merged into the existing directory and an
+    existing ``.vscode/settings.json`` is merged rather than replaced.
+    """
+    if tracker:
+        tracker.start("fetch", "rendering from local kit")
+    try:
+        version = kit_version()
+        files = package_files(ai_assistant, script_type, root=root, version=version)
+    except Exception as e:
+        if tracker:
+            tracker.error("fetch", str(e))
+        elif verbose:
+            console.print(f"[red]Error rendering template:[/red] {e}")
+        raise
+    if tracker:
+        tracker.complete("fetch", f"local kit {version} ({len(files)} files)")
+        tracker.skip("download", "rendered locally")
+        tracker.start("extract")
+    elif verbose:
+        console.print(f"Rendering {len(files)} template files...")
+
+    try:
+        if not is_current_dir:
+            project_path.mkdir(parents=True)
+        template = package_bytes(files)
+        vscode_settings = project_path / ".vscode" / "settings.json"
+        if is_current_dir and ".vscode/settings.json" in files and vscode_settings.exists():
+            from .download import handle_vscode_settings
+
+            source = files.pop(".vscode/settings.json")
+            handle_vscode_settings(
+                source, vscode_settings, Path(".vscode/settings.json"), verbose, tracker
+            )
+        written = write_package(files, project_path)
+        record_install(project_path, template, release=version, ai=ai_assistant, script=script_type)
+    except Exception as e:
+        if tracker:
+            tracker.error("extract", str(e))
+        elif verbose:
+            console.print(f"[red]Error rendering template:[/red] {e}")
+        if not is_current_dir and project_path.exists():
+            shutil.rmtree(project_path)
+        raise
+
+    if tracker:
+        tracker.complete("extract", f"{len(files)} files rendered")
+        tracker.skip("zip-list", "no archive")
+        tracker.start("extracted-summary")
+        tracker.complete(
+            "extracted-summary", f"{len({rel.split('/', 1)[0] for rel in files})} top-level items"
+        )
+        scripts = [p for p in written if p.suffix == ".sh" and os.access(p, os.X_OK)]
+        tracker.complete("chmod", f"{len(scripts)} scripts executable")
+        tracker.skip("cleanup", "no archive")
+    elif verbose:
+        console.print("[cyan]Template files written to[/cyan] " + str(project_path))
+    return project_path
+
+
+def zip_package(files: dict[str, Path | str], dest: Path) -> Path:
+    """Write package files into a release-style zip at ``dest`` (atomically)."""
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f"{dest.name}.{os.getpid()}.part")
+    try:
+        with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for rel, source in files.items():
+                if isinstance(source, Path):
+                    info = zipfile.ZipInfo.from_file(source, arcname=rel)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    data = source.read_bytes()
+                    mode = script_mode(rel, data[:2], info.external_attr >> 16)
+                    info.external_attr = mode << 16
+                    zf.writestr(info, data)
+                else:
+                    zf.writestr(rel, source)
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return dest
+
+
+def release_asset_name(agent: str, script: str, version: str) -> str:
+    return f"nuaa-template-{agent}-{script}-{version}.zip"
+
+
+def build_release_packages(
+    output_dir: Path,
+    agents: list[str] | None = None,
+    scripts: list[str] | None = None,
+    *,
+    version: str | None = None,
+    root: Path | None = None,
+    max_workers: int | None = None,
+) -> list[Path]:
+    """Render and zip every requested agent/script package in parallel.
+
+    Returns the archive paths in (agent, script) order.
+    """
+    version = version or kit_version()
+    pairs = [
+        (a, s) for a in agents or list(AGENT_CONFIG) for s in scripts or list(SCRIPT_TYPE_CHOICES)
+    ]
+
+    def build(pair: tuple[str, str]) -> Path:
+        agent, script = pair
+        files = package_files(agent, script, root=root, version=version)
+        return zip_package(files, output_dir / release_asset_name(agent, script, version))
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(build, pairs))
@@ -0,0 +1,132 @@
+"""Utility helpers for NUAA feature folders and markdown templates."""
+
+import re
+from datetime import datetime
+from pathlib import Path
+
+from .locks import file_lock, write_atomic
+from .templating import Template, compile_template, load_template
+from .workspace import FEATURES, WorkspaceIndex
+
+
+def _slugify(text: str) -> str:
+    """Convert text to a filesystem-friendly slug."""
+    text = text.strip().lower()
+    text = re.sub(r"[^a-z0-9\s-]", "", text)
+    text = re.sub(r"[\s_-]+", "-", text)
+    return re.sub(r"^-+|-+$", "", text) or "feature"
+
+
+def _find_templates_root(start: Path | None = None) -> Path:
+    """Find .nuaa/templates or nuaa-kit/templates directory by walking up from start (or CWD)."""
+    search_origin = start or Path.cwd()
+
+    candidates: list[Path] = []
+    for path in [search_origin, *search_origin.parents]:
+        candidates.append(path / ".nuaa" / "templates")
+        candidates.append(path / "nuaa-kit" / "templates")
+
+    repo_root = Path(__file__).parent.parent.parent
+    candidates.append(repo_root / ".nuaa" / "templates")
+    candidates.append(repo_root / "nuaa-kit" / "templates")
+
+    for candidate in candidates:
+        if candidate.is_dir():
+            return candidate
+
+    raise FileNotFoundError(
+        "Could not locate '.nuaa/templates' or 'nuaa-kit/templates'. Run 'nuaa init' first or ensure NUAA templates are available."
+    )
+
+
+def _ensure_nuaa_root(root: Path | None = None) -> Path:
+    """Ensure the 'nuaa' directory exists under the project root (current dir by default)."""
+    if root is None:
+        root = Path.cwd()
+    nuaa_root = root / "nuaa"
+    nuaa_root.mkdir(parents=True, exist_ok=True)
+    return nuaa_root
+
+
+def _next_feature_dir(program_name: str, root: Path | None = None) -> tuple[Path, str, str]:
+    """Create the next feature directory 'nuaa/NNN-slug' and return (path, num_str, slug).
+
+    The number is reserved through the workspace index, so concurrent callers never
+    share a directory.
+    """
+    nuaa_root = _ensure_nuaa_root(root)
+    slug = _slugify(program_name)
+    entry = WorkspaceIndex(nuaa_root.parent).reserve(FEATURES, slug)
+    return nuaa_root / entry["name"], f"{entry['number']:03d}", slug
+
+
+def _find_feature_dir_by_program(program_name: str, root: Path | None = None) -> Path | None:
+    """Try to find an existing feature dir whose slug starts with the program name slug."""
+    nuaa_root = _ensure_nuaa_root(root)
+    entry = WorkspaceIndex(nuaa_root.parent).find_by_slug(FEATURES, _slugify(program_name))
+    return nuaa_root / entry["name"] if entry else None
+
+
+def _feature_dir_for_program(program_name: str, root: Path | None = None) -> Path:
+    """Return the program's feature dir, creating the next one if none exists yet.
+
+    The lookup is repeated under the index lock before creating, so parallel runs
+    for the same new program end up in one directory.
+    """
+    found = _find_feature_dir_by_program(program_name, root)
+    if found is not None:
+        return found
+    nuaa_root = _ensure_nuaa_root(root)
+    entry = WorkspaceIndex(nuaa_root.parent).reserve(FEATURES, _slugify(program_name), reuse=True)
+    return nuaa_root / entry["name"]
+
+
+def _load_compiled_template(name: str, templates_root: Path | None = None) -> Template:
+    """Load a template in compiled form (see ``nuaa_cli.templating``)."""
+    path = (templates_root or _find_templates_root()) / name
+    if not path.exists():
+        raise FileNotFoundError(f"Template not found: {name}")
+    return load_template(path)
+
+
+def _placeholder_values(mapping: dict[str, str]) -> dict[str, str]:
+    """Map the [Placeholders] and {{TOKENS}} used in templates to their values."""
+    values = {
+        # Bracket placeholders used in templates
+        "[Name]": mapping.get("PROGRAM_NAME", ""),
+        "[Description]": mapping.get("TARGET_POPULATION", ""),
+        "[Timeframe]": mapping.get("DURATION", ""),
+        "[Date]": mapping.get("DATE", datetime.now().strftime("%Y-%m-%d")),
+    }
+    # Curly token replacements
+    values.update((f"{{{{{k}}}}}", v) for k, v in mapping.items())
+    return values
+
+
+def _apply_replacements(text: str, mapping: dict[str, str]) -> str:
+    """Apply simple placeholder replacements supporting both [Placeholders] and {{TOKENS}}."""
+    return compile_template(text).render(_placeholder_values(mapping))
+
+
+def _render_template(name: str, mapping: dict[str, str]) -> str:
+    """Render a named template with ``mapping`` in one pass over its compiled form."""
+    return _load_compiled_template(name).render(_placeholder_values(mapping))
+
+
+def _prepend_metadata(text: str, metadata: dict[str, str]) -> str:
+    """Prepend a YAML-style metadata block to markdown text."""
+    lines = ["---"]
+    for k, v in metadata.items():
+        lines.append(f"{k}: {v}")
+    lines.append("---\n")
+    return "\n".join(lines) + text
+
+
+def _write_markdown(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with file_lock(path):
+        write_atomic(path, content)
+
+
+def _stamp() -> str:
+    return datetime.now().astimezone().strftime("%Y-%m-%d %H:%M:%S %Z")
@@ -0,0 +1,121 @@
+"""Parallel drafting schedule for the unfinished sections of a plan.
+
+Sections that have passed their gate are done; every other section is a task
+whose cost is its estimated length in words (``DEFAULT_SECTION_WORDS`` when the
+plan gives no estimate). From the dependency graph we derive:
+
+* **waves**: section ``s`` belongs to wave ``1 + max(wave of its unfinished
+  dependencies)``, so every section in a wave can be drafted at the same time;
+* the **critical path**: the heaviest chain of dependent unfinished sections,
+  which bounds the makespan however many agents work on the plan;
+* an **assignment** to N agents by list scheduling: whenever an agent is free,
+  it takes the ready section with the heaviest remaining chain (its "bottom
+  level"), starting once its dependencies are drafted. This is the classic
+  highest-level-first heuristic; the result is reported with the lower bound
+  ``max(critical path, total work / N)`` so its quality is visible.
+"""
+
+from typing import NamedTuple
+
+from .planfile import Plan, Section
+
+DEFAULT_SECTION_WORDS = 500
+
+
+class Slot(NamedTuple):
+    section: Section
+    agent: int
+    start: int
+    end: int
+
+
+class Schedule(NamedTuple):
+    waves: list[list[Section]]
+    critical_path: list[Section]
+    critical_length: int
+    slots: list[Slot]
+    agents: int
+    makespan: int
+    lower_bound: int
+    total: int
+
+
+def section_weight(section: Section) -> int:
+    """Estimated drafting cost of a section, in words."""
+    return section.estimated_words or DEFAULT_SECTION_WORDS
+
+
+def _unfinished(plan: Plan) -> tuple[list[Section], dict[int, list[int]]]:
+    """Unfinished sections in dependency order, with their unfinished dependencies."""
+    sections, deps = [], {}
+    for result in plan.check().results:
+        if not result.section.passed:
+            sections.append(result.section)
+            deps[result.section.number] = sorted(
+                {d.number for d in result.dependencies if not d.passed}
+            )
+    return sections, deps
+
+
+def parallel_waves(plan: Plan) -> list[list[Section]]:
+    """Group unfinished sections into waves that can each be drafted in parallel."""
+    sections, deps = _unfinished(plan)
+    level: dict[int, int] = {}
+    for section in sections:
+        level[section.number] = 1 + max(
+            (level[d] for d in deps[section.number] if d in level), default=-1
+        )
+    waves: list[list[Section]] = [[] for _ in range(max(level.values(), default=-1) + 1)]
+    for section in sections:
+        waves[level[section.number]].append(section)
+    return [sorted(wave, key=lambda s: s.number) for wave in waves]
+
+
+def assign_agents(plan: Plan, agents: int, weight=section_weight) -> list[Slot]:
+    """Assign unfinished sections to ``agents`` workers by highest-level-first list scheduling."""
+    sections, deps = _unfinished(plan)
+    remaining = {s.number: s for s in sections}
+    dependents: dict[int, list[int]] = {s.number: [] for s in sections}
+    for number, needs in deps.items():
+        for dep in needs:
+            dependents[dep].append(number)
+
+    # Bottom level: the heaviest chain from a section to the end of the plan
+    bottom: dict[int, int] = {}
+    for section in reversed(sections):
+        bottom[section.number] = weight(section) + max(
+            (bottom[d] for d in dependents[section.number] if d in bottom), default=0
+        )
+
+    free_at = [0] * agents
+    finished: dict[int, int] = {}
+    slots: list[Slot] = []
+    while remaining:
+        ready = [n for n in remaining if all(d in finished for d in deps[n])]
+        if not ready:
+            break  # the rest are caught in a dependency cycle
+        number = max(ready, key=lambda n: (bottom[n], -n))
+        earliest = max((finished[d] for d in deps[number]), default=0)
+        agent = min(range(agents), key=lambda a: (max(free_at[a], earliest), a))
+        start = max(free_at[agent], earliest)
+        end = start + weight(remaining[number])
+        slots.append(Slot(remaining.pop(number), agent + 1, start, end))
+        finished[number] = free_at[agent] = end
+    return sorted(slots, key=lambda slot: (slot.agent, slot.start))
+
+
+def build_schedule(plan: Plan, agents: int, weight=section_weight) -> Schedule:
+    """Compute waves, critical path and an agent assignment for a plan."""
+    critical_length, critical_path = plan.critical_path(weight)
+    slots = assign_agents(plan, agents, weight)
+    total = sum(slot.end - slot.start for slot in slots)
+    return Schedule(
+        waves=parallel_waves(plan),
+        critical_path=critical_path,
+        critical_length=critical_length,
+        slots=slots,
+        agents=agents,
+        makespan=max((slot.end for slot in slots), default=0),
+        lower_bound=max(critical_length, -(-total // agents)),
+        total=total,
+    )
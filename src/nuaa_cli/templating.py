@@ -0,0 +1,111 @@
+"""Compiled markdown templates for the scaffolding commands.
+
+A template is split once into literal segments and placeholder slots, either
+``{{TOKEN}}`` or a bracketed word such as ``[Name]`` or ``[CORE_MISSION]``.
+Rendering is then a single join over the segments, whatever the number of
+placeholders, and a slot without a value is kept exactly as written.
+
+Compiled templates are kept in the user cache directory (see ``cache.py``),
+in ``compiled-templates/<key>.json`` where the key is derived from the templates
+directory's path. Each file holds one entry per template keyed by its mtime and
+size, so unchanged templates are never re-tokenized. The templates directory
+itself is never written, so an installed kit stays read-only. A missing or
+unwritable cache only costs a recompile.
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import NamedTuple
+
+from .cache import cache_root
+
+COMPILED_CACHE = "compiled-templates"
+CACHE_VERSION = 1
+
+_SLOT = re.compile(r"\{\{[A-Za-z0-9_]+\}\}|\[[A-Za-z][A-Za-z0-9_]*\]")
+
+# templates directory -> loaded cache document
+_CACHES: dict[Path, dict] = {}
+
+
+class Template(NamedTuple):
+    literals: tuple[str, ...]
+    slots: tuple[str, ...]  # placeholder text, e.g. "{{PROGRAM_NAME}}" or "[Date]"
+
+    def render(self, values: dict[str, str]) -> str:
+        """Fill each slot from ``values``, keyed by its placeholder text."""
+        parts = [self.literals[0]]
+        for slot, literal in zip(self.slots, self.literals[1:]):
+            parts.append(values.get(slot, slot))
+            parts.append(literal)
+        return "".join(parts)
+
+
+def compile_template(text: str) -> Template:
+    """Split ``text`` into literals and placeholder slots (one more literal than slots)."""
+    literals, slots = [], []
+    position = 0
+    for match in _SLOT.finditer(text):
+        literals.append(text[position : match.start()])
+        slots.append(match.group())
+        position = match.end()
+    literals.append(text[position:])
+    return Template(tuple(literals), tuple(slots))
+
+
+def _cache_file(templates_dir: Path) -> Path:
+    """Return the cache file of a templates directory, keyed by its resolved path."""
+    key = hashlib.sha256(str(templates_dir.resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_root() / COMPILED_CACHE / f"{key}.json"
+
+
+def _load_cache(templates_dir: Path) -> dict:
+    cache = _CACHES.get(templates_dir)
+    if cache is None:
+        try:
+            with open(_cache_file(templates_dir), "r", encoding="utf-8") as f:
+                cache = json.load(f)
+            if cache.get("version") != CACHE_VERSION:
+                raise ValueError("compiled template cache version mismatch")
+        except (OSError, ValueError):
+            cache = {"version": CACHE_VERSION, "templates": {}}
+        _CACHES[templates_dir] = cache
+    return cache
+
+
+def _save_cache(templates_dir: Path, cache: dict) -> None:
+    path = _cache_file(templates_dir)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(cache, f, separators=(",", ":"))
+        os.replace(tmp, path)
+    except OSError:
+        pass  # unwritable cache directory: the in-memory copy still serves this process
+
+
+def load_template(path: Path) -> Template:
+    """Return the compiled form of the template at ``path``, compiling it only if it changed.
+
+    Raises ``FileNotFoundError`` if the template does not exist.
+    """
+    path = Path(path)
+    stat = path.stat()
+    cache = _load_cache(path.parent)
+    entry = cache["templates"].get(path.name)
+    if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+        return Template(tuple(entry["literals"]), tuple(entry["slots"]))
+
+    template = compile_template(path.read_text(encoding="utf-8"))
+    cache["templates"][path.name] = {
+        "mtime_ns": stat.st_mtime_ns,
+        "size": stat.st_size,
+        "literals": template.literals,
+        "slots": template.slots,
+    }
+    _save_cache(path.parent, cache)
+    return template
@@ -0,0 +1,294 @@
+"""Incremental template upgrades for existing workspaces (``nuaa upgrade``).
+
+``init`` records the installed template in ``.nuaa/template-manifest.json``: the
+release, agent, script type and the SHA-256 of every file it wrote, with the file
+contents kept in a content-addressed ``FileStore`` under ``.nuaa/cache/merge-bases/``.
+An upgrade compares that manifest with the target release's hashes and only
+touches files whose template content changed:
+
+- unchanged on disk: replaced with the new version
+- edited by the user: three-way merged (base = installed template version);
+  overlapping edits are written with conflict markers
+- removed from the template: deleted unless the user edited them
+- new in the template but already present locally: the template version is
+  written next to it as ``<file>.nuaa-new``
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import time
+import zipfile
+from pathlib import Path
+from typing import NamedTuple
+
+from .cache import FileStore
+from .workspace import PROJECT_CACHE, project_cache
+
+INSTALL_MANIFEST = ".nuaa/template-manifest.json"
+VSCODE_SETTINGS = ".vscode/settings.json"
+NEW_SUFFIX = ".nuaa-new"
+MERGE_BASES = "merge-bases"
+
+
+class Change(NamedTuple):
+    path: str
+    action: str  # add, update, merge, conflict, sidecar, remove, keep
+    data: bytes | None = None
+    detail: str = ""
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def package_bytes(files: dict[str, Path | str]) -> dict[str, bytes]:
+    """Return the bytes of a rendered package (see ``render.package_files``)."""
+    return {
+        rel: source.read_bytes() if isinstance(source, Path) else source.encode("utf-8")
+        for rel, source in files.items()
+    }
+
+
+def archive_package(zip_path: Path) -> dict[str, bytes]:
+    """Return the files of a template archive, keyed by path without the wrapper directory."""
+    from .download import _archive_prefix, _safe_relative
+
+    with zipfile.ZipFile(zip_path) as zf:
+        infos = [info for info in zf.infolist() if not info.is_dir()]
+        prefix = _archive_prefix([info.filename for info in zf.infolist()])
+        return {
+            _safe_relative(info.filename[len(prefix) :]).as_posix(): zf.read(info) for info in infos
+        }
+
+
+def load_install(project_path: Path) -> dict | None:
+    """Return the installed template manifest of a workspace, or None if it has none."""
+    try:
+        with open(project_path / INSTALL_MANIFEST, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+def record_install(
+    project_path: Path,
+    files: dict[str, bytes],
+    *,
+    release: str,
+    ai: str,
+    script: str,
+    store: FileStore | None = None,
+) -> dict:
+    """Write the installed template manifest and keep each file as a future merge base.
+
+    Stored files that the new manifest no longer references are pruned.
+    """
+    store = store or FileStore(project_cache(project_path) / MERGE_BASES)
+    manifest = {
+        "release": release,
+        "ai": ai,
+        "script": script,
+        "installed_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        "files": {rel: store.put(data) for rel, data in sorted(files.items())},
+    }
+    path = project_path / INSTALL_MANIFEST
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(path, (json.dumps(manifest, indent=2) + "\n").encode("utf-8"))
+    store.prune(set(manifest["files"].values()))
+    return manifest
+
+
+# ------------------------------
+# Three-way merge
+# ------------------------------
+
+
+def _sync_regions(base: list[str], ours: list[str], theirs: list[str]) -> list[tuple]:
+    """Return base ranges unchanged on both sides, as (base, ours, theirs) index pairs."""
+    ours_blocks = difflib.SequenceMatcher(None, base, ours, autojunk=False).get_matching_blocks()
+    theirs_blocks = difflib.SequenceMatcher(
+        None, base, theirs, autojunk=False
+    ).get_matching_blocks()
+    regions = []
+    ia = ib = 0
+    while ia < len(ours_blocks) and ib < len(theirs_blocks):
+        a_base, a_start, a_len = ours_blocks[ia]
+        b_base, b_start, b_len = theirs_blocks[ib]
+        start, end = max(a_base, b_base), min(a_base + a_len, b_base + b_len)
+        if start < end:
+            a = a_start + start - a_base
+            b = b_start + start - b_base
+            regions.append((start, end, a, a + end - start, b, b + end - start))
+        if a_base + a_len < b_base + b_len:
+            ia += 1
+        else:
+            ib += 1
+    regions.append((len(base), len(base), len(ours), len(ours), len(theirs), len(theirs)))
+    return regions
+
+
+def merge3(
+    base: str, ours: str, theirs: str, ours_label: str = "local", theirs_label: str = "template"
+) -> tuple[str, int]:
+    """Line-based three-way merge; returns (merged text, number of conflicting hunks).
+
+    Hunks changed on only one side take that side; hunks changed identically on
+    both sides are kept once; anything else is emitted between conflict markers.
+    """
+    base_lines = base.splitlines(keepends=True)
+    ours_lines = ours.splitlines(keepends=True)
+    theirs_lines = theirs.splitlines(keepends=True)
+
+    def terminated(lines: list[str]) -> list[str]:
+        return [*lines[:-1], lines[-1] + "\n"] if lines and not lines[-1].endswith("\n") else lines
+
+    out: list[str] = []
+    conflicts = 0
+    iz = ia = ib = 0
+    for z_start, z_end, a_start, a_end, b_start, b_end in _sync_regions(
+        base_lines, ours_lines, theirs_lines
+    ):
+        base_chunk = base_lines[iz:z_start]
+        ours_chunk = ours_lines[ia:a_start]
+        theirs_chunk = theirs_lines[ib:b_start]
+        if ours_chunk == theirs_chunk or theirs_chunk == base_chunk:
+            out += ours_chunk
+        elif ours_chunk == base_chunk:
+            out += theirs_chunk
+        else:
+            conflicts += 1
+            out.append(f"<<<<<<< {ours_label}\n")
+            out += terminated(ours_chunk)
+            out.append("=======\n")
+            out += terminated(theirs_chunk)
+            out.append(f">>>>>>> {theirs_label}\n")
+        out += base_lines[z_start:z_end]
+        iz, ia, ib = z_end, a_end, b_end
+    return "".join(out), conflicts
+
+
+# ------------------------------
+# Planning and applying
+# ------------------------------
+
+
+def _merge_file(
+    path: Path, rel: str, base: bytes | None, current: bytes, new: bytes, target_release: str
+) -> Change:
+    if rel == VSCODE_SETTINGS:
+        from .download import merge_json_files
+
+        try:
+            merged = merge_json_files(path, json.loads(new))
+            return Change(
+                rel, "merge", (json.dumps(merged, indent=4) + "\n").encode(), "settings merged"
+            )
+        except ValueError:
+            pass
+    if base is None:
+        return Change(rel, "sidecar", new, f"no merge base; template version in {rel}{NEW_SUFFIX}")
+    try:
+        text, conflicts = merge3(
+            base.decode("utf-8"),
+            current.decode("utf-8"),
+            new.decode("utf-8"),
+            theirs_label=target_release,
+        )
+    except UnicodeDecodeError:
+        return Change(rel, "sidecar", new, f"binary file; template version in {rel}{NEW_SUFFIX}")
+    if conflicts:
+        return Change(rel, "conflict", text.encode("utf-8"), f"{conflicts} conflicting hunk(s)")
+    return Change(rel, "merge", text.encode("utf-8"), "local edits kept")
+
+
+def plan_upgrade(
+    project_path: Path,
+    installed: dict | None,
+    target: dict[str, bytes],
+    target_release: str,
+    store: FileStore | None = None,
+) -> tuple[list[Change], int]:
+    """Compare installed and target template hashes; returns (changes, unchanged count).
+
+    Only files whose template content differs between the two releases are read
+    from disk; everything else is counted as unchanged without being opened.
+    """
+    store = store or FileStore(project_path / PROJECT_CACHE / MERGE_BASES)
+    installed_files: dict[str, str] = (installed or {}).get("files", {})
+    changes: list[Change] = []
+    unchanged = 0
+
+    for rel, new in sorted(target.items()):
+        new_sha = _sha256(new)
+        base_sha = installed_files.get(rel)
+        if base_sha == new_sha:
+            unchanged += 1
+            continue
+        path = project_path / rel
+        if not path.is_file():
+            if base_sha is None:
+                changes.append(Change(rel, "add", new))
+            else:
+                changes.append(Change(rel, "keep", None, "deleted locally"))
+            continue
+        current = path.read_bytes()
+        current_sha = _sha256(current)
+        if current_sha == new_sha:
+            unchanged += 1
+        elif base_sha is not None and current_sha == base_sha:
+            changes.append(Change(rel, "update", new))
+        else:
+            base = store.get(base_sha) if base_sha else None
+            change = _merge_file(path, rel, base, current, new, target_release)
+            if change.action == "merge" and change.data == current:
+                unchanged += 1
+            else:
+                changes.append(change)
+
+    for rel, base_sha in sorted(installed_files.items()):
+        if rel in target:
+            continue
+        path = project_path / rel
+        if not path.is_file():
+            continue
+        if _sha256(path.read_bytes()) == base_sha:
+            changes.append(Change(rel, "remove"))
+        else:
+            changes.append(Change(rel, "keep", None, "removed from template, edited locally"))
+    return changes, unchanged
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "wb") as f:
+        f.write(data)
+    if path.exists():
+        os.chmod(tmp, path.stat().st_mode)
+    os.replace(tmp, path)
+
+
+def apply_upgrade(project_path: Path, changes: list[Change]) -> list[Path]:
+    """Write the planned changes and return the paths that were touched."""
+    from .render import script_mode
+
+    touched = []
+    for change in changes:
+        path = project_path / change.path
+        if change.action == "remove":
+            path.unlink()
+        elif change.action in ("add", "update", "merge", "conflict", "sidecar"):
+            if change.action == "sidecar":
+                path = path.with_name(path.name + NEW_SUFFIX)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _write_atomic(path, change.data or b"")
+            if os.name != "nt":
+                mode = path.stat().st_mode
+                new_mode = script_mode(change.path, (change.data or b"")[:2], mode)
+                if new_mode != mode:
+                    os.chmod(path, new_mode)
+        else:
+            continue
+        touched.append(path)
+    return touched
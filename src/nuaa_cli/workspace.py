@@ -0,0 +1,287 @@
+"""Workspace index of numbered feature and initiative folders.
+
+Commands used to list ``nuaa/`` or ``initiatives/`` and stat every child to find
+the next number, a folder by slug, or the most recently touched initiative. The
+index in ``.nuaa/index.json`` keeps one entry per ``NNN-slug`` folder::
+
+    {"number": 7, "slug": "naloxone-distribution", "path": "initiatives/007-...",
+     "mtime": 1731400000.0, "mtime_ns": 1731400000000000000, "status": "planned"}
+
+Each collection stores the ``st_mtime_ns`` of its parent directory. Adding,
+removing or renaming a folder changes that mtime, so one ``stat`` per collection
+tells whether the cached entries are still valid; only then is the directory
+rescanned. Commands that create or write into a folder call ``record`` to update
+its entry in place. Only those write paths persist the index; read-only commands
+such as ``status`` or ``inventory`` keep a rescan in memory.
+
+Each collection also keeps a pointer to its most recent folder: the one a
+command last created or wrote to through ``record``, or the newest folder found
+by the last rescan. ``latest`` therefore costs the collection's ``stat`` plus one
+``stat`` of that folder, which refreshes its status if files were added or
+removed in it. Edits made outside the CLI inside *another* existing folder do
+not change the parent directory's mtime and so do not move the pointer.
+
+New folders are created with ``reserve``, which allocates the next number and
+creates the folder while holding the index's lock, so concurrent CLI runs never
+hand out the same number.
+"""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+
+from .locks import file_lock
+
+INDEX_PATH = Path(".nuaa") / "index.json"
+INDEX_VERSION = 2
+
+# Machine-local caches of the CLI; the directory ignores itself in git
+PROJECT_CACHE = Path(".nuaa") / "cache"
+
+FEATURES = "nuaa"
+INITIATIVES = "initiatives"
+
+_NUMBERED = re.compile(r"^(\d{3})-(.*)$")
+
+# (artifact, status) checked in order; the first one present wins
+_STAGES = {
+    INITIATIVES: [
+        ("final", "assembled"),
+        ("drafts", "drafting"),
+        ("plan.md", "planned"),
+        ("spec.md", "specified"),
+    ],
+    FEATURES: [
+        ("report.md", "reported"),
+        ("proposal.md", "proposed"),
+        ("program-design.md", "designed"),
+    ],
+}
+
+
+def project_cache(root: Path) -> Path:
+    """Return ``.nuaa/cache`` under ``root``, creating it with a ``.gitignore`` that ignores it.
+
+    ``.nuaa/`` holds the installed kit and is committed; the caches in this
+    directory are not. Raises OSError in a read-only workspace.
+    """
+    directory = Path(root) / PROJECT_CACHE
+    ignore = directory / ".gitignore"
+    if not ignore.exists():
+        directory.mkdir(parents=True, exist_ok=True)
+        ignore.write_text("# Machine-local caches of the nuaa CLI\n*\n", encoding="utf-8")
+    return directory
+
+
+def folder_status(kind: str, path: Path) -> str:
+    """Return the workflow stage of a feature or initiative folder from the artifacts it has."""
+    for artifact, status in _STAGES.get(kind, []):
+        if (path / artifact).exists():
+            return status
+    return "new"
+
+
+class WorkspaceIndex:
+    """Persistent index of ``nuaa/`` features and ``initiatives/`` folders under a project root."""
+
+    def __init__(self, root: Path | None = None):
+        self.root = Path(root) if root is not None else Path.cwd()
+        self.path = self.root / INDEX_PATH
+        self._data: dict | None = None
+        self._dirty = False
+
+    # ------------------------------
+    # Persistence and validation
+    # ------------------------------
+
+    def _load(self) -> dict:
+        if self._data is None:
+            try:
+                with open(self.path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if data.get("version") != INDEX_VERSION:
+                    raise ValueError("index version mismatch")
+            except (OSError, ValueError):
+                data = {"version": INDEX_VERSION, "collections": {}}
+            self._data = data
+        return self._data
+
+    def save(self) -> None:
+        """Write the index if it changed (atomically; a lost race only costs a rescan)."""
+        if not self._dirty or self._data is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(self._data, f, separators=(",", ":"))
+            os.replace(tmp, self.path)
+            self._dirty = False
+        except OSError:
+            pass  # read-only workspace: keep working from the in-memory index
+
+    def collection(self, kind: str) -> dict[str, dict]:
+        """Return ``{folder name: entry}`` for a collection, rescanning it only if it changed."""
+        data = self._load()
+        directory = self.root / kind
+        try:
+            dir_mtime = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            dir_mtime = None
+        cached = data["collections"].get(kind)
+        if cached is None or cached.get("dir_mtime_ns") != dir_mtime:
+            cached = {"dir_mtime_ns": dir_mtime, "entries": self._scan(kind, directory)}
+            self._summarize(cached)
+            data["collections"][kind] = cached
+            self._dirty = True  # persisted by the next write (record or reserve)
+        return cached["entries"]
+
+    @staticmethod
+    def _summarize(cached: dict) -> None:
+        """Precompute the newest folder and highest number so lookups need no pass."""
+        entries = cached["entries"]
+        cached["latest"] = max(entries, key=lambda n: (entries[n]["mtime"], n), default=None)
+        cached["highest"] = max(
+            (e["number"] for e in entries.values() if e["number"] is not None), default=0
+        )
+
+    def _scan(self, kind: str, directory: Path) -> dict[str, dict]:
+        entries: dict[str, dict] = {}
+        if not directory.is_dir():
+            return entries
+        with os.scandir(directory) as it:
+            for child in it:
+                if child.is_dir():
+                    stat = child.stat()
+                    entries[child.name] = self._entry(kind, child.name, stat.st_mtime, stat)
+        return entries
+
+    def _entry(
+        self, kind: str, name: str, mtime: float, stat: os.stat_result, status: str | None = None
+    ) -> dict:
+        match = _NUMBERED.match(name)
+        return {
+            "number": int(match.group(1)) if match else None,
+            "slug": match.group(2) if match else name,
+            "path": f"{kind}/{name}",
+            "mtime": mtime,
+            "mtime_ns": stat.st_mtime_ns,
+            "status": status or folder_status(kind, self.root / kind / name),
+        }
+
+    # ------------------------------
+    # Updates
+    # ------------------------------
+
+    def record(self, kind: str, name: str, status: str | None = None) -> dict:
+        """Add or refresh the entry for ``kind/name`` after the CLI wrote to it.
+
+        The entry is updated in place and the collection's directory mtime re-stamped,
+        so a folder the caller just created does not trigger a rescan.
+        """
+        cached = self._load()["collections"].get(kind)
+        if cached is None:
+            self.collection(kind)
+            cached = self._load()["collections"][kind]
+        entries = cached["entries"]
+        path = self.root / kind / name
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            entries.pop(name, None)
+            self._summarize(cached)
+            entry = {}
+        else:
+            mtime = max(stat.st_mtime, time.time())
+            entry = entries[name] = self._entry(kind, name, mtime, stat, status)
+            cached["latest"] = name
+            cached["highest"] = max(cached["highest"], entry["number"] or 0)
+        try:
+            cached["dir_mtime_ns"] = (self.root / kind).stat().st_mtime_ns
+        except FileNotFoundError:
+            cached["dir_mtime_ns"] = None
+        self._dirty = True
+        self.save()
+        return entry
+
+    def reserve(self, kind: str, slug: str, number: int | None = None, reuse: bool = False) -> dict:
+        """Create the folder ``kind/NNN-slug`` under the next free number and return its entry.
+
+        Allocation and ``mkdir`` happen under the lock of ``.nuaa/index.json``, and the
+        collection is re-read inside it, so parallel callers each get their own number.
+        The ``mkdir`` itself is exclusive: if a script that does not take the lock made
+        the same folder first, the next number is tried. With an explicit ``number`` the
+        folder is created as-is and ``FileExistsError`` is raised if it already exists.
+        With ``reuse``, an existing folder matching ``slug`` is returned instead.
+        """
+        with file_lock(self.path):
+            self._data = None  # another process may have reserved a number since we loaded
+            if reuse:
+                existing = self.find_by_slug(kind, slug)
+                if existing:
+                    return existing
+            directory = self.root / kind
+            directory.mkdir(parents=True, exist_ok=True)
+            candidate = number or self.next_number(kind)
+            while True:
+                name = f"{candidate:03d}-{slug}"
+                try:
+                    os.mkdir(directory / name)
+                    break
+                except FileExistsError:
+                    if number is not None:
+                        raise
+                    candidate += 1
+            entry = self.record(kind, name, status="new")
+        return {"name": name, **entry}
+
+    # ------------------------------
+    # Lookups
+    # ------------------------------
+
+    def latest(self, kind: str) -> dict | None:
+        """Return the most recent entry of a collection, or None if it is empty.
+
+        The entry's status is recomputed if its folder changed since it was indexed.
+        """
+        entries = self.collection(kind)
+        name = self._load()["collections"][kind]["latest"]
+        if not name:
+            return None
+        entry = entries[name]
+        try:
+            mtime_ns = (self.root / kind / name).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+        if entry.get("mtime_ns") != mtime_ns:
+            entry["status"] = folder_status(kind, self.root / kind / name)
+            entry["mtime_ns"] = mtime_ns
+            self._dirty = True  # persisted by the next write
+        return {"name": name, **entry}
+
+    def next_number(self, kind: str) -> int:
+        """Return one more than the highest ``NNN`` prefix in a collection."""
+        self.collection(kind)
+        return self._load()["collections"][kind]["highest"] + 1
+
+    def find_by_slug(self, kind: str, slug: str) -> dict | None:
+        """Return the first folder (by name) whose name contains ``-<slug>`` as whole words."""
+        entries = self.collection(kind)
+        pattern = re.compile(rf"-\b{re.escape(slug)}\b")
+        for name in sorted(entries):
+            if pattern.search(name):
+                return {"name": name, **entries[name]}
+        return None
+
+
+def latest_initiative(root: Path | None = None) -> str | None:
+    """Return the name of the most recently modified initiative folder, or None."""
+    entry = WorkspaceIndex(root).latest(INITIATIVES)
+    return entry["name"] if entry else None
+
+
+def record_initiative(name: str, root: Path | None = None) -> None:
+    """Refresh an initiative's index entry after a command wrote into it."""
+    WorkspaceIndex(root).record(INITIATIVES, name)
@@ -0,0 +1,11 @@
+"""Shared test fixtures."""
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path: Path, monkeypatch):
+    """Point the user cache at the test's temporary directory, never the real one."""
+    monkeypatch.setenv("NUAA_CACHE_DIR", str(tmp_path / "cache"))
@@ -55,15 +55,15 @@ def test_review_no_initiatives(tmp_path: Path):
         os.chdir(cwd)
 
 
-def test_export_no_script(tmp_path: Path):
-    """Test export command when export script is missing."""
+def test_export_no_initiatives(tmp_path: Path):
+    """Test export command with no initiatives directory."""
     cwd = os.getcwd()
     os.chdir(tmp_path)
     try:
         runner = CliRunner()
         result = runner.invoke(app, ["export"])
         assert result.exit_code == 1
-        assert "Export script not found" in result.output
+        assert "No initiatives directory found" in result.output
     finally:
         os.chdir(cwd)
 
@@ -85,8 +85,8 @@ def test_assemble_with_initiative_directory(tmp_path: Path):
         os.chdir(cwd)
 
 
-def test_assemble_success_message(tmp_path: Path):
-    """Test assemble command displays success message when plan exists."""
+def test_assemble_refuses_plan_without_sections(tmp_path: Path):
+    """Test assemble command refuses a plan that lists no sections."""
     project_root = tmp_path
     initiatives_dir = project_root / "initiatives" / "001-test"
     initiatives_dir.mkdir(parents=True, exist_ok=True)
@@ -100,10 +100,8 @@ def test_assemble_success_message(tmp_path: Path):
     try:
         runner = CliRunner()
         result = runner.invoke(app, ["assemble", "001-test"])
-        assert result.exit_code == 0
-        assert "Ready to Assemble" in result.output
-        assert "AI will:" in result.output
-        assert "/nuaa.assemble" in result.output
+        assert result.exit_code == 1
+        assert "plan.md lists no sections" in result.output
     finally:
         os.chdir(cwd)
 
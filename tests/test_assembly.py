@@ -0,0 +1,144 @@
+"""Tests for native, incremental assembly of section drafts."""
+
+import io
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.assembly import AssemblyCache, assemble_initiative, render_section
+from nuaa_cli.planfile import load_plan
+
+PLAN = """# Document Plan: Naloxone Proposal
+
+## Document Structure
+
+### Section 1: Executive Summary
+**Gate**: 1
+**Dependencies**: None
+**Status**: Passed
+
+### Section 2: Program Description
+**Gate**: 2
+**Dependencies**: Section 1
+**Status**: {status}
+"""
+
+DRAFT = """# Program Description
+
+**Initiative**: 001-naloxone
+**Gate**: Gate 2 - Core Content
+**Status**: Draft
+
+---
+
+## Section Purpose
+
+Describe the program.
+
+---
+
+## Content
+
+Peer workers distribute naloxone.
+
+```markdown
+## Not a heading
+```
+
+### Delivery Model
+
+Outreach vans.
+
+---
+
+## Revision History
+
+- **2026-01-01**: Initial draft created
+"""
+
+
+def _initiative(root: Path, status: str = "Passed", name: str = "001-naloxone") -> Path:
+    folder = root / "initiatives" / name
+    (folder / "sections").mkdir(parents=True)
+    (folder / "plan.md").write_text(PLAN.format(status=status), encoding="utf-8")
+    (folder / "sections" / "executive-summary.md").write_text(
+        "# Executive Summary\n\nWe ask for $50,000.\n", encoding="utf-8"
+    )
+    (folder / "sections" / "program-description.md").write_text(DRAFT, encoding="utf-8")
+    return folder
+
+
+def test_render_section_keeps_only_reader_content():
+    out = io.StringIO()
+
+    headings, words = render_section(io.StringIO(DRAFT), out, "Program Description")
+
+    assert out.getvalue() == (
+        "## Program Description\n\n"
+        "Peer workers distribute naloxone.\n\n"
+        "```markdown\n## Not a heading\n```\n\n"
+        "### Delivery Model\n\n"
+        "Outreach vans.\n"
+    )
+    assert headings == [[2, "Program Description"], [3, "Delivery Model"]]
+    assert words == 12
+
+
+def test_reassembly_rerenders_only_changed_sections(tmp_path: Path):
+    folder = _initiative(tmp_path)
+
+    first = assemble_initiative("001-naloxone", root=tmp_path)
+    document = first.output.read_text(encoding="utf-8")
+
+    assert first.output == folder / "final" / "001-naloxone.md"
+    assert [s.rendered for s in first.sections] == [True, True]
+    assert "1. [Executive Summary](#executive-summary)\n2. [Program Description]" in document
+    assert document.index("## Executive Summary") < document.index("## Program Description")
+    assert "Revision History" not in document and "**Initiative**" not in document
+
+    again = assemble_initiative("001-naloxone", root=tmp_path)
+    assert not again.written and [s.rendered for s in again.sections] == [False, False]
+
+    (folder / "sections" / "executive-summary.md").write_text(
+        "# Executive Summary\n\n## Ask\n\nWe ask for [PLACEHOLDER: amount].\n", encoding="utf-8"
+    )
+    third = assemble_initiative("001-naloxone", root=tmp_path)
+    assert third.written and [s.rendered for s in third.sections] == [True, False]
+    assert "   - [Ask](#ask)" in third.output.read_text(encoding="utf-8")
+    assert third.unresolved == {"Executive Summary": 1}
+
+
+def test_initiatives_keep_separate_caches(tmp_path: Path):
+    section = load_plan(_initiative(tmp_path) / "plan.md").find("Executive Summary")
+    _initiative(tmp_path, name="002-housing")
+
+    # Two runs that overlap: each loads, renders and saves its own initiative.
+    first = AssemblyCache(tmp_path, "001-naloxone")
+    second = AssemblyCache(tmp_path, "002-housing")
+    for cache in (first, second):
+        cache.chunk(section)
+    first.save()
+    second.save()
+
+    for name in ("001-naloxone", "002-housing"):
+        assert list(AssemblyCache(tmp_path, name).entry["sections"]) == ["executive-summary.md"]
+
+
+def test_assembly_refuses_sections_that_have_not_passed(tmp_path: Path):
+    _initiative(tmp_path, status="In Progress")
+
+    with pytest.raises(ValueError, match="Program Description: status is In Progress"):
+        assemble_initiative("001-naloxone", root=tmp_path)
+
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        result = CliRunner().invoke(app, ["assemble", "001-naloxone"])
+    finally:
+        os.chdir(cwd)
+    assert result.exit_code == 1
+    assert "not Passed" in result.output
+    assert not (tmp_path / "initiatives" / "001-naloxone" / "final").exists()
@@ -0,0 +1,65 @@
+"""Tests for batch program design scaffolding (``nuaa design --from``)."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.designs import load_programs
+
+REPO_TEMPLATES = Path(__file__).resolve().parents[1] / "nuaa-kit" / "templates"
+
+
+@pytest.fixture
+def project(tmp_path: Path):
+    kit = tmp_path / "nuaa-kit" / "templates"
+    kit.mkdir(parents=True)
+    for name in ("program-design.md", "logic-model.md", "impact-framework.md"):
+        (kit / name).write_text((REPO_TEMPLATES / name).read_text(encoding="utf-8"))
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        yield tmp_path
+    finally:
+        os.chdir(cwd)
+
+
+def test_design_from_csv_scaffolds_every_program(project: Path):
+    (project / "nuaa" / "002-hep-c-testing").mkdir(parents=True)
+    (project / "nuaa" / "002-hep-c-testing" / "logic-model.md").write_text("kept\n")
+    (project / "programs.csv").write_text(
+        "program,population,duration,funder,feature\n"
+        "Peer Naloxone,people at risk of overdose,12 months,NSW Health,\n"
+        "Hep C Testing,people who inject drugs,6 months,,002-hep-c-testing\n"
+        "Mobile Van,regional communities,2 years,PHN,\n"
+    )
+
+    result = CliRunner().invoke(app, ["design", "--from", "programs.csv", "--jobs", "4"])
+
+    assert result.exit_code == 0, result.output
+    assert "3 of 3 program designs ready, 11 files written" in result.output
+    names = sorted(p.name for p in (project / "nuaa").iterdir())
+    assert names == ["002-hep-c-testing", "003-peer-naloxone", "004-mobile-van"]
+    design = (project / "nuaa" / "004-mobile-van" / "program-design.md").read_text()
+    assert "title: Mobile Van - Program Design" in design
+    assert "feature: 004-mobile-van" in design
+    assert (project / "nuaa" / "002-hep-c-testing" / "logic-model.md").read_text() == "kept\n"
+
+
+def test_load_programs_reports_invalid_rows(tmp_path: Path):
+    source = tmp_path / "programs.jsonl"
+    source.write_text(
+        json.dumps({"program_name": "Outreach", "target_population": "youth", "duration": "1y"})
+        + "\n"
+        + json.dumps({"program": "No Duration", "population": "adults"})
+        + "\n"
+    )
+
+    with pytest.raises(ValueError, match="entry 2: missing duration"):
+        load_programs(source)
+
+    source.write_text(source.read_text().splitlines()[0] + "\n")
+    assert [p.program for p in load_programs(source)] == ["Outreach"]
@@ -0,0 +1,148 @@
+"""Tests for resumable downloads and the rate-limit aware retry scheduler."""
+
+import hashlib
+from pathlib import Path
+
+import httpx
+import pytest
+
+from nuaa_cli.cache import TemplateCache
+from nuaa_cli.download import download_asset, fetch_asset_into_cache, fetch_release
+from nuaa_cli.github import RELEASES_LATEST_URL, RetryScheduler
+
+ASSET_URL = "https://github.com/example/releases/download/v1.0.0/asset.zip"
+PAYLOAD = bytes(range(256)) * 64
+
+
+class RecordingScheduler(RetryScheduler):
+    """Scheduler with a fixed clock that records waits instead of sleeping."""
+
+    def __init__(self, **kwargs):
+        self.waits: list[float] = []
+        super().__init__(sleep=self.waits.append, clock=lambda: 1_000_000.0, **kwargs)
+
+
+def _dropping_stream(data: bytes, cut: int):
+    yield data[:cut]
+    raise httpx.ReadError("connection reset")
+
+
+class FlakyAssetHost:
+    """Serves PAYLOAD, dropping the first full-body response part way through."""
+
+    def __init__(self, cut: int | None = 1000):
+        self.cut = cut
+        self.ranges: list[str | None] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        range_header = request.headers.get("Range")
+        self.ranges.append(range_header)
+        if range_header:
+            start = int(range_header.removeprefix("bytes=").rstrip("-"))
+            body = PAYLOAD[start:]
+            return httpx.Response(
+                206,
+                content=body,
+                headers={"Content-Range": f"bytes {start}-{len(PAYLOAD) - 1}/{len(PAYLOAD)}"},
+            )
+        if self.cut is not None:
+            cut, self.cut = self.cut, None
+            return httpx.Response(
+                200,
+                headers={"Content-Length": str(len(PAYLOAD))},
+                content=_dropping_stream(PAYLOAD, cut),
+            )
+        return httpx.Response(200, content=PAYLOAD)
+
+    def client(self) -> httpx.Client:
+        return httpx.Client(transport=httpx.MockTransport(self.handler))
+
+
+def test_interrupted_download_resumes_with_range(tmp_path: Path):
+    host = FlakyAssetHost(cut=1000)
+    scheduler = RecordingScheduler()
+    dest = tmp_path / "asset.zip"
+
+    with host.client() as client:
+        sha256 = download_asset(client, ASSET_URL, dest, show_progress=False, scheduler=scheduler)
+
+    assert host.ranges == [None, "bytes=1000-"]
+    assert len(scheduler.waits) == 1
+    assert dest.read_bytes() == PAYLOAD
+    assert sha256 == hashlib.sha256(PAYLOAD).hexdigest()
+
+
+def test_partial_file_from_previous_run_is_resumed(tmp_path: Path):
+    host = FlakyAssetHost(cut=None)
+    cache = TemplateCache(tmp_path / "cache")
+    staging = cache.staging_path("asset.zip", "v1.0.0")
+    staging.write_bytes(PAYLOAD[:4096])
+    asset = {
+        "name": "asset.zip",
+        "browser_download_url": ASSET_URL,
+        "digest": "sha256:" + hashlib.sha256(PAYLOAD).hexdigest(),
+    }
+
+    with host.client() as client:
+        blob, was_cached = fetch_asset_into_cache(
+            client, cache, "v1.0.0", asset, show_progress=False, scheduler=RecordingScheduler()
+        )
+
+    assert host.ranges == ["bytes=4096-"]
+    assert not was_cached
+    assert blob.read_bytes() == PAYLOAD
+    assert not staging.exists()
+
+
+def test_server_ignoring_range_restarts_from_scratch(tmp_path: Path):
+    dest = tmp_path / "asset.zip"
+    dest.write_bytes(b"stale partial bytes")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=PAYLOAD)
+
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        download_asset(client, ASSET_URL, dest, show_progress=False, scheduler=RecordingScheduler())
+
+    assert dest.read_bytes() == PAYLOAD
+
+
+def test_rate_limited_release_waits_until_reset():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url)
+        if len(calls) == 1:
+            return httpx.Response(
+                403,
+                headers={"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1000030"},
+            )
+        return httpx.Response(200, json={"tag_name": "v1.0.0", "assets": []})
+
+    scheduler = RecordingScheduler()
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        release = fetch_release(client, scheduler=scheduler)
+
+    assert release["tag_name"] == "v1.0.0"
+    assert [str(u) for u in calls] == [RELEASES_LATEST_URL] * 2
+    assert scheduler.waits == [31.0]
+
+
+def test_retry_after_longer_than_max_wait_fails_fast():
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(429, headers={"Retry-After": "3600"})
+
+    scheduler = RecordingScheduler(max_wait=60)
+    with httpx.Client(transport=httpx.MockTransport(handler)) as client:
+        with pytest.raises(RuntimeError, match="Retry after: 3600 seconds"):
+            fetch_release(client, scheduler=scheduler)
+    assert scheduler.waits == []
+
+
+def test_scheduler_gives_up_after_max_attempts():
+    scheduler = RecordingScheduler(max_attempts=3)
+    headers = httpx.Headers()
+    assert scheduler.delay_for_response(503, headers, 0) is not None
+    assert scheduler.delay_for_response(503, headers, 2) is None
+    assert scheduler.delay_for_response(404, headers, 0) is None
+    assert scheduler.delay_for_response(403, headers, 0) is None
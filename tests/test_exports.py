@@ -0,0 +1,95 @@
+"""Tests for parallel, make-style document export."""
+
+import os
+import stat
+import sys
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.exports import CURRENT, EXPORTED, ExportCache, plan_exports, run_exports
+
+FAKE_PANDOC = """#!{python}
+import shutil, sys
+args = sys.argv[1:]
+with open({log!r}, "a") as log:
+    log.write(" ".join(args) + "\\n")
+shutil.copyfile(args[0], args[args.index("-o") + 1])
+"""
+
+
+def _fake_pandoc(tmp_path: Path, monkeypatch) -> Path:
+    """Put a pandoc on PATH that copies its input and logs each call."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    log = tmp_path / "pandoc.log"
+    pandoc = bin_dir / "pandoc"
+    pandoc.write_text(FAKE_PANDOC.format(python=sys.executable, log=str(log)))
+    pandoc.chmod(pandoc.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+    return log
+
+
+def _assembled(root: Path, *names: str) -> None:
+    for name in names:
+        final = root / "initiatives" / name / "final"
+        final.mkdir(parents=True)
+        (final / f"{name}.md").write_text(f"# {name}\n", encoding="utf-8")
+
+
+def test_exports_skip_outputs_whose_inputs_are_unchanged(tmp_path: Path, monkeypatch):
+    log = _fake_pandoc(tmp_path, monkeypatch)
+    _assembled(tmp_path, "001-naloxone", "002-outreach")
+    templates = tmp_path / "templates"
+    templates.mkdir()
+    (templates / "nuaa-word-template.docx").write_bytes(b"reference v1")
+
+    def export():
+        cache = ExportCache(tmp_path)
+        jobs, missing = plan_exports(
+            ["001-naloxone", "002-outreach", "003-empty"],
+            ["docx", "html"],
+            cache,
+            templates,
+            root=tmp_path,
+        )
+        assert missing == ["003-empty"]
+        return [(r.initiative, r.format, r.status) for r in run_exports(jobs, cache, workers=4)]
+
+    assert [status for _, _, status in export()] == [EXPORTED] * 4
+    assert (tmp_path / "initiatives" / "002-outreach" / "final" / "002-outreach.html").is_file()
+    assert len(log.read_text().splitlines()) == 4
+
+    assert [status for _, _, status in export()] == [CURRENT] * 4
+
+    (templates / "nuaa-word-template.docx").write_bytes(b"reference v2")
+    (tmp_path / "initiatives" / "002-outreach" / "final" / "002-outreach.md").write_text("# New\n")
+    assert export() == [
+        ("001-naloxone", "docx", EXPORTED),
+        ("001-naloxone", "html", CURRENT),
+        ("002-outreach", "docx", EXPORTED),
+        ("002-outreach", "html", EXPORTED),
+    ]
+    assert len(log.read_text().splitlines()) == 7
+
+
+def test_export_command_reports_each_format(tmp_path: Path, monkeypatch):
+    _fake_pandoc(tmp_path, monkeypatch)
+    _assembled(tmp_path, "001-naloxone")
+
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        runner = CliRunner()
+        first = runner.invoke(app, ["export", "001-naloxone", "--format", "docx,html"])
+        second = runner.invoke(app, ["export", "--all", "--format", "html,docx", "--json"])
+        bad = runner.invoke(app, ["export", "--format", "odt"])
+    finally:
+        os.chdir(cwd)
+
+    assert first.exit_code == 0, first.output
+    assert "2 exported, 0 up to date, 0 failed" in first.output
+    assert second.exit_code == 0, second.output
+    assert '"current": 2' in second.output
+    assert bad.exit_code == 1 and "Unsupported format: odt" in bad.output
@@ -0,0 +1,89 @@
+"""Tests for single-pass template archive extraction."""
+
+import json
+import os
+import stat
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from nuaa_cli.download import extract_template_archive
+
+posix_only = pytest.mark.skipif(os.name == "nt", reason="POSIX file modes")
+
+
+def _entry(name: str, mode: int) -> zipfile.ZipInfo:
+    info = zipfile.ZipInfo(name)
+    info.create_system = 3
+    info.external_attr = (stat.S_IFREG | mode) << 16
+    return info
+
+
+def _archive(path: Path, entries: list[tuple[zipfile.ZipInfo | str, str]]) -> Path:
+    with zipfile.ZipFile(path, "w") as zf:
+        for info, content in entries:
+            zf.writestr(info, content)
+    return path
+
+
+@posix_only
+def test_strips_wrapper_and_applies_modes(tmp_path: Path):
+    archive = _archive(
+        tmp_path / "t.zip",
+        [
+            ("nuaa-template/", ""),
+            ("nuaa-template/README.md", "# Readme\n"),
+            (_entry("nuaa-template/bin/tool", 0o755), "binary"),
+            ("nuaa-template/.nuaa/scripts/bash/common.sh", "#!/usr/bin/env bash\n"),
+            ("nuaa-template/.nuaa/scripts/bash/notes.sh", "# sourced only\n"),
+        ],
+    )
+    project = tmp_path / "project"
+
+    extract_template_archive(archive, project, verbose=False)
+
+    assert sorted(p.name for p in project.iterdir()) == [".nuaa", "README.md", "bin"]
+    assert os.access(project / "bin" / "tool", os.X_OK)
+    assert os.access(project / ".nuaa" / "scripts" / "bash" / "common.sh", os.X_OK)
+    assert not os.access(project / ".nuaa" / "scripts" / "bash" / "notes.sh", os.X_OK)
+    assert not os.access(project / "README.md", os.X_OK)
+
+
+def test_single_file_archive_is_not_flattened(tmp_path: Path):
+    archive = _archive(tmp_path / "t.zip", [("README.md", "# Readme\n")])
+    project = tmp_path / "project"
+
+    extract_template_archive(archive, project, verbose=False)
+
+    assert (project / "README.md").read_text() == "# Readme\n"
+
+
+def test_merge_into_current_directory(tmp_path: Path):
+    project = tmp_path / "project"
+    (project / ".vscode").mkdir(parents=True)
+    (project / ".vscode" / "settings.json").write_text(json.dumps({"editor.tabSize": 2}))
+    (project / "notes.md").write_text("keep me\n")
+    (project / "README.md").write_text("old\n")
+    archive = _archive(
+        tmp_path / "t.zip",
+        [
+            ("wrap/README.md", "new\n"),
+            ("wrap/.vscode/settings.json", json.dumps({"chat.promptFiles": True})),
+        ],
+    )
+
+    extract_template_archive(archive, project, is_current_dir=True, verbose=False)
+
+    assert (project / "README.md").read_text() == "new\n"
+    assert (project / "notes.md").read_text() == "keep me\n"
+    settings = json.loads((project / ".vscode" / "settings.json").read_text())
+    assert settings == {"editor.tabSize": 2, "chat.promptFiles": True}
+
+
+def test_rejects_paths_outside_project(tmp_path: Path):
+    archive = _archive(tmp_path / "t.zip", [("../escape.txt", "x"), ("ok.txt", "y")])
+
+    with pytest.raises(ValueError, match="Unsafe path"):
+        extract_template_archive(archive, tmp_path / "project", verbose=False)
+    assert not (tmp_path / "escape.txt").exists()
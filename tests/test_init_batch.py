@@ -0,0 +1,106 @@
+"""Tests for `nuaa init --batch` and concurrency-safe git initialization."""
+
+import json
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.batch import load_manifest
+from nuaa_cli.system import init_git_repo
+
+runner = CliRunner()
+
+needs_git = pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+
+
+@pytest.fixture(autouse=True)
+def git_identity(monkeypatch):
+    for var in ("GIT_AUTHOR", "GIT_COMMITTER"):
+        monkeypatch.setenv(f"{var}_NAME", "NUAA Test")
+        monkeypatch.setenv(f"{var}_EMAIL", "test@example.org")
+
+
+def test_load_manifest_resolves_paths_and_defaults(tmp_path: Path):
+    manifest = tmp_path / "cohort.csv"
+    manifest.write_text("path,ai,script\nalpha,claude,\nbeta,,ps\n")
+
+    projects = load_manifest(manifest, default_ai="gemini", default_script="sh")
+
+    assert [(p.path, p.ai, p.script) for p in projects] == [
+        (tmp_path / "alpha", "claude", "sh"),
+        (tmp_path / "beta", "gemini", "ps"),
+    ]
+
+
+def test_load_manifest_reports_every_bad_entry(tmp_path: Path):
+    (tmp_path / "exists").mkdir()
+    manifest = tmp_path / "cohort.json"
+    manifest.write_text(
+        json.dumps(
+            [
+                {"path": "a", "ai": "nope", "script": "sh"},
+                {"path": "exists", "ai": "claude", "script": "sh"},
+                {"path": "a", "ai": "claude", "script": "zsh"},
+            ]
+        )
+    )
+
+    with pytest.raises(ValueError) as excinfo:
+        load_manifest(manifest)
+    message = str(excinfo.value)
+    assert "unknown AI assistant 'nope'" in message
+    assert "directory already exists" in message
+    assert "duplicate path" in message and "unknown script type 'zsh'" in message
+
+
+@needs_git
+def test_init_git_repo_leaves_cwd_alone(tmp_path: Path):
+    project = tmp_path / "project"
+    project.mkdir()
+    (project / "README.md").write_text("# Project\n")
+    os.chdir(tmp_path)
+
+    ok, error = init_git_repo(project, quiet=True)
+
+    assert ok, error
+    assert Path.cwd() == tmp_path
+    assert (project / ".git").is_dir()
+
+
+@needs_git
+def test_batch_init_provisions_all_projects(tmp_path: Path):
+    manifest = tmp_path / "cohort.csv"
+    manifest.write_text(
+        "path,ai,script\nprograms/peer-support,claude,sh\nprograms/outreach,claude,sh\n"
+        "programs/harm-reduction,gemini,ps\n"
+    )
+    os.chdir(tmp_path)
+
+    result = runner.invoke(
+        app, ["init", "--batch", str(manifest), "--ignore-agent-tools", "--jobs", "2"]
+    )
+
+    assert result.exit_code == 0, result.output
+    assert "3 projects, 2 templates" in result.output
+    for name in ("peer-support", "outreach"):
+        project = tmp_path / "programs" / name
+        assert (project / ".claude" / "commands" / "nuaa.design.md").is_file()
+        assert (project / ".git").is_dir()
+    gemini = tmp_path / "programs" / "harm-reduction"
+    assert (gemini / ".gemini" / "commands" / "nuaa.design.toml").is_file()
+    assert (gemini / ".nuaa" / "scripts" / "powershell").is_dir()
+
+
+def test_batch_rejects_project_name(tmp_path: Path):
+    manifest = tmp_path / "cohort.csv"
+    manifest.write_text("path,ai,script\nalpha,claude,sh\n")
+    os.chdir(tmp_path)
+
+    result = runner.invoke(app, ["init", "demo", "--batch", str(manifest)])
+
+    assert result.exit_code == 1
+    assert not (tmp_path / "alpha").exists()
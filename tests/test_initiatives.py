@@ -0,0 +1,70 @@
+"""Tests for in-process initiative creation."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from nuaa_cli.initiatives import create_initiative, generate_slug
+from nuaa_cli.workspace import INDEX_PATH, INITIATIVES, WorkspaceIndex
+
+TEMPLATE = """---
+title: "[PROGRAM_NAME] - Program Specification"
+initiative: "[INITIATIVE_NUMBER]-[INITIATIVE_SLUG]"
+created: "[CREATED_DATE]"
+---
+
+# Program Specification: [PROGRAM_NAME]
+
+[PLACEHOLDER: Who is this for?]
+"""
+
+
+@pytest.fixture
+def project(tmp_path: Path) -> Path:
+    templates = tmp_path / "nuaa-kit" / "templates"
+    templates.mkdir(parents=True)
+    (templates / "program-specification-template.md").write_text(TEMPLATE, encoding="utf-8")
+    return tmp_path
+
+
+def test_generate_slug_matches_script_rules():
+    """Stop words and short words are dropped; three words are kept, or four if exactly four."""
+    assert generate_slug("Peer naloxone distribution program for Western Sydney") == (
+        "peer-naloxone-distribution"
+    )
+    assert generate_slug("We want a mobile harm reduction van") == "mobile-harm-reduction-van"
+    assert generate_slug("Do it") == "do-it"
+    assert generate_slug("Go to it as") == "go-to-it"
+    assert generate_slug("!!!") == "initiative"
+
+
+def test_create_initiative_renders_spec(project: Path):
+    created = create_initiative(
+        "Peer naloxone distribution", short_name="Naloxone Peers", root=project
+    )
+
+    assert created.name == "001-naloxone-peers"
+    content = created.spec_file.read_text(encoding="utf-8")
+    assert 'initiative: "001-naloxone-peers"' in content
+    assert "# Program Specification: Peer naloxone distribution" in content
+    assert "[PLACEHOLDER: Who is this for?]" in content
+    latest = WorkspaceIndex(project).latest(INITIATIVES)
+    assert (latest["name"], latest["status"]) == ("001-naloxone-peers", "specified")
+    index = json.loads((project / INDEX_PATH).read_text())
+    assert index["collections"][INITIATIVES]["entries"][created.name]["status"] == "specified"
+
+    with pytest.raises(FileExistsError):
+        create_initiative("Another program", short_name="naloxone-peers", number=1, root=project)
+
+
+def test_parallel_creation_reserves_distinct_numbers(project: Path):
+    """Concurrent callers never share a number, even with the same description."""
+    (project / "initiatives" / "003-existing").mkdir(parents=True)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        created = list(pool.map(lambda _: create_initiative("Outreach", root=project), range(8)))
+
+    assert sorted(c.number for c in created) == [f"{n:03d}" for n in range(4, 12)]
+    assert all(c.spec_file.is_file() for c in created)
@@ -0,0 +1,81 @@
+"""Tests for the workspace-wide marker inventory."""
+
+import json
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.inventory import workspace_inventory
+
+PLAN = """# Document Plan
+
+### Section 1: Program Description
+**Gate**: 1
+**Status**: In Progress
+**Dependencies**: None
+"""
+
+
+def _workspace(root: Path) -> None:
+    initiative = root / "initiatives" / "001-naloxone"
+    (initiative / "sections").mkdir(parents=True)
+    (initiative / "spec.md").write_text(
+        "# Spec\n## Population\nAges: [NEEDS CLARIFICATION: age range?]\n- [x] reviewed\n"
+    )
+    (initiative / "plan.md").write_text(PLAN)
+    (initiative / "sections" / "program-description.md").write_text(
+        "# Program Description\n[PLACEHOLDER: staff]\n## Budget\n[PLACEHOLDER: total] [Amount]\n"
+    )
+    feature = root / "nuaa" / "001-outreach"
+    feature.mkdir(parents=True)
+    (feature / "proposal.md").write_text("# Proposal\nDone.\n")
+
+
+def test_inventory_groups_markers_by_folder_section_and_heading(tmp_path: Path):
+    _workspace(tmp_path)
+
+    report = workspace_inventory(root=tmp_path)
+
+    assert report["totals"] == {
+        "placeholder": 2,
+        "clarification": 1,
+        "bracket": 1,
+        "total": 4,
+        "documents": 2,
+    }
+    initiative = report["initiatives"][0]
+    assert initiative["documents_scanned"] == 3
+    section, spec = initiative["documents"]
+    assert section["path"] == "initiatives/001-naloxone/sections/program-description.md"
+    assert section["section"] == "Program Description"
+    assert section["headings"] == {"Program Description": 1, "Budget": 2}
+    assert spec["markers"][0] == {
+        "kind": "clarification",
+        "text": "[NEEDS CLARIFICATION: age range?]",
+        "line": 3,
+        "column": 7,
+        "section": "Population",
+    }
+    assert report["features"][0]["counts"]["total"] == 0
+
+    again = workspace_inventory(root=tmp_path)
+    assert again["cached"] == again["scanned"] == 4
+
+
+def test_inventory_command_json(tmp_path: Path):
+    _workspace(tmp_path)
+
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        result = CliRunner().invoke(app, ["inventory", "--json"])
+        table = CliRunner().invoke(app, ["inventory", "--details"])
+    finally:
+        os.chdir(cwd)
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["totals"]["total"] == 4
+    assert table.exit_code == 0, table.output
+    assert "4 unresolved marker(s) in 2 document(s)" in table.output
@@ -0,0 +1,152 @@
+"""Tests for advisory per-file locks."""
+
+import os
+import shutil
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from nuaa_cli import locks
+from nuaa_cli.locks import LockTimeout, fallback_lock_path, file_lock, write_atomic
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+
+HOLD_LOCK = """
+import sys, time
+from nuaa_cli.locks import file_lock
+with file_lock(sys.argv[1]):
+    print("locked", flush=True)
+    time.sleep(30)
+"""
+
+
+def test_lock_excludes_other_writers(tmp_path: Path):
+    plan = tmp_path / "plan.md"
+    acquired = threading.Event()
+    release = threading.Event()
+
+    def holder():
+        with file_lock(plan):
+            acquired.set()
+            release.wait(5)
+
+    thread = threading.Thread(target=holder)
+    thread.start()
+    acquired.wait(5)
+    try:
+        with pytest.raises(LockTimeout):
+            with file_lock(plan, timeout=0.1):
+                pass
+    finally:
+        release.set()
+        thread.join()
+
+    with file_lock(plan, timeout=0.1):
+        write_atomic(plan, "# Plan\n")
+    assert plan.read_text() == "# Plan\n"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["plan.md"]
+
+
+def test_fallback_lock_file(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(locks, "fcntl", None)
+    spec = tmp_path / "spec.md"
+    marker = fallback_lock_path(spec)
+
+    with file_lock(spec):
+        assert marker.read_text().strip() == str(os.getpid())
+        with pytest.raises(LockTimeout):
+            with file_lock(spec, timeout=0.1):
+                pass
+    assert not marker.exists()
+
+    marker.write_text("12345\n")
+    os.utime(marker, (1, 1))  # abandoned long ago
+    with file_lock(spec, timeout=0.1):
+        pass
+    assert not marker.exists()
+
+
+@pytest.mark.skipif(locks.fcntl is None, reason="flock is POSIX-only")
+def test_flock_holders_honour_fallback_marker(tmp_path: Path):
+    spec = tmp_path / "spec.md"
+    owner = subprocess.Popen(["sleep", "30"])
+    try:
+        fallback_lock_path(spec).write_text(f"{owner.pid}\n")
+        with pytest.raises(LockTimeout):
+            with file_lock(spec, timeout=0.1):
+                pass
+    finally:
+        owner.kill()
+        owner.wait()
+
+    # The owner is gone, so its marker no longer holds the lock
+    with file_lock(spec, timeout=0.1):
+        pass
+    assert not fallback_lock_path(spec).exists()
+
+
+@pytest.mark.skipif(locks.fcntl is None, reason="flock is POSIX-only")
+def test_killed_holder_does_not_block_later_writers(tmp_path: Path):
+    plan = tmp_path / "plan.md"
+    holder = subprocess.Popen(
+        [sys.executable, "-c", HOLD_LOCK, str(plan)], stdout=subprocess.PIPE, text=True
+    )
+    assert holder.stdout.readline().strip() == "locked"
+    holder.kill()
+    holder.wait()
+    assert fallback_lock_path(plan).exists()
+
+    with file_lock(plan, timeout=1):
+        pass
+    assert sorted(p.name for p in tmp_path.iterdir()) == []
+
+
+def test_fallback_writers_see_a_held_lock(tmp_path: Path):
+    """A writer without flock (bash ``set -C``, PowerShell ``CreateNew``) is excluded too."""
+    plan = tmp_path / "plan.md"
+    marker = fallback_lock_path(plan)
+    acquire = f'( set -C; echo "$$" > "{marker}" ) 2>/dev/null'
+
+    with file_lock(plan):
+        with pytest.raises(FileExistsError):
+            os.close(os.open(marker, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+        assert subprocess.run(["bash", "-c", acquire]).returncode != 0
+    assert not marker.exists()
+
+    holder = f'( set -C; echo "$$" > "{marker}" ) && echo locked && exec sleep 30'
+    with subprocess.Popen(["bash", "-c", holder], stdout=subprocess.PIPE, text=True) as bash:
+        try:
+            assert bash.stdout.readline().strip() == "locked"
+            with pytest.raises(LockTimeout):
+                with file_lock(plan, timeout=0.1):
+                    pass
+        finally:
+            bash.kill()
+
+
+@pytest.mark.skipif(shutil.which("flock") is None, reason="flock(1) not installed")
+def test_bash_scripts_share_the_lock(tmp_path: Path):
+    plan = tmp_path / "plan.md"
+    plan.write_text("# Plan\n")
+    script = (
+        f'source "{REPO_ROOT}/scripts/bash/common.sh"\n'
+        f'acquire_file_lock "{plan}" && echo locked && release_file_lock "{plan}"\n'
+    )
+    env = {**os.environ, "NUAA_LOCK_TIMEOUT": "0.2"}
+
+    with file_lock(plan):
+        blocked = subprocess.run(["bash", "-c", script], capture_output=True, text=True, env=env)
+    free = subprocess.run(["bash", "-c", script], capture_output=True, text=True, env=env)
+
+    assert blocked.returncode != 0 and "Timed out" in blocked.stderr
+    assert free.stdout.strip() == "locked"
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["plan.md"]
+
+    killed_writer = subprocess.Popen(["true"])
+    killed_writer.wait()
+    fallback_lock_path(plan).write_text(f"{killed_writer.pid}\n")  # left by a dead writer
+    killed = subprocess.run(["bash", "-c", script], capture_output=True, text=True, env=env)
+    assert killed.stdout.strip() == "locked", killed.stderr
@@ -0,0 +1,88 @@
+"""Tests for the placeholder scanner behind ``nuaa lint placeholders``."""
+
+import json
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from nuaa_cli import app, markers
+from nuaa_cli.markers import BRACKET, CLARIFICATION, PLACEHOLDER, Marker, scan_markdown, scan_text
+
+FINAL = "---\ntitle: Proposal\nstatus: final\n---\n"
+
+
+def test_scan_text_skips_links_and_fenced_code():
+    text = (
+        "# [Program Name]\n"
+        "See [the guide](guide.md) and [PLACEHOLDER: budget total].\n"
+        "## Budget\n"
+        "```markdown\n"
+        "# [Name] inside a fence\n"
+        "```\n"
+        "Ages: [NEEDS CLARIFICATION: which age range?]\n"
+    )
+
+    assert scan_text(text) == [
+        Marker(BRACKET, "[Program Name]", 1, 3, "[Program Name]"),
+        Marker(PLACEHOLDER, "[PLACEHOLDER: budget total]", 2, 31, "[Program Name]"),
+        Marker(CLARIFICATION, "[NEEDS CLARIFICATION: which age range?]", 7, 7, "Budget"),
+    ]
+
+
+def test_unchanged_files_are_answered_from_the_cache(tmp_path: Path, monkeypatch):
+    docs = tmp_path / "docs"
+    docs.mkdir()
+    (docs / "final.md").write_text(FINAL + "Amount: [Amount]\n")
+    (docs / "draft.md").write_text("Draft with [PLACEHOLDER: aims]\n")
+
+    first, hits = scan_markdown([docs], root=tmp_path)
+    assert hits == 0
+    assert [(Path(s.path).name, s.final, len(s.markers)) for s in first] == [
+        ("draft.md", False, 1),
+        ("final.md", True, 1),
+    ]
+
+    scanned = []
+    original = markers.scan_text
+    monkeypatch.setattr(markers, "scan_text", lambda text: scanned.append(text) or original(text))
+    os.utime(docs / "draft.md", ns=(1, 1))  # touched, same content: hashed but not rescanned
+    (docs / "final.md").write_text(FINAL + "Amount: $5000\n")
+
+    second, hits = scan_markdown([docs], root=tmp_path)
+    assert hits == 1
+    assert len(scanned) == 1
+    assert [len(s.markers) for s in second] == [1, 0]
+
+
+def test_large_batches_scan_on_a_process_pool(tmp_path: Path, monkeypatch):
+    monkeypatch.setattr(markers, "PARALLEL_THRESHOLD", 4)
+    for n in range(10):
+        (tmp_path / f"doc{n}.md").write_text(f"Line\n[PLACEHOLDER: item {n}]\n")
+
+    scans, _ = scan_markdown([tmp_path], root=tmp_path, jobs=2, cache=False)
+
+    assert [s.markers[0].text for s in scans] == [f"[PLACEHOLDER: item {n}]" for n in range(10)]
+    assert not (tmp_path / ".nuaa").exists()
+
+
+def test_lint_placeholders_fails_on_final_documents(tmp_path: Path):
+    (tmp_path / "final.md").write_text(FINAL + "Funded by [Funder]\n")
+    (tmp_path / "draft.md").write_text("[PLACEHOLDER: anything]\n")
+
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        runner = CliRunner()
+        result = runner.invoke(app, ["lint", "placeholders", "."])
+        as_json = runner.invoke(app, ["lint", "placeholders", "draft.md", "--json"])
+    finally:
+        os.chdir(cwd)
+
+    assert result.exit_code == 1
+    assert "Placeholder tokens found in FINAL document" in result.output
+    assert "[Funder]" in result.output and "PLACEHOLDER: anything" not in result.output
+    assert as_json.exit_code == 0, as_json.output
+    report = json.loads(as_json.output)
+    assert report["failing"] == []
+    assert report["files"][0]["markers"][0]["kind"] == PLACEHOLDER
@@ -80,15 +80,15 @@ def test_plan_command_with_clarifications():
             os.chdir(cwd)
 
 
-def test_gate_check_command_no_script():
-    """Test gate-check command when script doesn't exist"""
+def test_gate_check_command_no_initiatives():
+    """Test gate-check command with no initiatives directory"""
     with tempfile.TemporaryDirectory() as tmpdir:
         cwd = os.getcwd()
         os.chdir(tmpdir)
         try:
             result = runner.invoke(app, ["gate-check", "Test Section"])
             assert result.exit_code == 1
-            assert "Script not found" in result.stdout
+            assert "No initiatives directory found" in result.stdout
         finally:
             os.chdir(cwd)
 
@@ -137,8 +137,8 @@ def test_status_command_with_plan():
         try:
             result = runner.invoke(app, ["status"])
             assert result.exit_code == 0
-            assert "Status Check Ready" in result.stdout
-            assert "/nuaa.status" in result.stdout
+            assert "Initiative Status" in result.stdout
+            assert "No sections found" in result.stdout
         finally:
             os.chdir(cwd)
 
@@ -193,9 +193,9 @@ def test_gate_check_command_with_initiative_option():
                 app, 
                 ["gate-check", "Test Section", "--initiative", "001-test"]
             )
-            # Will fail due to missing script, but check args are accepted
+            # Will fail due to missing plan, but check args are accepted
             assert result.exit_code == 1
-            assert "Script not found" in result.stdout
+            assert "Plan not found" in result.stdout
         finally:
             os.chdir(cwd)
 
@@ -0,0 +1,284 @@
+"""Tests for the native plan.md model and gate-check."""
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.locks import LockTimeout
+from nuaa_cli.planfile import (
+    add_dependency,
+    load_plan,
+    parse_dependencies,
+    parse_plan,
+    set_gate,
+    set_status,
+)
+
+runner = CliRunner()
+
+PLAN = """# Document Plan: Peer Naloxone
+
+**Status**: Planning
+
+## Section Breakdown
+
+### Section 1: Program Description
+
+**Gate**: Gate 1 - Initial Structure
+**Dependencies**: None (foundation section)
+**Status**: Passed
+
+### Section 2: Staffing Model
+
+**Gate**: Gate 2 - Core Content
+**Dependencies**: Section 1 (must be drafted first)
+**Status**: In Progress
+
+### Section 3: Budget Justification
+
+**Gate**: Gate 3 - Evidence
+**Dependencies**: Program Description, Staffing Model
+**Status**: Not Started
+
+## Quality Gates
+
+### Gate 1: Initial Structure
+
+**Status**: Pending
+"""
+
+
+# Section names from nuaa-kit/commands/report.md contain "&" and parenthetical notes
+KIT_PLAN = """### Section 2: Program Overview & Context
+**Status**: Passed
+
+### Section 9: Next Steps & Sustainability (Final Reports)
+**Status**: Passed
+
+### Section 10: Monitoring and Evaluation
+**Dependencies**: Program Overview & Context, Next Steps & Sustainability (Final Reports)
+
+### Section 11: Appendix
+**Dependencies**: Monitoring and Evaluation (after analysis)
+
+### Section 12: Risks, Assumptions
+**Dependencies**: Section 2
+
+### Section 13: Budget
+**Dependencies**: Risks, Assumptions
+"""
+
+
+def _workspace(root: Path, plan: str = PLAN) -> Path:
+    folder = root / "initiatives" / "001-naloxone"
+    folder.mkdir(parents=True)
+    (folder / "plan.md").write_text(plan)
+    return folder / "plan.md"
+
+
+def test_parse_plan_sections_and_dependencies():
+    plan = parse_plan(PLAN.encode())
+
+    assert [(s.number, s.name, s.gate, s.status) for s in plan] == [
+        (1, "Program Description", 1, "Passed"),
+        (2, "Staffing Model", 2, "In Progress"),
+        (3, "Budget Justification", 3, "Not Started"),
+    ]
+    assert plan.graph() == {1: [], 2: [1], 3: [1, 2]}
+    assert plan.find("section 2").name == "Staffing Model"
+    assert plan.blockers(plan.find("Budget Justification")) == [
+        "Staffing Model (status: In Progress)"
+    ]
+
+    start, end = plan.find("Staffing Model").spans["Status"]
+    assert PLAN.encode()[start:end] == b"In Progress"
+
+
+def test_parse_dependencies_forms():
+    assert parse_dependencies("None (foundation section)") == ()
+    assert parse_dependencies("Sections 2, 3") == ("2", "3")
+    assert parse_dependencies("Program Description; Staffing Model (draft first)") == (
+        "Program Description",
+        "Staffing Model (draft first)",
+    )
+    assert parse_dependencies("Monitoring and Evaluation") == ("Monitoring and Evaluation",)
+
+
+def test_dependencies_on_kit_section_names():
+    """Names from the report template keep their ``&`` and parenthetical notes."""
+    plan = parse_plan(KIT_PLAN.encode())
+
+    check = plan.check()
+
+    assert check.errors == []
+    assert [d.number for d in plan.resolve(plan.find("Section 10"))[0]] == [2, 9]
+    assert [d.number for d in plan.resolve(plan.find("Appendix"))[0]] == [10]
+    assert [d.number for d in plan.resolve(plan.find("Budget"))[0]] == [12]
+    assert plan.blockers(plan.find("Section 10")) == []
+
+
+def test_load_plan_reparses_only_when_file_changes(tmp_path: Path):
+    path = _workspace(tmp_path)
+
+    first = load_plan(path)
+    assert load_plan(path) is first
+
+    path.write_text(PLAN.replace("**Status**: In Progress", "**Status**: Passed"))
+    os.utime(path, ns=(1, 1))
+    assert load_plan(path).find("Staffing Model").passed
+
+
+def test_gate_check_blocked_and_passed(tmp_path: Path):
+    _workspace(tmp_path)
+    os.chdir(tmp_path)
+
+    blocked = runner.invoke(app, ["gate-check", "Budget Justification"])
+    assert blocked.exit_code == 1
+    assert "Gate Check Failed" in blocked.output
+    assert "Staffing Model (status: In Progress)" in blocked.output
+
+    passed = runner.invoke(app, ["gate-check", "Staffing Model"])
+    assert passed.exit_code == 0, passed.output
+    assert "Gate Check Passed" in passed.output
+
+
+def test_gate_check_unknown_section(tmp_path: Path):
+    _workspace(tmp_path)
+    os.chdir(tmp_path)
+
+    result = runner.invoke(app, ["gate-check", "Evaluation"])
+
+    assert result.exit_code == 1
+    assert "not found" in result.output
+
+
+def test_plan_check_reports_cycles_and_unknown_dependencies():
+    plan = parse_plan(
+        PLAN.replace("Section 1 (must be drafted first)", "Budget Justification")
+        .replace("**Dependencies**: None", "**Dependencies**: Evaluation")
+        .encode()
+    )
+
+    check = plan.check()
+
+    assert [r.section.number for r in check.results] == [1, 2, 3]
+    assert check.errors == [
+        "Section 1: Program Description depends on unknown section 'Evaluation'",
+        "Dependency cycle: Section 2: Staffing Model → Section 3: Budget Justification"
+        " → Section 2: Staffing Model",
+    ]
+
+
+def test_gate_check_all_json(tmp_path: Path):
+    _workspace(tmp_path)
+    os.chdir(tmp_path)
+
+    result = runner.invoke(app, ["gate-check", "--all", "--json"])
+
+    assert result.exit_code == 0, result.output
+    document = json.loads(result.output)
+    assert document["summary"] == {"total": 3, "passed": 1, "ready": 1, "blocked": 1}
+    assert [s["dependencies_satisfied"] for s in document["sections"]] == [True, True, False]
+    assert document["errors"] == []
+
+    table = runner.invoke(app, ["gate-check", "--all"])
+    assert table.exit_code == 0, table.output
+    assert "1 passed" in table.output and "waiting on" in table.output
+
+
+def test_structured_edits_splice_only_the_field(tmp_path: Path):
+    original = PLAN.replace("**Status**: In Progress", "**Status**: In Progress  ")
+    path = _workspace(tmp_path, original.replace(", Staffing Model", ""))
+
+    set_status(path, "Staffing Model", "Gate Review")
+    set_gate(path, "Section 3", 4)
+    section = add_dependency(path, "Budget Justification", "Section 2")
+    add_dependency(path, "Budget Justification", "Staffing Model")  # already there
+
+    assert section.dependencies == ("Program Description", "Staffing Model")
+    assert path.read_text() == (
+        original.replace("In Progress", "Gate Review").replace("Gate 3", "Gate 4")
+    )
+    assert load_plan(path).find("Staffing Model").status == "Gate Review"
+
+
+def test_structured_edits_reread_a_plan_changed_behind_the_cache(tmp_path: Path):
+    path = _workspace(tmp_path)
+    load_plan(path)
+    stat = path.stat()
+
+    # Same size and mtime, but the offsets of the sections have moved.
+    edited = PLAN.replace("Peer Naloxone", "Peer Naloxone!").replace(
+        "Quality Gates", "Quality Gate"
+    )
+    path.write_text(edited)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    set_status(path, "Staffing Model", "Passed")
+
+    assert path.read_text() == edited.replace("**Status**: In Progress", "**Status**: Passed")
+    assert load_plan(path).find("Staffing Model").passed
+
+
+def test_structured_edits_insert_missing_field_and_reject_cycles(tmp_path: Path):
+    path = _workspace(tmp_path, PLAN.replace("**Status**: Not Started\n", "", 1))
+
+    set_status(path, "Budget Justification", "Blocked")
+
+    budget = load_plan(path).find("Budget Justification")
+    assert budget.status == "Blocked"
+    assert "**Dependencies**: Program Description, Staffing Model\n**Status**: Blocked\n" in (
+        path.read_text()
+    )
+    with pytest.raises(ValueError, match="cycle"):
+        add_dependency(path, "Program Description", "Budget Justification")
+    with pytest.raises(ValueError, match="not found"):
+        set_status(path, "Evaluation", "Passed")
+
+
+def test_added_dependencies_on_kit_section_names_read_back(tmp_path: Path):
+    path = _workspace(tmp_path, KIT_PLAN)
+
+    add_dependency(path, "Appendix", "Section 9")
+    add_dependency(path, "Appendix", "Risks, Assumptions")
+
+    plan = load_plan(path)
+    assert plan.find("Appendix").fields["Dependencies"] == (
+        "Monitoring and Evaluation (after analysis), "
+        "Next Steps & Sustainability (Final Reports), Section 12"
+    )
+    assert [d.number for d in plan.resolve(plan.find("Appendix"))[0]] == [10, 9, 12]
+
+
+def test_gate_check_records_result(tmp_path: Path):
+    path = _workspace(tmp_path)
+    os.chdir(tmp_path)
+
+    result = runner.invoke(app, ["gate-check", "Staffing Model", "--record", "passed"])
+
+    assert result.exit_code == 0, result.output
+    assert load_plan(path).find("Staffing Model").passed
+
+
+def test_gate_check_records_failed_for_blocked_section(tmp_path: Path, monkeypatch):
+    path = _workspace(tmp_path)
+    os.chdir(tmp_path)
+
+    passed = runner.invoke(app, ["gate-check", "Budget Justification", "--record", "Passed"])
+    failed = runner.invoke(app, ["gate-check", "Budget Justification", "--record", "Failed"])
+
+    assert passed.exit_code == 1 and "Cannot record Passed" in passed.output
+    assert failed.exit_code == 1, failed.output
+    assert load_plan(path).find("Budget Justification").status == "Failed"
+
+    def locked(*args):
+        raise LockTimeout(path, 30)
+
+    monkeypatch.setattr("nuaa_cli.commands.gate_check.set_status", locked)
+    result = runner.invoke(app, ["gate-check", "Program Description", "--record", "Passed"])
+    assert result.exit_code == 1
+    assert "Error recording result" in result.output and "Timed out" in result.output
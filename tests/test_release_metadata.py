@@ -0,0 +1,96 @@
+"""Tests for the shared release-metadata cache used by version, check and init."""
+
+import os
+import time
+
+import pytest
+from typer.testing import CliRunner
+
+from nuaa_cli import app, releases
+from nuaa_cli.cache import TemplateCache, slim_release
+from nuaa_cli.config import RELEASES_LATEST_URL
+
+RELEASE = {
+    "tag_name": "v1.2.0",
+    "published_at": "2025-11-12T09:30:00Z",
+    "body": "long release notes " * 100,
+    "author": {"login": "someone"},
+    "assets": [
+        {
+            "name": "nuaa-template-claude-sh-v1.2.0.zip",
+            "size": 123,
+            "browser_download_url": "https://example.org/a.zip",
+            "uploader": {"login": "someone"},
+        }
+    ],
+}
+
+
+@pytest.fixture
+def cache() -> TemplateCache:
+    return TemplateCache()
+
+
+@pytest.fixture
+def spawned(monkeypatch) -> list[list[str]]:
+    """Record background refresh processes instead of starting them."""
+    calls: list[list[str]] = []
+    monkeypatch.setattr(releases.subprocess, "Popen", lambda args, **kwargs: calls.append(args))
+    return calls
+
+
+def _age(cache: TemplateCache, seconds: float) -> None:
+    index = cache._load()
+    index["releases"][RELEASES_LATEST_URL]["fetched_at"] = time.time() - seconds
+    cache._save(index)
+
+
+def test_store_release_keeps_only_used_fields(cache: TemplateCache):
+    cache.store_release(RELEASES_LATEST_URL, None, RELEASE)
+
+    etag, data = cache.release(RELEASES_LATEST_URL)
+    assert etag is None
+    assert data == slim_release(RELEASE)
+    assert "body" not in data and "uploader" not in data["assets"][0]
+    assert cache.release_age(RELEASES_LATEST_URL) < 5
+
+
+def test_version_reads_fresh_cache_without_refreshing(cache: TemplateCache, spawned):
+    cache.store_release(RELEASES_LATEST_URL, '"e1"', RELEASE)
+
+    result = CliRunner().invoke(app, ["version"])
+
+    assert result.exit_code == 0, result.output
+    assert "1.2.0" in result.output and "2025-11-12" in result.output
+    assert spawned == []
+
+
+def test_stale_cache_is_served_and_refreshed_once(cache: TemplateCache, spawned):
+    cache.store_release(RELEASES_LATEST_URL, '"e1"', RELEASE)
+    _age(cache, 7200)
+
+    assert releases.cached_latest_release(cache)["tag_name"] == "v1.2.0"
+    assert releases.cached_latest_release(cache)["tag_name"] == "v1.2.0"
+
+    assert len(spawned) == 1
+    assert spawned[0][-2:] == ["nuaa_cli.releases", str(cache.root)]
+    assert (cache.root / "release-refresh.lock").exists()
+
+
+def test_check_never_waits_on_github(cache: TemplateCache, spawned, monkeypatch):
+    monkeypatch.setenv("PATH", os.defpath)
+
+    result = CliRunner().invoke(app, ["check"])
+    assert result.exit_code == 0, result.output
+    assert len(spawned) == 1
+
+    cache.store_release(RELEASES_LATEST_URL, None, RELEASE)
+    result = CliRunner().invoke(app, ["check"])
+    assert "Latest templates: v1.2.0 (released 2025-11-12)" in result.output
+
+
+def test_background_refresh_can_be_disabled(cache: TemplateCache, spawned, monkeypatch):
+    monkeypatch.setenv("NUAA_RELEASE_REFRESH", "0")
+
+    assert releases.refresh_in_background(cache) is False
+    assert spawned == []
@@ -0,0 +1,127 @@
+"""Tests for local rendering of agent template packages."""
+
+import os
+import shutil
+import subprocess
+import zipfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.config import AGENT_CONFIG
+from nuaa_cli.render import build_release_packages, package_files, render_command
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+RELEASE_SCRIPT = REPO_ROOT / ".github" / "workflows" / "scripts" / "create-release-packages.sh"
+
+COMMAND_SOURCE = """\
+---
+description: Draft a section for __AGENT__
+scripts:
+  sh: scripts/bash/create-section-draft.sh --json "{ARGS}"
+  ps: scripts/powershell/create-section-draft.ps1 -Json "{ARGS}"
+agent_scripts:
+  sh: scripts/bash/update-agent-context.sh __AGENT__
+  ps: scripts/powershell/update-agent-context.ps1 -AgentType __AGENT__
+---
+
+Run `{SCRIPT}` then `{AGENT_SCRIPT}`.
+User input: {ARGS}
+See templates/section-template.md and memory/constitution.md. Escape \\d here.
+"""
+
+
+def _kit(root: Path) -> Path:
+    (root / "nuaa-kit" / "commands").mkdir(parents=True)
+    (root / "nuaa-kit" / "templates").mkdir(parents=True)
+    (root / "scripts" / "bash").mkdir(parents=True)
+    (root / "scripts" / "powershell").mkdir(parents=True)
+    (root / "memory").mkdir()
+    (root / "nuaa-kit" / "commands" / "draft.md").write_text(COMMAND_SOURCE)
+    (root / "nuaa-kit" / "commands" / "status.md").write_text("# Status\n\n{ARGS}\n\n\n")
+    (root / "nuaa-kit" / "templates" / "section-template.md").write_text("# [SECTION]\n")
+    (root / "scripts" / "bash" / "common.sh").write_text("#!/usr/bin/env bash\n")
+    (root / "scripts" / "powershell" / "common.ps1").write_text("# common\n")
+    (root / "memory" / "constitution.md").write_text("# Constitution\n")
+    return root
+
+
+def test_render_command_substitutes_placeholders(tmp_path: Path):
+    source = _kit(tmp_path) / "nuaa-kit" / "commands" / "draft.md"
+
+    claude = render_command(source, "claude", "sh")
+    assert "scripts:" not in claude and "agent_scripts:" not in claude
+    assert 'Run `.nuaa/scripts/bash/create-section-draft.sh --json "$ARGUMENTS"`' in claude
+    assert "update-agent-context.sh claude`" in claude
+    assert "See .nuaa/templates/section-template.md" in claude
+
+    gemini = render_command(source, "gemini", "ps")
+    assert gemini.startswith('description = "Draft a section for __AGENT__"\n\nprompt = """\n')
+    assert "-AgentType gemini" in gemini and "{{args}}" in gemini
+    assert "Escape \\\\d here." in gemini
+
+
+def test_render_command_is_memoized_until_source_changes(tmp_path: Path):
+    source = _kit(tmp_path) / "nuaa-kit" / "commands" / "status.md"
+    first = render_command(source, "claude", "sh")
+    assert render_command(source, "claude", "sh") is first
+
+    source.write_text("# Status v2\n")
+    os.utime(source, ns=(0, 1))
+    assert render_command(source, "claude", "sh") == "# Status v2\n"
+
+
+def test_copilot_package_has_prompt_files(tmp_path: Path):
+    files = package_files("copilot", "sh", root=_kit(tmp_path), version="v1.2.3")
+    prompt = files[".github/prompts/nuaa.status.prompt.md"]
+    assert prompt.startswith("---\nagent: nuaa.status\nversion: v1.2.3\n")
+    assert prompt.endswith(files[".github/agents/nuaa.status.agent.md"])
+    assert ".nuaa/scripts/bash/common.sh" in files
+    assert ".nuaa/scripts/powershell/common.ps1" not in files
+
+
+@pytest.mark.skipif(not (shutil.which("bash") and shutil.which("zip")), reason="needs bash and zip")
+def test_matches_release_script_output(tmp_path: Path):
+    """Every agent/script package is byte-identical to create-release-packages.sh."""
+    kit = _kit(tmp_path / "kit")
+    script_dir = kit / ".github" / "workflows" / "scripts"
+    script_dir.mkdir(parents=True)
+    shutil.copy2(RELEASE_SCRIPT, script_dir)
+    result = subprocess.run(
+        ["bash", str(script_dir / RELEASE_SCRIPT.name), "v9.9.9"],
+        cwd=kit,
+        capture_output=True,
+        text=True,
+        timeout=300,
+    )
+    assert result.returncode == 0, result.stderr
+
+    archives = build_release_packages(tmp_path / "py", version="v9.9.9", root=kit)
+    assert len(archives) == len(AGENT_CONFIG) * 2
+    for archive in archives:
+        with zipfile.ZipFile(kit / ".genreleases" / archive.name) as expected_zip:
+            expected = {
+                n: expected_zip.read(n) for n in expected_zip.namelist() if not n.endswith("/")
+            }
+        with zipfile.ZipFile(archive) as actual_zip:
+            actual = {n: actual_zip.read(n) for n in actual_zip.namelist()}
+        assert actual == expected, archive.name
+
+
+def test_init_renders_locally(tmp_path: Path):
+    os.chdir(tmp_path)
+    result = CliRunner().invoke(
+        app,
+        ["init", "demo", "--ai", "gemini", "--script", "sh", "--no-git", "--ignore-agent-tools"],
+    )
+
+    assert result.exit_code == 0, result.output
+    project = tmp_path / "demo"
+    assert (project / ".gemini" / "commands" / "nuaa.design.toml").is_file()
+    assert (project / ".nuaa" / "templates" / "program-design.md").is_file()
+    script = project / ".nuaa" / "scripts" / "bash" / "common.sh"
+    assert script.is_file()
+    if os.name != "nt":
+        assert os.access(script, os.X_OK)
@@ -0,0 +1,80 @@
+"""Tests for the parallel drafting scheduler."""
+
+import json
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.planfile import parse_plan
+from nuaa_cli.schedule import build_schedule, parallel_waves
+
+runner = CliRunner()
+
+
+def _plan(*sections: tuple[str, str, str, str]) -> str:
+    blocks = ["# Document Plan\n"]
+    for number, (name, deps, words, status) in enumerate(sections, start=1):
+        blocks.append(
+            f"### Section {number}: {name}\n\n"
+            f"**Gate**: Gate 1 - Structure\n"
+            f"**Dependencies**: {deps}\n"
+            f"**Estimated Length**: {words}\n"
+            f"**Status**: {status}\n"
+        )
+    return "\n".join(blocks)
+
+
+PLAN = _plan(
+    ("Summary", "None", "2 paragraphs (200 words)", "Passed"),
+    ("Context", "Section 1", "800 words", "Not Started"),
+    ("Population", "Section 1", "400 words", "Not Started"),
+    ("Program", "Context, Population", "4-5 paragraphs (600-800 words)", "In Progress"),
+    ("Staffing", "Section 3", "300 words", "Not Started"),
+    ("Budget", "Program, Staffing", "500 words", "Not Started"),
+)
+
+
+def test_waves_and_critical_path():
+    plan = parse_plan(PLAN.encode())
+
+    waves = [[s.name for s in wave] for wave in parallel_waves(plan)]
+    schedule = build_schedule(plan, agents=2)
+
+    assert waves == [["Context", "Population"], ["Program", "Staffing"], ["Budget"]]
+    assert [s.name for s in schedule.critical_path] == ["Context", "Program", "Budget"]
+    assert schedule.critical_length == 2000
+    assert schedule.total == 2700
+
+
+def test_agent_assignment_respects_dependencies():
+    plan = parse_plan(PLAN.encode())
+
+    schedule = build_schedule(plan, agents=2)
+    ends = {slot.section.name: slot.end for slot in schedule.slots}
+    starts = {slot.section.name: slot.start for slot in schedule.slots}
+
+    assert starts["Program"] >= max(ends["Context"], ends["Population"])
+    assert starts["Budget"] >= max(ends["Program"], ends["Staffing"])
+    assert schedule.makespan == schedule.lower_bound == 2000
+    assert build_schedule(plan, agents=1).makespan == 2700
+
+
+def test_schedule_command_json(tmp_path: Path):
+    folder = tmp_path / "initiatives" / "001-naloxone"
+    folder.mkdir(parents=True)
+    (folder / "plan.md").write_text(PLAN)
+    os.chdir(tmp_path)
+
+    result = runner.invoke(app, ["schedule", "--agents", "3", "--json"])
+
+    assert result.exit_code == 0, result.output
+    document = json.loads(result.output)
+    assert document["agents"] == 3
+    assert document["makespan"] == 2000
+    assert len(document["assignments"]) == 5
+
+    table = runner.invoke(app, ["schedule"])
+    assert table.exit_code == 0, table.output
+    assert "Critical path" in table.output
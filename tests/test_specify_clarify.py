@@ -18,37 +18,20 @@ def _copy_templates(templates_src: Path, kit_dir: Path, names: list[str]) -> Non
             dst.write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
 
 
-def _copy_scripts(scripts_src: Path, scripts_dir: Path, names: list[str]) -> None:
-    """Copy specified scripts from source to destination."""
-    for name in names:
-        src = scripts_src / name
-        dst = scripts_dir / name
-        if src.exists():
-            dst.parent.mkdir(parents=True, exist_ok=True)
-            dst.write_text(src.read_text(encoding="utf-8"), encoding="utf-8")
-            # Make executable
-            dst.chmod(0o755)
-
-
 def test_specify_creates_initiative(tmp_path: Path):
     """Test that specify command creates an initiative with spec file."""
     repo_root = Path(__file__).resolve().parents[1]
     templates_src = repo_root / "nuaa-kit" / "templates"
-    scripts_src = repo_root / "scripts" / "bash"
-    
+
     assert templates_src.is_dir(), "templates not found; run tests from repository root"
-    assert scripts_src.is_dir(), "scripts not found; run tests from repository root"
     
     # Setup temporary project
     project_root = tmp_path
     kit_dir = project_root / "nuaa-kit" / "templates"
     kit_dir.mkdir(parents=True, exist_ok=True)
-    scripts_dir = project_root / "scripts" / "bash"
-    scripts_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Copy required template and script
+
+    # Copy required template
     _copy_templates(templates_src, kit_dir, ["program-specification-template.md"])
-    _copy_scripts(scripts_src, scripts_dir, ["create-new-initiative.sh"])
     
     # Run from project directory
     cwd = os.getcwd()
@@ -186,17 +169,13 @@ def test_specify_auto_increment(tmp_path: Path):
     """Test that multiple specify commands create auto-incrementing initiatives."""
     repo_root = Path(__file__).resolve().parents[1]
     templates_src = repo_root / "nuaa-kit" / "templates"
-    scripts_src = repo_root / "scripts" / "bash"
-    
+
     # Setup project
     project_root = tmp_path
     kit_dir = project_root / "nuaa-kit" / "templates"
     kit_dir.mkdir(parents=True, exist_ok=True)
-    scripts_dir = project_root / "scripts" / "bash"
-    scripts_dir.mkdir(parents=True, exist_ok=True)
-    
+
     _copy_templates(templates_src, kit_dir, ["program-specification-template.md"])
-    _copy_scripts(scripts_src, scripts_dir, ["create-new-initiative.sh"])
     
     cwd = os.getcwd()
     os.chdir(project_root)
@@ -222,3 +201,71 @@ def test_specify_auto_increment(tmp_path: Path):
         
     finally:
         os.chdir(cwd)
+
+
+def test_apply_answers_rebuilds_spec_in_one_pass():
+    """Answers are spliced at the marker spans; answer text is never rescanned."""
+    from nuaa_cli.clarifications import apply_answers, find_clarifications, match_answers
+
+    who, when = "[NEEDS CLARIFICATION: Who?]", "[NEEDS CLARIFICATION: When?]"
+    text = f"A {who} B {when} C {who}"
+    clarifications = find_clarifications(text)
+    matched = match_answers(clarifications, {"Who?": when, 2: "2026", 9: "x"})
+
+    assert matched.unused == [9]
+    assert apply_answers(text, clarifications, matched.answers) == f"A {when} B 2026 C {when}"
+
+
+def test_clarify_applies_answer_files_across_initiatives(tmp_path: Path):
+    """--answers resolves markers by question or index without prompting."""
+    for name in ("001-naloxone", "002-outreach"):
+        folder = tmp_path / "initiatives" / name
+        folder.mkdir(parents=True)
+        (folder / "spec.md").write_text(
+            "Ages: [NEEDS CLARIFICATION: What age range?]\n"
+            "Length: [NEEDS CLARIFICATION: Pilot or ongoing?]\n",
+            encoding="utf-8",
+        )
+    (tmp_path / "answers.jsonl").write_text(
+        '{"initiative": "001-naloxone", "question": "What age range?", "answer": "18+"}\n'
+        '{"initiative": "001-naloxone", "index": 2, "answer": "Pilot"}\n'
+        '{"initiative": "002-outreach", "index": 1, "answer": "18-35"}\n',
+        encoding="utf-8",
+    )
+    (tmp_path / "bad.jsonl").write_text('{"question": "What age range?"}\n', encoding="utf-8")
+
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        runner = CliRunner()
+        result = runner.invoke(app, ["clarify", "--answers", "answers.jsonl"])
+        bad = runner.invoke(app, ["clarify", "--answers", "bad.jsonl"])
+    finally:
+        os.chdir(cwd)
+
+    assert result.exit_code == 0, result.output
+    assert "Resolved 3 clarification(s) in 2 specification(s)" in result.output
+    first = (tmp_path / "initiatives" / "001-naloxone" / "spec.md").read_text(encoding="utf-8")
+    second = (tmp_path / "initiatives" / "002-outreach" / "spec.md").read_text(encoding="utf-8")
+    assert first == "Ages: 18+\nLength: Pilot\n"
+    assert second == "Ages: 18-35\nLength: [NEEDS CLARIFICATION: Pilot or ongoing?]\n"
+    assert bad.exit_code == 1
+    assert "entry 1: missing answer" in bad.output
+
+
+def test_load_answers_reads_yaml_mappings(tmp_path: Path):
+    """YAML answers may be flat or nested under initiative names."""
+    import pytest
+
+    pytest.importorskip("yaml")
+    from nuaa_cli.clarifications import load_answers
+
+    path = tmp_path / "answers.yaml"
+    path.write_text(
+        "What age range?: All adults\n001-naloxone:\n  2: Ongoing service\n", encoding="utf-8"
+    )
+
+    assert load_answers(path) == {
+        None: {"What age range?": "All adults"},
+        "001-naloxone": {2: "Ongoing service"},
+    }
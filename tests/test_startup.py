@@ -0,0 +1,113 @@
+"""Startup benchmarks: import cost and time-to-first-output per subcommand.
+
+Budgets are deliberately generous so the suite stays stable on slow CI
+runners; override them with NUAA_IMPORT_BUDGET_MS / NUAA_FIRST_OUTPUT_BUDGET_MS
+when profiling locally. The module-isolation checks are exact and catch an
+eager import of the network stack regardless of machine speed.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+IMPORT_BUDGET_MS = float(os.getenv("NUAA_IMPORT_BUDGET_MS", "1500"))
+FIRST_OUTPUT_BUDGET_MS = float(os.getenv("NUAA_FIRST_OUTPUT_BUDGET_MS", "3000"))
+
+# Modules only network or interactive commands are allowed to load
+HEAVY_MODULES = [
+    "httpx",
+    "truststore",
+    "ssl",
+    "readchar",
+    "rich.live",
+    "rich.progress",
+    "rich.tree",
+]
+
+# Commands that never touch the network
+LOCAL_COMMANDS = [
+    ["status"],
+    ["refine", "Example Program"],
+    ["plan"],
+    ["draft", "Program Description"],
+    ["revise", "Program Description"],
+    ["assemble"],
+    ["review"],
+    ["clarify"],
+    ["gate-check", "Program Description"],
+    ["lint", "placeholders"],
+    ["inventory"],
+]
+
+
+def _python(*args: str, cwd: Path | None = None) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+        timeout=60,
+    )
+
+
+def _imported_modules(stderr: str) -> set[str]:
+    """Parse module names from ``python -X importtime`` output."""
+    modules = set()
+    for line in stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            modules.add(line.rsplit("|", 1)[1].strip())
+    return modules
+
+
+def test_import_does_not_load_network_stack():
+    """Importing the package must not pull in the HTTP/TLS or interactive stack."""
+    code = (
+        "import json, sys, nuaa_cli; "
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    result = _python("-c", code)
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout) == []
+
+
+def test_import_time_budget():
+    """Cumulative import time of nuaa_cli stays within budget."""
+    result = _python("-X", "importtime", "-c", "import nuaa_cli")
+    assert result.returncode == 0, result.stderr
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and line.rstrip().endswith("| nuaa_cli"):
+            cumulative_us = int(line.split("|")[1])
+    assert cumulative_us is not None, result.stderr
+    elapsed_ms = cumulative_us / 1000
+    print(f"import nuaa_cli: {elapsed_ms:.1f} ms")
+    assert elapsed_ms < IMPORT_BUDGET_MS
+
+
+@pytest.mark.parametrize("argv", LOCAL_COMMANDS, ids=lambda argv: argv[0])
+def test_local_command_startup(argv: list[str], tmp_path: Path):
+    """Local commands print their first output quickly and never import httpx."""
+    start = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-X", "importtime", "-m", "nuaa_cli", *argv],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        stdin=subprocess.DEVNULL,
+        cwd=tmp_path,
+    )
+    assert proc.stdout is not None
+    first_byte = proc.stdout.read(1)
+    first_output_ms = (time.perf_counter() - start) * 1000
+    _, stderr = proc.communicate(timeout=60)
+
+    assert first_byte, "command produced no output"
+    print(f"nuaa {argv[0]}: first output after {first_output_ms:.1f} ms")
+    assert first_output_ms < FIRST_OUTPUT_BUDGET_MS
+
+    loaded = _imported_modules(stderr.decode("utf-8", "replace"))
+    assert not loaded & set(HEAVY_MODULES), sorted(loaded & set(HEAVY_MODULES))
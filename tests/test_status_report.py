@@ -0,0 +1,111 @@
+"""Tests for the computed `nuaa status` report."""
+
+import json
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.progress import STATUS_CACHE, StatusCache
+
+runner = CliRunner()
+
+PLAN = """# Document Plan
+
+### Section 1: Program Description
+
+**Gate**: Gate 1 - Initial Structure
+**Dependencies**: None
+**Status**: Passed
+
+### Section 2: Staffing Model
+
+**Gate**: Gate 2 - Core Content
+**Dependencies**: Section 1
+**Status**: In Progress
+
+### Section 3: Target Population
+
+**Gate**: Gate 2 - Core Content
+**Dependencies**: Section 1
+**Status**: Not Started
+
+### Section 4: Budget Justification
+
+**Gate**: Gate 3 - Evidence
+**Dependencies**: Staffing Model, Target Population
+**Status**: Not Started
+"""
+
+
+def _initiative(root: Path) -> Path:
+    folder = root / "initiatives" / "001-naloxone"
+    (folder / "sections").mkdir(parents=True)
+    (folder / "plan.md").write_text(PLAN)
+    (folder / "sections" / "program-description.md").write_text("Peer workers carry kits.\n")
+    return folder
+
+
+def test_status_report_numbers(tmp_path: Path):
+    folder = _initiative(tmp_path)
+
+    report = StatusCache(tmp_path).report("001-naloxone")
+
+    assert (report["total"], report["passed"], report["completion"]) == (4, 1, 25.0)
+    assert report["gates"]["2"] == {
+        "total": 2,
+        "passed": 0,
+        "in_progress": 1,
+        "failed": 0,
+        "remaining": 1,
+        "pass_rate": 0,
+    }
+    assert [s["state"] for s in report["sections"]] == ["passed", "in_progress", "ready", "blocked"]
+    assert report["sections"][0]["words"] == 4
+    assert report["next"] == ["Target Population"]
+    assert report["blocked"] == [
+        {
+            "section": "Budget Justification",
+            "blockers": [
+                "Staffing Model (status: In Progress)",
+                "Target Population (status: Not Started)",
+            ],
+        }
+    ]
+    assert report["critical_path"] == {
+        "length": 2,
+        "sections": ["Staffing Model", "Budget Justification"],
+    }
+    assert (tmp_path / STATUS_CACHE).is_file()
+    assert (tmp_path / STATUS_CACHE).with_name(".gitignore").read_text().endswith("\n*\n")
+    assert report["initiative"] == folder.name
+
+
+def test_status_cache_invalidated_by_draft(tmp_path: Path, monkeypatch):
+    folder = _initiative(tmp_path)
+    StatusCache(tmp_path).report("001-naloxone")
+
+    def no_compute(*args, **kwargs):
+        raise AssertionError("report recomputed")
+
+    with monkeypatch.context() as m:
+        m.setattr("nuaa_cli.progress.compute_status", no_compute)
+        assert StatusCache(tmp_path).report("001-naloxone")["drafted"] == 1
+
+    (folder / "sections" / "staffing-model.md").write_text("Two coordinators.\n")
+    assert StatusCache(tmp_path).report("001-naloxone")["drafted"] == 2
+
+
+def test_status_json_output(tmp_path: Path):
+    _initiative(tmp_path)
+    os.chdir(tmp_path)
+
+    result = runner.invoke(app, ["status", "--json"])
+
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["next"] == ["Target Population"]
+
+    table = runner.invoke(app, ["status"])
+    assert table.exit_code == 0, table.output
+    assert "25.0%" in table.output and "Gate Summary" in table.output
@@ -0,0 +1,191 @@
+"""Tests for the content-addressed template archive cache."""
+
+import hashlib
+import io
+import time
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import httpx
+
+from nuaa_cli.cache import TemplateCache
+from nuaa_cli.download import (
+    download_and_extract_template,
+    download_template_from_github,
+    fetch_asset_into_cache,
+)
+from nuaa_cli.github import RELEASES_LATEST_URL
+
+ASSET_NAME = "nuaa-template-claude-sh-v1.0.0.zip"
+ASSET_URL = f"https://github.com/example/releases/download/v1.0.0/{ASSET_NAME}"
+
+
+def _zip_bytes() -> bytes:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("nuaa-template/README.md", "# Template\n")
+        zf.writestr("nuaa-template/.claude/commands/nuaa.design.md", "design\n")
+    return buf.getvalue()
+
+
+class FakeGitHub:
+    """Minimal releases API + asset host that honours If-None-Match."""
+
+    def __init__(self, payload: bytes, delay: float = 0):
+        self.payload = payload
+        self.delay = delay  # seconds an asset download takes
+        self.requests: list[tuple[str, int]] = []
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        url = str(request.url)
+        if url == RELEASES_LATEST_URL:
+            if request.headers.get("If-None-Match") == '"r1"':
+                self.requests.append((url, 304))
+                return httpx.Response(304)
+            self.requests.append((url, 200))
+            release = {
+                "tag_name": "v1.0.0",
+                "assets": [
+                    {
+                        "name": ASSET_NAME,
+                        "size": len(self.payload),
+                        "browser_download_url": ASSET_URL,
+                        "digest": "sha256:" + hashlib.sha256(self.payload).hexdigest(),
+                    }
+                ],
+            }
+            return httpx.Response(200, json=release, headers={"ETag": '"r1"'})
+        if url == ASSET_URL:
+            self.requests.append((url, 200))
+            time.sleep(self.delay)
+            return httpx.Response(200, content=self.payload)
+        return httpx.Response(404)
+
+    def client(self) -> httpx.Client:
+        return httpx.Client(transport=httpx.MockTransport(self.handler))
+
+
+def test_cache_add_lookup_and_dedupe(tmp_path: Path):
+    cache = TemplateCache(tmp_path / "cache")
+    for tag in ("v1", "v2"):
+        src = tmp_path / f"{tag}.zip"
+        src.write_bytes(b"same bytes")
+        cache.add(tag, "asset.zip", src)
+
+    first = cache.lookup("v1", "asset.zip")
+    second = cache.lookup("v2", "asset.zip")
+    assert first is not None and first == second
+    assert first.name == hashlib.sha256(b"same bytes").hexdigest()
+    assert len(list(cache.blobs_dir.iterdir())) == 1
+    assert cache.lookup("v3", "asset.zip") is None
+
+
+def test_concurrent_adds_keep_every_entry(tmp_path: Path):
+    cache = TemplateCache(tmp_path / "cache")
+    sources = []
+    for n in range(16):
+        src = tmp_path / f"{n}.zip"
+        src.write_bytes(f"archive {n}".encode())
+        sources.append(src)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda src: cache.add("v1", src.name, src), sources))
+
+    assert all(cache.lookup("v1", src.name) is not None for src in sources)
+    assert sorted(p.name for p in cache.root.iterdir()) == ["blobs", "index.json"]
+
+
+def test_cache_evicts_least_recently_used(tmp_path: Path):
+    cache = TemplateCache(tmp_path / "cache", max_bytes=25)
+    for name in ("a", "b", "c"):
+        src = tmp_path / name
+        src.write_bytes(name.encode() * 10)
+        cache.add("v1", name, src)
+        if name == "b":
+            assert cache.lookup("v1", "a") is not None  # a is now more recent than b
+
+    assert cache.lookup("v1", "b") is None
+    assert cache.lookup("v1", "a") is not None
+    assert cache.lookup("v1", "c") is not None
+    assert len(list(cache.blobs_dir.iterdir())) == 2
+
+
+def test_warm_download_makes_no_requests(tmp_path: Path):
+    github = FakeGitHub(_zip_bytes())
+    cache = TemplateCache(tmp_path / "cache")
+
+    with github.client() as client:
+        cold_zip, cold_meta = download_template_from_github(
+            "claude", tmp_path, verbose=False, show_progress=False, client=client, cache=cache
+        )
+    assert cold_meta["cached"] is True
+    assert [status for _, status in github.requests] == [200, 200]
+    assert not list(cache.tmp_dir.iterdir())
+
+    github.requests.clear()
+    with github.client() as client:
+        warm_zip, warm_meta = download_template_from_github(
+            "claude", tmp_path, verbose=False, show_progress=False, client=client, cache=cache
+        )
+    assert github.requests == []
+    assert warm_zip == cold_zip
+    assert warm_meta["release"] == "v1.0.0"
+
+
+def test_concurrent_fetches_share_one_download(tmp_path: Path):
+    payload = _zip_bytes()
+    github = FakeGitHub(payload, delay=0.2)
+    cache = TemplateCache(tmp_path / "cache")
+    asset = {
+        "name": ASSET_NAME,
+        "browser_download_url": ASSET_URL,
+        "digest": "sha256:" + hashlib.sha256(payload).hexdigest(),
+    }
+
+    def fetch(_):
+        with github.client() as client:
+            return fetch_asset_into_cache(client, cache, "v1.0.0", asset, show_progress=False)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(fetch, range(4)))
+
+    assert github.requests == [(ASSET_URL, 200)]
+    assert len({blob for blob, _ in results}) == 1
+    assert sorted(cached for _, cached in results) == [False, True, True, True]
+    assert results[0][0].read_bytes() == payload
+    assert not list(cache.tmp_dir.iterdir())
+
+
+def test_stale_release_metadata_is_revalidated(tmp_path: Path, monkeypatch):
+    github = FakeGitHub(_zip_bytes())
+    cache = TemplateCache(tmp_path / "cache")
+    with github.client() as client:
+        download_template_from_github(
+            "claude", tmp_path, verbose=False, show_progress=False, client=client, cache=cache
+        )
+
+    monkeypatch.setenv("NUAA_RELEASE_TTL", "0")
+    github.requests.clear()
+    with github.client() as client:
+        _, meta = download_template_from_github(
+            "claude", tmp_path, verbose=False, show_progress=False, client=client, cache=cache
+        )
+    assert github.requests == [(RELEASES_LATEST_URL, 304)]
+    assert meta["release"] == "v1.0.0"
+    assert cache.release_age(RELEASES_LATEST_URL) < 5
+
+
+def test_extract_from_cache_keeps_archive(tmp_path: Path):
+    github = FakeGitHub(_zip_bytes())
+    cache = TemplateCache(tmp_path / "cache")
+    project = tmp_path / "project"
+
+    with github.client() as client:
+        download_and_extract_template(
+            project, "claude", "sh", verbose=False, client=client, cache=cache
+        )
+
+    assert (project / "README.md").is_file()
+    assert (project / ".claude" / "commands" / "nuaa.design.md").is_file()
+    assert cache.lookup("v1.0.0", ASSET_NAME) is not None
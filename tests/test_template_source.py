@@ -0,0 +1,109 @@
+"""Tests for offline template sources (local zips, asset directories and bundles)."""
+
+import hashlib
+import io
+import os
+import zipfile
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.bundle import resolve_template_source, write_bundle
+from nuaa_cli.download import download_and_extract_template
+
+runner = CliRunner()
+
+
+def _template_zip(path: Path, marker: str = "v1") -> Path:
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as zf:
+        zf.writestr("nuaa-template/README.md", f"# Template {marker}\n")
+        zf.writestr("nuaa-template/.claude/commands/nuaa.design.md", "design\n")
+    path.write_bytes(buf.getvalue())
+    return path
+
+
+def _bundle(tmp_path: Path) -> Path:
+    archives = []
+    for agent in ("claude", "gemini"):
+        asset = _template_zip(tmp_path / f"nuaa-template-{agent}-sh-v1.2.0.zip", agent)
+        archives.append((asset.name, asset, hashlib.sha256(asset.read_bytes()).hexdigest()))
+    bundle = write_bundle(tmp_path / "out" / "nuaa-templates-v1.2.0.zip", "v1.2.0", archives)
+    for _, asset, _ in archives:
+        asset.unlink()
+    return bundle
+
+
+def test_local_zip_is_extracted_and_kept(tmp_path: Path):
+    source = _template_zip(tmp_path / "nuaa-template-claude-sh-v1.0.0.zip")
+    project = tmp_path / "project"
+
+    download_and_extract_template(
+        project, "claude", "sh", verbose=False, template_source=str(source)
+    )
+
+    assert (project / "README.md").read_text() == "# Template v1\n"
+    assert source.is_file()
+
+
+def test_asset_directory_picks_highest_version(tmp_path: Path):
+    mirror = tmp_path / "mirror"
+    mirror.mkdir()
+    _template_zip(mirror / "nuaa-template-claude-sh-v1.9.0.zip", "old")
+    _template_zip(mirror / "nuaa-template-claude-sh-v1.10.0.zip", "new")
+    _template_zip(mirror / "nuaa-template-gemini-sh-v2.0.0.zip", "gemini")
+
+    path, meta = resolve_template_source(mirror.as_uri(), "claude", "sh", tmp_path)
+
+    assert path.name == "nuaa-template-claude-sh-v1.10.0.zip"
+    assert meta["release"] == "v1.10.0"
+    assert meta["local"] is True
+
+
+def test_bundle_member_is_extracted_and_cleaned_up(tmp_path: Path):
+    bundle = _bundle(tmp_path)
+    project = tmp_path / "project"
+    work = tmp_path / "work"
+    work.mkdir()
+    os.chdir(work)
+
+    download_and_extract_template(
+        project, "gemini", "sh", verbose=False, template_source=str(bundle.parent)
+    )
+
+    assert (project / "README.md").read_text() == "# Template gemini\n"
+    assert list(work.iterdir()) == []
+    assert bundle.is_file()
+
+
+def test_bundle_without_matching_agent(tmp_path: Path):
+    bundle = _bundle(tmp_path)
+    with pytest.raises(FileNotFoundError, match="nuaa-template-qwen-sh"):
+        resolve_template_source(str(bundle), "qwen", "sh", tmp_path)
+
+
+def test_init_with_template_source(tmp_path: Path):
+    bundle = _bundle(tmp_path)
+    os.chdir(tmp_path)
+
+    result = runner.invoke(
+        app,
+        [
+            "init",
+            "demo",
+            "--ai",
+            "claude",
+            "--script",
+            "sh",
+            "--no-git",
+            "--ignore-agent-tools",
+            "--template-source",
+            str(bundle),
+        ],
+    )
+
+    assert result.exit_code == 0, result.output
+    assert (tmp_path / "demo" / ".claude" / "commands" / "nuaa.design.md").is_file()
+    assert not (tmp_path / "nuaa-template-claude-sh-v1.2.0.zip").exists()
@@ -0,0 +1,73 @@
+"""Tests for compiled single-pass template rendering."""
+
+import json
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.scaffold import _apply_replacements
+from nuaa_cli.templating import COMPILED_CACHE, compile_template, load_template
+
+REPO_TEMPLATES = Path(__file__).resolve().parents[1] / "nuaa-kit" / "templates"
+
+
+def test_render_fills_slots_in_one_pass():
+    """Values are not rescanned, and slots without a value stay as written."""
+    template = compile_template(
+        "# [Name]\n{{FUNDER}} funds [Name] from [Date]. See [x] {{OTHER}}\n"
+    )
+
+    assert len(template.literals) == len(template.slots) + 1
+    assert template.render({"[Name]": "{{FUNDER}}", "{{FUNDER}}": "PHN", "[Date]": "2026"}) == (
+        "# {{FUNDER}}\nPHN funds {{FUNDER}} from 2026. See [x] {{OTHER}}\n"
+    )
+    assert (
+        _apply_replacements(
+            "[Name] for [Timeframe] ({{AMOUNT}})",
+            {
+                "PROGRAM_NAME": "Outreach",
+                "DURATION": "6 months",
+                "AMOUNT": "$5000",
+            },
+        )
+        == "Outreach for 6 months ($5000)"
+    )
+
+
+def test_compiled_templates_are_cached_by_mtime(tmp_path: Path):
+    templates = tmp_path / ".nuaa" / "templates"
+    templates.mkdir(parents=True)
+    path = templates / "proposal.md"
+    path.write_text("Proposal for {{PROGRAM_NAME}}\n")
+
+    assert load_template(path).render({"{{PROGRAM_NAME}}": "Outreach"}) == "Proposal for Outreach\n"
+    [cache_file] = (tmp_path / "cache" / COMPILED_CACHE).iterdir()
+    cache = json.loads(cache_file.read_text())
+    assert cache["templates"]["proposal.md"]["slots"] == ["{{PROGRAM_NAME}}"]
+    assert sorted(p.name for p in templates.parent.iterdir()) == ["templates"]
+
+    path.write_text("Budget for {{PROGRAM_NAME}}: {{AMOUNT}}\n")
+    os.utime(path, ns=(1, 1))
+    assert load_template(path).slots == ("{{PROGRAM_NAME}}", "{{AMOUNT}}")
+
+
+def test_mission_set_fills_every_constitution_placeholder(tmp_path: Path):
+    kit = tmp_path / "nuaa-kit" / "templates"
+    kit.mkdir(parents=True)
+    name = "mission-constitution-template.md"
+    (kit / name).write_text((REPO_TEMPLATES / name).read_text(encoding="utf-8"))
+
+    cwd = os.getcwd()
+    os.chdir(tmp_path)
+    try:
+        result = CliRunner().invoke(app, ["mission", "--set", "Peer-led harm reduction"])
+    finally:
+        os.chdir(cwd)
+
+    assert result.exit_code == 0, result.output
+    constitution = (tmp_path / "memory" / "constitution.md").read_text(encoding="utf-8")
+    assert "Peer-led harm reduction" in constitution
+    assert "[CORE_MISSION]" not in constitution
+    assert "_COMMITMENT_" not in constitution and "_REQUIREMENT_" not in constitution
@@ -0,0 +1,143 @@
+"""Tests for manifest-driven incremental template upgrades."""
+
+import json
+import os
+from pathlib import Path
+
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.render import install_package, package_files
+from nuaa_cli.upgrade import (
+    INSTALL_MANIFEST,
+    apply_upgrade,
+    load_install,
+    merge3,
+    package_bytes,
+    plan_upgrade,
+    record_install,
+)
+
+runner = CliRunner()
+
+
+def _kit(root: Path, commands: dict[str, str]) -> Path:
+    for sub in ("nuaa-kit/commands", "nuaa-kit/templates", "scripts/bash", "memory"):
+        (root / sub).mkdir(parents=True, exist_ok=True)
+    for name, text in commands.items():
+        (root / "nuaa-kit" / "commands" / f"{name}.md").write_text(text)
+    (root / "nuaa-kit" / "templates" / "section-template.md").write_text("# [SECTION]\n")
+    (root / "scripts" / "bash" / "common.sh").write_text("#!/usr/bin/env bash\n")
+    (root / "memory" / "constitution.md").write_text("# Constitution\n")
+    return root
+
+
+def test_merge3_combines_independent_edits():
+    base = "title\none\ntwo\nthree\n"
+    ours = "title\none (local note)\ntwo\nthree\n"
+    theirs = "title\none\ntwo\nthree\nfour\n"
+
+    merged, conflicts = merge3(base, ours, theirs)
+
+    assert conflicts == 0
+    assert merged == "title\none (local note)\ntwo\nthree\nfour\n"
+
+
+def test_merge3_marks_overlapping_edits():
+    merged, conflicts = merge3("a\nb\nc\n", "a\nmine\nc\n", "a\ntheirs\nc\n", theirs_label="v2")
+
+    assert conflicts == 1
+    assert merged == "a\n<<<<<<< local\nmine\n=======\ntheirs\n>>>>>>> v2\nc\n"
+
+
+def test_upgrade_touches_only_changed_files(tmp_path: Path):
+    v1 = {
+        "status": "# Status\n\nShow progress.\n",
+        "draft": "# Draft\n\nStep one.\nStep two.\n",
+        "old": "# Old command\n",
+        "stable": "# Stable\n",
+    }
+    kit = _kit(tmp_path / "kit1", v1)
+    project = tmp_path / "project"
+    install_package(project, "claude", "sh", verbose=False, root=kit)
+    commands = project / ".claude" / "commands"
+    draft = commands / "nuaa.draft.md"
+    draft.write_text("# Draft\n\nStep one (our tweak).\nStep two.\n")
+    stable_mtime = (commands / "nuaa.stable.md").stat().st_mtime_ns
+
+    v2 = {
+        "status": "# Status\n\nShow progress and blockers.\n",
+        "draft": "# Draft\n\nStep one.\nStep two.\nStep three.\n",
+        "new": "# New command\n",
+        "stable": "# Stable\n",
+    }
+    target = package_bytes(package_files("claude", "sh", root=_kit(tmp_path / "kit2", v2)))
+    changes, unchanged = plan_upgrade(project, load_install(project), target, "v2")
+
+    actions = {change.path: change.action for change in changes}
+    assert actions == {
+        ".claude/commands/nuaa.status.md": "update",
+        ".claude/commands/nuaa.draft.md": "merge",
+        ".claude/commands/nuaa.new.md": "add",
+        ".claude/commands/nuaa.old.md": "remove",
+    }
+    assert unchanged == len(target) - 3
+
+    apply_upgrade(project, changes)
+    assert draft.read_text() == "# Draft\n\nStep one (our tweak).\nStep two.\nStep three.\n"
+    assert (commands / "nuaa.status.md").read_text().endswith("and blockers.\n")
+    assert (commands / "nuaa.new.md").is_file()
+    assert not (commands / "nuaa.old.md").exists()
+    assert (commands / "nuaa.stable.md").stat().st_mtime_ns == stable_mtime
+
+
+def test_merge_bases_live_in_the_project_and_are_pruned(tmp_path: Path):
+    project = tmp_path / "project"
+    bases = project / ".nuaa" / "cache" / "merge-bases"
+    first = record_install(
+        project, {"a.md": b"one\n", "b.md": b"two\n"}, release="v1", ai="claude", script="sh"
+    )
+    assert sorted(p.name for p in bases.iterdir()) == sorted(first["files"].values())
+
+    second = record_install(project, {"a.md": b"one\n"}, release="v2", ai="claude", script="sh")
+
+    assert [p.name for p in bases.iterdir()] == [second["files"]["a.md"]]
+    assert not (tmp_path / "cache" / "files").exists()
+
+
+def test_untracked_local_file_gets_sidecar(tmp_path: Path):
+    project = tmp_path / "project"
+    (project / "docs").mkdir(parents=True)
+    (project / "docs" / "guide.md").write_text("my guide\n")
+    record_install(project, {}, release="v1", ai="claude", script="sh")
+
+    changes, _ = plan_upgrade(project, load_install(project), {"docs/guide.md": b"new\n"}, "v2")
+    apply_upgrade(project, changes)
+
+    assert [c.action for c in changes] == ["sidecar"]
+    assert (project / "docs" / "guide.md").read_text() == "my guide\n"
+    assert (project / "docs" / "guide.md.nuaa-new").read_text() == "new\n"
+
+
+def test_upgrade_command_after_local_init(tmp_path: Path):
+    os.chdir(tmp_path)
+    result = runner.invoke(
+        app,
+        ["init", "demo", "--ai", "claude", "--script", "sh", "--no-git", "--ignore-agent-tools"],
+    )
+    assert result.exit_code == 0, result.output
+    manifest = json.loads((tmp_path / "demo" / INSTALL_MANIFEST).read_text())
+    assert manifest["ai"] == "claude" and ".claude/commands/nuaa.design.md" in manifest["files"]
+
+    os.chdir(tmp_path / "demo")
+    result = runner.invoke(app, ["upgrade"])
+    assert result.exit_code == 0, result.output
+    assert "0 file(s) to change" in result.output
+    assert "Already up to date" in result.output
+
+
+def test_upgrade_without_manifest_needs_agent(tmp_path: Path):
+    os.chdir(tmp_path)
+    result = runner.invoke(app, ["upgrade"])
+    assert result.exit_code == 1
+    assert "No template manifest found" in result.output
@@ -0,0 +1,130 @@
+"""Tests for the workspace index of feature and initiative folders."""
+
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from nuaa_cli import app
+from nuaa_cli.scaffold import (
+    _feature_dir_for_program,
+    _find_feature_dir_by_program,
+    _next_feature_dir,
+)
+from nuaa_cli.workspace import (
+    FEATURES,
+    INDEX_PATH,
+    INITIATIVES,
+    WorkspaceIndex,
+    latest_initiative,
+    record_initiative,
+)
+
+
+def _initiatives(root: Path, *names: str) -> None:
+    """Create initiative folders, newest first."""
+    for age, name in enumerate(names):
+        folder = root / "initiatives" / name
+        folder.mkdir(parents=True)
+        (folder / "spec.md").write_text("# Spec\n")
+        os.utime(folder, (1_000_000 - age, 1_000_000 - age))
+
+
+def test_feature_numbering_and_lookup(tmp_path: Path):
+    (tmp_path / "nuaa" / "004-outreach").mkdir(parents=True)
+
+    first, num, slug = _next_feature_dir("Peer Naloxone Distribution", root=tmp_path)
+    second, _, _ = _next_feature_dir("Needle Exchange", root=tmp_path)
+
+    assert (num, slug) == ("005", "peer-naloxone-distribution")
+    assert second.name == "006-needle-exchange"
+    assert _find_feature_dir_by_program("naloxone distribution", root=tmp_path) == first
+    assert _find_feature_dir_by_program("Outreach", root=tmp_path).name == "004-outreach"
+    assert _find_feature_dir_by_program("housing", root=tmp_path) is None
+
+    index = json.loads((tmp_path / INDEX_PATH).read_text())
+    entry = index["collections"][FEATURES]["entries"]["005-peer-naloxone-distribution"]
+    assert entry["number"] == 5 and entry["path"] == "nuaa/005-peer-naloxone-distribution"
+
+
+def test_parallel_feature_numbering_never_shares_a_directory(tmp_path: Path):
+    """Concurrent scaffolds each reserve their own number; one new program gets one folder."""
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        dirs = list(pool.map(lambda i: _next_feature_dir("Outreach", root=tmp_path)[0], range(8)))
+        shared = set(pool.map(lambda i: _feature_dir_for_program("Hep C", root=tmp_path), range(8)))
+
+    assert sorted(d.name for d in dirs) == [f"{n:03d}-outreach" for n in range(1, 9)]
+    assert [d.name for d in shared] == ["009-hep-c"]
+
+
+def test_unchanged_collection_is_not_rescanned(tmp_path: Path, monkeypatch):
+    _initiatives(tmp_path, "001-alpha", "002-beta")
+    assert WorkspaceIndex(tmp_path).latest(INITIATIVES)["name"] == "001-alpha"
+    assert not (tmp_path / INDEX_PATH).exists()  # lookups never write the index
+    record_initiative("002-beta", tmp_path)
+
+    def no_scan(self, kind, directory):
+        raise AssertionError("collection rescanned")
+
+    with monkeypatch.context() as m:
+        m.setattr(WorkspaceIndex, "_scan", no_scan)
+        index = WorkspaceIndex(tmp_path)
+        assert index.next_number(INITIATIVES) == 3
+        assert index.latest(INITIATIVES)["name"] == "002-beta"
+
+    (tmp_path / "initiatives" / "007-gamma").mkdir()
+    assert WorkspaceIndex(tmp_path).next_number(INITIATIVES) == 8
+
+
+def test_record_moves_initiative_to_front(tmp_path: Path):
+    _initiatives(tmp_path, "001-alpha", "002-beta")
+    assert latest_initiative(tmp_path) == "001-alpha"
+
+    (tmp_path / "initiatives" / "002-beta" / "plan.md").write_text("# Plan\n")
+    record_initiative("002-beta", tmp_path)
+
+    entry = WorkspaceIndex(tmp_path).latest(INITIATIVES)
+    assert entry["name"] == "002-beta" and entry["status"] == "planned"
+
+
+def test_latest_is_one_stat_and_refreshes_its_status(tmp_path: Path, monkeypatch):
+    _initiatives(tmp_path, "001-alpha", "002-beta")
+    record_initiative("002-beta", tmp_path)
+
+    # Adding a file changes the folder's mtime but not that of initiatives/
+    (tmp_path / "initiatives" / "002-beta" / "plan.md").write_text("# Plan\n")
+    stats = []
+    real_stat = Path.stat
+    monkeypatch.setattr(Path, "stat", lambda self, **kw: stats.append(self) or real_stat(self))
+
+    entry = WorkspaceIndex(tmp_path).latest(INITIATIVES)
+
+    assert (entry["name"], entry["status"]) == ("002-beta", "planned")
+    folders = [p for p in stats if tmp_path / "initiatives" in (p, p.parent)]
+    assert [p.name for p in folders] == ["initiatives", "002-beta"]
+
+
+def test_status_uses_indexed_latest_initiative(tmp_path: Path):
+    _initiatives(tmp_path, "001-alpha", "002-beta")
+    (tmp_path / "initiatives" / "001-alpha" / "plan.md").write_text("# Plan\n")
+    os.chdir(tmp_path)
+
+    result = CliRunner().invoke(app, ["status"])
+
+    assert result.exit_code == 0, result.output
+    assert "001-alpha" in result.output
+    assert not (tmp_path / INDEX_PATH).exists()
+
+
+@pytest.mark.parametrize("command", [["plan"], ["assemble"], ["draft", "Intro"]])
+def test_commands_report_missing_initiatives(tmp_path: Path, command: list[str]):
+    (tmp_path / "initiatives").mkdir()
+    os.chdir(tmp_path)
+
+    result = CliRunner().invoke(app, command)
+
+    assert result.exit_code == 1
+    assert "No initiatives found" in result.output